@@ -41,6 +41,13 @@ import app.models  # noqa: F401 — mesma ordem que app/models/__init__.py
 # 3. Atribua o metadata da sua Base
 target_metadata = Base.metadata
 
+from app.core.search_index import is_search_table  # noqa: E402
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Tabelas FTS5 (e sombras) são criadas por SQL nas migrações; o autogenerate não deve removê-las."""
+    return not (type_ == "table" and is_search_table(name))
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -64,6 +71,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -86,7 +94,10 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata, render_as_batch=True
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
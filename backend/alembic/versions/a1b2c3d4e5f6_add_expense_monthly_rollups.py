@@ -0,0 +1,57 @@
+"""expense_monthly_rollups: totais mensais de lançamentos mantidos por delta
+
+Revision ID: a1b2c3d4e5f6
+Revises: z0a1b2c3d4e5
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a1b2c3d4e5f6"
+down_revision: Union[str, None] = "z0a1b2c3d4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "expense_monthly_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("executive_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("expense_category_id", sa.Integer(), nullable=True),
+        sa.Column("entry_type", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("expense_count", sa.Integer(), nullable=False),
+        sa.Column("total_amount", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(["executive_id"], ["executives.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_expense_monthly_rollups_id"), "expense_monthly_rollups", ["id"], unique=False)
+    op.create_index(
+        "ix_expense_monthly_rollups_bucket",
+        "expense_monthly_rollups",
+        ["executive_id", "month", "expense_category_id", "entry_type", "status"],
+        unique=False,
+    )
+    # carga inicial a partir dos lançamentos existentes
+    op.execute(
+        """
+        INSERT INTO expense_monthly_rollups
+            (executive_id, month, expense_category_id, entry_type, status, expense_count, total_amount)
+        SELECT executive_id, strftime('%Y-%m-01', expense_date), expense_category_id, entry_type, status,
+               COUNT(id), SUM(amount)
+        FROM expenses
+        GROUP BY executive_id, strftime('%Y-%m-01', expense_date), expense_category_id, entry_type, status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_expense_monthly_rollups_bucket", table_name="expense_monthly_rollups")
+    op.drop_index(op.f("ix_expense_monthly_rollups_id"), table_name="expense_monthly_rollups")
+    op.drop_table("expense_monthly_rollups")
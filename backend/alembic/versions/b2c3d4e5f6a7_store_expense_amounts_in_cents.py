@@ -0,0 +1,54 @@
+"""valores de lançamentos em centavos inteiros (expenses.amount_cents, expense_monthly_rollups.total_cents)
+
+Revision ID: b2c3d4e5f6a7
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b2c3d4e5f6a7"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("expenses") as batch_op:
+        batch_op.add_column(sa.Column("amount_cents", sa.Integer(), nullable=True))
+    op.execute("UPDATE expenses SET amount_cents = CAST(ROUND(amount * 100) AS INTEGER)")
+    with op.batch_alter_table("expenses") as batch_op:
+        batch_op.alter_column("amount_cents", existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column("amount")
+
+    with op.batch_alter_table("expense_monthly_rollups") as batch_op:
+        batch_op.add_column(sa.Column("total_cents", sa.Integer(), nullable=True))
+    op.execute("UPDATE expense_monthly_rollups SET total_cents = CAST(ROUND(total_amount * 100) AS INTEGER)")
+    with op.batch_alter_table("expense_monthly_rollups") as batch_op:
+        batch_op.alter_column("total_cents", existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column("total_amount")
+
+    # impressões digitais guardavam somas em decimal: a próxima regeneração refaz tudo
+    op.execute("UPDATE reports SET fingerprints = NULL")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("expense_monthly_rollups") as batch_op:
+        batch_op.add_column(sa.Column("total_amount", sa.Numeric(precision=14, scale=2), nullable=True))
+    op.execute("UPDATE expense_monthly_rollups SET total_amount = total_cents / 100.0")
+    with op.batch_alter_table("expense_monthly_rollups") as batch_op:
+        batch_op.alter_column("total_amount", existing_type=sa.Numeric(precision=14, scale=2), nullable=False)
+        batch_op.drop_column("total_cents")
+
+    with op.batch_alter_table("expenses") as batch_op:
+        batch_op.add_column(sa.Column("amount", sa.Numeric(precision=14, scale=2), nullable=True))
+    op.execute("UPDATE expenses SET amount = amount_cents / 100.0")
+    with op.batch_alter_table("expenses") as batch_op:
+        batch_op.alter_column("amount", existing_type=sa.Numeric(precision=14, scale=2), nullable=False)
+        batch_op.drop_column("amount_cents")
+
+    op.execute("UPDATE reports SET fingerprints = NULL")
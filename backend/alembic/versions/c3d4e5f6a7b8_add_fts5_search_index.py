@@ -0,0 +1,52 @@
+"""busca textual: tabelas FTS5 (conteúdo externo) para contacts, documents, events e tasks, com triggers
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-19
+
+Atenção: batch_alter_table nessas tabelas recria a tabela e descarta os triggers; a migração
+que fizer isso deve recriá-los (mesmo SQL abaixo) e rodar o 'rebuild'.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, None] = "b2c3d4e5f6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TOKENIZER = "unicode61 remove_diacritics 2"
+_SOURCES = (
+    ("contacts", ("full_name", "email", "company", "role", "notes")),
+    ("documents", ("name",)),
+    ("events", ("title", "description", "location")),
+    ("tasks", ("title", "description")),
+)
+
+
+def upgrade() -> None:
+    for table, columns in _SOURCES:
+        fts = f"{table}_fts"
+        names = ", ".join(columns)
+        new_values = ", ".join(f"new.{name}" for name in columns)
+        old_values = ", ".join(f"old.{name}" for name in columns)
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+        insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', "
+            f"content_rowid='id', tokenize='{_TOKENIZER}')"
+        )
+        op.execute(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END")
+        op.execute(f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN {delete_old} {insert_new} END")
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")  # indexa as linhas existentes
+
+
+def downgrade() -> None:
+    for table, _columns in reversed(_SOURCES):
+        fts = f"{table}_fts"
+        for suffix in ("au", "ad", "ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
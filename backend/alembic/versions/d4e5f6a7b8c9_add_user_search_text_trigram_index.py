@@ -0,0 +1,57 @@
+"""gestão de usuários: users.search_text normalizado + índice FTS5 trigram (users_fts)
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-19
+
+"""
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DELETE_OLD = "INSERT INTO users_fts(users_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);"
+_INSERT_NEW = "INSERT INTO users_fts(rowid, search_text) VALUES (new.id, new.search_text);"
+
+
+def _fold(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("search_text", sa.String(), nullable=False, server_default=""))
+
+    bind = op.get_bind()
+    users = sa.table("users", sa.column("id", sa.Integer), sa.column("name", sa.String), sa.column("email", sa.String), sa.column("search_text", sa.String))
+    rows = bind.execute(sa.select(users.c.id, users.c.name, users.c.email)).all()
+    if rows:
+        bind.execute(
+            users.update().where(users.c.id == sa.bindparam("row_id")).values(search_text=sa.bindparam("folded")),
+            [{"row_id": row_id, "folded": _fold(f"{name or ''} {email or ''}")} for row_id, name, email in rows],
+        )
+
+    op.execute(
+        "CREATE VIRTUAL TABLE users_fts USING fts5(search_text, content='users', content_rowid='id', tokenize='trigram')"
+    )
+    op.execute(f"CREATE TRIGGER users_fts_ai AFTER INSERT ON users BEGIN {_INSERT_NEW} END")
+    op.execute(f"CREATE TRIGGER users_fts_ad AFTER DELETE ON users BEGIN {_DELETE_OLD} END")
+    op.execute(f"CREATE TRIGGER users_fts_au AFTER UPDATE OF search_text ON users BEGIN {_DELETE_OLD} {_INSERT_NEW} END")
+    op.execute("INSERT INTO users_fts(users_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    for suffix in ("au", "ad", "ai"):
+        op.execute(f"DROP TRIGGER IF EXISTS users_fts_{suffix}")
+    op.execute("DROP TABLE IF EXISTS users_fts")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("search_text")
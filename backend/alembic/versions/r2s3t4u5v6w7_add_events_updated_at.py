@@ -0,0 +1,38 @@
+"""add updated_at to events (feed iCalendar / GET condicional)
+
+Revision ID: r2s3t4u5v6w7
+Revises: q1w2e3r4t5y6
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "r2s3t4u5v6w7"
+down_revision: Union[str, None] = "q1w2e3r4t5y6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+    op.execute("UPDATE events SET updated_at = CURRENT_TIMESTAMP WHERE updated_at IS NULL")
+
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.alter_column("updated_at", existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index(
+            "ix_events_executive_id_updated_at",
+            ["executive_id", "updated_at"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.drop_index("ix_events_executive_id_updated_at")
+        batch_op.drop_column("updated_at")
@@ -0,0 +1,30 @@
+"""index events (executive_id, end_time) para consultas por janela
+
+Revision ID: s3t4u5v6w7x8
+Revises: r2s3t4u5v6w7
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "s3t4u5v6w7x8"
+down_revision: Union[str, None] = "r2s3t4u5v6w7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.create_index(
+            "ix_events_executive_id_end_time",
+            ["executive_id", "end_time"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.drop_index("ix_events_executive_id_end_time")
@@ -0,0 +1,30 @@
+"""index events (start_time, reminder_minutes) para o agendador de lembretes
+
+Revision ID: t4u5v6w7x8y9
+Revises: s3t4u5v6w7x8
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "t4u5v6w7x8y9"
+down_revision: Union[str, None] = "s3t4u5v6w7x8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.create_index(
+            "ix_events_start_time_reminder_minutes",
+            ["start_time", "reminder_minutes"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.drop_index("ix_events_start_time_reminder_minutes")
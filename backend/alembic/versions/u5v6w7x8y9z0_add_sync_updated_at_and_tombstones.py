@@ -0,0 +1,74 @@
+"""updated_at nas entidades sincronizadas + tabela sync_tombstones (GET /sync)
+
+Revision ID: u5v6w7x8y9z0
+Revises: t4u5v6w7x8y9
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "u5v6w7x8y9z0"
+down_revision: Union[str, None] = "t4u5v6w7x8y9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabelas por executivo: índice (executive_id, updated_at).
+EXECUTIVE_TABLES = ("tasks", "contacts", "expenses", "documents", "expense_categories")
+# Tabelas globais (tipos/categorias): índice só em updated_at.
+GLOBAL_TABLES = ("event_types", "contact_types", "document_categories")
+
+
+def upgrade() -> None:
+    for table in EXECUTIVE_TABLES + GLOBAL_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+        op.execute(f"UPDATE {table} SET updated_at = CURRENT_TIMESTAMP WHERE updated_at IS NULL")
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column("updated_at", existing_type=sa.DateTime(), nullable=False)
+            if table in EXECUTIVE_TABLES:
+                batch_op.create_index(
+                    f"ix_{table}_executive_id_updated_at",
+                    ["executive_id", "updated_at"],
+                    unique=False,
+                )
+            else:
+                batch_op.create_index(f"ix_{table}_updated_at", ["updated_at"], unique=False)
+
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("executive_id", sa.Integer(), nullable=True),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_sync_tombstones_id"), "sync_tombstones", ["id"], unique=False)
+    op.create_index(
+        "ix_sync_tombstones_executive_id_deleted_at",
+        "sync_tombstones",
+        ["executive_id", "deleted_at"],
+        unique=False,
+    )
+    op.create_index("ix_sync_tombstones_deleted_at", "sync_tombstones", ["deleted_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sync_tombstones_deleted_at", table_name="sync_tombstones")
+    op.drop_index("ix_sync_tombstones_executive_id_deleted_at", table_name="sync_tombstones")
+    op.drop_index(op.f("ix_sync_tombstones_id"), table_name="sync_tombstones")
+    op.drop_table("sync_tombstones")
+
+    for table in EXECUTIVE_TABLES + GLOBAL_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            if table in EXECUTIVE_TABLES:
+                batch_op.drop_index(f"ix_{table}_executive_id_updated_at")
+            else:
+                batch_op.drop_index(f"ix_{table}_updated_at")
+            batch_op.drop_column("updated_at")
@@ -0,0 +1,49 @@
+"""fila persistente de e-mails de saída (outbound_emails)
+
+Revision ID: v6w7x8y9z0a1
+Revises: u5v6w7x8y9z0
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "v6w7x8y9z0a1"
+down_revision: Union[str, None] = "u5v6w7x8y9z0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbound_emails",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("to_email", sa.String(length=255), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("body_text", sa.Text(), nullable=False),
+        sa.Column("body_html", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_outbound_emails_id"), "outbound_emails", ["id"], unique=False)
+    op.create_index(
+        "ix_outbound_emails_status_next_attempt_at",
+        "outbound_emails",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbound_emails_status_next_attempt_at", table_name="outbound_emails")
+    op.drop_index(op.f("ix_outbound_emails_id"), table_name="outbound_emails")
+    op.drop_table("outbound_emails")
@@ -0,0 +1,51 @@
+"""reports.summary e índices (executive_id, data) para geração de relatórios no servidor
+
+Revision ID: w7x8y9z0a1b2
+Revises: v6w7x8y9z0a1
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "w7x8y9z0a1b2"
+down_revision: Union[str, None] = "v6w7x8y9z0a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.add_column(sa.Column("summary", sa.JSON(), nullable=True))
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.create_index(
+            "ix_events_executive_id_start_time",
+            ["executive_id", "start_time"],
+            unique=False,
+        )
+    with op.batch_alter_table("expenses") as batch_op:
+        batch_op.create_index(
+            "ix_expenses_executive_id_expense_date",
+            ["executive_id", "expense_date"],
+            unique=False,
+        )
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.create_index(
+            "ix_tasks_executive_id_due_date",
+            ["executive_id", "due_date"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_index("ix_tasks_executive_id_due_date")
+    with op.batch_alter_table("expenses") as batch_op:
+        batch_op.drop_index("ix_expenses_executive_id_expense_date")
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.drop_index("ix_events_executive_id_start_time")
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.drop_column("summary")
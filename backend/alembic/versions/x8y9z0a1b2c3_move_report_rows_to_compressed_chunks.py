@@ -0,0 +1,95 @@
+"""linhas de relatório em report_chunks (JSON zlib por bloco) no lugar de reports.generated_data
+
+Revision ID: x8y9z0a1b2c3
+Revises: w7x8y9z0a1b2
+Create Date: 2026-10-19
+
+"""
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "x8y9z0a1b2c3"
+down_revision: Union[str, None] = "w7x8y9z0a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_ROWS = 500
+
+reports = sa.table(
+    "reports",
+    sa.column("id", sa.Integer),
+    sa.column("generated_data", sa.JSON),
+    sa.column("row_count", sa.Integer),
+)
+report_chunks = sa.table(
+    "report_chunks",
+    sa.column("report_id", sa.Integer),
+    sa.column("chunk_index", sa.Integer),
+    sa.column("first_row", sa.Integer),
+    sa.column("row_count", sa.Integer),
+    sa.column("payload", sa.LargeBinary),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_chunks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("report_id", sa.Integer(), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("first_row", sa.Integer(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["report_id"], ["reports.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("report_id", "chunk_index", name="uq_report_chunks_report_id_chunk_index"),
+    )
+    op.create_index(op.f("ix_report_chunks_id"), "report_chunks", ["id"], unique=False)
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.add_column(sa.Column("row_count", sa.Integer(), nullable=False, server_default="0"))
+
+    conn = op.get_bind()
+    for report_id, data in conn.execute(sa.select(reports.c.id, reports.c.generated_data)).all():
+        rows = data or []
+        for index, start in enumerate(range(0, len(rows), CHUNK_ROWS)):
+            block = rows[start : start + CHUNK_ROWS]
+            payload = zlib.compress(json.dumps(block, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+            conn.execute(
+                report_chunks.insert().values(
+                    report_id=report_id, chunk_index=index, first_row=start, row_count=len(block), payload=payload
+                )
+            )
+        conn.execute(reports.update().where(reports.c.id == report_id).values(row_count=len(rows)))
+
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.drop_column("generated_data")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.add_column(sa.Column("generated_data", sa.JSON(), nullable=True))
+
+    conn = op.get_bind()
+    rows_by_report: dict = {}
+    chunks = conn.execute(
+        sa.select(report_chunks.c.report_id, report_chunks.c.payload).order_by(
+            report_chunks.c.report_id, report_chunks.c.chunk_index
+        )
+    )
+    for report_id, payload in chunks:
+        rows_by_report.setdefault(report_id, []).extend(json.loads(zlib.decompress(payload)))
+    for (report_id,) in conn.execute(sa.select(reports.c.id)).all():
+        conn.execute(
+            reports.update().where(reports.c.id == report_id).values(generated_data=rows_by_report.get(report_id, []))
+        )
+
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.alter_column("generated_data", existing_type=sa.JSON(), nullable=False)
+        batch_op.drop_column("row_count")
+    op.drop_index(op.f("ix_report_chunks_id"), table_name="report_chunks")
+    op.drop_table("report_chunks")
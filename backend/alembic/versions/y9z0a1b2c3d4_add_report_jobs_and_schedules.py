@@ -0,0 +1,73 @@
+"""jobs assíncronos de relatório (report_jobs) e agendamentos recorrentes (report_schedules)
+
+Revision ID: y9z0a1b2c3d4
+Revises: x8y9z0a1b2c3
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "y9z0a1b2c3d4"
+down_revision: Union[str, None] = "x8y9z0a1b2c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_schedules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("frequency", sa.String(length=16), nullable=False),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("executive_ids", sa.JSON(), nullable=True),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("next_run_at", sa.DateTime(), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_report_schedules_id"), "report_schedules", ["id"], unique=False)
+    op.create_index(op.f("ix_report_schedules_owner_id"), "report_schedules", ["owner_id"], unique=False)
+    op.create_index(op.f("ix_report_schedules_next_run_at"), "report_schedules", ["next_run_at"], unique=False)
+
+    op.create_table(
+        "report_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("progress", sa.Integer(), nullable=False),
+        sa.Column("current_section", sa.String(length=32), nullable=True),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("executive_ids", sa.JSON(), nullable=True),
+        sa.Column("report_id", sa.Integer(), nullable=True),
+        sa.Column("schedule_id", sa.Integer(), nullable=True),
+        sa.Column("requested_by_id", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["report_id"], ["reports.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["schedule_id"], ["report_schedules.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["requested_by_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_report_jobs_id"), "report_jobs", ["id"], unique=False)
+    op.create_index(op.f("ix_report_jobs_requested_by_id"), "report_jobs", ["requested_by_id"], unique=False)
+    op.create_index("ix_report_jobs_status_created_at", "report_jobs", ["status", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_jobs_status_created_at", table_name="report_jobs")
+    op.drop_index(op.f("ix_report_jobs_requested_by_id"), table_name="report_jobs")
+    op.drop_index(op.f("ix_report_jobs_id"), table_name="report_jobs")
+    op.drop_table("report_jobs")
+    op.drop_index(op.f("ix_report_schedules_next_run_at"), table_name="report_schedules")
+    op.drop_index(op.f("ix_report_schedules_owner_id"), table_name="report_schedules")
+    op.drop_index(op.f("ix_report_schedules_id"), table_name="report_schedules")
+    op.drop_table("report_schedules")
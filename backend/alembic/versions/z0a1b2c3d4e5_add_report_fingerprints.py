@@ -0,0 +1,27 @@
+"""reports.fingerprints: impressão digital por (seção, executivo) para regeneração incremental
+
+Revision ID: z0a1b2c3d4e5
+Revises: y9z0a1b2c3d4
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "z0a1b2c3d4e5"
+down_revision: Union[str, None] = "y9z0a1b2c3d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.add_column(sa.Column("fingerprints", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.drop_column("fingerprints")
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 from sqlalchemy.orm import Session
@@ -11,20 +11,19 @@ from app.models import user_model as user_models
 from app.repositories.user_repository import UserRepository
 
 _bearer = HTTPBearer(auto_error=False)
+# Usuário já autenticado pela requisição externa de POST /batch (request.state).
+AUTHENTICATED_USER_STATE = "authenticated_user"
 
 
-def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
-    db: Session = Depends(get_db),
-) -> user_models.Usuario:
-    if credentials is None or not credentials.credentials:
+def user_from_token(token: Optional[str], db: Session) -> user_models.Usuario:
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Não autenticado.",
             headers={"WWW-Authenticate": "Bearer"},
         )
     try:
-        payload = decode_token(credentials.credentials)
+        payload = decode_token(token)
         uid = int(payload["sub"])
     except (JWTError, KeyError, ValueError, TypeError):
         raise HTTPException(
@@ -41,6 +40,25 @@ def get_current_user(
     return user
 
 
+def get_current_user(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+    db: Session = Depends(get_db),
+) -> user_models.Usuario:
+    authenticated = getattr(request.state, AUTHENTICATED_USER_STATE, None)
+    if authenticated is not None:
+        return authenticated
+    return user_from_token(credentials.credentials if credentials else None, db)
+
+
+def get_stream_token(
+    access_token: Optional[str] = Query(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> Optional[str]:
+    """Token de uma conexão SSE: cabeçalho Bearer ou ?access_token= (EventSource não envia cabeçalhos)."""
+    return credentials.credentials if credentials else access_token
+
+
 def get_invite_frontend_base(
     x_frontend_base_url: Optional[str] = Header(None, alias="X-Frontend-Base-URL"),
 ) -> str:
@@ -0,0 +1,27 @@
+"""
+Recalcula `expense_monthly_rollups` do zero a partir de `expenses`.
+
+Uso (na pasta backend): python -m app.commands.rebuild_expense_rollup
+Útil após importações diretas no banco ou se o resumo divergir dos lançamentos.
+"""
+
+import app.models  # noqa: F401 — registra os modelos
+from app.core.database import SessionLocal
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository
+
+
+def rebuild_expense_rollup(session_factory=SessionLocal) -> int:
+    db = session_factory()
+    try:
+        groups = ExpenseRollupRepository(db=db).rebuild()
+        db.commit()
+        return groups
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print(f"Resumo de lançamentos recalculado: {rebuild_expense_rollup()} grupos.")
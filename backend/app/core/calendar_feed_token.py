@@ -0,0 +1,24 @@
+import base64
+import hashlib
+import hmac
+import os
+
+
+def _feed_secret() -> str:
+    # CALENDAR_FEED_SECRET permite revogar todos os links de assinatura sem trocar o JWT_SECRET.
+    return os.getenv("CALENDAR_FEED_SECRET") or os.getenv(
+        "JWT_SECRET", "altere-esta-chave-em-producao"
+    )
+
+
+def calendar_feed_token(executive_id: int) -> str:
+    digest = hmac.new(
+        _feed_secret().encode("utf-8"),
+        f"ics-feed:{int(executive_id)}".encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+    return base64.urlsafe_b64encode(digest[:24]).decode("ascii")
+
+
+def verify_calendar_feed_token(executive_id: int, token: str) -> bool:
+    return hmac.compare_digest(calendar_feed_token(executive_id), (token or "").strip())
@@ -1,43 +1,157 @@
-"""Verificação server-side de Cloudflare Turnstile."""
+"""
+Verificação server-side de Cloudflare Turnstile.
 
+Um `httpx.AsyncClient` por processo (keep-alive: sem novo handshake TCP/TLS por cadastro),
+com orçamento total de TURNSTILE_TIMEOUT_SECONDS por verificação e circuit breaker: com o
+upstream lento ou fora do ar, os cadastros falham na hora em vez de segurar o worker.
+O endpoint é configurável (TURNSTILE_VERIFY_URL / `set_verifier`) para testes locais.
+"""
+
+import asyncio
 import logging
 import os
+import time
+from typing import Optional
 
 import httpx
 
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.latency import LatencyRecorder
+
 logger = logging.getLogger(__name__)
 
 TURNSTILE_VERIFY_URL = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
 CAPTCHA_VALIDATION_ERROR = "Não foi possível validar a verificação de segurança."
 
+TURNSTILE_TIMEOUT_SECONDS = float(os.getenv("TURNSTILE_TIMEOUT_SECONDS", "3"))
+TURNSTILE_BREAKER_FAILURES = int(os.getenv("TURNSTILE_BREAKER_FAILURES", "5"))
+TURNSTILE_BREAKER_RESET_SECONDS = float(os.getenv("TURNSTILE_BREAKER_RESET_SECONDS", "30"))
+
+# Desfechos registrados nas métricas
+OUTCOME_SUCCESS = "success"
+OUTCOME_REJECTED = "rejected"
+OUTCOME_UPSTREAM_ERROR = "upstream_error"
+OUTCOME_SHORT_CIRCUITED = "short_circuited"
+
 
 class CaptchaVerificationError(Exception):
     """Token de CAPTCHA ausente, inválido ou não verificado."""
 
 
-def verify_turnstile_token(token: str, *, remote_ip: str | None = None) -> None:
-    secret = os.getenv("TURNSTILE_SECRET_KEY", "").strip()
-    if not secret:
-        logger.error("TURNSTILE_SECRET_KEY não configurada")
-        raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR)
+class _UpstreamError(Exception):
+    """Falha do serviço (timeout, conexão, 5xx, resposta ilegível): conta para o breaker."""
+
+
+class TurnstileVerifier:
+    def __init__(
+        self,
+        verify_url: Optional[str] = None,
+        timeout_seconds: float = TURNSTILE_TIMEOUT_SECONDS,
+        breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.verify_url = verify_url or os.getenv("TURNSTILE_VERIFY_URL", "").strip() or TURNSTILE_VERIFY_URL
+        self.timeout_seconds = timeout_seconds
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=TURNSTILE_BREAKER_FAILURES,
+            reset_seconds=TURNSTILE_BREAKER_RESET_SECONDS,
+        )
+        self.metrics = LatencyRecorder()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout_seconds, connect=min(1.0, self.timeout_seconds)),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def verify(self, token: str, *, remote_ip: Optional[str] = None) -> None:
+        secret = os.getenv("TURNSTILE_SECRET_KEY", "").strip()
+        if not secret:
+            logger.error("TURNSTILE_SECRET_KEY não configurada")
+            raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR)
+
+        cleaned = (token or "").strip()
+        if not cleaned:
+            raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR)
+
+        if not self.breaker.allow():
+            self.metrics.record(OUTCOME_SHORT_CIRCUITED)
+            logger.warning("Turnstile: circuito aberto, verificação recusada sem chamar o upstream")
+            raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR)
 
-    cleaned = (token or "").strip()
-    if not cleaned:
-        raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR)
+        payload: dict[str, str] = {"secret": secret, "response": cleaned}
+        if remote_ip:
+            payload["remoteip"] = remote_ip
 
-    payload: dict[str, str] = {"secret": secret, "response": cleaned}
-    if remote_ip:
-        payload["remoteip"] = remote_ip
+        started = time.perf_counter()
+        try:
+            data = await asyncio.wait_for(self._post(payload), timeout=self.timeout_seconds)
+        except (_UpstreamError, asyncio.TimeoutError, httpx.HTTPError) as exc:
+            self.breaker.record_failure()
+            self.metrics.record(OUTCOME_UPSTREAM_ERROR, time.perf_counter() - started)
+            logger.warning("Falha ao verificar Turnstile: %r", exc)
+            raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR) from exc
+        except BaseException:
+            # Cancelamento (cliente desconectou) ou erro inesperado: a prova do meio-aberto não
+            # pode ficar pendente, senão allow() recusa tudo até reiniciar o processo.
+            self.breaker.release()
+            raise
 
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(TURNSTILE_VERIFY_URL, data=payload)
-            response.raise_for_status()
+        elapsed = time.perf_counter() - started
+        self.breaker.record_success()
+        if not data.get("success"):
+            self.metrics.record(OUTCOME_REJECTED, elapsed)
+            logger.info("Turnstile rejeitou token: %s", data.get("error-codes"))
+            raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR)
+        self.metrics.record(OUTCOME_SUCCESS, elapsed)
+
+    async def _post(self, payload: dict[str, str]) -> dict:
+        response = await self._get_client().post(self.verify_url, data=payload)
+        if response.status_code >= 500:
+            raise _UpstreamError(f"HTTP {response.status_code}")
+        try:
             data = response.json()
-    except Exception as exc:
-        logger.warning("Falha ao verificar Turnstile: %s", exc)
-        raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR) from exc
+        except ValueError as exc:
+            raise _UpstreamError("resposta não é JSON") from exc
+        if not isinstance(data, dict):
+            raise _UpstreamError("resposta inesperada")
+        return data
+
+    def snapshot(self) -> dict:
+        return {"breakerState": self.breaker.state, **self.metrics.snapshot()}
+
+
+_verifier: Optional[TurnstileVerifier] = None
+
+
+def get_verifier() -> TurnstileVerifier:
+    global _verifier
+    if _verifier is None:
+        _verifier = TurnstileVerifier()
+    return _verifier
+
+
+def set_verifier(verifier: Optional[TurnstileVerifier]) -> None:
+    """Troca o verificador do processo (ex.: upstream local nos testes); None volta ao padrão."""
+    global _verifier
+    _verifier = verifier
+
+
+async def verify_turnstile_token(token: str, *, remote_ip: str | None = None) -> None:
+    await get_verifier().verify(token, remote_ip=remote_ip)
+
 
-    if not data.get("success"):
-        logger.info("Turnstile rejeitou token: %s", data.get("error-codes"))
-        raise CaptchaVerificationError(CAPTCHA_VALIDATION_ERROR)
+async def aclose() -> None:
+    """Fecha o pool HTTP (shutdown da API); o próximo uso cria outro."""
+    if _verifier is not None:
+        await _verifier.aclose()
@@ -0,0 +1,240 @@
+"""
+Feed de alterações em processo (pub/sub).
+
+Os hooks de sessão do ORM acumulam as alterações das entidades rastreadas durante os
+flushes e só publicam após o commit (after_commit); rollback descarta. Caminhos por
+statement (INSERT/DELETE em lote) registram suas linhas com `track_rows`; as exclusões por
+statement vão também aos `add_delete_sink` na mesma transação (tombstones do delta sync; as do
+unit of work têm listener próprio no modelo, ativo mesmo sem o feed instalado). Assinantes são
+filas asyncio no event loop do worker — nenhuma thread por conexão.
+"""
+
+import asyncio
+import itertools
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+CHANGE_FEED_BACKLOG = int(os.getenv("CHANGE_FEED_BACKLOG", "1000"))
+SUBSCRIBER_QUEUE_SIZE = 256
+
+_PENDING_KEY = "change_feed.pending"
+
+OP_CREATE = "create"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class ChangeNotice:
+    entity: str
+    id: int
+    op: str
+    version: int
+    executive_id: Optional[int] = None
+
+    def as_dict(self) -> dict:
+        return {
+            "entity": self.entity,
+            "id": self.id,
+            "op": self.op,
+            "version": self.version,
+            "executiveId": self.executive_id,
+        }
+
+
+# (entity, id, op, executive_id) — versão atribuída na publicação
+PendingChange = Tuple[str, int, str, Optional[int]]
+
+
+class Subscription:
+    """Fila de um assinante. `overflowed` indica que avisos foram perdidos (cliente deve recarregar)."""
+
+    def __init__(self, accepts: Callable[[ChangeNotice], bool], queue_size: int):
+        self.accepts = accepts
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def offer(self, notice: ChangeNotice) -> None:
+        if not self.accepts(notice):
+            return
+        if self.queue.full():
+            self.overflowed = True
+            return
+        self.queue.put_nowait(notice)
+
+
+class ChangeHub:
+    def __init__(self, backlog: int = CHANGE_FEED_BACKLOG, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._version = 0
+        self._backlog: Deque[ChangeNotice] = deque(maxlen=backlog)
+        self._subscribers: Dict[int, Subscription] = {}
+        self._ids = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, changes: Iterable[PendingChange]) -> List[ChangeNotice]:
+        """Chamado de qualquer thread (após o commit); a entrega acontece no event loop."""
+        with self._lock:
+            notices = []
+            for entity, entity_id, op, executive_id in changes:
+                self._version += 1
+                notices.append(ChangeNotice(entity, entity_id, op, self._version, executive_id))
+            self._backlog.extend(notices)
+            loop = self._loop
+        if notices and loop is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                self._fan_out(notices)
+            else:
+                loop.call_soon_threadsafe(self._fan_out, notices)
+        return notices
+
+    def _fan_out(self, notices: List[ChangeNotice]) -> None:
+        for subscription in list(self._subscribers.values()):
+            for notice in notices:
+                subscription.offer(notice)
+
+    def subscribe(
+        self, accepts: Callable[[ChangeNotice], bool], since: Optional[int] = None
+    ) -> Tuple[int, Subscription, Optional[List[ChangeNotice]]]:
+        """
+        Registra um assinante no loop corrente. Com `since`, devolve os avisos posteriores
+        ainda no backlog — ou None se o backlog já não cobre esse ponto (recarregar tudo).
+        """
+        self._loop = asyncio.get_running_loop()
+        token = next(self._ids)
+        subscription = Subscription(accepts, self.queue_size)
+        with self._lock:
+            self._subscribers[token] = subscription
+            replay: Optional[List[ChangeNotice]] = []
+            if since is not None and since > self._version:
+                # Last-Event-ID de antes de um reinício (o contador é em memória): não há como repor.
+                replay = None
+            elif since is not None and since < self._version:
+                oldest = self._backlog[0].version if self._backlog else self._version + 1
+                if since + 1 < oldest:
+                    replay = None
+                else:
+                    replay = [n for n in self._backlog if n.version > since and accepts(n)]
+        return token, subscription, replay
+
+    def unsubscribe(self, token: int) -> None:
+        self._subscribers.pop(token, None)
+
+
+hub = ChangeHub()
+
+# modelo → nome da entidade no feed; preenchido por `register`
+_TRACKED: Dict[type, str] = {}
+
+
+# Destinos chamados na mesma transação das exclusões por statement, com linhas (entity, id, executive_id).
+DeleteSink = Callable[[Session, List[Tuple[str, int, Optional[int]]]], None]
+_DELETE_SINKS: List[DeleteSink] = []
+
+
+def register(model: type, entity: str) -> None:
+    _TRACKED[model] = entity
+
+
+def add_delete_sink(sink: DeleteSink) -> None:
+    if sink not in _DELETE_SINKS:
+        _DELETE_SINKS.append(sink)
+
+
+def _notify_deleted(session: Session, rows: List[Tuple[str, int, Optional[int]]]) -> None:
+    if rows:
+        for sink in _DELETE_SINKS:
+            sink(session, rows)
+
+
+def _pending(session: Session) -> Dict[Tuple[str, int], PendingChange]:
+    return session.info.setdefault(_PENDING_KEY, {})
+
+
+def _record(pending: Dict[Tuple[str, int], PendingChange], change: PendingChange) -> None:
+    entity, entity_id, op, executive_id = change
+    previous = pending.get((entity, entity_id))
+    if previous is not None and previous[2] == OP_CREATE and op == OP_UPDATE:
+        op = OP_CREATE  # criado e alterado na mesma transação continua sendo criação
+    pending[(entity, entity_id)] = (entity, entity_id, op, executive_id)
+
+
+def track_rows(
+    session: Session, entity: str, op: str, rows: Iterable[Tuple[int, Optional[int]]]
+) -> None:
+    """Registra linhas (id, executive_id) alteradas por statement, fora do unit of work."""
+    pending = _pending(session)
+    rows = list(rows)
+    for entity_id, executive_id in rows:
+        _record(pending, (entity, entity_id, op, executive_id))
+    if op == OP_DELETE:
+        _notify_deleted(session, [(entity, entity_id, executive_id) for entity_id, executive_id in rows])
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    if not _TRACKED:
+        return
+    pending = _pending(session)
+    for items, op in (
+        (session.new, OP_CREATE),
+        (session.dirty, OP_UPDATE),
+        (session.deleted, OP_DELETE),
+    ):
+        for item in items:
+            entity = _TRACKED.get(type(item))
+            if entity is None or item.id is None:
+                continue
+            if op == OP_UPDATE and not session.is_modified(item, include_collections=False):
+                continue
+            executive_id = getattr(item, "executive_id", None)
+            _record(pending, (entity, item.id, op, executive_id))
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        hub.publish(pending.values())
+
+
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+_installed = False
+
+
+def install() -> None:
+    global _installed
+    if _installed:
+        return
+    sa_event.listen(Session, "after_flush", _after_flush)
+    sa_event.listen(Session, "after_commit", _after_commit)
+    sa_event.listen(Session, "after_soft_rollback", _after_soft_rollback)
+    _installed = True
+
+
+def visible_to(executive_ids: Optional[Set[int]]) -> Callable[[ChangeNotice], bool]:
+    """Filtro de escopo: None enxerga tudo; entidades sem executivo (tipos globais) vão a todos."""
+    if executive_ids is None:
+        return lambda notice: True
+    return lambda notice: notice.executive_id is None or notice.executive_id in executive_ids
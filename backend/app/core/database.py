@@ -1,8 +1,9 @@
 import os
 
+from fastapi import Request
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
-from typing import Generator
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from typing import Callable, Generator
 
 # Padrão: SQLite local. Em Docker, use DATABASE_URL (ex.: sqlite:////app/data/sql_app.db).
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./sql_app.db")
@@ -20,13 +21,30 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 class Base(DeclarativeBase):
     pass
 
+# Sub-requisições de POST /batch reaproveitam a sessão da requisição externa (request.state).
+SHARED_SESSION_STATE = "shared_db"
+
+
 # Função de Injeção de Dependência (Dependency Injection)
 # O FastAPI usará isso para criar uma sessão de DB para cada requisição
-def get_db():
+def get_db(request: Request):
+    shared = getattr(request.state, SHARED_SESSION_STATE, None)
+    if shared is not None:
+        # Quem abriu a sessão (a requisição externa) é quem a fecha.
+        yield shared
+        return
     db = SessionLocal()
     try:
         yield db
     finally:
         # Garante que a sessão é fechada após a requisição,
         # liberando o recurso do DB.
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    Fábrica de sessões para dependências que precisam fechar a sessão antes da resposta.
+    Com get_db (yield) a sessão e a conexão do pool só voltam quando a resposta termina,
+    o que num stream SSE significa a conexão inteira do cliente.
+    """
+    return SessionLocal
@@ -0,0 +1,452 @@
+"""Serialização e leitura iCalendar (RFC 5545) — horários naive exportados como floating time."""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.recurrence import RecurrenceParams
+
+CRLF = "\r\n"
+PRODID = "-//HMR//Executiva Cloud//PT-BR"
+UID_DOMAIN = "executivacloud"
+MAX_LINE_OCTETS = 75
+
+# Mesmo índice de recurrence.py: domingo = 0 … sábado = 6.
+WEEKDAY_CODES = ("SU", "MO", "TU", "WE", "TH", "FR", "SA")
+FREQUENCIES = {
+    "daily": "DAILY",
+    "weekly": "WEEKLY",
+    "monthly": "MONTHLY",
+    "annually": "YEARLY",
+}
+# Fuso usado para converter horários UTC/TZID importados para o wall-clock armazenado.
+CALENDAR_TIMEZONE = os.getenv("CALENDAR_TIMEZONE", "America/Sao_Paulo")
+
+
+@dataclass(frozen=True)
+class VEvent:
+    uid: str
+    start: datetime
+    end: datetime
+    summary: str
+    dtstamp: datetime
+    description: Optional[str] = None
+    location: Optional[str] = None
+    categories: Optional[str] = None
+    rrule: Optional[str] = None
+    exdates: Sequence[datetime] = ()
+    recurrence_id: Optional[datetime] = None
+    alarm_minutes: Optional[int] = None
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Quebra em linhas de até 75 octetos (UTF-8) sem partir caracteres multibyte."""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + CRLF
+    parts = []
+    current = ""
+    current_octets = 0
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        size = len(char.encode("utf-8"))
+        if current_octets + size > limit:
+            parts.append(current)
+            current = ""
+            current_octets = 0
+            # Linhas de continuação começam com um espaço, que conta no limite.
+            limit = MAX_LINE_OCTETS - 1
+        current += char
+        current_octets += size
+    parts.append(current)
+    return (CRLF + " ").join(parts) + CRLF
+
+
+def format_datetime(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def format_utc(value: datetime) -> str:
+    return format_datetime(value) + "Z"
+
+
+def build_rrule(rule: RecurrenceParams, start: datetime, until: datetime) -> Optional[str]:
+    """
+    RRULE equivalente à expansão de `recurrence.py`, limitada por UNTIL.
+    Retorna None quando a regra não tem equivalente exato no RFC 5545
+    (mensal após o dia 28 ou anual em 29/02, que aqui são ajustados para o fim do mês).
+    """
+    frequency = FREQUENCIES.get(rule.frequency)
+    if frequency is None:
+        return None
+    if rule.frequency == "monthly" and start.day > 28:
+        return None
+    if rule.frequency == "annually" and (start.month, start.day) == (2, 29):
+        return None
+
+    parts = [f"FREQ={frequency}"]
+    if rule.interval > 1:
+        parts.append(f"INTERVAL={rule.interval}")
+    if rule.frequency == "weekly":
+        days = sorted(set(rule.days_of_week or []))
+        if not days:
+            return None
+        parts.append("BYDAY=" + ",".join(WEEKDAY_CODES[d] for d in days))
+        parts.append("WKST=SU")
+    parts.append(f"UNTIL={format_datetime(until)}")
+    return ";".join(parts)
+
+
+def calendar_header(name: str) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ]
+    return "".join(fold_line(line) for line in lines)
+
+
+def calendar_footer() -> str:
+    return fold_line("END:VCALENDAR")
+
+
+def serialize_vevent(event: VEvent) -> str:
+    return "".join(fold_line(line) for line in _vevent_lines(event))
+
+
+def _vevent_lines(event: VEvent) -> Iterator[str]:
+    yield "BEGIN:VEVENT"
+    yield f"UID:{event.uid}"
+    yield f"DTSTAMP:{format_utc(event.dtstamp)}"
+    yield f"LAST-MODIFIED:{format_utc(event.dtstamp)}"
+    if event.recurrence_id is not None:
+        yield f"RECURRENCE-ID:{format_datetime(event.recurrence_id)}"
+    yield f"DTSTART:{format_datetime(event.start)}"
+    yield f"DTEND:{format_datetime(event.end)}"
+    if event.rrule:
+        yield f"RRULE:{event.rrule}"
+    if event.exdates:
+        yield "EXDATE:" + ",".join(format_datetime(d) for d in sorted(event.exdates))
+    yield f"SUMMARY:{escape_text(event.summary)}"
+    if event.description:
+        yield f"DESCRIPTION:{escape_text(event.description)}"
+    if event.location:
+        yield f"LOCATION:{escape_text(event.location)}"
+    if event.categories:
+        yield f"CATEGORIES:{escape_text(event.categories)}"
+    if event.alarm_minutes is not None and event.alarm_minutes >= 0:
+        yield "BEGIN:VALARM"
+        yield "ACTION:DISPLAY"
+        yield f"DESCRIPTION:{escape_text(event.summary)}"
+        yield f"TRIGGER:-PT{int(event.alarm_minutes)}M"
+        yield "END:VALARM"
+    yield "END:VEVENT"
+
+
+# ---------------------------------------------------------------------------
+# Leitura (import): parser em streaming, uma linha lógica por vez.
+# ---------------------------------------------------------------------------
+
+Params = Dict[str, str]
+Property = Tuple[Params, str]
+
+_DURATION_RE = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+_SKIPPED_COMPONENTS = frozenset({"VTIMEZONE", "VTODO", "VJOURNAL", "VFREEBUSY"})
+
+
+@dataclass
+class ParsedVEvent:
+    """Propriedades de um VEVENT (nome → ocorrências) e o menor alarme encontrado."""
+
+    properties: Dict[str, List[Property]] = field(default_factory=dict)
+    alarm_minutes: Optional[int] = None
+
+    def first(self, name: str) -> Optional[Property]:
+        values = self.properties.get(name)
+        return values[0] if values else None
+
+    def text(self, name: str) -> Optional[str]:
+        prop = self.first(name)
+        return unescape_text(prop[1]) if prop is not None else None
+
+    def all(self, name: str) -> List[Property]:
+        return self.properties.get(name, [])
+
+
+def unescape_text(value: str) -> str:
+    out = []
+    chars = iter(value)
+    for char in chars:
+        if char != "\\":
+            out.append(char)
+            continue
+        nxt = next(chars, "")
+        out.append("\n" if nxt in ("n", "N") else nxt)
+    return "".join(out)
+
+
+def iter_content_lines(stream: IO[str]) -> Iterator[str]:
+    """Desfaz o folding (linhas iniciadas por espaço/tab) sem carregar o arquivo inteiro."""
+    pending: Optional[str] = None
+    for raw in stream:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending:
+            yield pending
+        pending = line
+    if pending:
+        yield pending
+
+
+def parse_content_line(line: str) -> Tuple[str, Params, str]:
+    """`NOME;PARAM=valor:conteúdo` — respeita `:` e `;` dentro de aspas nos parâmetros."""
+    in_quotes = False
+    colon = -1
+    for index, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            colon = index
+            break
+    if colon < 0:
+        raise ValueError("Linha iCalendar inválida.")
+    head, value = line[:colon], line[colon + 1 :]
+
+    segments = []
+    current = []
+    in_quotes = False
+    for char in head:
+        if char == '"':
+            in_quotes = not in_quotes
+        if char == ";" and not in_quotes:
+            segments.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    segments.append("".join(current))
+
+    params: Params = {}
+    for segment in segments[1:]:
+        key, _, raw = segment.partition("=")
+        params[key.strip().upper()] = raw.strip().strip('"')
+    return segments[0].strip().upper(), params, value
+
+
+def iter_vevents(lines: Iterable[str]) -> Iterator[ParsedVEvent]:
+    """Emite cada VEVENT ao encontrar END:VEVENT; VALARM vira `alarm_minutes`."""
+    current: Optional[ParsedVEvent] = None
+    stack: List[str] = []
+    alarm_trigger: Optional[str] = None
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            name, params, value = parse_content_line(line)
+        except ValueError:
+            continue
+        if name == "BEGIN":
+            component = value.strip().upper()
+            stack.append(component)
+            if component == "VEVENT" and current is None:
+                current = ParsedVEvent()
+            elif component == "VALARM":
+                alarm_trigger = None
+            continue
+        if name == "END":
+            component = value.strip().upper()
+            if stack:
+                stack.pop()
+            if component == "VALARM" and current is not None and alarm_trigger:
+                minutes = duration_minutes_before(alarm_trigger)
+                if minutes is not None and (
+                    current.alarm_minutes is None or minutes < current.alarm_minutes
+                ):
+                    current.alarm_minutes = minutes
+            elif component == "VEVENT" and current is not None:
+                yield current
+                current = None
+            continue
+        if current is None or not stack or any(c in _SKIPPED_COMPONENTS for c in stack):
+            continue
+        if stack[-1] == "VALARM":
+            if name == "TRIGGER" and params.get("VALUE", "DURATION").upper() == "DURATION":
+                alarm_trigger = value
+            continue
+        if stack[-1] == "VEVENT":
+            current.properties.setdefault(name, []).append((params, value))
+
+
+def parse_duration(value: str) -> Optional[timedelta]:
+    match = _DURATION_RE.match(value.strip().upper())
+    if not match or value.strip().upper() in ("P", "PT"):
+        return None
+    parts = {k: int(v) for k, v in match.groupdict().items() if k != "sign" and v}
+    delta = timedelta(
+        weeks=parts.get("weeks", 0),
+        days=parts.get("days", 0),
+        hours=parts.get("hours", 0),
+        minutes=parts.get("minutes", 0),
+        seconds=parts.get("seconds", 0),
+    )
+    return -delta if match.group("sign") == "-" else delta
+
+
+def duration_minutes_before(trigger: str) -> Optional[int]:
+    delta = parse_duration(trigger)
+    if delta is None or delta > timedelta(0):
+        return None
+    return int(-delta.total_seconds() // 60)
+
+
+def _local_zone() -> Optional[ZoneInfo]:
+    try:
+        return ZoneInfo(CALENDAR_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def parse_datetime_value(value: str, params: Params) -> Tuple[datetime, bool]:
+    """
+    Converte DATE / DATE-TIME para datetime naive no fuso CALENDAR_TIMEZONE.
+    Retorna (datetime, é_dia_inteiro). Floating time é mantido como está.
+    """
+    raw = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or len(raw) == 8:
+        parsed = datetime.strptime(raw[:8], "%Y%m%d")
+        return parsed, True
+
+    is_utc = raw.endswith("Z")
+    parsed = datetime.strptime(raw.rstrip("Z")[:15], "%Y%m%dT%H%M%S")
+    source_zone = None
+    if is_utc:
+        source_zone = timezone.utc
+    elif params.get("TZID"):
+        try:
+            source_zone = ZoneInfo(params["TZID"])
+        except (ZoneInfoNotFoundError, ValueError):
+            source_zone = None
+    local = _local_zone()
+    if source_zone is not None and local is not None:
+        parsed = parsed.replace(tzinfo=source_zone).astimezone(local).replace(tzinfo=None)
+    return parsed, False
+
+
+def parse_rrule(value: str, start: datetime) -> Optional[RecurrenceParams]:
+    """
+    Mapeia RRULE para RecurrenceParams quando a expansão local é equivalente.
+    Regras com BYSETPOS, BYMONTH, BYDAY numerado etc. retornam None.
+    Sem COUNT/UNTIL, count/end_date ficam None (o chamador define o horizonte).
+    """
+    parts: Dict[str, str] = {}
+    for item in value.strip().split(";"):
+        key, _, raw = item.partition("=")
+        if key:
+            parts[key.strip().upper()] = raw.strip()
+
+    reverse = {v: k for k, v in FREQUENCIES.items()}
+    frequency = reverse.get(parts.pop("FREQ", "").upper())
+    if frequency is None:
+        return None
+    try:
+        interval = int(parts.pop("INTERVAL", "1"))
+    except ValueError:
+        return None
+
+    days_of_week: Optional[List[int]] = None
+    byday = parts.pop("BYDAY", None)
+    if byday:
+        codes = [code.strip().upper() for code in byday.split(",") if code.strip()]
+        if any(code not in WEEKDAY_CODES for code in codes):
+            return None
+        days_of_week = sorted({WEEKDAY_CODES.index(code) for code in codes})
+        if frequency == "daily" and interval == 1:
+            frequency = "weekly"
+        elif frequency != "weekly":
+            return None
+
+    start_day_code = WEEKDAY_CODES[(start.weekday() + 1) % 7]
+    if frequency == "weekly":
+        if not days_of_week:
+            days_of_week = [WEEKDAY_CODES.index(start_day_code)]
+        wkst = parts.pop("WKST", "SU").upper()
+        if wkst != "SU" and interval > 1 and len(days_of_week) > 1:
+            return None
+    else:
+        parts.pop("WKST", None)
+
+    bymonthday = parts.pop("BYMONTHDAY", None)
+    if bymonthday is not None and (frequency != "monthly" or bymonthday != str(start.day)):
+        return None
+
+    count: Optional[int] = None
+    end_date: Optional[date] = None
+    if "COUNT" in parts:
+        try:
+            count = int(parts.pop("COUNT"))
+        except ValueError:
+            return None
+    if "UNTIL" in parts:
+        until_raw = parts.pop("UNTIL")
+        try:
+            until, _ = parse_datetime_value(until_raw, {})
+        except ValueError:
+            return None
+        end_date = until.date()
+
+    if parts:
+        return None
+    if frequency == "monthly" and start.day > 28:
+        return None
+    return RecurrenceParams(
+        frequency=frequency,
+        interval=interval,
+        days_of_week=days_of_week,
+        end_date=end_date,
+        count=count,
+    )
+
+
+def parse_exdates(event: ParsedVEvent) -> List[datetime]:
+    out: List[datetime] = []
+    for params, value in event.all("EXDATE"):
+        for item in value.split(","):
+            if item.strip():
+                try:
+                    out.append(parse_datetime_value(item, params)[0])
+                except ValueError:
+                    continue
+    return out
+
+
+def all_day_bounds(start: datetime, end: Optional[datetime]) -> Tuple[datetime, datetime]:
+    """Evento de dia inteiro: DTEND é exclusivo; sem DTEND dura um dia."""
+    begin = datetime.combine(start.date(), time.min)
+    finish = datetime.combine((end or start + timedelta(days=1)).date(), time.min)
+    if finish <= begin:
+        finish = begin + timedelta(days=1)
+    return begin, finish
@@ -0,0 +1,82 @@
+"""Operações sobre intervalos semiabertos [início, fim) — varredura ordenada (sweep line)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+_END = 0  # no mesmo instante, fins são processados antes de inícios: encostar não é conflito
+_START = 1
+
+
+@dataclass(frozen=True)
+class Interval:
+    start: datetime
+    end: datetime
+    key: Any = None
+
+
+def overlapping_pairs(
+    candidates: Sequence[Interval], existing: Sequence[Interval]
+) -> List[Tuple[Interval, Interval]]:
+    """
+    Pares (candidato, existente) que se sobrepõem, em O((n + m) log(n + m) + k).
+    Sobreposições dentro do mesmo grupo não são reportadas.
+    """
+    points: List[Tuple[datetime, int, int, int]] = []
+    for side, intervals in ((0, candidates), (1, existing)):
+        for index, interval in enumerate(intervals):
+            if interval.start >= interval.end:
+                continue
+            points.append((interval.start, _START, side, index))
+            points.append((interval.end, _END, side, index))
+    points.sort()
+
+    active: Tuple[Dict[int, Interval], Dict[int, Interval]] = ({}, {})
+    pairs: List[Tuple[Interval, Interval]] = []
+    for _, kind, side, index in points:
+        if kind == _END:
+            active[side].pop(index, None)
+            continue
+        interval = (candidates, existing)[side][index]
+        for other in active[1 - side].values():
+            pairs.append((interval, other) if side == 0 else (other, interval))
+        active[side][index] = interval
+    return pairs
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """União ordenada: intervalos que se sobrepõem ou se encostam viram um só (sem `key`)."""
+    merged: List[Interval] = []
+    for interval in sorted(intervals, key=lambda i: (i.start, i.end)):
+        if interval.start >= interval.end:
+            continue
+        if merged and interval.start <= merged[-1].end:
+            if interval.end > merged[-1].end:
+                merged[-1] = Interval(merged[-1].start, interval.end)
+            continue
+        merged.append(Interval(interval.start, interval.end))
+    return merged
+
+
+def subtract_intervals(windows: Sequence[Interval], busy: Sequence[Interval]) -> List[Interval]:
+    """
+    `windows` menos `busy`, ambos ordenados e sem sobreposição internos
+    (saída de `merge_intervals`). Dois ponteiros, O(n + m).
+    """
+    free: List[Interval] = []
+    j = 0
+    for window in windows:
+        cursor = window.start
+        while j < len(busy) and busy[j].end <= cursor:
+            j += 1
+        k = j
+        while k < len(busy) and busy[k].start < window.end:
+            if busy[k].start > cursor:
+                free.append(Interval(cursor, busy[k].start, window.key))
+            cursor = max(cursor, busy[k].end)
+            k += 1
+        if cursor < window.end:
+            free.append(Interval(cursor, window.end, window.key))
+    return free
@@ -0,0 +1,38 @@
+"""Métricas de latência em processo: contadores por desfecho + percentis das últimas N amostras."""
+
+import threading
+from collections import Counter, deque
+from typing import Deque, Dict, Optional
+
+
+class LatencyRecorder:
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._outcomes: Counter = Counter()
+
+    def record(self, outcome: str, seconds: Optional[float] = None) -> None:
+        with self._lock:
+            self._outcomes[outcome] += 1
+            if seconds is not None:
+                self._samples.append(seconds)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            samples = sorted(self._samples)
+            outcomes = dict(self._outcomes)
+
+        def percentile(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            index = min(len(samples) - 1, int(round(p * (len(samples) - 1))))
+            return round(samples[index] * 1000, 2)
+
+        return {
+            "outcomes": outcomes,
+            "samples": len(samples),
+            "p50Ms": percentile(0.50),
+            "p95Ms": percentile(0.95),
+            "p99Ms": percentile(0.99),
+            "maxMs": round(samples[-1] * 1000, 2) if samples else None,
+        }
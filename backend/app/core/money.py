@@ -0,0 +1,24 @@
+"""
+Valores monetários em centavos inteiros.
+
+O banco guarda `INTEGER` (centavos): somas e comparações no SQLite são exatas e feitas em
+aritmética inteira. A API continua em `Decimal` com duas casas; a conversão fica aqui.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional
+
+CENT = Decimal("0.01")
+
+
+def to_cents(value: Any) -> int:
+    """Decimal/str/int/float → centavos (arredondamento comercial, meio para cima)."""
+    if isinstance(value, float):
+        value = str(value)  # evita carregar o erro binário do float para o Decimal
+    return int((Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP) * 100).to_integral_value())
+
+
+def from_cents(cents: Optional[int]) -> Optional[Decimal]:
+    if cents is None:
+        return None
+    return (Decimal(int(cents)) / 100).quantize(CENT)
@@ -0,0 +1,122 @@
+"""
+Índice de busca textual (SQLite FTS5) sobre contatos, documentos, eventos e tarefas,
+e por trigramas sobre usuários (gestão de usuários).
+
+Cada entidade tem uma tabela virtual `<tabela>_fts` de conteúdo externo (o texto fica só na
+tabela original; o FTS guarda o índice invertido), mantida por triggers de INSERT/UPDATE/DELETE.
+Em produção as tabelas e triggers vêm da migração; `install_search_ddl` replica o mesmo DDL
+no `create_all` (testes e bancos novos sem Alembic).
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from sqlalchemy import MetaData
+from sqlalchemy import event as sa_event
+
+# Sem acento e sem diferenciar maiúsculas: "joao" encontra "João".
+SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+# Marcadores do trecho destacado; viram <mark> depois de escapar o HTML.
+SNIPPET_OPEN = "\x02"
+SNIPPET_CLOSE = "\x03"
+SNIPPET_TOKENS = 12
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    entity: str
+    table: str
+    title_column: str
+    columns: Tuple[Tuple[str, float], ...]  # (coluna, peso no bm25)
+    tokenizer: str = SEARCH_TOKENIZER
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+    @property
+    def column_names(self) -> List[str]:
+        return [name for name, _weight in self.columns]
+
+
+SEARCH_SOURCES: Tuple[SearchSource, ...] = (
+    SearchSource(
+        "contact",
+        "contacts",
+        "full_name",
+        (("full_name", 10.0), ("email", 5.0), ("company", 3.0), ("role", 2.0), ("notes", 1.0)),
+    ),
+    SearchSource("document", "documents", "name", (("name", 1.0),)),
+    SearchSource("event", "events", "title", (("title", 10.0), ("description", 1.0), ("location", 3.0))),
+    SearchSource("task", "tasks", "title", (("title", 10.0), ("description", 1.0))),
+)
+SEARCH_ENTITIES = tuple(source.entity for source in SEARCH_SOURCES)
+
+# Gestão de usuários: `users.search_text` (nome + e-mail já normalizados) com trigramas, para
+# "contém" em qualquer posição (inclusive no meio do e-mail). Fora da busca geral (/search).
+USER_SEARCH_SOURCE = SearchSource("user", "users", "name", (("search_text", 1.0),), tokenizer="trigram")
+USER_SEARCH_MIN_LENGTH = 3  # o trigram só casa termos com 3+ caracteres
+
+INDEXED_SOURCES: Tuple[SearchSource, ...] = SEARCH_SOURCES + (USER_SEARCH_SOURCE,)
+
+
+def trigram_expression(folded: str) -> str:
+    """Um termo normalizado como frase literal do trigram (aspas internas dobradas)."""
+    return '"' + folded.replace('"', '""') + '"'
+
+
+def match_expression(query: str) -> str:
+    """Termos do usuário como prefixos entre aspas (E implícito); nada da sintaxe FTS5 passa adiante."""
+    terms = _TERM.findall(query or "")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def create_statements(source: SearchSource) -> List[str]:
+    columns = ", ".join(source.column_names)
+    new_values = ", ".join(f"new.{name}" for name in source.column_names)
+    old_values = ", ".join(f"old.{name}" for name in source.column_names)
+    fts, table = source.fts_table, source.table
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+    insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, content='{table}', "
+        f"content_rowid='id', tokenize='{source.tokenizer}')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        # Só as colunas indexadas: mudar updated_at/executive_id não mexe no índice.
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def drop_statements(source: SearchSource) -> List[str]:
+    fts = source.fts_table
+    return [f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ("ai", "ad", "au")] + [f"DROP TABLE IF EXISTS {fts}"]
+
+
+def is_search_table(name: str) -> bool:
+    """Tabelas virtuais e suas tabelas-sombra (`*_fts_data`, `*_fts_idx`...), fora do metadata."""
+    return any(name == source.fts_table or name.startswith(source.fts_table + "_") for source in INDEXED_SOURCES)
+
+
+def install_search_ddl(metadata: MetaData) -> None:
+    def _create(_target, connection, **_kw):
+        if connection.dialect.name != "sqlite":
+            return
+        for source in INDEXED_SOURCES:
+            for statement in create_statements(source):
+                connection.exec_driver_sql(statement)
+
+    def _drop(_target, connection, **_kw):
+        if connection.dialect.name != "sqlite":
+            return
+        for source in INDEXED_SOURCES:
+            for statement in drop_statements(source):
+                connection.exec_driver_sql(statement)
+
+    sa_event.listen(metadata, "after_create", _create)
+    sa_event.listen(metadata, "before_drop", _drop)
@@ -0,0 +1,20 @@
+"""Formatação de mensagens Server-Sent Events (text/event-stream)."""
+
+import json
+from typing import Any, Optional
+
+SSE_HEARTBEAT_SECONDS = 15.0
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+SSE_HEARTBEAT = ": ping\n\n"
+
+
+def sse_message(event: str, data: Any, event_id: Optional[Any] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'), ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def sse_retry(milliseconds: int) -> str:
+    return f"retry: {milliseconds}\n\n"
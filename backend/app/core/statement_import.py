@@ -0,0 +1,152 @@
+"""
+Leitura em streaming de planilhas (CSV) e extratos bancários (OFX) para importação de lançamentos.
+
+Os iteradores devolvem um registro por vez (`número da linha/transação`, campos brutos), sem
+carregar o arquivo inteiro; a conversão para ExpenseCreate fica no serviço.
+"""
+
+import csv
+import itertools
+import re
+import unicodedata
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterator, Optional, TextIO, Tuple
+
+# campo do lançamento → cabeçalhos aceitos (normalizados: minúsculas, sem acento nem pontuação)
+CSV_COLUMN_ALIASES = {
+    "description": ("descricao", "description", "historico", "memo", "lancamento"),
+    "amount": ("valor", "amount", "valorrs", "quantia"),
+    "expense_date": ("data", "date", "expensedate", "datalancamento", "datadolancamento"),
+    "entry_type": ("tipo", "type", "entrytype"),
+    "category": ("categoria", "category"),
+    "status": ("status", "situacao"),
+    "entity_type": ("entidade", "entitytype", "tipodepessoa", "pessoa"),
+    "receipt_url": ("comprovante", "receipturl", "recibo"),
+}
+CSV_REQUIRED_FIELDS = ("description", "amount", "expense_date")
+
+_OFX_TOKEN = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+_OFX_READ_SIZE = 64 * 1024
+
+
+def normalize_header(value: str) -> str:
+    folded = unicodedata.normalize("NFKD", value or "").encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]", "", folded.lower())
+
+
+def parse_amount(value: str) -> Decimal:
+    """Aceita "1.234,56", "1234.56", "R$ -10,00" e "(10,00)" (negativo)."""
+    text = (value or "").strip().replace("R$", "").replace("\u00a0", "").replace(" ", "")
+    negative = text.startswith("(") and text.endswith(")")
+    text = text.strip("()")
+    if "," in text and "." in text:
+        if text.rfind(",") > text.rfind("."):
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+    elif "," in text:
+        text = text.replace(",", ".")
+    elif text.count(".") == 1 and len(text.rsplit(".", 1)[1]) == 3 and text.lstrip("-+").split(".")[0] not in ("", "0"):
+        text = text.replace(".", "")  # "1.234" = milhar
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Valor inválido: {value!r}.")
+    if not amount.is_finite():
+        raise ValueError(f"Valor inválido: {value!r}.")
+    return -amount if negative else amount
+
+
+_DAY_FIRST = re.compile(r"^(\d{1,2})[/-](\d{1,2})[/-](\d{4}|\d{2})$")
+_YEAR_FIRST = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})")
+
+
+def parse_date(value: str) -> date:
+    """dd/mm/aaaa, dd-mm-aaaa, dd/mm/aa, aaaa-mm-dd ou o formato OFX (aaaammdd[hhmmss][.xxx][fuso])."""
+    text = (value or "").strip()
+    try:
+        match = _DAY_FIRST.match(text)
+        if match:
+            day, month, year = (int(part) for part in match.groups())
+            return date(year + 2000 if year < 100 else year, month, day)
+        match = _YEAR_FIRST.match(text)
+        if match:
+            return date(*(int(part) for part in match.groups()))
+    except ValueError:
+        pass
+    raise ValueError(f"Data inválida: {value!r}.")
+
+
+def iter_csv_records(text: TextIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Linhas do CSV como {campo: valor bruto}, com o delimitador (";" ou ",") deduzido do cabeçalho.
+    O número devolvido é a linha no arquivo (o cabeçalho é a 1).
+    """
+    header_line = text.readline()
+    if not header_line.strip():
+        raise ValueError("Arquivo vazio.")
+    delimiter = ";" if header_line.count(";") >= header_line.count(",") else ","
+    reader = csv.reader(itertools.chain([header_line], text), delimiter=delimiter)
+    header = [normalize_header(name) for name in next(reader)]
+    positions: Dict[str, int] = {}
+    for field, aliases in CSV_COLUMN_ALIASES.items():
+        for index, name in enumerate(header):
+            if name in aliases:
+                positions[field] = index
+                break
+    missing = [field for field in CSV_REQUIRED_FIELDS if field not in positions]
+    if missing:
+        raise ValueError("Colunas obrigatórias ausentes: descrição, valor e data.")
+    for values in reader:
+        if not any(value.strip() for value in values):
+            continue
+        record = {
+            field: values[index].strip() if index < len(values) else ""
+            for field, index in positions.items()
+        }
+        yield reader.line_num, record
+
+
+def _iter_ofx_tokens(text: TextIO) -> Iterator[Tuple[bool, str, str]]:
+    """(fechamento?, TAG, texto) em blocos de 64 KiB; funciona com OFX 1.x (SGML) e 2.x (XML)."""
+    buffer = ""
+    while True:
+        block = text.read(_OFX_READ_SIZE)
+        buffer += block
+        cut = len(buffer) if not block else buffer.rfind("<")
+        if cut > 0:
+            for match in _OFX_TOKEN.finditer(buffer, 0, cut):
+                yield bool(match.group(1)), match.group(2).upper(), match.group(3).strip()
+            buffer = buffer[cut:]
+        if not block:
+            return
+
+
+def iter_ofx_transactions(text: TextIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Cada <STMTTRN> como {fitid, amount, expense_date, description}; o número é a ordem no extrato."""
+    current: Optional[Dict[str, str]] = None
+    index = 0
+    for closing, tag, value in _iter_ofx_tokens(text):
+        if tag == "STMTTRN":
+            if current is not None:  # fechamento, ou nova transação sem </STMTTRN> (SGML tolerante)
+                index += 1
+                yield index, _ofx_record(current)
+            current = None if closing else {}
+            continue
+        if current is not None and not closing and value:
+            current[tag] = value
+    if current is not None:
+        index += 1
+        yield index, _ofx_record(current)
+
+
+def _ofx_record(fields: Dict[str, str]) -> Dict[str, str]:
+    name, memo = fields.get("NAME", ""), fields.get("MEMO", "")
+    parts = [name] + ([memo] if memo and memo != name else [])
+    return {
+        "fitid": fields.get("FITID", ""),
+        "amount": fields.get("TRNAMT", ""),
+        "expense_date": fields.get("DTPOSTED", ""),
+        "description": " - ".join(part for part in parts if part),
+    }
@@ -0,0 +1,10 @@
+"""Normalização de texto para busca: sem acentos, sem diferença de caixa e com espaços colapsados."""
+
+import unicodedata
+
+
+def fold_text(value: str) -> str:
+    """"  José  da CONCEIÇÃO " → "jose da conceicao"."""
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
@@ -1,4 +1,6 @@
 # main.py
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -14,7 +16,10 @@ if _env_path.is_file():
     load_dotenv(_env_path)
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core import captcha_service
 from app.core.allowed_origins import LOCAL_ORIGIN_REGEX, get_cors_origins, origin_is_allowed
+from app.services import email_queue, email_templates, reminder_scheduler, report_jobs, typeahead_index
+from app.services.change_feed_service import install_change_tracking
 
 # Importa o roteador de usuários que acabamos de criar
 from app.routers import (
@@ -37,9 +42,36 @@ from app.routers import (
     support,
     expense_category,
     expense,
+    changes,
+    sync,
+    dashboard,
+    search,
+    typeahead,
+    composite,
 )
 
-app = FastAPI(title="Executiva Cloud API", description="Executiva Cloud API")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    install_change_tracking()
+    # Índice do autocompletar acompanha as gravações do ORM (baldes carregam sob demanda).
+    typeahead_index.install()
+    # Compila os templates de e-mail uma vez; erro de template aparece já no arranque.
+    email_templates.load_templates()
+    # Worker da fila de e-mails (EMAIL_QUEUE_ENABLED=false desliga, ex.: testes).
+    email_queue.start()
+    # Agendador de lembretes (REMINDER_SCHEDULER_ENABLED=false desliga, ex.: testes).
+    await reminder_scheduler.start()
+    # Pool de jobs de relatório + agendamentos (REPORT_JOBS_ENABLED=false desliga, ex.: testes).
+    report_jobs.start()
+    yield
+    await reminder_scheduler.stop()
+    await asyncio.to_thread(report_jobs.stop)
+    await asyncio.to_thread(email_queue.stop)
+    await captcha_service.aclose()
+
+
+app = FastAPI(title="Executiva Cloud API", description="Executiva Cloud API", lifespan=lifespan)
 
 origins = get_cors_origins()
 
@@ -87,6 +119,12 @@ app.include_router(report.router)
 app.include_router(support.router)
 app.include_router(expense_category.router)
 app.include_router(expense.router)
+app.include_router(changes.router)
+app.include_router(sync.router)
+app.include_router(dashboard.router)
+app.include_router(search.router)
+app.include_router(typeahead.router)
+app.include_router(composite.router)
 
 
 @app.exception_handler(OperationalError)
@@ -22,3 +22,38 @@ from app.models import task_model  # noqa: F401
 from app.models import report_model  # noqa: F401
 from app.models import expense_category_model  # noqa: F401 — antes de expense (FK)
 from app.models import expense_model  # noqa: F401
+from app.models import expense_rollup_model  # noqa: F401
+from app.models import sync_tombstone_model  # noqa: F401
+from app.models import outbound_email_model  # noqa: F401
+from app.models import report_job_model  # noqa: F401
+
+from app.core.database import Base  # noqa: E402
+from app.core.search_index import install_search_ddl  # noqa: E402
+
+install_search_ddl(Base.metadata)  # tabelas FTS5 + triggers também no create_all (fora do metadata)
+
+from app.models.contact_model import Contact  # noqa: E402
+from app.models.contact_type_model import ContactType  # noqa: E402
+from app.models.document_category_model import DocumentCategory  # noqa: E402
+from app.models.document_model import Document  # noqa: E402
+from app.models.event_model import Event  # noqa: E402
+from app.models.event_type_model import EventType  # noqa: E402
+from app.models.expense_category_model import ExpenseCategory  # noqa: E402
+from app.models.expense_model import Expense  # noqa: E402
+from app.models.task_model import Task  # noqa: E402
+from app.models.sync_tombstone_model import install_tombstones  # noqa: E402
+
+# Entidades do feed de alterações (/changes) e do delta sync (/sync), com o nome usado nos avisos.
+TRACKED_ENTITIES = (
+    (Event, "event"),
+    (Task, "task"),
+    (Contact, "contact"),
+    (Expense, "expense"),
+    (Document, "document"),
+    (EventType, "eventType"),
+    (ContactType, "contactType"),
+    (ExpenseCategory, "expenseCategory"),
+    (DocumentCategory, "documentCategory"),
+)
+
+install_tombstones(TRACKED_ENTITIES)  # exclusões → tombstones em qualquer sessão, sem depender do lifespan
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -16,6 +18,11 @@ class Contact(Base):
     notes = Column(Text, nullable=True)
     contact_type_id = Column(Integer, ForeignKey("contact_types.id"), nullable=True)
     executive_id = Column(Integer, ForeignKey("executives.id"), nullable=False, index=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (Index("ix_contacts_executive_id_updated_at", "executive_id", "updated_at"),)
 
     contact_type = relationship("ContactType", back_populates="contacts")
     executive = relationship("Executive")
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -13,6 +15,11 @@ class Document(Base):
     category_id = Column(Integer, ForeignKey("document_categories.id"), nullable=True)
     executive_id = Column(Integer, ForeignKey("executives.id"), nullable=False, index=True)
     upload_date = Column(DateTime, nullable=False, index=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (Index("ix_documents_executive_id_updated_at", "executive_id", "updated_at"),)
 
     category = relationship("DocumentCategory", back_populates="documents")
     executive = relationship("Executive")
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -18,6 +20,16 @@ class Event(Base):
     reminder_minutes = Column(Integer, nullable=True)
     recurrence_id = Column(String, nullable=True, index=True)
     recurrence = Column(JSON, nullable=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index("ix_events_executive_id_updated_at", "executive_id", "updated_at"),
+        Index("ix_events_executive_id_end_time", "executive_id", "end_time"),
+        Index("ix_events_executive_id_start_time", "executive_id", "start_time"),
+        Index("ix_events_start_time_reminder_minutes", "start_time", "reminder_minutes"),
+    )
 
     event_type = relationship("EventType", back_populates="events")
     executive = relationship("Executive")
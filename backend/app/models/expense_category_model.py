@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -6,12 +8,18 @@ from app.core.database import Base
 
 class ExpenseCategory(Base):
     __tablename__ = "expense_categories"
-    __table_args__ = (UniqueConstraint("executive_id", "name", name="uq_expense_category_exec_name"),)
+    __table_args__ = (
+        UniqueConstraint("executive_id", "name", name="uq_expense_category_exec_name"),
+        Index("ix_expense_categories_executive_id_updated_at", "executive_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     executive_id = Column(Integer, ForeignKey("executives.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     color = Column(String, nullable=False, default="#64748b")
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
     executive = relationship("Executive")
     expenses = relationship("Expense", back_populates="category")
@@ -1,7 +1,13 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Numeric
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Numeric, DateTime, Index, type_coerce
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.money import from_cents, to_cents
 
 
 class Expense(Base):
@@ -16,12 +22,34 @@ class Expense(Base):
         index=True,
     )
     description = Column(String, nullable=False)
-    amount = Column(Numeric(14, 2), nullable=False)
+    amount_cents = Column(Integer, nullable=False)  # centavos; use `amount` (Decimal) fora das agregações
     expense_date = Column(Date, nullable=False, index=True)
     entry_type = Column(String, nullable=False)  # "A pagar" | "A receber" (JSON alias: type)
     entity_type = Column(String, nullable=False)  # Pessoa Física | Pessoa Jurídica
     status = Column(String, nullable=False)
     receipt_url = Column(Text, nullable=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index("ix_expenses_executive_id_updated_at", "executive_id", "updated_at"),
+        Index("ix_expenses_executive_id_expense_date", "executive_id", "expense_date"),
+    )
 
     executive = relationship("Executive")
     category = relationship("ExpenseCategory", back_populates="expenses")
+
+    @hybrid_property
+    def amount(self) -> Optional[Decimal]:
+        return from_cents(self.amount_cents)
+
+    @amount.inplace.setter
+    def _amount_setter(self, value: Any) -> None:
+        self.amount_cents = None if value is None else to_cents(value)
+
+    @amount.inplace.expression
+    @classmethod
+    def _amount_expression(cls):
+        # só para SELECT/filtros; somas devem usar `amount_cents` (inteiro, exato)
+        return type_coerce(cls.amount_cents / 100.0, Numeric(14, 2))
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
+
+from app.core.database import Base
+
+
+class ExpenseMonthlyRollup(Base):
+    """
+    Totais de lançamentos por (executivo, mês, categoria, tipo, status), mantidos por delta
+    pelo ExpenseRepository na mesma transação do lançamento. Recalcule do zero com
+    `python -m app.commands.rebuild_expense_rollup`.
+    """
+
+    __tablename__ = "expense_monthly_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    executive_id = Column(Integer, ForeignKey("executives.id"), nullable=False)
+    month = Column(Date, nullable=False)  # primeiro dia do mês
+    expense_category_id = Column(Integer, nullable=True)  # sem FK: ao excluir a categoria, o grupo migra para NULL
+    entry_type = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    expense_count = Column(Integer, nullable=False, default=0)
+    total_cents = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index(
+            "ix_expense_monthly_rollups_bucket",
+            "executive_id",
+            "month",
+            "expense_category_id",
+            "entry_type",
+            "status",
+        ),
+    )
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, Index
+
+from app.core.database import Base
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+FREQUENCY_DAILY = "daily"
+FREQUENCY_WEEKLY = "weekly"
+FREQUENCY_MONTHLY = "monthly"
+
+
+class ReportJob(Base):
+    """Geração de relatório fora do request; o worker atualiza o progresso a cada seção."""
+
+    __tablename__ = "report_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String(16), nullable=False, default=JOB_QUEUED)
+    progress = Column(Integer, nullable=False, default=0)  # 0–100
+    current_section = Column(String(32), nullable=True)
+    # Parâmetros do relatório (ReportGenerateRequest) e executivos já resolvidos no escopo de quem pediu
+    params = Column(JSON, nullable=False)
+    executive_ids = Column(JSON, nullable=True)  # None = todos (master)
+    report_id = Column(Integer, ForeignKey("reports.id", ondelete="SET NULL"), nullable=True)
+    schedule_id = Column(Integer, ForeignKey("report_schedules.id", ondelete="SET NULL"), nullable=True)
+    requested_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (Index("ix_report_jobs_status_created_at", "status", "created_at"),)
+
+
+class ReportSchedule(Base):
+    """Relatório recorrente: no horário de baixa (next_run_at) vira um ReportJob do período anterior."""
+
+    __tablename__ = "report_schedules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    frequency = Column(String(16), nullable=False)  # daily | weekly | monthly
+    params = Column(JSON, nullable=False)
+    executive_ids = Column(JSON, nullable=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    next_run_at = Column(DateTime, nullable=False, index=True)
+    last_run_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
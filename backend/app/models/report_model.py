@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, JSON, ForeignKey, LargeBinary, UniqueConstraint
 
 from app.core.database import Base
 
@@ -18,5 +18,23 @@ class Report(Base):
     include_tasks = Column(Boolean, nullable=False, default=True)
     include_contacts = Column(Boolean, nullable=False, default=True)
     total_records = Column(Integer, nullable=False, default=0)
-    generated_data = Column(JSON, nullable=False, default=list)
+    row_count = Column(Integer, nullable=False, default=0)  # linhas em report_chunks
+    summary = Column(JSON, nullable=True)  # contagens/somas por seção calculadas no SQL
+    # {seção: {executive_id: {rows, maxId, maxUpdatedAt, groups: [[grupo, qtd, centavos]]}}}: o que mudou desde a geração
+    fingerprints = Column(JSON, nullable=True)
     generated_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+class ReportChunk(Base):
+    """Bloco de linhas do relatório: JSON comprimido (zlib); lido só quando a página o cobre."""
+
+    __tablename__ = "report_chunks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    report_id = Column(Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False)
+    chunk_index = Column(Integer, nullable=False)
+    first_row = Column(Integer, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    payload = Column(LargeBinary, nullable=False)
+
+    __table_args__ = (UniqueConstraint("report_id", "chunk_index", name="uq_report_chunks_report_id_chunk_index"),)
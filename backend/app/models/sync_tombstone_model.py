@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, Integer, String, DateTime, Index, insert
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core import change_feed
+from app.core.database import Base
+
+
+class SyncTombstone(Base):
+    """Registro de exclusão para o delta sync (GET /sync); sem FK — a linha original já não existe."""
+
+    __tablename__ = "sync_tombstones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String(32), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    executive_id = Column(Integer, nullable=True)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_sync_tombstones_executive_id_deleted_at", "executive_id", "deleted_at"),
+        Index("ix_sync_tombstones_deleted_at", "deleted_at"),
+    )
+
+
+# modelo → nome da entidade no delta sync; preenchido por `install_tombstones`
+_ENTITIES: Dict[type, str] = {}
+
+
+def record_tombstones(connection: Connection, rows: Sequence[Tuple[str, int, Optional[int]]]) -> None:
+    """Grava tombstones na transação corrente (dentro do flush: SQL direto na conexão)."""
+    if rows:
+        connection.execute(
+            insert(SyncTombstone.__table__),
+            [
+                {"entity": entity, "entity_id": entity_id, "executive_id": executive_id}
+                for entity, entity_id, executive_id in rows
+            ],
+        )
+
+
+def _record_statement_deletes(session: Session, rows: Sequence[Tuple[str, int, Optional[int]]]) -> None:
+    record_tombstones(session.connection(), rows)
+
+
+def _after_delete(mapper, connection: Connection, target) -> None:
+    record_tombstones(connection, [(_ENTITIES[type(target)], target.id, getattr(target, "executive_id", None))])
+
+
+def install_tombstones(tracked: Iterable[Tuple[type, str]]) -> None:
+    """
+    Exclusões viram tombstones do delta sync em qualquer sessão, com ou sem o feed de alterações
+    (scripts, testes, workers sem lifespan): `after_delete` do mapper cobre o unit of work, e
+    os DELETE por statement chegam via `change_feed.track_rows`.
+    """
+    for model, entity in tracked:
+        if not sa_event.contains(model, "after_delete", _after_delete):
+            sa_event.listen(model, "after_delete", _after_delete)
+        _ENTITIES[model] = entity
+    change_feed.add_delete_sink(_record_statement_deletes)
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, JSON
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, JSON, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -16,5 +18,13 @@ class Task(Base):
     executive_id = Column(Integer, ForeignKey("executives.id"), nullable=False, index=True)
     recurrence_id = Column(String, nullable=True, index=True)
     recurrence = Column(JSON, nullable=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index("ix_tasks_executive_id_updated_at", "executive_id", "updated_at"),
+        Index("ix_tasks_executive_id_due_date", "executive_id", "due_date"),
+    )
 
     executive = relationship("Executive")
@@ -1,7 +1,8 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, event
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.text_normalize import fold_text
 
 
 class Usuario(Base):
@@ -22,6 +23,8 @@ class Usuario(Base):
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=True)
     executive_id = Column(Integer, ForeignKey("executives.id"), nullable=True)
     secretary_external_id = Column(String(64), nullable=True)
+    # nome + e-mail sem acento/caixa; indexado por trigramas em users_fts (busca da gestão de usuários)
+    search_text = Column(String, nullable=False, default="", server_default="")
 
     legal_organization = relationship("LegalOrganization", foreign_keys=[legal_organization_id])
     organization = relationship("Organization", foreign_keys=[organization_id])
@@ -31,3 +34,9 @@ class Usuario(Base):
         back_populates="user",
         cascade="all, delete-orphan",
     )
+
+
+@event.listens_for(Usuario, "before_insert")
+@event.listens_for(Usuario, "before_update")
+def _refresh_search_text(_mapper, _connection, target: Usuario) -> None:
+    target.search_text = fold_text(f"{target.name or ''} {target.email or ''}")
@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.contact_model import Contact
+from app.models.document_model import Document
+from app.models.event_model import Event
+from app.models.expense_category_model import ExpenseCategory
+from app.models.expense_model import Expense
+from app.models.task_model import Task
+
+# chave da resposta → modelo contado
+DASHBOARD_COUNTED = {
+    "events": Event,
+    "expenses": Expense,
+    "tasks": Task,
+    "contacts": Contact,
+    "documents": Document,
+}
+
+
+def _scoped(query, model, executive_ids: Optional[Iterable[int]]):
+    if executive_ids is None:
+        return query
+    return query.where(model.executive_id.in_(list(executive_ids)))
+
+
+class DashboardRepository:
+    """Consultas do painel: poucas, agregadas e apoiadas nos índices (executive_id, data)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def entity_counts(self, executive_ids: Optional[Iterable[int]]) -> Dict[str, int]:
+        """Contagem por entidade num único UNION ALL."""
+        ids = None if executive_ids is None else list(executive_ids)
+        parts = [
+            _scoped(select(literal(name).label("entity"), func.count(model.id).label("total")), model, ids)
+            for name, model in DASHBOARD_COUNTED.items()
+        ]
+        return {entity: total for entity, total in self.db.execute(union_all(*parts)).all()}
+
+    def upcoming_events(self, executive_ids: Optional[Iterable[int]], now: datetime, limit: int) -> List[Event]:
+        query = select(Event).where(Event.start_time >= now).order_by(Event.start_time, Event.id).limit(limit)
+        return list(self.db.scalars(_scoped(query, Event, executive_ids)).all())
+
+    def count_events_between(self, executive_ids: Optional[Iterable[int]], start: datetime, end: datetime) -> int:
+        query = select(func.count(Event.id)).where(Event.start_time >= start, Event.start_time <= end)
+        return self.db.execute(_scoped(query, Event, executive_ids)).scalar() or 0
+
+    def recent_expenses(self, executive_ids: Optional[Iterable[int]], limit: int) -> List[Tuple[Expense, Optional[str]]]:
+        query = (
+            select(Expense, ExpenseCategory.name)
+            .outerjoin(ExpenseCategory, ExpenseCategory.id == Expense.expense_category_id)
+            .order_by(Expense.expense_date.desc(), Expense.id.desc())
+            .limit(limit)
+        )
+        return [tuple(row) for row in self.db.execute(_scoped(query, Expense, executive_ids)).all()]
+
+    def task_counts(self, executive_ids: Optional[Iterable[int]]) -> List[Tuple[str, str, int]]:
+        """(prioridade, status, quantidade) por GROUP BY."""
+        query = select(Task.priority, Task.status, func.count(Task.id)).group_by(Task.priority, Task.status)
+        return [tuple(row) for row in self.db.execute(_scoped(query, Task, executive_ids)).all()]
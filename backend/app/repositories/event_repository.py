@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.change_feed import OP_CREATE, OP_DELETE, track_rows
 from app.models import event_model as models
 
 
@@ -25,6 +27,91 @@ class EventRepository:
             query = query.filter(self.model.executive_id == executive_id)
         return query.order_by(self.model.start_time.asc()).offset(skip).limit(limit).all()
 
+    def feed_stats(self, executive_id: int) -> Tuple[int, Optional[int], Optional[datetime]]:
+        """(total, maior id, última alteração) — coberto por ix_events_executive_id_updated_at."""
+        row = (
+            self.db.query(
+                func.count(self.model.id),
+                func.max(self.model.id),
+                func.max(self.model.updated_at),
+            )
+            .filter(self.model.executive_id == executive_id)
+            .one()
+        )
+        return int(row[0] or 0), row[1], row[2]
+
+    def iter_for_feed(self, executive_id: int, batch_size: int = 500) -> Iterator[models.Event]:
+        """Eventos avulsos primeiro, depois cada série contígua (recurrence_id, start_time)."""
+        return (
+            self.db.query(self.model)
+            .options(joinedload(self.model.event_type))
+            .filter(self.model.executive_id == executive_id)
+            .order_by(
+                self.model.recurrence_id.asc(),
+                self.model.start_time.asc(),
+                self.model.id.asc(),
+            )
+            .yield_per(batch_size)
+        )
+
+    def get_intervals(
+        self,
+        executive_ids: Sequence[int],
+        window_start: datetime,
+        window_end: datetime,
+        exclude_ids: Sequence[int] = (),
+        exclude_recurrence_id: Optional[str] = None,
+    ) -> List[Any]:
+        """Intervalos que tocam a janela, só as colunas necessárias (ix_events_executive_id_end_time)."""
+        query = self.db.query(
+            self.model.id,
+            self.model.executive_id,
+            self.model.title,
+            self.model.start_time,
+            self.model.end_time,
+            self.model.recurrence_id,
+        ).filter(
+            self.model.executive_id.in_(list(executive_ids)),
+            self.model.end_time > window_start,
+            self.model.start_time < window_end,
+        )
+        if exclude_ids:
+            query = query.filter(self.model.id.notin_(list(exclude_ids)))
+        if exclude_recurrence_id is not None:
+            query = query.filter(
+                (self.model.recurrence_id.is_(None))
+                | (self.model.recurrence_id != exclude_recurrence_id)
+            )
+        return query.order_by(self.model.start_time.asc()).all()
+
+    def max_reminder_minutes(self, from_time: datetime) -> int:
+        """Maior antecedência de lembrete entre eventos futuros (ix_events_start_time_reminder_minutes)."""
+        value = (
+            self.db.query(func.max(self.model.reminder_minutes))
+            .filter(self.model.start_time > from_time)
+            .scalar()
+        )
+        return int(value or 0)
+
+    def get_reminder_window(self, start_from: datetime, start_until: datetime) -> List[Any]:
+        """Eventos com lembrete cujo início cai em (start_from, start_until]."""
+        return (
+            self.db.query(
+                self.model.id,
+                self.model.executive_id,
+                self.model.title,
+                self.model.location,
+                self.model.start_time,
+                self.model.reminder_minutes,
+            )
+            .filter(
+                self.model.start_time > start_from,
+                self.model.start_time <= start_until,
+                self.model.reminder_minutes > 0,
+            )
+            .all()
+        )
+
     def create(self, payload: Dict[str, Any]) -> models.Event:
         db_item = self.model(**payload)
         self.db.add(db_item)
@@ -40,6 +127,17 @@ class EventRepository:
             self.db.refresh(item)
         return db_items
 
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """INSERT executemany numa única transação (sem refresh linha a linha)."""
+        if not rows:
+            return 0
+        inserted = self.db.execute(
+            insert(self.model).returning(self.model.id, self.model.executive_id), rows
+        ).all()
+        track_rows(self.db, "event", OP_CREATE, inserted)
+        self.db.commit()
+        return len(rows)
+
     def update(self, db_item: models.Event, payload: Dict[str, Any]) -> models.Event:
         for key, value in payload.items():
             setattr(db_item, key, value)
@@ -56,9 +154,25 @@ class EventRepository:
         recurrence_id: str,
         from_start_time: Optional[datetime] = None,
     ) -> int:
-        query = self.db.query(self.model).filter(self.model.recurrence_id == recurrence_id)
+        statement = delete(self.model).where(self.model.recurrence_id == recurrence_id)
         if from_start_time is not None:
-            query = query.filter(self.model.start_time >= from_start_time)
-        deleted_count = query.delete(synchronize_session=False)
+            statement = statement.where(self.model.start_time >= from_start_time)
+        deleted = self._delete_returning(statement)
         self.db.commit()
-        return deleted_count
+        return len(deleted)
+
+    def delete_occurrence(self, recurrence_id: str, start_time: datetime) -> int:
+        """Remove uma ocorrência da série sem commit (a transação é do chamador)."""
+        statement = delete(self.model).where(
+            self.model.recurrence_id == recurrence_id,
+            self.model.start_time == start_time,
+        )
+        return len(self._delete_returning(statement))
+
+    def _delete_returning(self, statement) -> List[Any]:
+        deleted = self.db.execute(
+            statement.returning(self.model.id, self.model.executive_id),
+            execution_options={"synchronize_session": False},
+        ).all()
+        track_rows(self.db, "event", OP_DELETE, deleted)
+        return deleted
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional, Set
 
 from sqlalchemy.orm import Session
 from app.models.executive_model import Executive
@@ -45,3 +45,7 @@ class ExecutiveRepository:
     def delete(self, db: Session, db_executive: Executive):
         db.delete(db_executive)
         db.commit()
+
+    def get_existing_ids(self, db: Session, executive_ids: List[int]) -> Set[int]:
+        rows = db.query(Executive.id).filter(Executive.id.in_(executive_ids)).all()
+        return {row.id for row in rows}
@@ -1,8 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.change_feed import OP_CREATE, track_rows
 from app.models import expense_category_model as models
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository
 
 
 class ExpenseCategoryRepository:
@@ -31,6 +34,22 @@ class ExpenseCategoryRepository:
             .first()
         )
 
+    def names_for_executive(self, executive_id: int) -> Dict[str, int]:
+        """nome → id das categorias do executivo, numa só consulta."""
+        rows = self.db.query(self.model.name, self.model.id).filter(self.model.executive_id == executive_id)
+        return {name: category_id for name, category_id in rows}
+
+    def bulk_create(self, executive_id: int, names: Iterable[str]) -> Dict[str, int]:
+        """Cria as categorias num INSERT em lote (sem commit: entra na transação de quem chama)."""
+        rows = [{"executive_id": executive_id, "name": name} for name in names]
+        if not rows:
+            return {}
+        inserted = self.db.execute(
+            insert(self.model).returning(self.model.id, self.model.executive_id, self.model.name), rows
+        ).all()
+        track_rows(self.db, "expenseCategory", OP_CREATE, [(row.id, row.executive_id) for row in inserted])
+        return {row.name: row.id for row in inserted}
+
     def create(self, payload: Dict[str, Any]) -> models.ExpenseCategory:
         db_item = self.model(**payload)
         self.db.add(db_item)
@@ -46,5 +65,7 @@ class ExpenseCategoryRepository:
         return db_item
 
     def delete(self, db_item: models.ExpenseCategory):
+        # os lançamentos da categoria ficam sem categoria (SET NULL): o resumo acompanha
+        ExpenseRollupRepository(db=self.db).detach_category(db_item.id)
         self.db.delete(db_item)
         self.db.commit()
@@ -1,14 +1,19 @@
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.change_feed import OP_CREATE, track_rows
 from app.models import expense_model as models
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository, rollup_key
 
 
 class ExpenseRepository:
     def __init__(self, db: Session):
         self.db = db
         self.model = models.Expense
+        self.rollups = ExpenseRollupRepository(db=db)
 
     def get_by_id(self, expense_id: int) -> Optional[models.Expense]:
         return self.db.query(self.model).filter(self.model.id == expense_id).first()
@@ -27,17 +32,42 @@ class ExpenseRepository:
     def create(self, payload: Dict[str, Any]) -> models.Expense:
         db_item = self.model(**payload)
         self.db.add(db_item)
+        self.rollups.add(db_item)
         self.db.commit()
         self.db.refresh(db_item)
         return db_item
 
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """INSERT executemany + deltas do resumo mensal numa única transação (valores em `amount_cents`)."""
+        if not rows:
+            return 0
+        inserted = self.db.execute(
+            insert(self.model).returning(self.model.id, self.model.executive_id), rows
+        ).all()
+        track_rows(self.db, "expense", OP_CREATE, inserted)
+        self.rollups.add_rows(rows)
+        self.db.commit()
+        return len(rows)
+
+    def existing_signatures(self, executive_id: int, dates: Iterable[date]) -> List[Tuple[date, int, str]]:
+        """(data, centavos, descrição) dos lançamentos do executivo nessas datas (índice executivo+data)."""
+        return [
+            tuple(row)
+            for row in self.db.query(self.model.expense_date, self.model.amount_cents, self.model.description)
+            .filter(self.model.executive_id == executive_id, self.model.expense_date.in_(list(dates)))
+            .all()
+        ]
+
     def update(self, db_item: models.Expense, payload: Dict[str, Any]) -> models.Expense:
+        old_key, old_cents = rollup_key(db_item), db_item.amount_cents
         for key, value in payload.items():
             setattr(db_item, key, value)
+        self.rollups.move(old_key, old_cents, db_item)
         self.db.commit()
         self.db.refresh(db_item)
         return db_item
 
     def delete(self, db_item: models.Expense):
+        self.rollups.remove(db_item)
         self.db.delete(db_item)
         self.db.commit()
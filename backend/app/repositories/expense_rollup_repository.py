@@ -0,0 +1,174 @@
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import extract, func, insert
+from sqlalchemy.orm import Session
+
+from app.models.expense_model import Expense
+from app.models.expense_rollup_model import ExpenseMonthlyRollup
+
+# (executive_id, mês, categoria, tipo, status)
+RollupKey = Tuple[int, date, Optional[int], str, str]
+
+
+def rollup_key(expense: Expense) -> RollupKey:
+    return (
+        expense.executive_id,
+        expense.expense_date.replace(day=1),
+        expense.expense_category_id,
+        expense.entry_type,
+        expense.status,
+    )
+
+
+def row_rollup_key(row: Dict[str, Any]) -> RollupKey:
+    """Mesma chave, a partir de um dict de colunas (gravações por statement)."""
+    return (
+        row["executive_id"],
+        row["expense_date"].replace(day=1),
+        row.get("expense_category_id"),
+        row["entry_type"],
+        row["status"],
+    )
+
+
+class ExpenseRollupRepository:
+    """Deltas e leitura de `expense_monthly_rollups`; quem chama faz o commit."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.model = ExpenseMonthlyRollup
+
+    def _bucket(self, key: RollupKey) -> Optional[ExpenseMonthlyRollup]:
+        executive_id, month, category_id, entry_type, status = key
+        category_filter = (
+            self.model.expense_category_id.is_(None)
+            if category_id is None
+            else self.model.expense_category_id == category_id
+        )
+        return (
+            self.db.query(self.model)
+            .filter(
+                self.model.executive_id == executive_id,
+                self.model.month == month,
+                category_filter,
+                self.model.entry_type == entry_type,
+                self.model.status == status,
+            )
+            .first()
+        )
+
+    def apply(self, key: RollupKey, count: int, cents: int) -> None:
+        if count == 0 and not cents:
+            return
+        bucket = self._bucket(key)
+        if bucket is None:
+            executive_id, month, category_id, entry_type, status = key
+            bucket = self.model(
+                executive_id=executive_id,
+                month=month,
+                expense_category_id=category_id,
+                entry_type=entry_type,
+                status=status,
+                expense_count=0,
+                total_cents=0,
+            )
+            self.db.add(bucket)
+        bucket.expense_count += count
+        bucket.total_cents += cents
+        if bucket.expense_count <= 0:
+            self.db.delete(bucket)
+        self.db.flush()
+
+    def add(self, expense: Expense) -> None:
+        self.apply(rollup_key(expense), 1, expense.amount_cents)
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Deltas de uma inserção em lote: um UPDATE/INSERT por grupo, não por linha."""
+        deltas: Dict[RollupKey, List[int]] = {}
+        for row in rows:
+            delta = deltas.setdefault(row_rollup_key(row), [0, 0])
+            delta[0] += 1
+            delta[1] += row["amount_cents"]
+        for key, (count, cents) in deltas.items():
+            self.apply(key, count, cents)
+
+    def remove(self, expense: Expense) -> None:
+        self.apply(rollup_key(expense), -1, -expense.amount_cents)
+
+    def move(self, old_key: RollupKey, old_cents: int, expense: Expense) -> None:
+        new_key, new_cents = rollup_key(expense), expense.amount_cents
+        if old_key == new_key:
+            self.apply(new_key, 0, new_cents - old_cents)
+            return
+        self.apply(old_key, -1, -old_cents)
+        self.apply(new_key, 1, new_cents)
+
+    def detach_category(self, category_id: int) -> None:
+        """Categoria excluída: os lançamentos ficam sem categoria, e os grupos dela também."""
+        buckets = self.db.query(self.model).filter(self.model.expense_category_id == category_id).all()
+        for bucket in buckets:
+            key = (bucket.executive_id, bucket.month, None, bucket.entry_type, bucket.status)
+            count, cents = bucket.expense_count, bucket.total_cents
+            self.db.delete(bucket)
+            self.db.flush()
+            self.apply(key, count, cents)
+
+    def rebuild(self) -> int:
+        """Recalcula a tabela inteira a partir de `expenses` (GROUP BY no banco); devolve os grupos gravados."""
+        year = extract("year", Expense.expense_date)
+        month = extract("month", Expense.expense_date)
+        grouped = (
+            self.db.query(
+                Expense.executive_id,
+                year,
+                month,
+                Expense.expense_category_id,
+                Expense.entry_type,
+                Expense.status,
+                func.count(Expense.id),
+                func.sum(Expense.amount_cents),
+            )
+            .group_by(Expense.executive_id, year, month, Expense.expense_category_id, Expense.entry_type, Expense.status)
+            .all()
+        )
+        self.db.query(self.model).delete(synchronize_session=False)
+        rows = [
+            {
+                "executive_id": executive_id,
+                "month": date(int(year_value), int(month_value), 1),
+                "expense_category_id": category_id,
+                "entry_type": entry_type,
+                "status": status,
+                "expense_count": count,
+                "total_cents": cents or 0,
+            }
+            for executive_id, year_value, month_value, category_id, entry_type, status, count, cents in grouped
+        ]
+        if rows:
+            self.db.execute(insert(self.model), rows)
+        return len(rows)
+
+    def summary_rows(
+        self,
+        executive_ids: Optional[Iterable[int]],
+        start_month: Optional[date] = None,
+        end_month: Optional[date] = None,
+    ) -> List[Tuple[date, Optional[int], str, str, int, int]]:
+        """(mês, categoria, tipo, status, quantidade, centavos): O(meses × categorias), não O(lançamentos)."""
+        query = self.db.query(
+            self.model.month,
+            self.model.expense_category_id,
+            self.model.entry_type,
+            self.model.status,
+            func.sum(self.model.expense_count),
+            func.sum(self.model.total_cents),
+        )
+        if executive_ids is not None:
+            query = query.filter(self.model.executive_id.in_(list(executive_ids)))
+        if start_month is not None:
+            query = query.filter(self.model.month >= start_month)
+        if end_month is not None:
+            query = query.filter(self.model.month <= end_month)
+        group_by = (self.model.month, self.model.expense_category_id, self.model.entry_type, self.model.status)
+        return [tuple(row) for row in query.group_by(*group_by).order_by(*group_by).all()]
@@ -0,0 +1,87 @@
+from typing import Any, Iterator, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.contact_model import Contact
+from app.models.contact_type_model import ContactType
+from app.models.event_model import Event
+from app.models.event_type_model import EventType
+from app.models.executive_model import Executive
+from app.models.expense_category_model import ExpenseCategory
+from app.models.expense_model import Expense
+
+# entidade → (modelo, colunas (cabeçalho, coluna), joins externos, ordenação)
+EXPORT_ENTITIES = {
+    "expenses": (
+        Expense,
+        (
+            ("ID", Expense.id),
+            ("Data", Expense.expense_date),
+            ("Descrição", Expense.description),
+            ("Categoria", ExpenseCategory.name),
+            ("Tipo", Expense.entry_type),
+            ("Pessoa", Expense.entity_type),
+            ("Status", Expense.status),
+            ("Valor", Expense.amount),
+            ("Executivo", Executive.full_name),
+        ),
+        ((ExpenseCategory, Expense.expense_category_id == ExpenseCategory.id),),
+        (Expense.executive_id, Expense.expense_date, Expense.id),
+    ),
+    "events": (
+        Event,
+        (
+            ("ID", Event.id),
+            ("Título", Event.title),
+            ("Início", Event.start_time),
+            ("Fim", Event.end_time),
+            ("Local", Event.location),
+            ("Tipo", EventType.name),
+            ("Executivo", Executive.full_name),
+            ("Descrição", Event.description),
+        ),
+        ((EventType, Event.event_type_id == EventType.id),),
+        (Event.executive_id, Event.start_time, Event.id),
+    ),
+    "contacts": (
+        Contact,
+        (
+            ("ID", Contact.id),
+            ("Nome", Contact.full_name),
+            ("E-mail", Contact.email),
+            ("Telefone", Contact.phone),
+            ("Empresa", Contact.company),
+            ("Cargo", Contact.role),
+            ("Tipo", ContactType.name),
+            ("Executivo", Executive.full_name),
+            ("Observações", Contact.notes),
+        ),
+        ((ContactType, Contact.contact_type_id == ContactType.id),),
+        (Contact.executive_id, Contact.full_name, Contact.id),
+    ),
+}
+
+
+class ExportRepository:
+    """Leitura em streaming para exportação: só colunas, `yield_per` (cursor no servidor, lotes)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def header(self, entity: str) -> Sequence[str]:
+        return [label for label, _ in EXPORT_ENTITIES[entity][1]]
+
+    def iter_rows(
+        self,
+        entity: str,
+        executive_ids: Optional[Set[int]],
+        batch_size: int = 1000,
+    ) -> Iterator[Tuple[Any, ...]]:
+        model, columns, joins, order = EXPORT_ENTITIES[entity]
+        query = self.db.query(*(column for _, column in columns)).select_from(model)
+        query = query.join(Executive, model.executive_id == Executive.id)
+        for target, condition in joins:
+            query = query.outerjoin(target, condition)
+        if executive_ids is not None:
+            query = query.filter(model.executive_id.in_(executive_ids))
+        return (tuple(row) for row in query.order_by(*order).yield_per(batch_size))
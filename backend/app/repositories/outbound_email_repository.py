@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.outbound_email_model import (
+    OutboundEmail,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SENDING,
+    STATUS_SENT,
+)
+
+
+class OutboundEmailRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(
+        self, to_email: str, subject: str, body_text: str, body_html: Optional[str] = None
+    ) -> OutboundEmail:
+        """Só adiciona à sessão: o commit é de quem chamou (e-mail sai junto com os dados)."""
+        row = OutboundEmail(
+            to_email=to_email,
+            subject=subject,
+            body_text=body_text,
+            body_html=body_html,
+            status=STATUS_PENDING,
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+        )
+        self.db.add(row)
+        return row
+
+    def claim_batch(self, now: datetime, limit: int, lease: timedelta) -> List[OutboundEmail]:
+        """
+        Reserva até `limit` mensagens vencidas num único UPDATE ... RETURNING, de modo que
+        dois workers (processos) não peguem a mesma linha.
+        """
+        due = (
+            select(OutboundEmail.id)
+            .where(
+                or_(
+                    and_(OutboundEmail.status == STATUS_PENDING, OutboundEmail.next_attempt_at <= now),
+                    and_(OutboundEmail.status == STATUS_SENDING, OutboundEmail.locked_until < now),
+                )
+            )
+            .order_by(OutboundEmail.next_attempt_at.asc(), OutboundEmail.id.asc())
+            .limit(limit)
+        )
+        claimed_ids = self.db.execute(
+            update(OutboundEmail)
+            .where(OutboundEmail.id.in_(due))
+            .values(status=STATUS_SENDING, locked_until=now + lease)
+            .returning(OutboundEmail.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        self.db.commit()
+        if not claimed_ids:
+            return []
+        return (
+            self.db.query(OutboundEmail)
+            .filter(OutboundEmail.id.in_(claimed_ids))
+            .order_by(OutboundEmail.next_attempt_at.asc(), OutboundEmail.id.asc())
+            .all()
+        )
+
+    def mark_sent(self, ids: Sequence[int], now: datetime) -> None:
+        if ids:
+            self.db.execute(
+                update(OutboundEmail)
+                .where(OutboundEmail.id.in_(list(ids)))
+                .values(status=STATUS_SENT, sent_at=now, locked_until=None, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+
+    def mark_retry(self, row: OutboundEmail, next_attempt_at: datetime, error: str) -> None:
+        row.status = STATUS_PENDING
+        row.attempts = (row.attempts or 0) + 1
+        row.next_attempt_at = next_attempt_at
+        row.locked_until = None
+        row.last_error = error
+
+    def mark_failed(self, row: OutboundEmail, error: str) -> None:
+        row.status = STATUS_FAILED
+        row.attempts = (row.attempts or 0) + 1
+        row.locked_until = None
+        row.last_error = error
+
+    def count_by_status(self, status: str) -> int:
+        return self.db.query(OutboundEmail).filter(OutboundEmail.status == status).count()
+
+    def prune_sent(self, before: datetime) -> int:
+        deleted = (
+            self.db.query(OutboundEmail)
+            .filter(OutboundEmail.status == STATUS_SENT, OutboundEmail.sent_at < before)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
@@ -0,0 +1,132 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.report_job_model import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    ReportJob,
+    ReportSchedule,
+)
+
+
+class ReportJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # --- jobs -----------------------------------------------------------------------------
+
+    def create_job(self, payload: Dict[str, Any]) -> ReportJob:
+        job = ReportJob(status=JOB_QUEUED, progress=0, **payload)
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def get_job(self, job_id: int) -> Optional[ReportJob]:
+        return self.db.get(ReportJob, job_id)
+
+    def queued_ids(self, limit: int) -> List[int]:
+        rows = (
+            self.db.query(ReportJob.id)
+            .filter(ReportJob.status == JOB_QUEUED)
+            .order_by(ReportJob.created_at.asc(), ReportJob.id.asc())
+            .limit(limit)
+        )
+        return [row.id for row in rows]
+
+    def claim(self, job_id: int, now: datetime) -> bool:
+        """queued → running num UPDATE condicional: só um worker (thread ou processo) executa o job."""
+        result = self.db.execute(
+            update(ReportJob)
+            .where(ReportJob.id == job_id, ReportJob.status == JOB_QUEUED)
+            .values(status=JOB_RUNNING, started_at=now, progress=0)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def requeue_interrupted(self) -> int:
+        """Jobs que estavam rodando quando o processo caiu voltam para a fila."""
+        result = self.db.execute(
+            update(ReportJob)
+            .where(ReportJob.status == JOB_RUNNING)
+            .values(status=JOB_QUEUED, progress=0, current_section=None, started_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def set_progress(self, job: ReportJob, progress: int, section: Optional[str]) -> None:
+        job.progress = progress
+        job.current_section = section
+        self.db.commit()
+
+    def mark_succeeded(self, job: ReportJob, report_id: int, now: datetime) -> None:
+        job.status = JOB_SUCCEEDED
+        job.progress = 100
+        job.current_section = None
+        job.report_id = report_id
+        job.finished_at = now
+        self.db.commit()
+
+    def mark_failed(self, job: ReportJob, error: str, now: datetime) -> None:
+        job.status = JOB_FAILED
+        job.current_section = None
+        job.error = error
+        job.finished_at = now
+        self.db.commit()
+
+    # --- agendamentos ----------------------------------------------------------------------
+
+    def create_schedule(self, payload: Dict[str, Any]) -> ReportSchedule:
+        schedule = ReportSchedule(**payload)
+        self.db.add(schedule)
+        self.db.commit()
+        self.db.refresh(schedule)
+        return schedule
+
+    def get_schedule(self, schedule_id: int) -> Optional[ReportSchedule]:
+        return self.db.get(ReportSchedule, schedule_id)
+
+    def list_schedules(self, owner_id: Optional[int]) -> List[ReportSchedule]:
+        query = self.db.query(ReportSchedule)
+        if owner_id is not None:
+            query = query.filter(ReportSchedule.owner_id == owner_id)
+        return query.order_by(ReportSchedule.next_run_at.asc(), ReportSchedule.id.asc()).all()
+
+    def enqueue_scheduled(
+        self, schedule: ReportSchedule, params: Dict[str, Any], now: datetime, next_run_at: datetime
+    ) -> int:
+        """Cria o job da execução e avança o agendamento na mesma transação (não duplica)."""
+        job = ReportJob(
+            status=JOB_QUEUED,
+            progress=0,
+            params=params,
+            executive_ids=schedule.executive_ids,
+            schedule_id=schedule.id,
+            requested_by_id=schedule.owner_id,
+        )
+        self.db.add(job)
+        schedule.last_run_at = now
+        schedule.next_run_at = next_run_at
+        self.db.flush()
+        job_id = job.id
+        self.db.commit()
+        return job_id
+
+    def delete_schedule(self, schedule: ReportSchedule) -> None:
+        self.db.delete(schedule)
+        self.db.commit()
+
+    def due_schedules(self, now: datetime) -> List[ReportSchedule]:
+        return (
+            self.db.query(ReportSchedule)
+            .filter(ReportSchedule.is_active.is_(True), ReportSchedule.next_run_at <= now)
+            .order_by(ReportSchedule.next_run_at.asc(), ReportSchedule.id.asc())
+            .all()
+        )
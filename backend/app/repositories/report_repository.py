@@ -1,8 +1,28 @@
-from typing import List, Optional, Dict, Any
+import json
+import os
+import zlib
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from sqlalchemy import func, insert, literal
 from sqlalchemy.orm import Session
 
+from app.models.contact_model import Contact
+from app.models.event_model import Event
+from app.models.expense_model import Expense
 from app.models import report_model as models
+from app.models.task_model import Task
+
+
+REPORT_CHUNK_ROWS = int(os.getenv("REPORT_CHUNK_ROWS", "500"))
+
+
+def encode_report_chunk(rows: List[Dict[str, Any]]) -> bytes:
+    return zlib.compress(json.dumps(rows, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def decode_report_chunk(payload: bytes) -> List[Dict[str, Any]]:
+    return json.loads(zlib.decompress(payload))
 
 
 class ReportRepository:
@@ -14,22 +34,214 @@ class ReportRepository:
         return self.db.query(self.model).filter(self.model.id == report_id).first()
 
     def get_all(self, skip: int = 0, limit: int = 1000) -> List[models.Report]:
+        """Só metadados: as linhas ficam em report_chunks e não são lidas aqui."""
         return self.db.query(self.model).order_by(self.model.generated_at.desc()).offset(skip).limit(limit).all()
 
-    def create(self, payload: Dict[str, Any]) -> models.Report:
+    def create(self, payload: Dict[str, Any], rows: Optional[List[Dict[str, Any]]] = None) -> models.Report:
         db_item = self.model(**payload)
         self.db.add(db_item)
+        self.db.flush()
+        self._write_rows(db_item, rows or [])
         self.db.commit()
         self.db.refresh(db_item)
         return db_item
 
-    def update(self, db_item: models.Report, payload: Dict[str, Any]) -> models.Report:
+    def update(
+        self, db_item: models.Report, payload: Dict[str, Any], rows: Optional[List[Dict[str, Any]]] = None
+    ) -> models.Report:
         for key, value in payload.items():
             setattr(db_item, key, value)
+        if rows is not None:
+            self._delete_rows(db_item.id)
+            self._write_rows(db_item, rows)
         self.db.commit()
         self.db.refresh(db_item)
         return db_item
 
     def delete(self, db_item: models.Report):
+        self._delete_rows(db_item.id)
         self.db.delete(db_item)
         self.db.commit()
+
+    def _write_rows(self, db_item: models.Report, rows: List[Dict[str, Any]]) -> None:
+        db_item.row_count = len(rows)
+        if not rows:
+            return
+        self.db.execute(
+            insert(models.ReportChunk),
+            [
+                {
+                    "report_id": db_item.id,
+                    "chunk_index": index,
+                    "first_row": start,
+                    "row_count": len(rows[start : start + REPORT_CHUNK_ROWS]),
+                    "payload": encode_report_chunk(rows[start : start + REPORT_CHUNK_ROWS]),
+                }
+                for index, start in enumerate(range(0, len(rows), REPORT_CHUNK_ROWS))
+            ],
+        )
+
+    def _delete_rows(self, report_id: int) -> None:
+        self.db.query(models.ReportChunk).filter(models.ReportChunk.report_id == report_id).delete(
+            synchronize_session=False
+        )
+
+    def get_rows(self, report_id: int, skip: int, limit: int) -> List[Dict[str, Any]]:
+        """Linhas [skip, skip + limit): descomprime só os blocos que cobrem a página."""
+        chunk = models.ReportChunk
+        payloads = (
+            self.db.query(chunk.first_row, chunk.payload)
+            .filter(
+                chunk.report_id == report_id,
+                chunk.first_row < skip + limit,
+                chunk.first_row + chunk.row_count > skip,
+            )
+            .order_by(chunk.chunk_index)
+            .all()
+        )
+        rows: List[Dict[str, Any]] = []
+        for first_row, payload in payloads:
+            block = decode_report_chunk(payload)
+            rows.extend(block[max(skip - first_row, 0) : skip + limit - first_row])
+        return rows
+
+    def iter_chunks(self, report_id: int) -> Iterator[List[Dict[str, Any]]]:
+        """Blocos do relatório em ordem, um descomprimido por vez."""
+        chunk = models.ReportChunk
+        query = (
+            self.db.query(chunk.payload)
+            .filter(chunk.report_id == report_id)
+            .order_by(chunk.chunk_index)
+            .yield_per(4)
+        )
+        for (payload,) in query:
+            yield decode_report_chunk(payload)
+
+
+# seção → (modelo, coluna da janela de datas, colunas exportadas, coluna de agrupamento extra)
+REPORT_SECTIONS = {
+    "events": (
+        Event,
+        Event.start_time,
+        (
+            Event.id.label("id"),
+            Event.executive_id.label("executiveId"),
+            Event.title.label("title"),
+            Event.start_time.label("startTime"),
+            Event.end_time.label("endTime"),
+            Event.location.label("location"),
+            Event.event_type_id.label("eventTypeId"),
+        ),
+        None,
+    ),
+    "expenses": (
+        Expense,
+        Expense.expense_date,
+        (
+            Expense.id.label("id"),
+            Expense.executive_id.label("executiveId"),
+            Expense.description.label("description"),
+            Expense.amount.label("amount"),
+            Expense.expense_date.label("expenseDate"),
+            Expense.entry_type.label("type"),
+            Expense.status.label("status"),
+            Expense.expense_category_id.label("categoryId"),
+        ),
+        Expense.entry_type,
+    ),
+    "tasks": (
+        Task,
+        Task.due_date,
+        (
+            Task.id.label("id"),
+            Task.executive_id.label("executiveId"),
+            Task.title.label("title"),
+            Task.due_date.label("dueDate"),
+            Task.priority.label("priority"),
+            Task.status.label("status"),
+        ),
+        Task.status,
+    ),
+    # contatos não têm data: entram todos os dos executivos selecionados
+    "contacts": (
+        Contact,
+        None,
+        (
+            Contact.id.label("id"),
+            Contact.executive_id.label("executiveId"),
+            Contact.full_name.label("fullName"),
+            Contact.email.label("email"),
+            Contact.phone.label("phone"),
+            Contact.company.label("company"),
+            Contact.role.label("role"),
+        ),
+        None,
+    ),
+}
+
+
+class ReportDataRepository:
+    """Consultas da geração de relatórios: só colunas, filtradas por (executive_id, data) indexado."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _windowed(self, query, section: str, executive_ids: Optional[Sequence[int]], start: Optional[date], end: Optional[date]):
+        model, date_column, _, _ = REPORT_SECTIONS[section]
+        if executive_ids is not None:
+            query = query.filter(model.executive_id.in_(executive_ids))
+        if date_column is None:
+            return query
+        is_datetime = date_column.type.python_type is datetime
+        if start is not None:
+            query = query.filter(date_column >= (datetime.combine(start, time.min) if is_datetime else start))
+        if end is not None:
+            if is_datetime:
+                query = query.filter(date_column < datetime.combine(end + timedelta(days=1), time.min))
+            else:
+                query = query.filter(date_column <= end)
+        return query
+
+    def section_rows(
+        self,
+        section: str,
+        executive_ids: Optional[Sequence[int]],
+        start: Optional[date],
+        end: Optional[date],
+    ) -> List[Any]:
+        model, date_column, columns, _ = REPORT_SECTIONS[section]
+        query = self._windowed(self.db.query(*columns), section, executive_ids, start, end)
+        order = [model.executive_id] + ([date_column] if date_column is not None else []) + [model.id]
+        return query.order_by(*order).all()
+
+    def section_fingerprints(
+        self,
+        section: str,
+        executive_ids: Optional[Sequence[int]],
+        start: Optional[date],
+        end: Optional[date],
+    ) -> Dict[int, Tuple[int, int, Optional[datetime]]]:
+        """executive_id → (linhas, maior id, maior updated_at) na janela: detecta inclusão, edição e exclusão."""
+        model = REPORT_SECTIONS[section][0]
+        query = self.db.query(model.executive_id, func.count(model.id), func.max(model.id), func.max(model.updated_at))
+        query = self._windowed(query, section, executive_ids, start, end)
+        return {
+            executive_id: (count, max_id, max_updated_at)
+            for executive_id, count, max_id, max_updated_at in query.group_by(model.executive_id)
+        }
+
+    def section_aggregates(
+        self,
+        section: str,
+        executive_ids: Optional[Sequence[int]],
+        start: Optional[date],
+        end: Optional[date],
+    ) -> List[Tuple[int, Optional[str], int, Any]]:
+        """(executive_id, grupo, quantidade, soma em centavos) por GROUP BY no banco, em aritmética inteira."""
+        model, _, _, bucket = REPORT_SECTIONS[section]
+        bucket_column = bucket if bucket is not None else literal(None)
+        amount = func.sum(Expense.amount_cents) if model is Expense else literal(None)
+        query = self.db.query(model.executive_id, bucket_column, func.count(model.id), amount)
+        query = self._windowed(query, section, executive_ids, start, end)
+        group_by = [model.executive_id] + ([bucket] if bucket is not None else [])
+        return [tuple(row) for row in query.group_by(*group_by).all()]
@@ -0,0 +1,56 @@
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.core.search_index import SEARCH_SOURCES, SNIPPET_CLOSE, SNIPPET_OPEN, SNIPPET_TOKENS, SearchSource
+
+# (entidade, id, executive_id, título, trecho, rank)
+SearchRow = Tuple[str, int, int, str, str, float]
+
+
+def _source_select(source: SearchSource, scoped: bool) -> str:
+    fts = source.fts_table
+    weights = ", ".join(str(weight) for _name, weight in source.columns)
+    scope = " AND base.executive_id IN :executive_ids" if scoped else ""
+    return (
+        f"SELECT '{source.entity}' AS entity, base.id AS id, base.executive_id AS executive_id, "
+        f"base.{source.title_column} AS title, "
+        f"snippet({fts}, -1, :open_mark, :close_mark, '…', {SNIPPET_TOKENS}) AS snippet, "
+        f"bm25({fts}, {weights}) AS rank "
+        f"FROM {fts} JOIN {source.table} AS base ON base.id = {fts}.rowid "
+        f"WHERE {fts} MATCH :match{scope}"
+    )
+
+
+class SearchRepository:
+    """Busca nas tabelas FTS5; ordem estável por (rank, entidade, id) para paginação por cursor."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        match: str,
+        executive_ids: Optional[Iterable[int]],
+        entities: Sequence[str],
+        limit: int,
+        after: Optional[Tuple[float, str, int]] = None,
+    ) -> List[SearchRow]:
+        scoped = executive_ids is not None
+        union = " UNION ALL ".join(
+            _source_select(source, scoped) for source in SEARCH_SOURCES if source.entity in entities
+        )
+        keyset = ""
+        params = {"match": match, "open_mark": SNIPPET_OPEN, "close_mark": SNIPPET_CLOSE, "limit": limit}
+        if after is not None:
+            keyset = (
+                "WHERE rank > :after_rank OR (rank = :after_rank AND "
+                "(entity > :after_entity OR (entity = :after_entity AND id > :after_id))) "
+            )
+            params.update(after_rank=after[0], after_entity=after[1], after_id=after[2])
+        statement = text(f"SELECT * FROM ({union}) {keyset}ORDER BY rank, entity, id LIMIT :limit")
+        if scoped:
+            statement = statement.bindparams(bindparam("executive_ids", expanding=True))
+            params["executive_ids"] = list(executive_ids)
+        return [tuple(row) for row in self.db.execute(statement, params).all()]
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Any, List, Optional, Set
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.models.sync_tombstone_model import SyncTombstone
+
+
+class SyncRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def changed_since(
+        self,
+        model: Any,
+        since: Optional[datetime],
+        until: datetime,
+        executive_ids: Optional[Set[int]],
+    ) -> List[Any]:
+        """Linhas com updated_at em (since, until] — coberto por (executive_id, updated_at)."""
+        query = self.db.query(model).filter(model.updated_at <= until)
+        if since is not None:
+            query = query.filter(model.updated_at > since)
+        if executive_ids is not None and hasattr(model, "executive_id"):
+            query = query.filter(model.executive_id.in_(executive_ids))
+        return query.order_by(model.updated_at.asc(), model.id.asc()).all()
+
+    def tombstones_since(
+        self, since: datetime, until: datetime, executive_ids: Optional[Set[int]]
+    ) -> List[SyncTombstone]:
+        query = self.db.query(SyncTombstone).filter(
+            SyncTombstone.deleted_at > since, SyncTombstone.deleted_at <= until
+        )
+        if executive_ids is not None:
+            query = query.filter(
+                or_(
+                    SyncTombstone.executive_id.is_(None),
+                    SyncTombstone.executive_id.in_(executive_ids),
+                )
+            )
+        return query.order_by(SyncTombstone.deleted_at.asc(), SyncTombstone.id.asc()).all()
+
+    def prune_tombstones(self, before: datetime) -> int:
+        deleted = (
+            self.db.query(SyncTombstone)
+            .filter(SyncTombstone.deleted_at < before)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
@@ -1,8 +1,10 @@
 from datetime import date
 from typing import List, Optional, Dict, Any
 
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
+from app.core.change_feed import OP_DELETE, track_rows
 from app.models import task_model as models
 
 
@@ -56,9 +58,13 @@ class TaskRepository:
         recurrence_id: str,
         from_due_date: Optional[date] = None,
     ) -> int:
-        query = self.db.query(self.model).filter(self.model.recurrence_id == recurrence_id)
+        statement = delete(self.model).where(self.model.recurrence_id == recurrence_id)
         if from_due_date is not None:
-            query = query.filter(self.model.due_date >= from_due_date)
-        deleted_count = query.delete(synchronize_session=False)
+            statement = statement.where(self.model.due_date >= from_due_date)
+        deleted = self.db.execute(
+            statement.returning(self.model.id, self.model.executive_id),
+            execution_options={"synchronize_session": False},
+        ).all()
+        track_rows(self.db, "task", OP_DELETE, deleted)
         self.db.commit()
-        return deleted_count
+        return len(deleted)
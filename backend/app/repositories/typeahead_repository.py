@@ -0,0 +1,39 @@
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import null
+from sqlalchemy.orm import Session
+
+from app.models.contact_model import Contact
+from app.models.executive_model import Executive
+
+# (id, executivo dono, nome, e-mail, CPF)
+TypeaheadRow = Tuple[int, int, str, Optional[str], Optional[str]]
+
+# Limite de parâmetros por IN (SQLite aceita 32766; folga para outros bancos)
+_OWNER_CHUNK = 900
+
+
+class TypeaheadRepository:
+    """Linhas mínimas (id, dono, nome, e-mail, CPF) para montar os baldes do autocompletar."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def rows(self, kind: str, owner_ids: Iterable[int]) -> List[TypeaheadRow]:
+        owners = list(owner_ids)
+        result: List[TypeaheadRow] = []
+        for start in range(0, len(owners), _OWNER_CHUNK):
+            chunk = owners[start : start + _OWNER_CHUNK]
+            if kind == "executive":
+                query = self.db.query(
+                    Executive.id, Executive.id, Executive.full_name, Executive.work_email, Executive.cpf
+                ).filter(Executive.id.in_(chunk))
+            else:
+                query = self.db.query(
+                    Contact.id, Contact.executive_id, Contact.full_name, Contact.email, null()
+                ).filter(Contact.executive_id.in_(chunk))
+            result.extend(tuple(row) for row in query.all())
+        return result
+
+    def all_executive_ids(self) -> List[int]:
+        return [row_id for (row_id,) in self.db.query(Executive.id).all()]
@@ -1,13 +1,16 @@
 from typing import Any, Optional
 
-from fastapi import APIRouter, Body, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, status
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import get_current_user, get_invite_frontend_base
+from app.core.captcha_service import get_verifier
 from app.models import user_model as user_models
 from app.schemas import auth_schema as schemas
 from app.schemas.executive_schema import ExecutiveProfileComplete
 from app.services.auth_service import AuthService, _user_to_public
-from app.services.invite_service import InviteService
+from app.services.invite_service import InviteService, parse_bulk_invite_csv
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -22,13 +25,23 @@ def login(body: schemas.LoginRequest, service: AuthService = Depends(AuthService
     response_model=schemas.RegisterOrganizationResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def register_organization(
+async def register_organization(
     body: schemas.RegisterOrganizationRequest,
+    request: Request,
     service: AuthService = Depends(AuthService),
     frontend_base: str = Depends(get_invite_frontend_base),
 ):
     """Cadastro público: organização jurídica + administrador da organização."""
-    return service.register_organization(body, frontend_base)
+    remote_ip = request.client.host if request.client else None
+    return await service.register_organization(body, frontend_base, remote_ip=remote_ip)
+
+
+@router.get("/captcha/metrics", response_model=schemas.CaptchaMetrics)
+def captcha_metrics(current: user_models.Usuario = Depends(get_current_user)):
+    """Métricas da verificação de CAPTCHA (apenas master)."""
+    if current.role != "master":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Apenas o master pode ver métricas.")
+    return get_verifier().snapshot()
 
 
 @router.post("/bootstrap-master", response_model=schemas.TokenResponse, status_code=status.HTTP_201_CREATED)
@@ -69,6 +82,44 @@ def invite_user(
     return service.invite_user(current, body, frontend_base)
 
 
+async def _bulk_invite_payload(request: Request) -> schemas.BulkInviteRequest:
+    """JSON ({invites, organizationId}), CSV puro (text/csv) ou multipart com campo `file`."""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    organization_id = request.query_params.get("organization_id")
+    try:
+        if content_type == "multipart/form-data":
+            form = await request.form()
+            upload = form.get("file")
+            if upload is None or isinstance(upload, str):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Envie o CSV no campo file.")
+            rows = parse_bulk_invite_csv(await upload.read())
+        elif content_type in ("text/csv", "application/csv", "text/plain"):
+            rows = parse_bulk_invite_csv(await request.body())
+        else:
+            return schemas.BulkInviteRequest.model_validate(await request.json())
+        return schemas.BulkInviteRequest(invites=rows, organizationId=organization_id)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=exc.errors()) from exc
+    except ValueError as exc:  # JSON malformado
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Corpo da requisição inválido.") from exc
+
+
+@router.post("/invite-users/bulk", response_model=schemas.BulkInviteResult)
+async def invite_users_bulk(
+    current: user_models.Usuario = Depends(get_current_user),
+    payload: schemas.BulkInviteRequest = Depends(_bulk_invite_payload),
+    service: InviteService = Depends(InviteService),
+    frontend_base: str = Depends(get_invite_frontend_base),
+):
+    """
+    Convites em lote. CSV: cabeçalho fullName,email,invitedRole,organizationId,secretaryExecutiveIds
+    (ids separados por ';'); `?organization_id=` vale para linhas sem empresa.
+    """
+    return await run_in_threadpool(
+        service.invite_users_bulk, current, payload.invites, frontend_base, payload.organization_id
+    )
+
+
 @router.get("/invite-status", response_model=schemas.InviteTokenStatusResponse)
 def invite_status(token: str, service: InviteService = Depends(InviteService)):
     return service.invite_token_status(token)
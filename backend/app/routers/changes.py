@@ -0,0 +1,28 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.sse import SSE_HEADERS
+from app.services.change_feed_service import ChangeScope, resolve_change_scope, stream_changes
+
+router = APIRouter(prefix="/changes", tags=["Changes"])
+
+
+@router.get("/stream")
+async def stream_change_feed(
+    request: Request,
+    last_event_id: Optional[int] = Query(None),
+    last_event_id_header: Optional[int] = Header(None, alias="Last-Event-ID"),
+    scope: ChangeScope = Depends(resolve_change_scope),
+):
+    """
+    Server-Sent Events com avisos compactos (entity, id, op, version) das entidades que o
+    usuário enxerga. Reconexões com Last-Event-ID recebem o que perderam; `reset` pede recarga.
+    """
+    since = last_event_id_header if last_event_id_header is not None else last_event_id
+    return StreamingResponse(
+        stream_changes(scope, request.is_disconnected, last_event_id=since),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Request, Response
+
+from app.api.deps import get_current_user
+from app.models import user_model as user_models
+from app.schemas import composite_schema as schemas
+from app.services.composite_service import CompositeService
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+
+@router.post("", response_model=schemas.CompositeResponse)
+async def run_batch(
+    payload: schemas.CompositeRequest,
+    request: Request,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: CompositeService = Depends(CompositeService),
+):
+    """
+    Várias leituras (GET) numa requisição: autentica uma vez e usa uma só sessão de banco.
+    Cada item de `responses` traz o status e o corpo que a chamada avulsa devolveria.
+    """
+    body = await service.run(request, current, payload)
+    return Response(content=body, media_type="application/json")
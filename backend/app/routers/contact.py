@@ -1,9 +1,16 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from app.api.deps import get_current_user
+from app.core.tabular_export import EXPORT_MEDIA_TYPES, export_headers
+from app.models import user_model as user_models
+from app.schemas import batch_schema
 from app.schemas import contact_schema as schemas
+from app.services.batch_service import BatchService
 from app.services.contact_service import ContactService
+from app.services.export_service import ExportService
 
 
 router = APIRouter(prefix="/contacts", tags=["Contacts"])
@@ -20,6 +27,16 @@ def create_contact(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
 
 
+@router.post("/batch", response_model=batch_schema.BatchResult)
+def batch_contacts(
+    payload: batch_schema.BatchRequest,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: BatchService = Depends(BatchService),
+):
+    """Contatos: create/update/delete em lote numa transação (`mode`: all_or_nothing ou best_effort), com resultado por item."""
+    return service.run(current, "contacts", payload)
+
+
 @router.get("/", response_model=List[schemas.Contact])
 def list_contacts(
     skip: int = 0,
@@ -30,6 +47,21 @@ def list_contacts(
     return service.get_all_contacts(skip=skip, limit=limit, executive_id=executive_id)
 
 
+@router.get("/export")
+def export_contacts(
+    export_format: Literal["csv", "xlsx"] = Query("csv", alias="format"),
+    executive_id: Optional[int] = None,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ExportService = Depends(ExportService),
+):
+    """Contatos em CSV ou XLSX, lidos do banco em lotes e enviados em streaming."""
+    return StreamingResponse(
+        service.iter_entity(current, "contacts", export_format, executive_id=executive_id),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=export_headers("contatos", export_format),
+    )
+
+
 @router.get("/{contact_id}", response_model=schemas.Contact)
 def get_contact(
     contact_id: int,
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.deps import get_current_user
+from app.models import user_model as user_models
+from app.schemas import dashboard_schema as schemas
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("/summary", response_model=schemas.DashboardSummary)
+def get_dashboard_summary(
+    executive_id: Optional[int] = None,
+    limit: int = Query(5, ge=1, le=50),
+    days: int = Query(7, ge=1, le=90),
+    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    current: user_models.Usuario = Depends(get_current_user),
+    service: DashboardService = Depends(DashboardService),
+):
+    """Próximos eventos, lançamentos recentes, tarefas em aberto, totais do mês e contagens (cache de poucos segundos)."""
+    try:
+        return service.get_summary(current, executive_id=executive_id, limit=limit, days=days, month=month)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
@@ -1,14 +1,38 @@
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from app.api.deps import get_current_user
+from app.core.calendar_feed_token import verify_calendar_feed_token
+from app.core.sse import SSE_HEADERS
+from app.core.tabular_export import EXPORT_MEDIA_TYPES, export_headers
+from app.models import user_model as user_models
+from app.schemas import batch_schema
 from app.schemas import event_schema as schemas
-from app.services.event_service import EventService
+from app.services.availability_service import AvailabilityService
+from app.services.batch_service import BatchService
+from app.services.calendar_feed_service import CalendarFeedService
+from app.services.change_feed_service import ChangeScope, resolve_change_scope
+from app.services.event_import_service import EventImportService
+from app.services.event_service import EventConflictError, EventService
+from app.services.export_service import ExportService
+from app.services.reminder_scheduler import sse_channel as reminder_sse_channel
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
 
+def _conflict_response(error: EventConflictError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "detail": str(error),
+            "conflicts": [c.model_dump(by_alias=True, mode="json") for c in error.conflicts],
+        },
+    )
+
+
 @router.get("/", response_model=List[schemas.Event])
 def get_all_events(
     skip: int = 0,
@@ -22,26 +46,128 @@ def get_all_events(
 @router.post("/series", response_model=List[schemas.Event], status_code=status.HTTP_201_CREATED)
 def create_event_series(
     payload: schemas.EventSeriesCreate,
+    conflicts: schemas.ConflictMode = "ignore",
     service: EventService = Depends(EventService),
 ):
     try:
-        return service.create_series(payload)
+        return service.create_series(payload, conflict_mode=conflicts)
+    except EventConflictError as error:
+        return _conflict_response(error)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+@router.post("/import", response_model=schemas.EventImportResult)
+def import_events(
+    executive_id: int,
+    event_type_id: Optional[int] = None,
+    file: UploadFile = File(...),
+    service: EventImportService = Depends(EventImportService),
+):
+    """Importa um arquivo iCalendar (.ics); RRULE suportadas viram séries."""
+    try:
+        return service.import_ics(file.file, executive_id=executive_id, event_type_id=event_type_id)
     except ValueError as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
 
 
+@router.post("/availability", response_model=schemas.AvailabilityResult)
+def find_availability(
+    payload: schemas.AvailabilityRequest,
+    service: AvailabilityService = Depends(AvailabilityService),
+):
+    """Horários livres em comum entre executivos, ranqueados, com livre/ocupado por executivo."""
+    try:
+        return service.find_availability(payload)
+    except ValueError as error:
+        detail = str(error)
+        status_code = status.HTTP_404_NOT_FOUND if "não encontrado" in detail else status.HTTP_400_BAD_REQUEST
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
 @router.put("/series/{recurrence_id}", response_model=List[schemas.Event])
 def replace_event_series(
     recurrence_id: str,
     payload: schemas.EventSeriesCreate,
+    conflicts: schemas.ConflictMode = "ignore",
     service: EventService = Depends(EventService),
 ):
     try:
-        return service.replace_series(recurrence_id, payload)
+        return service.replace_series(recurrence_id, payload, conflict_mode=conflicts)
+    except EventConflictError as error:
+        return _conflict_response(error)
     except ValueError as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
 
 
+@router.get("/export")
+def export_events(
+    export_format: Literal["csv", "xlsx"] = Query("csv", alias="format"),
+    executive_id: Optional[int] = None,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ExportService = Depends(ExportService),
+):
+    """Eventos em CSV ou XLSX, lidos do banco em lotes e enviados em streaming."""
+    return StreamingResponse(
+        service.iter_entity(current, "events", export_format, executive_id=executive_id),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=export_headers("agenda", export_format),
+    )
+
+
+@router.get("/reminders/stream")
+async def stream_reminders(
+    request: Request,
+    executive_id: Optional[List[int]] = Query(None),
+    scope: ChangeScope = Depends(resolve_change_scope),
+):
+    """
+    Server-Sent Events com os lembretes disparados pelo agendador, só dos executivos visíveis.
+    O escopo vem de uma sessão curta: o assinante não segura conexão do pool enquanto escuta.
+    """
+    executive_ids = scope.executive_ids
+    if executive_id:
+        executive_ids = set(executive_id) if executive_ids is None else set(executive_id) & executive_ids
+    return StreamingResponse(
+        reminder_sse_channel.stream(request.is_disconnected, executive_ids=executive_ids),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.get("/feed/{executive_id}/link", response_model=schemas.CalendarFeedLink)
+def get_calendar_feed_link(
+    executive_id: int,
+    request: Request,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: CalendarFeedService = Depends(CalendarFeedService),
+):
+    token = service.issue_feed_token(current, executive_id)
+    url = request.url_for("get_calendar_feed", executive_id=executive_id).include_query_params(token=token)
+    return schemas.CalendarFeedLink(executiveId=executive_id, feedUrl=str(url))
+
+
+@router.get("/feed/{executive_id}.ics", name="get_calendar_feed")
+def get_calendar_feed(
+    executive_id: int,
+    token: str,
+    request: Request,
+    service: CalendarFeedService = Depends(CalendarFeedService),
+):
+    """Assinatura iCalendar (RFC 5545) com ETag/Last-Modified para polling barato."""
+    if not verify_calendar_feed_token(executive_id, token):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Agenda não encontrada.")
+    fingerprint = service.fingerprint(executive_id)
+    headers = fingerprint.headers()
+    if fingerprint.matches(request.headers):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return StreamingResponse(
+        service.iter_calendar(executive_id),
+        media_type="text/calendar; charset=utf-8",
+        headers={**headers, "Content-Disposition": f'inline; filename="agenda-{executive_id}.ics"'},
+    )
+
+
 @router.get("/{event_id}", response_model=schemas.Event)
 def get_event(
     event_id: int,
@@ -56,22 +182,38 @@ def get_event(
 @router.post("/", response_model=schemas.Event, status_code=status.HTTP_201_CREATED)
 def create_event(
     payload: schemas.EventCreate,
+    conflicts: schemas.ConflictMode = "ignore",
     service: EventService = Depends(EventService),
 ):
     try:
-        return service.create_event(payload)
+        return service.create_event(payload, conflict_mode=conflicts)
+    except EventConflictError as error:
+        return _conflict_response(error)
     except ValueError as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
 
 
+@router.post("/batch", response_model=batch_schema.BatchResult)
+def batch_events(
+    payload: batch_schema.BatchRequest,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: BatchService = Depends(BatchService),
+):
+    """Eventos: create/update/delete em lote numa transação (`mode`: all_or_nothing ou best_effort), com resultado por item."""
+    return service.run(current, "events", payload)
+
+
 @router.put("/{event_id}", response_model=schemas.Event)
 def update_event(
     event_id: int,
     payload: schemas.EventUpdate,
+    conflicts: schemas.ConflictMode = "ignore",
     service: EventService = Depends(EventService),
 ):
     try:
-        return service.update_event(event_id, payload)
+        return service.update_event(event_id, payload, conflict_mode=conflicts)
+    except EventConflictError as error:
+        return _conflict_response(error)
     except ValueError as error:
         detail = str(error)
         status_code = status.HTTP_404_NOT_FOUND if "não encontrado" in detail else status.HTTP_400_BAD_REQUEST
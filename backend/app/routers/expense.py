@@ -1,9 +1,17 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 
+from app.api.deps import get_current_user
+from app.core.tabular_export import EXPORT_MEDIA_TYPES, export_headers
+from app.models import user_model as user_models
+from app.schemas import batch_schema
 from app.schemas import expense_schema as schemas
+from app.services.batch_service import BatchService
+from app.services.expense_import_service import ExpenseImportService
 from app.services.expense_service import ExpenseService
+from app.services.export_service import ExportService
 
 router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
@@ -18,6 +26,36 @@ def list_expenses(
     return service.get_all_expenses(skip=skip, limit=limit, executive_id=executive_id)
 
 
+@router.get("/export")
+def export_expenses(
+    export_format: Literal["csv", "xlsx"] = Query("csv", alias="format"),
+    executive_id: Optional[int] = None,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ExportService = Depends(ExportService),
+):
+    """Lançamentos em CSV ou XLSX, lidos do banco em lotes e enviados em streaming."""
+    return StreamingResponse(
+        service.iter_entity(current, "expenses", export_format, executive_id=executive_id),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=export_headers("financeiro", export_format),
+    )
+
+
+@router.get("/summary", response_model=schemas.ExpenseSummary)
+def get_expense_summary(
+    executive_id: Optional[int] = None,
+    start_month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    end_month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ExpenseService = Depends(ExpenseService),
+):
+    """Totais por mês, categoria, tipo e status, lidos do resumo mensal (custo independe do nº de lançamentos)."""
+    try:
+        return service.get_summary(current, executive_id=executive_id, start_month=start_month, end_month=end_month)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/{expense_id}", response_model=schemas.Expense)
 def get_expense(
     expense_id: int,
@@ -40,6 +78,47 @@ def create_expense(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/batch", response_model=batch_schema.BatchResult)
+def batch_expenses(
+    payload: batch_schema.BatchRequest,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: BatchService = Depends(BatchService),
+):
+    """Lançamentos: create/update/delete em lote numa transação (`mode`: all_or_nothing ou best_effort), com resultado por item."""
+    return service.run(current, "expenses", payload)
+
+
+@router.post("/import", response_model=schemas.ExpenseImportResult)
+def import_expenses(
+    executive_id: int,
+    import_format: Optional[Literal["csv", "ofx"]] = Query(None, alias="format"),
+    create_categories: bool = False,
+    default_type: Literal["A pagar", "A receber"] = "A pagar",
+    entity_type: Literal["Pessoa Física", "Pessoa Jurídica"] = "Pessoa Jurídica",
+    file: UploadFile = File(...),
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ExpenseImportService = Depends(ExpenseImportService),
+):
+    """
+    Importa lançamentos de planilha CSV ou extrato OFX (formato deduzido da extensão se omitido).
+    Linhas já existentes (mesma data, valor e descrição) são ignoradas.
+    """
+    if import_format is None:
+        import_format = "ofx" if (file.filename or "").lower().endswith(".ofx") else "csv"
+    try:
+        return service.import_file(
+            current,
+            file.file,
+            executive_id=executive_id,
+            import_format=import_format,
+            create_categories=create_categories,
+            default_type=default_type,
+            entity_type=entity_type,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.put("/{expense_id}", response_model=schemas.Expense)
 def update_expense(
     expense_id: int,
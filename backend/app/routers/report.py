@@ -1,8 +1,13 @@
-from typing import Dict, List
+from typing import Dict, List, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from app.api.deps import get_current_user
+from app.core.tabular_export import EXPORT_MEDIA_TYPES, export_headers
+from app.models import user_model as user_models
 from app.schemas import report_schema as schemas
+from app.services.report_job_service import ReportJobService
 from app.services.report_service import ReportService
 
 
@@ -18,17 +23,109 @@ def get_all_reports(
     return service.get_all_reports(skip=skip, limit=limit)
 
 
+@router.post("/jobs", response_model=schemas.ReportJob, status_code=status.HTTP_202_ACCEPTED)
+def create_report_job(
+    payload: schemas.ReportGenerateRequest,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportJobService = Depends(ReportJobService),
+):
+    """Enfileira a geração e responde na hora; acompanhe por GET /reports/jobs/{id}."""
+    try:
+        return service.create_job(current, payload)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+@router.get("/jobs/{job_id}", response_model=schemas.ReportJob)
+def get_report_job(
+    job_id: int,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportJobService = Depends(ReportJobService),
+):
+    try:
+        return service.get_job(current, job_id)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+
+
+@router.get("/schedules", response_model=List[schemas.ReportSchedule])
+def list_report_schedules(
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportJobService = Depends(ReportJobService),
+):
+    return service.list_schedules(current)
+
+
+@router.post("/schedules", response_model=schemas.ReportSchedule, status_code=status.HTTP_201_CREATED)
+def create_report_schedule(
+    payload: schemas.ReportScheduleCreate,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportJobService = Depends(ReportJobService),
+):
+    try:
+        return service.create_schedule(current, payload)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+@router.delete("/schedules/{schedule_id}", response_model=Dict[str, str])
+def delete_report_schedule(
+    schedule_id: int,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportJobService = Depends(ReportJobService),
+):
+    try:
+        return service.delete_schedule(current, schedule_id)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+
+
 @router.get("/{report_id}", response_model=schemas.Report)
 def get_report(
     report_id: int,
+    current: user_models.Usuario = Depends(get_current_user),
     service: ReportService = Depends(ReportService),
 ):
-    db_item = service.get_report(report_id)
+    db_item = service.get_report(current, report_id)
     if not db_item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Relatório não encontrado.")
     return db_item
 
 
+@router.get("/{report_id}/rows", response_model=schemas.ReportRowsPage)
+def get_report_rows(
+    report_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=5000),
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportService = Depends(ReportService),
+):
+    """Página de linhas do relatório; só os blocos comprimidos que a cobrem são lidos."""
+    try:
+        return service.get_report_rows(current, report_id, skip=skip, limit=limit)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+
+
+@router.get("/{report_id}/export")
+def export_report(
+    report_id: int,
+    export_format: Literal["csv", "xlsx"] = Query("csv", alias="format"),
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportService = Depends(ReportService),
+):
+    """Linhas do relatório em CSV ou XLSX, enviadas em streaming."""
+    try:
+        chunks = service.iter_report_export(current, report_id, export_format)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=export_headers(f"relatorio-{report_id}", export_format),
+    )
+
+
 @router.post("/", response_model=schemas.Report, status_code=status.HTTP_201_CREATED)
 def create_report(
     payload: schemas.ReportCreate,
@@ -40,6 +137,34 @@ def create_report(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
 
 
+@router.post("/generate", response_model=schemas.Report, status_code=status.HTTP_201_CREATED)
+def generate_report(
+    payload: schemas.ReportGenerateRequest,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportService = Depends(ReportService),
+):
+    """Gera o relatório no servidor a partir dos executivos, período e seções escolhidos."""
+    try:
+        return service.generate_report(current, payload)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+
+@router.post("/{report_id}/regenerate", response_model=schemas.ReportRegeneration)
+def regenerate_report(
+    report_id: int,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: ReportService = Depends(ReportService),
+):
+    """Atualiza o relatório recalculando só os executivos cujos dados mudaram desde a geração."""
+    try:
+        return service.regenerate_report(current, report_id)
+    except ValueError as error:
+        detail = str(error)
+        status_code = status.HTTP_404_NOT_FOUND if "não encontrado" in detail else status.HTTP_400_BAD_REQUEST
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
 @router.put("/{report_id}", response_model=schemas.Report)
 def update_report(
     report_id: int,
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.deps import get_current_user
+from app.models import user_model as user_models
+from app.schemas import search_schema as schemas
+from app.services.search_service import SearchService
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=schemas.SearchResults)
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    executive_id: Optional[int] = None,
+    entity: Optional[schemas.SearchEntity] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=512),
+    current: user_models.Usuario = Depends(get_current_user),
+    service: SearchService = Depends(SearchService),
+):
+    """Busca por prefixo (sem acento) em contatos, documentos, eventos e tarefas; mais relevantes primeiro."""
+    try:
+        return service.search(current, q, executive_id=executive_id, entity=entity, limit=limit, cursor=cursor)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
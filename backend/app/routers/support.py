@@ -1,5 +1,7 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 
+from app.core.database import get_db
 from app.schemas import support_schema as schemas
 from app.services.email_service import send_problem_report_email
 
@@ -7,7 +9,7 @@ router = APIRouter(prefix="/support", tags=["Support"])
 
 
 @router.post("/problem-report", response_model=schemas.MessageResponse)
-def submit_problem_report(payload: schemas.ProblemReportCreate):
+def submit_problem_report(payload: schemas.ProblemReportCreate, db: Session = Depends(get_db)):
     try:
         send_problem_report_email(
             context=payload.context,
@@ -18,8 +20,11 @@ def submit_problem_report(payload: schemas.ProblemReportCreate):
             screen_label=payload.screen_label,
             page_url=payload.page_url,
             user_agent=payload.user_agent,
+            db=db,
         )
+        db.commit()
     except Exception as exc:  # pragma: no cover - fallback defensivo
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Não foi possível enviar o relatório por e-mail.",
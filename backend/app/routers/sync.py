@@ -0,0 +1,23 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.deps import get_current_user
+from app.models import user_model as user_models
+from app.schemas import sync_schema as schemas
+from app.services.sync_service import SyncService
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@router.get("", response_model=schemas.SyncResponse)
+def delta_sync(
+    since: Optional[str] = None,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: SyncService = Depends(SyncService),
+):
+    """Só o que mudou desde `since` (token da resposta anterior); sem token, snapshot completo."""
+    try:
+        return service.sync(current, since=since)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
@@ -3,7 +3,11 @@ from typing import List, Optional, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from app.api.deps import get_current_user
+from app.models import user_model as user_models
+from app.schemas import batch_schema
 from app.schemas import task_schema as schemas
+from app.services.batch_service import BatchService
 from app.services.task_service import TaskService
 
 
@@ -65,6 +69,16 @@ def create_task(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
 
 
+@router.post("/batch", response_model=batch_schema.BatchResult)
+def batch_tasks(
+    payload: batch_schema.BatchRequest,
+    current: user_models.Usuario = Depends(get_current_user),
+    service: BatchService = Depends(BatchService),
+):
+    """Tarefas: create/update/delete em lote numa transação (`mode`: all_or_nothing ou best_effort), com resultado por item."""
+    return service.run(current, "tasks", payload)
+
+
 @router.put("/{task_id}", response_model=schemas.Task)
 def update_task(
     task_id: int,
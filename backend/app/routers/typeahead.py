@@ -0,0 +1,23 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import get_current_user
+from app.models import user_model as user_models
+from app.schemas import typeahead_schema as schemas
+from app.services.typeahead_service import TypeaheadService
+
+router = APIRouter(prefix="/typeahead", tags=["Typeahead"])
+
+
+@router.get("", response_model=schemas.TypeaheadResults)
+def typeahead(
+    kind: schemas.TypeaheadKind,
+    prefix: str = Query(..., min_length=1, max_length=100),
+    executive_id: Optional[int] = None,
+    limit: int = Query(10, ge=1, le=50),
+    current: user_models.Usuario = Depends(get_current_user),
+    service: TypeaheadService = Depends(TypeaheadService),
+):
+    """Sugestões por prefixo de nome, sobrenome, e-mail ou CPF (sem acento), no lugar de baixar as listas."""
+    return service.lookup(current, kind, prefix, executive_id=executive_id, limit=limit)
@@ -1,4 +1,4 @@
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator, field_validator, model_validator
 
@@ -122,6 +122,61 @@ class InviteUserResponse(BaseModel):
     message: str
 
 
+class BulkInviteRow(BaseModel):
+    """Uma linha do convite em lote (JSON ou CSV com os mesmos nomes de coluna)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    full_name: str = Field(..., alias="fullName", min_length=2, max_length=100)
+    email: EmailStr
+    invited_role: InvitedRoleLiteral = Field(..., alias="invitedRole")
+    organization_id: Optional[int] = Field(None, alias="organizationId")
+    secretary_executive_ids: Optional[List[int]] = Field(None, alias="secretaryExecutiveIds")
+
+    @field_validator("full_name")
+    @classmethod
+    def validate_invitee_name(cls, v: str) -> str:
+        return validate_two_word_name(v, "Nome completo")
+
+    @field_validator("secretary_executive_ids", mode="before")
+    @classmethod
+    def split_executive_ids(cls, v):
+        # CSV: "12;15" (ou separados por vírgula/espaço)
+        if isinstance(v, str):
+            return [part for part in v.replace(",", ";").replace(" ", ";").split(";") if part]
+        return v
+
+
+class BulkInviteRequest(BaseModel):
+    """`organizationId` no topo vale para as linhas que não informarem a própria empresa."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    invites: List[dict]
+    organization_id: Optional[int] = Field(None, alias="organizationId")
+
+
+class BulkInviteItemResult(BaseModel):
+    """Resultado por linha (`row` começa em 1; no CSV não conta o cabeçalho)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    row: int
+    email: Optional[str] = None
+    status: Literal["invited", "error"]
+    user_id: Optional[int] = Field(None, alias="userId")
+    message: Optional[str] = None
+
+
+class BulkInviteResult(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    total: int
+    invited: int
+    failed: int
+    items: List[BulkInviteItemResult] = Field(default_factory=list)
+
+
 class CompleteInviteRequest(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
@@ -140,3 +195,15 @@ class CompleteInviteRequest(BaseModel):
 
 class InviteTokenStatusResponse(BaseModel):
     valid: bool
+
+
+class CaptchaMetrics(BaseModel):
+    """Latência da verificação Turnstile (últimas N amostras) e estado do circuit breaker."""
+
+    breakerState: Literal["closed", "open", "half_open"]
+    outcomes: Dict[str, int]
+    samples: int
+    p50Ms: Optional[float] = None
+    p95Ms: Optional[float] = None
+    p99Ms: Optional[float] = None
+    maxMs: Optional[float] = None
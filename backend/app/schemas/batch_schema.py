@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+BATCH_MAX_OPERATIONS = 1000
+
+BatchOp = Literal["create", "update", "delete"]
+# all_or_nothing: qualquer erro cancela o lote inteiro; best_effort: grava o que for válido
+BatchMode = Literal["all_or_nothing", "best_effort"]
+
+
+class BatchOperation(BaseModel):
+    op: BatchOp
+    id: Optional[int] = None  # obrigatório em update/delete
+    # Corpo igual ao do POST (create) ou do PUT (update) da entidade, com os mesmos nomes de campo
+    data: Optional[Dict[str, Any]] = None
+
+
+class BatchRequest(BaseModel):
+    mode: BatchMode = "all_or_nothing"
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=BATCH_MAX_OPERATIONS)
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    op: BatchOp
+    id: Optional[int] = None
+    status: Literal["ok", "error", "skipped"]
+    message: Optional[str] = None
+
+
+class BatchResult(BaseModel):
+    mode: BatchMode
+    committed: bool
+    succeeded: int
+    failed: int
+    items: List[BatchItemResult] = Field(default_factory=list)
+
+    model_config = ConfigDict(populate_by_name=True)
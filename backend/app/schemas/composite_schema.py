@@ -0,0 +1,33 @@
+from typing import Any, List, Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+COMPOSITE_MAX_REQUESTS = 25
+
+
+class SubRequest(BaseModel):
+    id: str = Field(..., min_length=1, max_length=64)  # chave do cliente para achar a resposta
+    # Só leituras: gravações em lote têm POST /{entidade}/batch
+    method: Literal["GET"] = "GET"
+    path: str = Field(..., min_length=1, max_length=2048)  # ex.: "/executives/?skip=0&limit=1000"
+
+
+class CompositeRequest(BaseModel):
+    requests: List[SubRequest] = Field(..., min_length=1, max_length=COMPOSITE_MAX_REQUESTS)
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self):
+        ids = [item.id for item in self.requests]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Os ids das sub-requisições devem ser únicos.")
+        return self
+
+
+class SubResponse(BaseModel):
+    id: str
+    status: int
+    body: Any = None  # JSON da resposta, como viria na chamada avulsa
+
+
+class CompositeResponse(BaseModel):
+    responses: List[SubResponse] = Field(default_factory=list)
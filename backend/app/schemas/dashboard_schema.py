@@ -0,0 +1,65 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.schemas.expense_schema import ExpenseSummaryGroup
+
+
+class DashboardEvent(BaseModel):
+    id: int
+    title: str
+    start_time: datetime = Field(..., alias="startTime")
+    end_time: datetime = Field(..., alias="endTime")
+    location: Optional[str] = None
+    executive_id: int = Field(..., alias="executiveId")
+
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+
+class DashboardExpense(BaseModel):
+    id: int
+    description: str
+    amount: Decimal
+    expense_date: date = Field(..., alias="expenseDate")
+    entry_type: str = Field(..., alias="type")
+    status: str
+    category_name: Optional[str] = Field(None, alias="categoryName")
+    executive_id: int = Field(..., alias="executiveId")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class DashboardTaskCounts(BaseModel):
+    """Tarefas em aberto (status diferente de "Concluído") por prioridade, e todas por status."""
+
+    open: int
+    open_by_priority: Dict[str, int] = Field(default_factory=dict, alias="openByPriority")
+    by_status: Dict[str, int] = Field(default_factory=dict, alias="byStatus")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class DashboardExpenseTotals(BaseModel):
+    """Totais do mês lidos da tabela de resumo mensal."""
+
+    month: str
+    count: int
+    by_type: List[ExpenseSummaryGroup] = Field(default_factory=list, alias="byType")
+    by_status: List[ExpenseSummaryGroup] = Field(default_factory=list, alias="byStatus")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class DashboardSummary(BaseModel):
+    executive_id: Optional[int] = Field(None, alias="executiveId")
+    generated_at: datetime = Field(..., alias="generatedAt")
+    counts: Dict[str, int] = Field(default_factory=dict)
+    upcoming_events: List[DashboardEvent] = Field(default_factory=list, alias="upcomingEvents")
+    events_next_days: int = Field(..., alias="eventsNextDays")
+    recent_expenses: List[DashboardExpense] = Field(default_factory=list, alias="recentExpenses")
+    tasks: DashboardTaskCounts
+    expenses: DashboardExpenseTotals
+
+    model_config = ConfigDict(populate_by_name=True)
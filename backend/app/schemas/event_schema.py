@@ -1,4 +1,4 @@
-from datetime import datetime, date
+from datetime import datetime, date, time
 from typing import Optional, Literal, List
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -64,11 +64,116 @@ class EventUpdate(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+ConflictMode = Literal["ignore", "warn", "reject"]
+
+
+class EventConflict(BaseModel):
+    """Evento existente do executivo que se sobrepõe a `occurrenceStart`."""
+
+    event_id: int = Field(..., alias="eventId")
+    title: str
+    start_time: datetime = Field(..., alias="startTime")
+    end_time: datetime = Field(..., alias="endTime")
+    recurrence_id: Optional[str] = Field(None, alias="recurrenceId")
+    occurrence_start: datetime = Field(..., alias="occurrenceStart")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class Event(EventBase):
     id: int
+    conflicts: Optional[List[EventConflict]] = None
 
 
 class RecurrenceDeleteResult(BaseModel):
     deleted_count: int = Field(..., alias="deletedCount")
 
     model_config = ConfigDict(populate_by_name=True)
+
+
+class EventReminder(BaseModel):
+    """Lembrete disparado pelo servidor (SSE em /events/reminders/stream)."""
+
+    event_id: int = Field(..., alias="eventId")
+    executive_id: int = Field(..., alias="executiveId")
+    title: str
+    location: Optional[str] = None
+    start_time: datetime = Field(..., alias="startTime")
+    reminder_minutes: int = Field(..., alias="reminderMinutes")
+    fire_at: datetime = Field(..., alias="fireAt")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CalendarFeedLink(BaseModel):
+    """URL de assinatura .ics (Outlook/Google); o token dispensa login no cliente de calendário."""
+
+    executive_id: int = Field(..., alias="executiveId")
+    feed_url: str = Field(..., alias="feedUrl")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class EventImportItemResult(BaseModel):
+    """Linha do relatório de importação (apenas VEVENTs com erro ou aviso)."""
+
+    index: int
+    uid: Optional[str] = None
+    title: Optional[str] = None
+    status: Literal["created", "error"]
+    created_count: int = Field(default=0, alias="createdCount")
+    message: Optional[str] = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class EventImportResult(BaseModel):
+    total_vevents: int = Field(..., alias="totalVevents")
+    created_events: int = Field(..., alias="createdEvents")
+    created_series: int = Field(..., alias="createdSeries")
+    failed: int
+    items: List[EventImportItemResult] = Field(default_factory=list)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class AvailabilityRequest(BaseModel):
+    """Busca de horários livres em comum; `workingDays` segue getDay() (0 = domingo)."""
+
+    executive_ids: List[int] = Field(..., alias="executiveIds", min_length=1, max_length=100)
+    range_start: datetime = Field(..., alias="rangeStart")
+    range_end: datetime = Field(..., alias="rangeEnd")
+    workday_start: time = Field(time(9, 0), alias="workdayStart")
+    workday_end: time = Field(time(18, 0), alias="workdayEnd")
+    working_days: List[int] = Field(default_factory=lambda: [1, 2, 3, 4, 5], alias="workingDays")
+    slot_minutes: int = Field(..., alias="slotMinutes", ge=5, le=24 * 60)
+    buffer_minutes: int = Field(0, alias="bufferMinutes", ge=0, le=240)
+    step_minutes: int = Field(15, alias="stepMinutes", ge=5, le=24 * 60)
+    max_slots: int = Field(20, alias="maxSlots", ge=1, le=500)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class TimeBlock(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class AvailabilitySlot(TimeBlock):
+    """`fragments`: sobras menores que um slot que o horário deixa na janela livre (menor é melhor)."""
+
+    rank: int
+    fragments: int
+
+
+class ExecutiveAvailability(BaseModel):
+    executive_id: int = Field(..., alias="executiveId")
+    busy: List[TimeBlock]
+    free: List[TimeBlock]
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class AvailabilityResult(BaseModel):
+    slots: List[AvailabilitySlot]
+    executives: List[ExecutiveAvailability]
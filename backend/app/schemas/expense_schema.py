@@ -1,6 +1,6 @@
 from datetime import date
 from decimal import Decimal
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -39,3 +39,50 @@ class ExpenseUpdate(BaseModel):
 
 class Expense(ExpenseBase):
     id: int
+
+
+class ExpenseSummaryGroup(BaseModel):
+    """Um grupo do resumo; só as dimensões do agrupamento vêm preenchidas."""
+
+    month: Optional[str] = None  # AAAA-MM
+    expense_category_id: Optional[int] = Field(None, alias="categoryId")
+    category_name: Optional[str] = Field(None, alias="categoryName")
+    entry_type: Optional[str] = Field(None, alias="type")
+    status: Optional[str] = None
+    count: int
+    amount: Decimal
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ExpenseSummary(BaseModel):
+    """Totais de lançamentos lidos da tabela de resumo mensal (não dos lançamentos)."""
+
+    count: int
+    by_month: List[ExpenseSummaryGroup] = Field(default_factory=list, alias="byMonth")
+    by_category: List[ExpenseSummaryGroup] = Field(default_factory=list, alias="byCategory")
+    by_type: List[ExpenseSummaryGroup] = Field(default_factory=list, alias="byType")
+    by_status: List[ExpenseSummaryGroup] = Field(default_factory=list, alias="byStatus")
+    groups: List[ExpenseSummaryGroup] = Field(default_factory=list)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ExpenseImportItemResult(BaseModel):
+    """Linha do relatório de importação (apenas linhas com erro)."""
+
+    line: int
+    description: Optional[str] = None
+    status: Literal["error"] = "error"
+    message: str
+
+
+class ExpenseImportResult(BaseModel):
+    total_rows: int = Field(..., alias="totalRows")
+    created: int
+    duplicates: int
+    failed: int
+    created_categories: List[str] = Field(default_factory=list, alias="createdCategories")
+    items: List[ExpenseImportItemResult] = Field(default_factory=list)
+
+    model_config = ConfigDict(populate_by_name=True)
@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -14,13 +14,12 @@ class ReportBase(BaseModel):
     include_tasks: bool = Field(default=True, alias="includeTasks")
     include_contacts: bool = Field(default=True, alias="includeContacts")
     total_records: int = Field(default=0, alias="totalRecords", ge=0)
-    generated_data: List[Dict[str, Any]] = Field(default_factory=list, alias="generatedData")
 
     model_config = ConfigDict(populate_by_name=True, from_attributes=True)
 
 
 class ReportCreate(ReportBase):
-    pass
+    generated_data: List[Dict[str, Any]] = Field(default_factory=list, alias="generatedData")
 
 
 class ReportUpdate(BaseModel):
@@ -38,6 +37,79 @@ class ReportUpdate(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class ReportGenerateRequest(BaseModel):
+    """Parâmetros do relatório; os dados são calculados no servidor (lista vazia = todos os visíveis)."""
+
+    name: str = Field(..., min_length=1, max_length=255)
+    selected_executive_ids: List[int] = Field(default_factory=list, alias="selectedExecutiveIds")
+    start_date: Optional[date] = Field(None, alias="startDate")
+    end_date: Optional[date] = Field(None, alias="endDate")
+    include_events: bool = Field(default=True, alias="includeEvents")
+    include_expenses: bool = Field(default=True, alias="includeExpenses")
+    include_tasks: bool = Field(default=True, alias="includeTasks")
+    include_contacts: bool = Field(default=True, alias="includeContacts")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class Report(ReportBase):
+    """Metadados do relatório; as linhas vêm paginadas de GET /reports/{id}/rows."""
+
     id: int
     generated_at: datetime = Field(..., alias="generatedAt")
+    row_count: int = Field(0, alias="rowCount")
+    summary: Optional[Dict[str, Any]] = None
+
+
+class ReportRegeneration(BaseModel):
+    """Relatório regenerado + executivos recalculados por seção (os demais vieram dos blocos gravados)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    report: Report
+    stale_executives: Dict[str, List[int]] = Field(default_factory=dict, alias="staleExecutives")
+
+
+class ReportRowsPage(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    items: List[Dict[str, Any]]
+    total: int
+    skip: int
+    limit: int
+
+
+class ReportJob(BaseModel):
+    id: int
+    status: Literal["queued", "running", "succeeded", "failed"]
+    progress: int
+    current_section: Optional[str] = Field(None, alias="currentSection")
+    report_id: Optional[int] = Field(None, alias="reportId")
+    schedule_id: Optional[int] = Field(None, alias="scheduleId")
+    error: Optional[str] = None
+    created_at: datetime = Field(..., alias="createdAt")
+    started_at: Optional[datetime] = Field(None, alias="startedAt")
+    finished_at: Optional[datetime] = Field(None, alias="finishedAt")
+
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+
+class ReportScheduleCreate(BaseModel):
+    """Relatório recorrente do período anterior (ontem, semana ou mês passado), gerado de madrugada."""
+
+    name: str = Field(..., min_length=1, max_length=200)
+    frequency: Literal["daily", "weekly", "monthly"] = "monthly"
+    selected_executive_ids: List[int] = Field(default_factory=list, alias="selectedExecutiveIds")
+    include_events: bool = Field(default=True, alias="includeEvents")
+    include_expenses: bool = Field(default=True, alias="includeExpenses")
+    include_tasks: bool = Field(default=True, alias="includeTasks")
+    include_contacts: bool = Field(default=True, alias="includeContacts")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ReportSchedule(ReportScheduleCreate):
+    id: int
+    is_active: bool = Field(..., alias="isActive")
+    next_run_at: datetime = Field(..., alias="nextRunAt")
+    last_run_at: Optional[datetime] = Field(None, alias="lastRunAt")
@@ -0,0 +1,25 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+SearchEntity = Literal["contact", "document", "event", "task"]
+
+
+class SearchHit(BaseModel):
+    entity: SearchEntity
+    id: int
+    executive_id: int = Field(..., alias="executiveId")
+    title: str
+    # HTML já escapado; só os termos encontrados vêm em <mark>...</mark>
+    snippet: str
+    rank: float
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SearchResults(BaseModel):
+    items: List[SearchHit] = Field(default_factory=list)
+    # Repassar como `cursor` para a próxima página; None = fim
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+
+    model_config = ConfigDict(populate_by_name=True)
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.schemas.contact_schema import Contact
+from app.schemas.contact_type_schema import ContactType
+from app.schemas.document_category_schema import DocumentCategory
+from app.schemas.document_schema import Document
+from app.schemas.event_schema import Event
+from app.schemas.event_type_schema import EventType
+from app.schemas.expense_category_schema import ExpenseCategory
+from app.schemas.expense_schema import Expense
+from app.schemas.task_schema import Task
+
+SyncEntity = Literal[
+    "event",
+    "task",
+    "contact",
+    "expense",
+    "document",
+    "eventType",
+    "contactType",
+    "expenseCategory",
+    "documentCategory",
+]
+
+
+class SyncDeleted(BaseModel):
+    entity: SyncEntity
+    id: int
+    executive_id: Optional[int] = Field(None, alias="executiveId")
+    deleted_at: datetime = Field(..., alias="deletedAt")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SyncChanges(BaseModel):
+    events: List[Event] = Field(default_factory=list)
+    tasks: List[Task] = Field(default_factory=list)
+    contacts: List[Contact] = Field(default_factory=list)
+    expenses: List[Expense] = Field(default_factory=list)
+    documents: List[Document] = Field(default_factory=list)
+    event_types: List[EventType] = Field(default_factory=list, alias="eventTypes")
+    contact_types: List[ContactType] = Field(default_factory=list, alias="contactTypes")
+    expense_categories: List[ExpenseCategory] = Field(default_factory=list, alias="expenseCategories")
+    document_categories: List[DocumentCategory] = Field(default_factory=list, alias="documentCategories")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SyncResponse(BaseModel):
+    """
+    `full=true`: snapshot completo (sem token ou token expirado) — substitua o cache local.
+    Caso contrário aplique `deleted` e depois `changed`. Guarde `token` para a próxima chamada.
+    """
+
+    token: str
+    full: bool
+    changed: SyncChanges
+    deleted: List[SyncDeleted] = Field(default_factory=list)
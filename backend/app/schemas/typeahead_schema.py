@@ -0,0 +1,21 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+TypeaheadKind = Literal["executive", "contact"]
+
+
+class TypeaheadItem(BaseModel):
+    id: int
+    executive_id: int = Field(..., alias="executiveId")
+    name: str
+    email: Optional[str] = None
+    # chave normalizada que casou com o prefixo (nome, sobrenome, e-mail ou CPF)
+    matched: str
+
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+
+class TypeaheadResults(BaseModel):
+    kind: TypeaheadKind
+    items: List[TypeaheadItem] = Field(default_factory=list)
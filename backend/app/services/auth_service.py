@@ -5,6 +5,7 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.captcha_service import CaptchaVerificationError, verify_turnstile_token
 from app.core.database import get_db
@@ -74,19 +75,27 @@ class AuthService:
             user=_user_to_public(user),
         )
 
-    def register_organization(
+    async def register_organization(
         self,
         body: auth_schemas.RegisterOrganizationRequest,
         frontend_base: str,
+        remote_ip: Optional[str] = None,
     ) -> auth_schemas.RegisterOrganizationResponse:
+        # CAPTCHA no event loop (cliente HTTP compartilhado); o resto é síncrono, no threadpool.
         try:
-            verify_turnstile_token(body.captcha_token)
+            await verify_turnstile_token(body.captcha_token, remote_ip=remote_ip)
         except CaptchaVerificationError as exc:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(exc),
             ) from exc
+        return await run_in_threadpool(self._register_organization, body, frontend_base)
 
+    def _register_organization(
+        self,
+        body: auth_schemas.RegisterOrganizationRequest,
+        frontend_base: str,
+    ) -> auth_schemas.RegisterOrganizationResponse:
         if self.users.get_by_email(body.adminEmail):
             logger.info(
                 "register_organization blocked: duplicate admin email",
@@ -166,7 +175,7 @@ class AuthService:
             self.db.flush()
 
             link = build_set_password_link(raw_token, frontend_base)
-            send_invite_email(str(body.adminEmail), body.adminName.strip(), link)
+            send_invite_email(str(body.adminEmail), body.adminName.strip(), link, db=self.db)
             self.db.commit()
         except HTTPException:
             self.db.rollback()
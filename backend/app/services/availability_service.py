@@ -0,0 +1,115 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.intervals import Interval, merge_intervals, subtract_intervals
+from app.repositories.event_repository import EventRepository
+from app.repositories.executive_repository import ExecutiveRepository
+from app.schemas import event_schema as schemas
+
+MAX_RANGE_DAYS = 92
+
+
+def _working_windows(payload: schemas.AvailabilityRequest) -> List[Interval]:
+    """Janelas de expediente dentro do período, em ordem."""
+    working_days = set(payload.working_days)
+    windows: List[Interval] = []
+    day = payload.range_start.date()
+    while day <= payload.range_end.date():
+        # JS getDay(): Sun=0 … Sat=6. Python weekday(): Mon=0 … Sun=6.
+        if (day.weekday() + 1) % 7 in working_days:
+            start = max(datetime.combine(day, payload.workday_start), payload.range_start)
+            end = min(datetime.combine(day, payload.workday_end), payload.range_end)
+            if start < end:
+                windows.append(Interval(start, end))
+        day += timedelta(days=1)
+    return windows
+
+
+def _candidate_slots(
+    free: List[Interval], duration: timedelta, step: timedelta
+) -> List[schemas.AvailabilitySlot]:
+    slots: List[schemas.AvailabilitySlot] = []
+    for window in free:
+        # Inícios alinhados ao passo (ex.: 10:07 → 10:15) a partir da meia-noite.
+        midnight = datetime.combine(window.start.date(), datetime.min.time())
+        offset = (window.start - midnight) % step
+        start = window.start if not offset else window.start + (step - offset)
+        while start + duration <= window.end:
+            end = start + duration
+            fragments = sum(
+                1
+                for leftover in (start - window.start, window.end - end)
+                if timedelta(0) < leftover < duration
+            )
+            slots.append(schemas.AvailabilitySlot(start=start, end=end, rank=0, fragments=fragments))
+            start += step
+    return slots
+
+
+class AvailabilityService:
+    """Livre/ocupado de vários executivos: uma consulta por janela + união ordenada."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.event_repo = EventRepository(db=db)
+        self.executive_repo = ExecutiveRepository()
+
+    def find_availability(self, payload: schemas.AvailabilityRequest) -> schemas.AvailabilityResult:
+        if payload.range_start >= payload.range_end:
+            raise ValueError("A data/hora de fim deve ser maior que a de início.")
+        if payload.range_end - payload.range_start > timedelta(days=MAX_RANGE_DAYS):
+            raise ValueError(f"O período consultado não pode exceder {MAX_RANGE_DAYS} dias.")
+        if payload.workday_start >= payload.workday_end:
+            raise ValueError("O fim do expediente deve ser maior que o início.")
+
+        executive_ids = list(dict.fromkeys(payload.executive_ids))
+        missing = set(executive_ids) - self.executive_repo.get_existing_ids(self.db, executive_ids)
+        if missing:
+            raise ValueError(f"Executivo não encontrado: {', '.join(map(str, sorted(missing)))}.")
+
+        buffer = timedelta(minutes=payload.buffer_minutes)
+        rows = self.event_repo.get_intervals(
+            executive_ids, payload.range_start - buffer, payload.range_end + buffer
+        )
+        busy_by_executive: Dict[int, List[Interval]] = defaultdict(list)
+        for row in rows:
+            busy_by_executive[row.executive_id].append(Interval(row.start_time, row.end_time))
+
+        windows = _working_windows(payload)
+        executives: List[schemas.ExecutiveAvailability] = []
+        padded: List[Interval] = []
+        for executive_id in executive_ids:
+            busy = merge_intervals(busy_by_executive.get(executive_id, ()))
+            padded.extend(Interval(b.start - buffer, b.end + buffer) for b in busy)
+            executives.append(
+                schemas.ExecutiveAvailability(
+                    executiveId=executive_id,
+                    busy=[
+                        schemas.TimeBlock(
+                            start=max(b.start, payload.range_start), end=min(b.end, payload.range_end)
+                        )
+                        for b in busy
+                        # só dentro da margem do buffer: afeta os horários, mas não é bloco do período
+                        if b.end > payload.range_start and b.start < payload.range_end
+                    ],
+                    free=[schemas.TimeBlock(start=f.start, end=f.end) for f in subtract_intervals(windows, busy)],
+                )
+            )
+
+        common_free = subtract_intervals(windows, merge_intervals(padded))
+        slots = _candidate_slots(
+            common_free,
+            timedelta(minutes=payload.slot_minutes),
+            timedelta(minutes=payload.step_minutes),
+        )
+        # Primeiro os horários que não deixam sobras inúteis na janela, depois os mais cedo.
+        slots.sort(key=lambda slot: (slot.fragments, slot.start))
+        ranked = slots[: payload.max_slots]
+        for position, slot in enumerate(ranked, start=1):
+            slot.rank = position
+        return schemas.AvailabilityResult(slots=ranked, executives=executives)
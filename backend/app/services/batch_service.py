@@ -0,0 +1,379 @@
+"""
+Lotes de create/update/delete (POST /{entidade}/batch) numa única transação.
+
+O lote é validado antes de qualquer escrita: uma consulta carrega as linhas-alvo de update/delete,
+uma consulta por coluna de referência confere executivo, tipo e categoria, e cada update é
+revalidado já mesclado com a linha atual (schema de criação). Depois, um INSERT executemany com
+RETURNING, um UPDATE em lote por chave primária e um DELETE ... RETURNING — um commit só. Os efeitos
+colaterais das gravações linha a linha (feed de mudanças, resumo mensal de lançamentos, índice do
+autocompletar) são aplicados explicitamente, já que statements não passam pelo unit of work.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from fastapi import Depends
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.change_feed import OP_CREATE, OP_DELETE, OP_UPDATE, track_rows
+from app.core.database import get_db
+from app.core.money import from_cents, to_cents
+from app.models import user_model as user_models
+from app.models.contact_model import Contact
+from app.models.contact_type_model import ContactType
+from app.models.event_model import Event
+from app.models.event_type_model import EventType
+from app.models.executive_model import Executive
+from app.models.expense_category_model import ExpenseCategory
+from app.models.expense_model import Expense
+from app.models.task_model import Task
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository, row_rollup_key
+from app.schemas import batch_schema as schemas
+from app.schemas import contact_schema, event_schema, expense_schema, task_schema
+from app.services.executive_scope import visible_executive_ids
+from app.services.typeahead_index import get_index as get_typeahead_index
+
+logger = logging.getLogger(__name__)
+
+_RECURRENCE_DUMP = {"by_alias": False, "mode": "json", "exclude_none": True}
+
+
+@dataclass(frozen=True)
+class _Reference:
+    column: str
+    model: type
+    message: str
+    # a referência precisa ser do mesmo executivo da linha (categoria de lançamento)
+    owned_message: Optional[str] = None
+
+
+def _plain_row(payload: BaseModel) -> Dict[str, Any]:
+    return payload.model_dump(by_alias=False)
+
+
+def _recurrence_row(payload: BaseModel) -> Dict[str, Any]:
+    """JSON do SQLite não aceita date/datetime aninhados: a regra vai serializada."""
+    row = payload.model_dump(by_alias=False)
+    if payload.recurrence is not None:
+        row["recurrence"] = payload.recurrence.model_dump(**_RECURRENCE_DUMP)
+    return row
+
+
+def _expense_row(payload: BaseModel) -> Dict[str, Any]:
+    row = payload.model_dump(by_alias=False)
+    row["amount_cents"] = to_cents(row.pop("amount"))
+    return row
+
+
+def _expense_input(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {**row, "amount": from_cents(row["amount_cents"])}
+
+
+def _check_event_times(row: Dict[str, Any]) -> None:
+    if row["start_time"] >= row["end_time"]:
+        raise ValueError("A data/hora de fim deve ser maior que a de início.")
+
+
+@dataclass(frozen=True)
+class BatchEntity:
+    name: str
+    feed_entity: str
+    model: type
+    create_schema: Type[BaseModel]
+    update_schema: Type[BaseModel]
+    not_found: str
+    references: Tuple[_Reference, ...] = ()
+    to_row: Callable[[BaseModel], Dict[str, Any]] = _plain_row
+    to_input: Callable[[Dict[str, Any]], Dict[str, Any]] = dict
+    check: Optional[Callable[[Dict[str, Any]], None]] = None
+    column_aliases: Dict[str, str] = field(default_factory=dict)  # campo do schema → coluna
+
+
+BATCH_ENTITIES: Dict[str, BatchEntity] = {
+    "contacts": BatchEntity(
+        name="contacts",
+        feed_entity="contact",
+        model=Contact,
+        create_schema=contact_schema.ContactCreate,
+        update_schema=contact_schema.ContactUpdate,
+        not_found="Contato não encontrado.",
+        references=(_Reference("contact_type_id", ContactType, "Tipo de contato informado não existe."),),
+    ),
+    "tasks": BatchEntity(
+        name="tasks",
+        feed_entity="task",
+        model=Task,
+        create_schema=task_schema.TaskCreate,
+        update_schema=task_schema.TaskUpdate,
+        not_found="Tarefa não encontrada.",
+        to_row=_recurrence_row,
+    ),
+    "expenses": BatchEntity(
+        name="expenses",
+        feed_entity="expense",
+        model=Expense,
+        create_schema=expense_schema.ExpenseCreate,
+        update_schema=expense_schema.ExpenseUpdate,
+        not_found="Lançamento não encontrado.",
+        references=(
+            _Reference(
+                "expense_category_id",
+                ExpenseCategory,
+                "Categoria informada não existe.",
+                owned_message="A categoria não pertence ao executivo do lançamento.",
+            ),
+        ),
+        to_row=_expense_row,
+        to_input=_expense_input,
+        column_aliases={"amount": "amount_cents"},
+    ),
+    "events": BatchEntity(
+        name="events",
+        feed_entity="event",
+        model=Event,
+        create_schema=event_schema.EventCreate,
+        update_schema=event_schema.EventUpdate,
+        not_found="Evento não encontrado.",
+        references=(_Reference("event_type_id", EventType, "Tipo de evento informado não existe."),),
+        to_row=_recurrence_row,
+        check=_check_event_times,
+    ),
+}
+
+
+@dataclass
+class _Planned:
+    index: int
+    op: str
+    id: Optional[int] = None
+    row: Optional[Dict[str, Any]] = None  # create: linha completa; update: linha mesclada
+    changes: Optional[Dict[str, Any]] = None  # update: só as colunas enviadas
+    previous: Optional[Dict[str, Any]] = None  # update/delete: linha atual
+    error: Optional[str] = None
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"]) or "data"
+    return f"Campo inválido ({location}): {first['msg']}."
+
+
+class BatchService:
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+
+    def run(self, actor: user_models.Usuario, entity_name: str, request: schemas.BatchRequest) -> schemas.BatchResult:
+        entity = BATCH_ENTITIES[entity_name]
+        planned = self._parse(entity, request.operations)
+        self._validate(entity, actor, planned)
+
+        failed = [item for item in planned if item.error]
+        if failed and request.mode == "all_or_nothing":
+            return self._result(request.mode, planned, committed=False, skip_valid=True)
+        valid = [item for item in planned if not item.error]
+        if not valid:
+            return self._result(request.mode, planned, committed=False)
+
+        try:
+            self._write(entity, valid)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            logger.exception("Falha ao gravar lote de %s", entity.name)
+            for item in valid:
+                item.error = "Falha ao gravar o lote; nada foi salvo."
+            return self._result(request.mode, planned, committed=False)
+
+        if entity.name == "contacts":
+            owners = {
+                owner
+                for item in valid
+                for owner in ((item.row or {}).get("executive_id"), (item.previous or {}).get("executive_id"))
+                if owner is not None
+            }
+            get_typeahead_index().invalidate("contact", owners)
+        return self._result(request.mode, planned, committed=True)
+
+    def _parse(self, entity: BatchEntity, operations: List[schemas.BatchOperation]) -> List[_Planned]:
+        planned: List[_Planned] = []
+        targets: Set[int] = set()
+        for index, operation in enumerate(operations):
+            item = _Planned(index=index, op=operation.op, id=operation.id)
+            planned.append(item)
+            if operation.op == "create":
+                if operation.id is not None:
+                    item.error = "Não informe id ao criar."
+                    continue
+                try:
+                    item.row = entity.to_row(entity.create_schema.model_validate(operation.data or {}))
+                except ValidationError as error:
+                    item.error = _validation_message(error)
+                continue
+            if operation.id is None:
+                item.error = "Informe o id do registro."
+            elif operation.id in targets:
+                item.error = "Registro repetido no lote."
+            else:
+                targets.add(operation.id)
+            if operation.op == "update" and item.error is None:
+                try:
+                    update_data = entity.update_schema.model_validate(operation.data or {})
+                except ValidationError as error:
+                    item.error = _validation_message(error)
+                    continue
+                item.changes = update_data.model_dump(by_alias=False, exclude_unset=True)
+                if not item.changes:
+                    item.error = "Nenhum campo para atualizar."
+        return planned
+
+    def _validate(self, entity: BatchEntity, actor: user_models.Usuario, planned: List[_Planned]) -> None:
+        model = entity.model
+        target_ids = [item.id for item in planned if item.op != "create" and item.error is None]
+        existing: Dict[int, Dict[str, Any]] = {}
+        if target_ids:
+            rows = self.db.execute(select(model.__table__).where(model.__table__.c.id.in_(target_ids))).mappings()
+            existing = {row["id"]: dict(row) for row in rows}
+
+        for item in planned:
+            if item.error or item.op == "create":
+                continue
+            item.previous = existing.get(item.id)
+            if item.previous is None:
+                item.error = entity.not_found
+                continue
+            if item.op == "update":
+                merged = {**entity.to_input(item.previous), **item.changes}
+                try:
+                    item.row = entity.to_row(entity.create_schema.model_validate(merged))
+                except ValidationError as error:
+                    item.error = _validation_message(error)
+                    continue
+                item.changes = {entity.column_aliases.get(key, key): item.row[entity.column_aliases.get(key, key)] for key in item.changes}
+
+        # Referências: uma consulta por coluna para o lote inteiro.
+        lookups: Dict[str, Dict[int, Optional[int]]] = {}
+        executive_ids = {
+            value
+            for item in planned
+            if not item.error
+            for value in ((item.row or {}).get("executive_id"), (item.previous or {}).get("executive_id"))
+            if value is not None
+        }
+        known_executives = {
+            row_id for (row_id,) in self.db.query(Executive.id).filter(Executive.id.in_(executive_ids))
+        } if executive_ids else set()
+        for reference in entity.references:
+            ids = {item.row.get(reference.column) for item in planned if not item.error and item.row} - {None}
+            columns = [reference.model.id]
+            if reference.owned_message:
+                columns.append(reference.model.executive_id)
+            found = self.db.query(*columns).filter(reference.model.id.in_(ids)).all() if ids else []
+            lookups[reference.column] = {row[0]: (row[1] if reference.owned_message else None) for row in found}
+
+        visible = visible_executive_ids(self.db, actor)
+        for item in planned:
+            if item.error:
+                continue
+            owners = {(item.previous or {}).get("executive_id"), (item.row or {}).get("executive_id")} - {None}
+            if visible is not None and not owners <= visible:
+                item.error = "Executivo fora do seu escopo."
+                continue
+            if item.row is None:
+                continue
+            if item.row["executive_id"] not in known_executives:
+                item.error = "Executivo informado não existe."
+                continue
+            try:
+                for reference in entity.references:
+                    value = item.row.get(reference.column)
+                    if value is None:
+                        continue
+                    if value not in lookups[reference.column]:
+                        raise ValueError(reference.message)
+                    if reference.owned_message and lookups[reference.column][value] != item.row["executive_id"]:
+                        raise ValueError(reference.owned_message)
+                if entity.check is not None:
+                    entity.check(item.row)
+            except ValueError as error:
+                item.error = str(error)
+
+    def _write(self, entity: BatchEntity, valid: List[_Planned]) -> None:
+        model = entity.model
+        creates = [item for item in valid if item.op == "create"]
+        updates = [item for item in valid if item.op == "update"]
+        deletes = [item for item in valid if item.op == "delete"]
+
+        if creates:
+            inserted = self.db.execute(
+                insert(model).returning(model.id, model.executive_id, sort_by_parameter_order=True),
+                [item.row for item in creates],
+            ).all()
+            for item, (row_id, _executive_id) in zip(creates, inserted):
+                item.id = row_id
+            track_rows(self.db, entity.feed_entity, OP_CREATE, inserted)
+
+        if updates:
+            now = datetime.utcnow()
+            self.db.execute(
+                update(model),
+                [{"id": item.id, **item.changes, "updated_at": now} for item in updates],
+                execution_options={"synchronize_session": False},
+            )
+            track_rows(self.db, entity.feed_entity, OP_UPDATE, [(item.id, item.row["executive_id"]) for item in updates])
+
+        if deletes:
+            removed = self.db.execute(
+                delete(model).where(model.id.in_([item.id for item in deletes])).returning(model.id, model.executive_id),
+                execution_options={"synchronize_session": False},
+            ).all()
+            track_rows(self.db, entity.feed_entity, OP_DELETE, removed)
+
+        if entity.name == "expenses":
+            self._apply_rollups(creates, updates, deletes)
+
+    def _apply_rollups(self, creates: List[_Planned], updates: List[_Planned], deletes: List[_Planned]) -> None:
+        """Deltas agregados por grupo do resumo mensal: um UPDATE/INSERT por grupo tocado."""
+        deltas: Dict[Tuple, List[int]] = {}
+
+        def add(row: Dict[str, Any], sign: int) -> None:
+            delta = deltas.setdefault(row_rollup_key(row), [0, 0])
+            delta[0] += sign
+            delta[1] += sign * row["amount_cents"]
+
+        for item in creates:
+            add(item.row, 1)
+        for item in updates:
+            add(item.previous, -1)
+            add(item.row, 1)
+        for item in deletes:
+            add(item.previous, -1)
+        rollups = ExpenseRollupRepository(db=self.db)
+        for key, (count, cents) in deltas.items():
+            rollups.apply(key, count, cents)
+
+    @staticmethod
+    def _result(mode: str, planned: List[_Planned], committed: bool, skip_valid: bool = False) -> schemas.BatchResult:
+        items = []
+        for item in planned:
+            if item.error:
+                result_status, message = "error", item.error
+            elif skip_valid or not committed:
+                result_status, message = "skipped", "Não gravado: o lote foi cancelado." if skip_valid else None
+            else:
+                result_status, message = "ok", None
+            items.append(
+                schemas.BatchItemResult(index=item.index, op=item.op, id=item.id, status=result_status, message=message)
+            )
+        succeeded = sum(1 for result in items if result.status == "ok")
+        return schemas.BatchResult(
+            mode=mode,
+            committed=committed,
+            succeeded=succeeded,
+            failed=sum(1 for result in items if result.status == "error"),
+            items=items,
+        )
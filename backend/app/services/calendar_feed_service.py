@@ -0,0 +1,204 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime as format_http_date, parsedate_to_datetime
+from typing import Iterator, List, Mapping, Optional
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.calendar_feed_token import calendar_feed_token
+from app.core.database import get_db
+from app.core.icalendar import (
+    UID_DOMAIN,
+    VEvent,
+    build_rrule,
+    calendar_footer,
+    calendar_header,
+    serialize_vevent,
+)
+from app.core.recurrence import RecurrenceParams, expand_datetimes
+from app.models import event_model as models
+from app.models import user_model as user_models
+from app.repositories.event_repository import EventRepository
+from app.repositories.executive_repository import ExecutiveRepository
+from app.schemas import event_schema as schemas
+from app.services.executive_scope import executive_visible_to_actor
+
+
+@dataclass(frozen=True)
+class FeedFingerprint:
+    etag: str
+    last_modified: Optional[datetime]
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_http_date(
+                self.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+            )
+        return headers
+
+    def matches(self, request_headers: Mapping[str, str]) -> bool:
+        """GET condicional (RFC 9110): If-None-Match tem precedência sobre If-Modified-Since."""
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            return "*" in candidates or self.etag in candidates
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            modified = self.last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+            return modified <= since
+        return False
+
+
+def _event_uid(event: models.Event) -> str:
+    return f"event-{event.id}@{UID_DOMAIN}"
+
+
+def _series_uid(recurrence_id: str) -> str:
+    return f"series-{recurrence_id}@{UID_DOMAIN}"
+
+
+def _to_vevent(event: models.Event, **overrides) -> VEvent:
+    fields = dict(
+        uid=_event_uid(event),
+        start=event.start_time,
+        end=event.end_time,
+        summary=event.title,
+        dtstamp=event.updated_at or datetime.utcnow(),
+        description=event.description,
+        location=event.location,
+        categories=event.event_type.name if event.event_type is not None else None,
+        alarm_minutes=event.reminder_minutes,
+    )
+    fields.update(overrides)
+    return VEvent(**fields)
+
+
+def _same_details(a: models.Event, b: models.Event) -> bool:
+    return (
+        a.title == b.title
+        and a.description == b.description
+        and a.location == b.location
+        and a.event_type_id == b.event_type_id
+        and a.reminder_minutes == b.reminder_minutes
+        and (a.end_time - a.start_time) == (b.end_time - b.start_time)
+    )
+
+
+def _series_rule(occurrences: List[models.Event]) -> Optional[RecurrenceParams]:
+    raw = occurrences[0].recurrence
+    if not raw:
+        return None
+    try:
+        rule = schemas.RecurrenceRule.model_validate(raw)
+    except ValueError:
+        return None
+    return RecurrenceParams(
+        frequency=rule.frequency,
+        interval=rule.interval,
+        days_of_week=list(rule.days_of_week) if rule.days_of_week else None,
+    )
+
+
+def series_vevents(occurrences: List[models.Event]) -> Iterator[VEvent]:
+    """
+    Uma série (mesmo recurrence_id, ordenada por início) vira um VEVENT com RRULE.
+    Ocorrências apagadas entram em EXDATE, ocorrências editadas viram RECURRENCE-ID
+    e ocorrências movidas para fora da regra são exportadas como eventos avulsos.
+    """
+    master = occurrences[0]
+    last_start = occurrences[-1].start_time
+    rule = _series_rule(occurrences) if len(occurrences) > 1 else None
+    rrule = build_rrule(rule, master.start_time, last_start) if rule is not None else None
+    expected: List[datetime] = []
+    if rrule is not None:
+        try:
+            expected = [
+                start
+                for start in expand_datetimes(
+                    master.start_time,
+                    RecurrenceParams(
+                        frequency=rule.frequency,
+                        interval=rule.interval,
+                        days_of_week=rule.days_of_week,
+                        end_date=last_start.date(),
+                    ),
+                )
+                if start <= last_start
+            ]
+        except ValueError:
+            expected = []
+    if not expected:
+        for event in occurrences:
+            yield _to_vevent(event)
+        return
+
+    expected_set = set(expected)
+    by_start = {}
+    strays = []
+    for event in occurrences:
+        if event.start_time in expected_set and event.start_time not in by_start:
+            by_start[event.start_time] = event
+        else:
+            strays.append(event)
+
+    uid = _series_uid(master.recurrence_id)
+    yield _to_vevent(
+        master,
+        uid=uid,
+        dtstamp=max(e.updated_at or datetime.utcnow() for e in occurrences),
+        rrule=rrule,
+        exdates=[start for start in expected if start not in by_start],
+    )
+    for start, event in by_start.items():
+        if event is not master and not _same_details(event, master):
+            yield _to_vevent(event, uid=uid, recurrence_id=start)
+    for event in strays:
+        yield _to_vevent(event)
+
+
+class CalendarFeedService:
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.event_repo = EventRepository(db=db)
+        self.executive_repo = ExecutiveRepository()
+
+    def issue_feed_token(self, actor: user_models.Usuario, executive_id: int) -> str:
+        if self.executive_repo.get_by_id(self.db, executive_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Executivo não encontrado.")
+        if not executive_visible_to_actor(self.db, actor, executive_id):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+        return calendar_feed_token(executive_id)
+
+    def fingerprint(self, executive_id: int) -> FeedFingerprint:
+        total, max_id, last_modified = self.event_repo.feed_stats(executive_id)
+        stamp = last_modified.isoformat() if last_modified else "-"
+        digest = hashlib.sha256(f"{executive_id}:{total}:{max_id}:{stamp}".encode("utf-8")).hexdigest()
+        return FeedFingerprint(etag=f'"{digest[:32]}"', last_modified=last_modified)
+
+    def iter_calendar(self, executive_id: int) -> Iterator[str]:
+        executive = self.executive_repo.get_by_id(self.db, executive_id)
+        name = f"Agenda — {executive.full_name}" if executive is not None else "Agenda"
+        yield calendar_header(name)
+
+        series: List[models.Event] = []
+        for event in self.event_repo.iter_for_feed(executive_id):
+            if series and event.recurrence_id != series[0].recurrence_id:
+                yield "".join(serialize_vevent(v) for v in series_vevents(series))
+                series = []
+            if event.recurrence_id is None:
+                yield serialize_vevent(_to_vevent(event))
+            else:
+                series.append(event)
+        if series:
+            yield "".join(serialize_vevent(v) for v in series_vevents(series))
+
+        yield calendar_footer()
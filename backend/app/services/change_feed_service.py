@@ -0,0 +1,69 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional, Set
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_stream_token, user_from_token
+from app.core import change_feed
+from app.core.database import get_session_factory
+from app.core.sse import SSE_HEARTBEAT, SSE_HEARTBEAT_SECONDS, sse_message, sse_retry
+from app.models import TRACKED_ENTITIES
+from app.services.executive_scope import visible_executive_ids
+
+
+def install_change_tracking() -> None:
+    # Tombstones do delta sync não dependem disto: ver install_tombstones em app/models.
+    for model, entity in TRACKED_ENTITIES:
+        change_feed.register(model, entity)
+    change_feed.install()
+
+
+@dataclass(frozen=True)
+class ChangeScope:
+    """Executivos visíveis ao usuário; None = todos (master)."""
+
+    executive_ids: Optional[Set[int]]
+
+
+def resolve_change_scope(
+    token: Optional[str] = Depends(get_stream_token),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+) -> ChangeScope:
+    # Resolvido uma vez por conexão (dependência síncrona, fora do event loop), numa sessão
+    # fechada antes do stream começar: cada assinante aberto não segura uma conexão do pool.
+    with session_factory() as db:
+        current = user_from_token(token, db)
+        return ChangeScope(executive_ids=visible_executive_ids(db, current))
+
+
+async def stream_changes(
+    scope: ChangeScope,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    last_event_id: Optional[int] = None,
+    heartbeat_seconds: float = SSE_HEARTBEAT_SECONDS,
+    hub: change_feed.ChangeHub = change_feed.hub,
+) -> AsyncIterator[str]:
+    accepts = change_feed.visible_to(scope.executive_ids)
+    token, subscription, replay = hub.subscribe(accepts, since=last_event_id)
+    try:
+        yield sse_retry(int(heartbeat_seconds * 1000))
+        if replay is None:
+            # Backlog não cobre a reconexão: o cliente deve recarregar as listas.
+            yield sse_message("reset", {"version": hub.version}, event_id=hub.version)
+        else:
+            for notice in replay:
+                yield sse_message("change", notice.as_dict(), event_id=notice.version)
+        while not await is_disconnected():
+            if subscription.overflowed:
+                subscription.overflowed = False
+                yield sse_message("reset", {"version": hub.version}, event_id=hub.version)
+            try:
+                notice = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield SSE_HEARTBEAT
+                continue
+            yield sse_message("change", notice.as_dict(), event_id=notice.version)
+    finally:
+        hub.unsubscribe(token)
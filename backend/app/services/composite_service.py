@@ -0,0 +1,109 @@
+"""
+POST /batch: várias leituras (GET) numa só ida e volta, para a carga inicial do SPA.
+
+A requisição externa autentica e abre a sessão; cada sub-requisição passa pelo roteador da
+própria aplicação (mesmas rotas, validação, escopo e erros da chamada avulsa) com o usuário e a
+sessão em `request.state`, então não decodifica o token, não busca o usuário nem abre conexão de
+novo. O corpo JSON de cada resposta entra no envelope como veio, sem decodificar e recodificar.
+"""
+
+import json
+from typing import List, Tuple
+from urllib.parse import unquote, urlsplit
+
+from fastapi import Depends, Request
+from sqlalchemy.orm import Session
+from starlette.exceptions import HTTPException
+
+from app.api.deps import AUTHENTICATED_USER_STATE
+from app.core.database import SHARED_SESSION_STATE, get_db
+from app.models import user_model as user_models
+from app.schemas import composite_schema as schemas
+
+COMPOSITE_PATH = "/batch"
+# Chaves que o roteamento da requisição externa deixou no escopo e não valem para a sub-requisição
+_ROUTED_SCOPE_KEYS = ("path_params", "endpoint", "route")
+_BODY_HEADERS = (b"content-length", b"content-type")
+
+# (id, status, corpo JSON já serializado)
+_Rendered = Tuple[str, int, bytes]
+
+
+def _detail(message: str) -> bytes:
+    return json.dumps({"detail": message}, ensure_ascii=False).encode("utf-8")
+
+
+class CompositeService:
+    """
+    Executa as sub-requisições em ordem, sobre a mesma sessão. Não em paralelo: a Session do
+    SQLAlchemy não é thread-safe, e no SQLite as leituras seriam serializadas de qualquer jeito.
+    """
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+
+    async def run(
+        self, request: Request, actor: user_models.Usuario, payload: schemas.CompositeRequest
+    ) -> bytes:
+        rendered = [await self._dispatch(request, actor, item) for item in payload.requests]
+        return self._render(rendered)
+
+    async def _dispatch(self, request: Request, actor: user_models.Usuario, item: schemas.SubRequest) -> _Rendered:
+        target = urlsplit(item.path)
+        if (
+            target.scheme
+            or target.netloc
+            or not target.path.startswith("/")
+            or target.path.rstrip("/") == COMPOSITE_PATH
+        ):
+            return item.id, 400, _detail("Caminho inválido para o lote.")
+
+        scope = {key: value for key, value in request.scope.items() if key not in _ROUTED_SCOPE_KEYS}
+        scope.update(
+            method=item.method,
+            path=unquote(target.path),
+            raw_path=target.path.encode("utf-8"),
+            query_string=target.query.encode("utf-8"),
+            headers=[(name, value) for name, value in request.scope["headers"] if name not in _BODY_HEADERS],
+            state={**request.scope.get("state", {}), SHARED_SESSION_STATE: self.db, AUTHENTICATED_USER_STATE: actor},
+        )
+        start: dict = {}
+        chunks: List[bytes] = []
+        body_sent = False
+
+        async def receive() -> dict:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            return {"type": "http.disconnect"}  # respostas em streaming (SSE) terminam aqui
+
+        async def send(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await request.app.router(scope, receive, send)
+        except HTTPException as error:
+            # 404/405 do roteamento: fora de uma rota não há handler que os transforme em resposta
+            return item.id, error.status_code, _detail(str(error.detail))
+        except Exception:
+            self.db.rollback()
+            return item.id, 500, _detail("Erro interno ao processar a sub-requisição.")
+
+        status_code = start.get("status", 500)
+        body = b"".join(chunks)
+        content_type = dict(start.get("headers", [])).get(b"content-type", b"")
+        if content_type and not content_type.startswith(b"application/json"):
+            return item.id, 406, _detail("Só respostas JSON podem ser agrupadas no lote.")
+        return item.id, status_code, body or b"null"
+
+    @staticmethod
+    def _render(rendered: List[_Rendered]) -> bytes:
+        parts: List[bytes] = []
+        for sub_id, status_code, body in rendered:
+            head = json.dumps({"id": sub_id, "status": status_code}, ensure_ascii=False)
+            parts.append(head[:-1].encode("utf-8") + b', "body": ' + body + b"}")
+        return b'{"responses": [' + b", ".join(parts) + b"]}"
@@ -0,0 +1,147 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.money import from_cents
+from app.core.ttl_cache import TTLCache
+from app.models import user_model as user_models
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository
+from app.schemas import dashboard_schema as schemas
+from app.schemas.expense_schema import ExpenseSummaryGroup
+from app.services.executive_scope import executive_visible_to_actor, visible_executive_ids
+
+DASHBOARD_CACHE_SECONDS = float(os.getenv("DASHBOARD_CACHE_SECONDS", "30"))
+TASK_DONE_STATUS = "Concluído"
+
+# Resumos recentes por (escopo, executivo, parâmetros): o painel é recarregado a cada navegação,
+# e alguns segundos de atraso são aceitáveis. Mudanças aparecem quando a entrada expira.
+summary_cache = TTLCache(ttl_seconds=DASHBOARD_CACHE_SECONDS, max_entries=2048)
+
+
+def _month_start(value: Optional[str], today: date) -> date:
+    if not value:
+        return today.replace(day=1)
+    try:
+        year, month = value.split("-")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        raise ValueError("Mês inválido (use AAAA-MM).")
+
+
+class DashboardService:
+    """Resumo do painel em poucas consultas agregadas, no lugar de baixar as listas e filtrar no cliente."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.repository = DashboardRepository(db=db)
+
+    def get_summary(
+        self,
+        actor: user_models.Usuario,
+        executive_id: Optional[int] = None,
+        limit: int = 5,
+        days: int = 7,
+        month: Optional[str] = None,
+    ) -> schemas.DashboardSummary:
+        if executive_id is not None:
+            if not executive_visible_to_actor(self.db, actor, executive_id):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+            executive_ids = {executive_id}
+        else:
+            executive_ids = visible_executive_ids(self.db, actor)
+        now = datetime.utcnow()
+        month_start = _month_start(month, now.date())
+
+        # O escopo entra na chave: atores com visões diferentes nunca compartilham entrada.
+        key = (
+            None if executive_ids is None else frozenset(executive_ids),
+            executive_id,
+            limit,
+            days,
+            month_start,
+        )
+        return summary_cache.get_or_compute(
+            key, lambda: self._build(executive_ids, executive_id, now, limit, days, month_start)
+        )
+
+    def _build(
+        self,
+        executive_ids,
+        executive_id: Optional[int],
+        now: datetime,
+        limit: int,
+        days: int,
+        month_start: date,
+    ) -> schemas.DashboardSummary:
+        if executive_ids is not None and not executive_ids:
+            counts: Dict[str, int] = {}
+            events, expenses, task_rows, rollup_rows, upcoming_count = [], [], [], [], 0
+        else:
+            counts = self.repository.entity_counts(executive_ids)
+            events = self.repository.upcoming_events(executive_ids, now, limit)
+            upcoming_count = self.repository.count_events_between(executive_ids, now, now + timedelta(days=days))
+            expenses = self.repository.recent_expenses(executive_ids, limit)
+            task_rows = self.repository.task_counts(executive_ids)
+            rollup_rows = ExpenseRollupRepository(db=self.db).summary_rows(executive_ids, month_start, month_start)
+
+        open_by_priority: Dict[str, int] = {}
+        by_status: Dict[str, int] = {}
+        for priority, task_status, total in task_rows:
+            by_status[task_status] = by_status.get(task_status, 0) + total
+            if task_status != TASK_DONE_STATUS:
+                open_by_priority[priority] = open_by_priority.get(priority, 0) + total
+
+        return schemas.DashboardSummary(
+            executive_id=executive_id,
+            generated_at=now,
+            counts={name: counts.get(name, 0) for name in ("events", "expenses", "tasks", "contacts", "documents")},
+            upcoming_events=[schemas.DashboardEvent.model_validate(event) for event in events],
+            events_next_days=upcoming_count,
+            recent_expenses=[
+                schemas.DashboardExpense(
+                    id=expense.id,
+                    description=expense.description,
+                    amount=expense.amount,
+                    expense_date=expense.expense_date,
+                    entry_type=expense.entry_type,
+                    status=expense.status,
+                    category_name=category_name,
+                    executive_id=expense.executive_id,
+                )
+                for expense, category_name in expenses
+            ],
+            tasks=schemas.DashboardTaskCounts(
+                open=sum(open_by_priority.values()),
+                open_by_priority=open_by_priority,
+                by_status=by_status,
+            ),
+            expenses=self._expense_totals(rollup_rows, month_start),
+        )
+
+    @staticmethod
+    def _expense_totals(rows: List, month_start: date) -> schemas.DashboardExpenseTotals:
+        by_type: Dict[str, List[int]] = {}
+        by_status: Dict[str, List[int]] = {}
+        for _month, _category, entry_type, expense_status, count, cents in rows:
+            for totals, key in ((by_type, entry_type), (by_status, expense_status)):
+                bucket = totals.setdefault(key, [0, 0])
+                bucket[0] += count
+                bucket[1] += cents or 0
+        label = month_start.strftime("%Y-%m")
+        return schemas.DashboardExpenseTotals(
+            month=label,
+            count=sum(row[4] for row in rows),
+            by_type=[
+                ExpenseSummaryGroup(month=label, entry_type=key, count=count, amount=from_cents(cents))
+                for key, (count, cents) in by_type.items()
+            ],
+            by_status=[
+                ExpenseSummaryGroup(month=label, status=key, count=count, amount=from_cents(cents))
+                for key, (count, cents) in by_status.items()
+            ],
+        )
@@ -0,0 +1,307 @@
+"""
+Fila de saída de e-mails.
+
+Os requests só gravam em `outbound_emails` (na mesma transação dos dados — ver
+`email_service._send_email_text`). Um worker em thread própria reserva lotes vencidos e
+envia todos pela mesma sessão SMTP, que fica aberta entre lotes e é fechada após um
+período ocioso. Falhas transitórias (4xx, conexão) são reagendadas com backoff
+exponencial; respostas 5xx ou o limite de tentativas marcam a mensagem como `failed`.
+"""
+
+import logging
+import os
+import random
+import smtplib
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.outbound_email_model import OutboundEmail
+from app.repositories.outbound_email_repository import OutboundEmailRepository
+from app.services.email_service import OUTBOX_WAKE_KEY, _build_message, _smtp_settings
+
+logger = logging.getLogger(__name__)
+
+EMAIL_QUEUE_BATCH_SIZE = int(os.getenv("EMAIL_QUEUE_BATCH_SIZE", "50"))
+EMAIL_QUEUE_POLL_SECONDS = float(os.getenv("EMAIL_QUEUE_POLL_SECONDS", "5"))
+EMAIL_QUEUE_MAX_ATTEMPTS = int(os.getenv("EMAIL_QUEUE_MAX_ATTEMPTS", "6"))
+EMAIL_QUEUE_BACKOFF_SECONDS = float(os.getenv("EMAIL_QUEUE_BACKOFF_SECONDS", "30"))
+EMAIL_QUEUE_BACKOFF_MAX_SECONDS = 3600.0
+EMAIL_QUEUE_SENT_RETENTION_DAYS = int(os.getenv("EMAIL_QUEUE_SENT_RETENTION_DAYS", "30"))
+SMTP_IDLE_SECONDS = float(os.getenv("SMTP_IDLE_SECONDS", "60"))
+# Reserva de um lote; se o processo cair no meio do envio, as linhas voltam à fila depois disso.
+CLAIM_LEASE = timedelta(minutes=5)
+PRUNE_INTERVAL = timedelta(hours=1)
+
+
+def email_queue_enabled() -> bool:
+    return os.getenv("EMAIL_QUEUE_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+
+
+def connect_smtp() -> smtplib.SMTP:
+    host, port, user, password, _ = _smtp_settings()
+    smtp = smtplib.SMTP(host, port, timeout=30)
+    try:
+        smtp.starttls()
+        smtp.login(user, password)
+    except Exception:
+        smtp.close()
+        raise
+    return smtp
+
+
+class SmtpConnectionPool:
+    """
+    Uma sessão SMTP autenticada reaproveitada entre lotes (o worker é uma thread só).
+    Depois de `check_after_seconds` parada, confirma com NOOP antes de reusar; após
+    `idle_seconds` sem uso, encerra (QUIT) para não segurar conexão no relay.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], smtplib.SMTP] = connect_smtp,
+        idle_seconds: float = SMTP_IDLE_SECONDS,
+        check_after_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._connect = connect
+        self.idle_seconds = idle_seconds
+        self.check_after_seconds = check_after_seconds
+        self.clock = clock
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self.connections_opened = 0
+
+    def acquire(self) -> smtplib.SMTP:
+        if self._smtp is not None:
+            idle = self.clock() - self._last_used
+            if idle >= self.idle_seconds:
+                self.close()
+            elif idle < self.check_after_seconds or self._alive():
+                return self._smtp
+            else:
+                self.discard()
+        self._smtp = self._connect()
+        self.connections_opened += 1
+        self._last_used = self.clock()
+        return self._smtp
+
+    def _alive(self) -> bool:
+        try:
+            return self._smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def release(self) -> None:
+        self._last_used = self.clock()
+
+    def close_if_idle(self) -> None:
+        if self._smtp is not None and self.clock() - self._last_used >= self.idle_seconds:
+            self.close()
+
+    def discard(self) -> None:
+        """Conexão quebrada: fecha o socket sem QUIT."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.close()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+
+def _is_permanent(exc: Exception) -> bool:
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(500 <= code < 600 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 500 <= exc.smtp_code < 600
+    return False
+
+
+def _connection_error(exc: Exception) -> bool:
+    """Erros sem resposta do servidor (queda, timeout): a sessão não serve mais."""
+    return not isinstance(exc, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused))
+
+
+def _describe(exc: Exception) -> str:
+    return f"{type(exc).__name__}: {exc}"[:1000]
+
+
+class EmailQueueWorker:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        pool: Optional[SmtpConnectionPool] = None,
+        batch_size: int = EMAIL_QUEUE_BATCH_SIZE,
+        poll_seconds: float = EMAIL_QUEUE_POLL_SECONDS,
+        max_attempts: int = EMAIL_QUEUE_MAX_ATTEMPTS,
+        backoff_seconds: float = EMAIL_QUEUE_BACKOFF_SECONDS,
+        from_addr: Optional[str] = None,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.session_factory = session_factory
+        self.pool = pool or SmtpConnectionPool()
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.from_addr = from_addr
+        self.clock = clock
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_prune: Optional[datetime] = None
+
+    # --- ciclo de vida --------------------------------------------------------------------
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self.run, name="email-queue", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+    def run(self) -> None:
+        try:
+            while not self._stopping.is_set():
+                self._wakeup.clear()  # antes de drenar: um wake durante o lote não se perde
+                try:
+                    claimed = self.drain_once()
+                    self._maybe_prune()
+                except Exception:  # noqa: BLE001 — o worker não pode morrer por um lote
+                    logger.exception("Falha ao processar a fila de e-mails")
+                    claimed = 0
+                if claimed >= self.batch_size:
+                    continue  # ainda há fila: segue sem esperar
+                self.pool.close_if_idle()
+                self._wakeup.wait(self.poll_seconds)
+        finally:
+            self.pool.close()
+
+    # --- envio ---------------------------------------------------------------------------
+
+    def drain_once(self) -> int:
+        """Reserva e envia um lote; devolve quantas mensagens foram reservadas."""
+        db = self.session_factory()
+        try:
+            repo = OutboundEmailRepository(db)
+            rows = repo.claim_batch(self.clock(), self.batch_size, CLAIM_LEASE)
+            if rows:
+                self._deliver(repo, rows)
+                db.commit()
+            return len(rows)
+        finally:
+            db.close()
+
+    def _deliver(self, repo: OutboundEmailRepository, rows: List[OutboundEmail]) -> None:
+        try:
+            from_addr = self.from_addr or _smtp_settings()[4]
+            smtp = self.pool.acquire()
+        except Exception as exc:  # noqa: BLE001 — relay fora do ar / configuração: tenta depois
+            logger.warning("SMTP indisponível: %s", exc)
+            for row in rows:
+                self._reschedule(repo, row, exc)
+            return
+
+        sent: List[int] = []
+        for index, row in enumerate(rows):
+            try:
+                message = _build_message(from_addr, row.to_email, row.subject, row.body_text, row.body_html)
+            except Exception as exc:  # noqa: BLE001 — cabeçalho inválido nunca vai passar
+                repo.mark_failed(row, _describe(exc))
+                continue
+            try:
+                smtp.send_message(message)
+            except (smtplib.SMTPException, OSError) as exc:
+                self._reschedule(repo, row, exc)
+                if _connection_error(exc):
+                    self.pool.discard()
+                    for pending in rows[index + 1:]:
+                        self._reschedule(repo, pending, exc)
+                    break
+                continue
+            sent.append(row.id)
+        else:
+            self.pool.release()
+        repo.mark_sent(sent, self.clock())
+
+    def _reschedule(self, repo: OutboundEmailRepository, row: OutboundEmail, exc: Exception) -> None:
+        error = _describe(exc)
+        attempts = (row.attempts or 0) + 1
+        if _is_permanent(exc) or attempts >= self.max_attempts:
+            logger.warning("E-mail %s para %s descartado: %s", row.id, row.to_email, error)
+            repo.mark_failed(row, error)
+            return
+        repo.mark_retry(row, self.clock() + self._backoff(attempts), error)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = min(self.backoff_seconds * 2 ** (attempts - 1), EMAIL_QUEUE_BACKOFF_MAX_SECONDS)
+        return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+    def _maybe_prune(self) -> None:
+        now = self.clock()
+        if self._last_prune is not None and now - self._last_prune < PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        db = self.session_factory()
+        try:
+            OutboundEmailRepository(db).prune_sent(now - timedelta(days=EMAIL_QUEUE_SENT_RETENTION_DAYS))
+        finally:
+            db.close()
+
+
+# --- integração com a aplicação ----------------------------------------------------------
+
+_worker: Optional[EmailQueueWorker] = None
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop(OUTBOX_WAKE_KEY, False) and _worker is not None:
+        _worker.wake()
+
+
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(OUTBOX_WAKE_KEY, None)
+
+
+def start(worker: Optional[EmailQueueWorker] = None) -> None:
+    global _worker
+    if _worker is not None or (worker is None and not email_queue_enabled()):
+        return
+    _worker = worker or EmailQueueWorker()
+    sa_event.listen(Session, "after_commit", _after_commit)
+    sa_event.listen(Session, "after_soft_rollback", _after_soft_rollback)
+    _worker.start()
+
+
+def stop() -> None:
+    global _worker
+    worker, _worker = _worker, None
+    if worker is None:
+        return
+    sa_event.remove(Session, "after_commit", _after_commit)
+    sa_event.remove(Session, "after_soft_rollback", _after_soft_rollback)
+    worker.stop()
@@ -1,8 +1,14 @@
-import html
 import os
-import smtplib
 from email.message import EmailMessage
 
+from sqlalchemy.orm import Session
+
+from app.repositories.outbound_email_repository import OutboundEmailRepository
+from app.services import email_templates
+
+# Sinaliza ao hook after_commit da fila que há e-mail novo (acorda o worker sem esperar o polling).
+OUTBOX_WAKE_KEY = "email_queue.wake"
+
 
 def _clean_env_secret(raw: str) -> str:
     """Strip whitespace, UTF-8 BOM, and optional surrounding quotes from .env values."""
@@ -17,16 +23,15 @@ def build_set_password_link(raw_token: str, frontend_base: str) -> str:
     return f"{base}/?flow=set-password&token={raw_token}"
 
 
-def send_password_reset_email(to_email: str, full_name: str, set_password_link: str) -> None:
+def send_password_reset_email(
+    to_email: str, full_name: str, set_password_link: str, *, db: Session
+) -> None:
     subject = "Executiva Cloud — redefinição de senha"
-    body = (
-        f"Olá, {full_name}.\n\n"
-        "Foi solicitada a redefinição da sua senha no Executiva Cloud.\n"
-        "Clique no link abaixo para escolher uma nova senha:\n\n"
-        f"{set_password_link}\n\n"
-        "Se você não solicitou, ignore este e-mail. Sua senha atual permanece ativa.\n"
+    body = email_templates.render(
+        email_templates.PASSWORD_RESET_TEXT,
+        {"full_name": full_name, "set_password_link": set_password_link},
     )
-    _send_email_text(to_email, subject, body)
+    _send_email_text(to_email, subject, body, db=db)
 
 
 def _smtp_settings() -> tuple[str, int, str, str, str]:
@@ -54,9 +59,9 @@ def _smtp_settings() -> tuple[str, int, str, str, str]:
     return host, port, user, password, from_addr
 
 
-def _send_smtp_text(to_email: str, subject: str, body: str, html_body: str | None = None) -> None:
-    host, port, user, password, from_addr = _smtp_settings()
-
+def _build_message(
+    from_addr: str, to_email: str, subject: str, body: str, html_body: str | None = None
+) -> EmailMessage:
     msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = from_addr
@@ -64,101 +69,46 @@ def _send_smtp_text(to_email: str, subject: str, body: str, html_body: str | Non
     msg.set_content(body)
     if html_body:
         msg.add_alternative(html_body, subtype="html")
+    return msg
 
-    with smtplib.SMTP(host, port, timeout=30) as smtp:
-        smtp.starttls()
-        smtp.login(user, password)
-        smtp.send_message(msg)
 
+def _send_email_text(
+    to_email: str,
+    subject: str,
+    body: str,
+    html_body: str | None = None,
+    *,
+    db: Session,
+) -> None:
+    """
+    Enfileira o e-mail em `outbound_emails` na transação de `db`; o envio SMTP é feito pelo
+    worker da fila (app.services.email_queue) após o commit. Rollback descarta o e-mail.
+    """
+    _smtp_settings()  # configuração incompleta continua falhando já no request
+    OutboundEmailRepository(db).enqueue(to_email, subject, body, html_body)
+    db.info[OUTBOX_WAKE_KEY] = True
 
-def _send_email_text(to_email: str, subject: str, body: str, html_body: str | None = None) -> None:
-    _send_smtp_text(to_email, subject, body, html_body=html_body)
 
+INVITE_SUBJECT = "Bem-vindo ao Executiva Cloud | HMR — defina sua senha"
 
-def _invite_email_plain(full_name: str, set_password_link: str) -> str:
-    return (
-        f"Olá, {full_name},\n\n"
-        "Seja bem-vindo(a) ao Executiva Cloud, plataforma da HMR.\n\n"
-        "Seu acesso foi preparado. Para começar, defina sua senha pelo link abaixo:\n\n"
-        f"{set_password_link}\n\n"
-        "Se você não solicitou este acesso, ignore este e-mail.\n\n"
-        "Atenciosamente,\n"
-        "Equipe HMR · Executiva Cloud\n"
-    )
+
+def send_invite_email(to_email: str, full_name: str, set_password_link: str, *, db: Session) -> None:
+    subject = INVITE_SUBJECT
+    context = {"full_name": full_name, "set_password_link": set_password_link}
+    body = email_templates.render(email_templates.INVITE_TEXT, context)
+    html_body = email_templates.render(email_templates.INVITE_HTML, context)
+    _send_email_text(to_email, subject, body, html_body=html_body, db=db)
 
 
-def _invite_email_html(full_name: str, set_password_link: str) -> str:
-    safe_name = html.escape(full_name)
-    safe_link = html.escape(set_password_link, quote=True)
-    return f"""\
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>Bem-vindo ao Executiva Cloud</title>
-</head>
-<body style="margin:0;padding:0;background-color:#f1f5f9;font-family:Arial,Helvetica,sans-serif;color:#0f172a;">
-  <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background-color:#f1f5f9;padding:32px 16px;">
-    <tr>
-      <td align="center">
-        <table role="presentation" width="600" cellspacing="0" cellpadding="0" style="max-width:600px;width:100%;background-color:#ffffff;border-radius:12px;overflow:hidden;border:1px solid #e2e8f0;">
-          <tr>
-            <td style="background-color:#1e293b;padding:28px 32px;">
-              <p style="margin:0;font-size:12px;letter-spacing:0.08em;text-transform:uppercase;color:#cbd5e1;font-weight:bold;">HMR</p>
-              <h1 style="margin:8px 0 0;font-size:22px;line-height:1.3;color:#ffffff;font-weight:bold;">Executiva Cloud</h1>
-            </td>
-          </tr>
-          <tr>
-            <td style="padding:32px;">
-              <p style="margin:0 0 16px;font-size:16px;line-height:1.5;">Olá, <strong>{safe_name}</strong>,</p>
-              <p style="margin:0 0 16px;font-size:15px;line-height:1.6;color:#334155;">
-                Seja bem-vindo(a) ao <strong>Executiva Cloud</strong>, a plataforma da <strong>HMR</strong> para gestão executiva.
-              </p>
-              <p style="margin:0 0 28px;font-size:15px;line-height:1.6;color:#334155;">
-                Seu acesso foi preparado. Clique no botão abaixo para criar sua senha e entrar na plataforma.
-              </p>
-              <table role="presentation" cellspacing="0" cellpadding="0" style="margin:0 0 28px;">
-                <tr>
-                  <td style="border-radius:8px;background-color:#0f172a;">
-                    <a href="{safe_link}" style="display:inline-block;padding:14px 24px;font-size:15px;font-weight:bold;color:#ffffff;text-decoration:none;">
-                      Criar minha senha
-                    </a>
-                  </td>
-                </tr>
-              </table>
-              <p style="margin:0 0 8px;font-size:13px;line-height:1.5;color:#64748b;">
-                Se o botão não funcionar, copie e cole este link no navegador:
-              </p>
-              <p style="margin:0 0 28px;font-size:13px;line-height:1.5;word-break:break-all;">
-                <a href="{safe_link}" style="color:#334155;">{safe_link}</a>
-              </p>
-              <p style="margin:0;font-size:13px;line-height:1.5;color:#64748b;">
-                Se você não solicitou este acesso, ignore este e-mail.
-              </p>
-            </td>
-          </tr>
-          <tr>
-            <td style="padding:20px 32px;background-color:#f8fafc;border-top:1px solid #e2e8f0;">
-              <p style="margin:0;font-size:12px;line-height:1.5;color:#94a3b8;">
-                Equipe HMR · Executiva Cloud
-              </p>
-            </td>
-          </tr>
-        </table>
-      </td>
-    </tr>
-  </table>
-</body>
-</html>
-"""
-
-
-def send_invite_email(to_email: str, full_name: str, set_password_link: str) -> None:
-    subject = "Bem-vindo ao Executiva Cloud | HMR — defina sua senha"
-    body = _invite_email_plain(full_name, set_password_link)
-    html_body = _invite_email_html(full_name, set_password_link)
-    _send_email_text(to_email, subject, body, html_body=html_body)
+def send_invite_emails(invites: list[tuple[str, str, str]], *, db: Session) -> None:
+    """Convites em lote (e-mail, nome, link): renderização em lote; o worker envia numa sessão SMTP."""
+    if not invites:
+        return
+    contexts = [{"full_name": full_name, "set_password_link": link} for _, full_name, link in invites]
+    bodies = email_templates.render_many(email_templates.INVITE_TEXT, contexts)
+    html_bodies = email_templates.render_many(email_templates.INVITE_HTML, contexts)
+    for (to_email, _, _), body, html_body in zip(invites, bodies, html_bodies):
+        _send_email_text(to_email, INVITE_SUBJECT, body, html_body=html_body, db=db)
 
 
 def _support_target_email() -> str:
@@ -180,19 +130,36 @@ def send_problem_report_email(
     screen_label: str | None = None,
     page_url: str | None = None,
     user_agent: str | None = None,
+    db: Session,
 ) -> None:
     subject_scope = "Login" if context == "login" else (screen_label or "Aplicação")
     subject = f"Executiva Cloud — Report de problema — {subject_scope} — {category}"
-    body_lines = [
-        f"Categoria: {category}",
-        f"Contexto: {context}",
-        f"Nome do usuário: {reporter_name or '(não informado)'}",
-        f"E-mail de contato: {reporter_email}",
-        f"Tela: {screen_label or '-'}",
-        f"URL: {page_url or '-'}",
-        f"Navegador: {user_agent or '-'}",
-        "",
-        "Descrição:",
-        description.strip(),
-    ]
-    _send_email_text(_support_target_email(), subject, "\n".join(body_lines))
+    body = email_templates.render(
+        email_templates.PROBLEM_REPORT_TEXT,
+        {
+            "category": category,
+            "context": context,
+            "reporter_name": reporter_name,
+            "reporter_email": reporter_email,
+            "screen_label": screen_label,
+            "page_url": page_url,
+            "user_agent": user_agent,
+            "description": description,
+        },
+    )
+    _send_email_text(_support_target_email(), subject, body, db=db)
+
+
+def send_event_reminder_emails(digests: list[tuple[str, str, list[str]]], *, db: Session) -> None:
+    """Um e-mail por executivo (e-mail, nome, linhas de lembrete); o worker envia o lote numa sessão SMTP."""
+    bodies = email_templates.render_many(
+        email_templates.REMINDER_DIGEST_TEXT,
+        ({"full_name": full_name, "lines": lines} for _, full_name, lines in digests),
+    )
+    for (to_email, _, lines), body in zip(digests, bodies):
+        subject = (
+            f"Executiva Cloud — lembrete: {lines[0]}"
+            if len(lines) == 1
+            else f"Executiva Cloud — {len(lines)} compromissos em breve"
+        )
+        _send_email_text(to_email, subject, body, db=db)
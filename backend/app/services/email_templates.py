@@ -0,0 +1,72 @@
+"""
+Templates de e-mail (Jinja2) em app/templates/email.
+
+Todos são compilados uma única vez (`load_templates`, chamado no arranque da API) e ficam
+em memória: o texto estático vira constantes no código Python gerado pelo Jinja, então
+cada renderização só intercala o contexto. `.html` tem autoescape; `.txt` não.
+`render_many` renderiza o mesmo template para vários destinatários (convites em lote,
+resumos de lembrete).
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, select_autoescape
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates" / "email"
+
+INVITE_HTML = "invite.html"
+INVITE_TEXT = "invite.txt"
+PASSWORD_RESET_TEXT = "password_reset.txt"
+PROBLEM_REPORT_TEXT = "problem_report.txt"
+REMINDER_DIGEST_TEXT = "reminder_digest.txt"
+
+TEMPLATE_NAMES = (
+    INVITE_HTML,
+    INVITE_TEXT,
+    PASSWORD_RESET_TEXT,
+    PROBLEM_REPORT_TEXT,
+    REMINDER_DIGEST_TEXT,
+)
+
+_env = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=select_autoescape(enabled_extensions=("html",), default=False),
+    undefined=StrictUndefined,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    auto_reload=False,  # sem stat() do arquivo a cada get_template
+    cache_size=-1,
+)
+
+_compiled: Dict[str, Template] = {}
+_lock = threading.Lock()
+
+
+def load_templates() -> Dict[str, Template]:
+    """Compila todos os templates (idempotente). Template com erro falha já no arranque."""
+    if len(_compiled) != len(TEMPLATE_NAMES):
+        with _lock:
+            for name in TEMPLATE_NAMES:
+                if name not in _compiled:
+                    _compiled[name] = _env.get_template(name)
+    return _compiled
+
+
+def get_template(name: str) -> Template:
+    template = _compiled.get(name)
+    if template is None:
+        template = load_templates().get(name) or _env.get_template(name)
+    return template
+
+
+def render(name: str, context: Mapping[str, Any]) -> str:
+    return get_template(name).render(context)
+
+
+def render_many(name: str, contexts: Iterable[Mapping[str, Any]]) -> List[str]:
+    template = get_template(name)
+    render_one = template.render
+    return [render_one(context) for context in contexts]
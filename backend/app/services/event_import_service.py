@@ -0,0 +1,357 @@
+import io
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import IO, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.icalendar import (
+    ParsedVEvent,
+    all_day_bounds,
+    iter_content_lines,
+    iter_vevents,
+    parse_datetime_value,
+    parse_duration,
+    parse_exdates,
+    parse_rrule,
+)
+from app.core.recurrence import MAX_OCCURRENCES, RecurrenceParams, expand_datetimes
+from app.repositories.event_repository import EventRepository
+from app.repositories.event_type_repository import EventTypeRepository
+from app.repositories.executive_repository import ExecutiveRepository
+from app.schemas import event_schema as schemas
+
+IMPORT_CHUNK_SIZE = int(os.getenv("EVENT_IMPORT_CHUNK_SIZE", "500"))
+OPEN_ENDED_HORIZON_DAYS = 365
+TITLE_MAX_LENGTH = 255
+
+_ROW_KEYS = (
+    "title",
+    "description",
+    "start_time",
+    "end_time",
+    "location",
+    "event_type_id",
+    "executive_id",
+    "reminder_minutes",
+    "recurrence_id",
+    "recurrence",
+)
+
+
+@dataclass
+class _PlannedItem:
+    index: int
+    uid: Optional[str]
+    title: str
+    rows: List[dict]
+    is_series: bool = False
+    message: Optional[str] = None
+
+
+@dataclass
+class _Override:
+    item: _PlannedItem
+    series_uid: str
+    original_start: datetime
+
+
+@dataclass
+class _Series:
+    recurrence_id: str
+    recurrence: dict
+
+
+@dataclass
+class _ImportState:
+    pending: List[_PlannedItem] = field(default_factory=list)
+    pending_rows: int = 0
+    overrides: List[_Override] = field(default_factory=list)
+    series_by_uid: Dict[str, _Series] = field(default_factory=dict)
+    report: List[schemas.EventImportItemResult] = field(default_factory=list)
+    total: int = 0
+    created_events: int = 0
+    created_series: int = 0
+    failed: int = 0
+
+
+def _recurrence_json(rule: RecurrenceParams) -> dict:
+    model = schemas.RecurrenceRule(
+        frequency=rule.frequency,
+        interval=rule.interval,
+        days_of_week=rule.days_of_week,
+        end_date=rule.end_date,
+        count=rule.count,
+    )
+    return model.model_dump(by_alias=False, mode="json", exclude_none=True)
+
+
+def _row(base: dict, start: datetime, end: datetime, **extra) -> dict:
+    row = {key: None for key in _ROW_KEYS}
+    row.update(base)
+    row.update(start_time=start, end_time=end, **extra)
+    return row
+
+
+class EventImportService:
+    """Importação de .ics em streaming: um VEVENT por vez, gravação em lotes (executemany)."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.event_repo = EventRepository(db=db)
+        self.event_type_repo = EventTypeRepository(db=db)
+        self.executive_repo = ExecutiveRepository()
+
+    def import_ics(
+        self,
+        stream: IO[bytes],
+        executive_id: int,
+        event_type_id: Optional[int] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> schemas.EventImportResult:
+        # Referências validadas uma vez para o arquivo inteiro.
+        if self.executive_repo.get_by_id(self.db, executive_id) is None:
+            raise ValueError("Executivo informado não existe.")
+        type_ids_by_name: Dict[str, int] = {}
+        if event_type_id is not None:
+            if self.event_type_repo.get_by_id(event_type_id) is None:
+                raise ValueError("Tipo de evento informado não existe.")
+        else:
+            type_ids_by_name = {
+                t.name.strip().lower(): t.id for t in self.event_type_repo.get_all(limit=10000)
+            }
+
+        state = _ImportState()
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline="")
+        try:
+            for index, vevent in enumerate(iter_vevents(iter_content_lines(text)), start=1):
+                state.total += 1
+                uid = vevent.text("UID")
+                title = (vevent.text("SUMMARY") or "").strip() or "(Sem título)"
+                try:
+                    self._plan(state, index, uid, title, vevent, executive_id, event_type_id, type_ids_by_name)
+                except ValueError as error:
+                    state.failed += 1
+                    state.report.append(
+                        schemas.EventImportItemResult(
+                            index=index, uid=uid, title=title, status="error", message=str(error)
+                        )
+                    )
+                    continue
+                if state.pending_rows >= chunk_size:
+                    self._flush(state)
+            self._flush(state)
+            self._apply_overrides(state)
+        finally:
+            text.detach()
+
+        return schemas.EventImportResult(
+            totalVevents=state.total,
+            createdEvents=state.created_events,
+            createdSeries=state.created_series,
+            failed=state.failed,
+            items=sorted(state.report, key=lambda item: item.index),
+        )
+
+    def _plan(
+        self,
+        state: _ImportState,
+        index: int,
+        uid: Optional[str],
+        title: str,
+        vevent: ParsedVEvent,
+        executive_id: int,
+        event_type_id: Optional[int],
+        type_ids_by_name: Dict[str, int],
+    ) -> None:
+        dtstart = vevent.first("DTSTART")
+        if dtstart is None:
+            raise ValueError("VEVENT sem DTSTART.")
+        start, all_day = parse_datetime_value(dtstart[1], dtstart[0])
+
+        end: Optional[datetime] = None
+        dtend = vevent.first("DTEND")
+        if dtend is not None:
+            end = parse_datetime_value(dtend[1], dtend[0])[0]
+        elif vevent.first("DURATION") is not None:
+            duration = parse_duration(vevent.first("DURATION")[1])
+            if duration is None:
+                raise ValueError("DURATION inválida.")
+            end = start + duration
+        if all_day:
+            start, end = all_day_bounds(start, end)
+        if end is None or end <= start:
+            raise ValueError("A data/hora de fim deve ser maior que a de início.")
+
+        if event_type_id is None:
+            categories = vevent.text("CATEGORIES") or ""
+            for name in categories.split(","):
+                event_type_id = type_ids_by_name.get(name.strip().lower())
+                if event_type_id is not None:
+                    break
+
+        base = {
+            "title": title[:TITLE_MAX_LENGTH],
+            "description": vevent.text("DESCRIPTION"),
+            "location": vevent.text("LOCATION"),
+            "event_type_id": event_type_id,
+            "executive_id": executive_id,
+            "reminder_minutes": vevent.alarm_minutes,
+        }
+
+        recurrence_id_prop = vevent.first("RECURRENCE-ID")
+        if recurrence_id_prop is not None and uid:
+            original_start = parse_datetime_value(recurrence_id_prop[1], recurrence_id_prop[0])[0]
+            item = _PlannedItem(index=index, uid=uid, title=title, rows=[_row(base, start, end)])
+            state.overrides.append(_Override(item=item, series_uid=uid, original_start=original_start))
+            return
+
+        rrule_prop = vevent.first("RRULE")
+        if rrule_prop is None:
+            self._queue(state, _PlannedItem(index=index, uid=uid, title=title, rows=[_row(base, start, end)]))
+            return
+
+        rule = parse_rrule(rrule_prop[1], start)
+        if rule is None:
+            self._queue(
+                state,
+                _PlannedItem(
+                    index=index,
+                    uid=uid,
+                    title=title,
+                    rows=[_row(base, start, end)],
+                    message="Regra de recorrência não suportada; importada apenas a primeira ocorrência.",
+                ),
+            )
+            return
+
+        rows, message = self._expand_series(base, start, end, rule, parse_exdates(vevent), all_day)
+        self._queue(
+            state,
+            _PlannedItem(index=index, uid=uid, title=title, rows=rows, is_series=True, message=message),
+        )
+        if uid:
+            first = rows[0]
+            state.series_by_uid[uid] = _Series(first["recurrence_id"], first["recurrence"])
+
+    def _expand_series(
+        self,
+        base: dict,
+        start: datetime,
+        end: datetime,
+        rule: RecurrenceParams,
+        exdates: List[datetime],
+        all_day: bool,
+    ) -> Tuple[List[dict], Optional[str]]:
+        message = None
+        end_date = rule.end_date
+        count = rule.count
+        if count is None and end_date is None:
+            end_date = start.date() + timedelta(days=OPEN_ENDED_HORIZON_DAYS)
+            message = "Série sem data final: importadas as ocorrências dos próximos 12 meses."
+        if count is None or count > MAX_OCCURRENCES:
+            if count is not None:
+                message = f"Série limitada a {MAX_OCCURRENCES} ocorrências."
+            count = MAX_OCCURRENCES
+        bounded = RecurrenceParams(
+            frequency=rule.frequency,
+            interval=rule.interval,
+            days_of_week=rule.days_of_week,
+            end_date=end_date,
+            count=count,
+        )
+        starts = expand_datetimes(start, bounded)
+        if exdates:
+            if all_day:
+                excluded_days = {d.date() for d in exdates}
+                starts = [s for s in starts if s.date() not in excluded_days]
+            else:
+                excluded = set(exdates)
+                starts = [s for s in starts if s not in excluded]
+        if not starts:
+            raise ValueError("Todas as ocorrências da série foram excluídas (EXDATE).")
+
+        duration = end - start
+        recurrence_id = str(uuid.uuid4())
+        recurrence = _recurrence_json(
+            RecurrenceParams(
+                frequency=rule.frequency,
+                interval=rule.interval,
+                days_of_week=rule.days_of_week,
+                end_date=end_date if rule.count is None else None,
+                count=min(rule.count, MAX_OCCURRENCES) if rule.count is not None else None,
+            )
+        )
+        rows = [
+            _row(base, s, s + duration, recurrence_id=recurrence_id, recurrence=recurrence)
+            for s in starts
+        ]
+        return rows, message
+
+    def _queue(self, state: _ImportState, item: _PlannedItem) -> None:
+        state.pending.append(item)
+        state.pending_rows += len(item.rows)
+
+    def _flush(self, state: _ImportState) -> None:
+        if not state.pending:
+            return
+        items, state.pending, state.pending_rows = state.pending, [], 0
+        try:
+            self.event_repo.bulk_insert([row for item in items for row in item.rows])
+        except SQLAlchemyError:
+            self.db.rollback()
+            for item in items:
+                self._record_failure(state, item, "Falha ao gravar o lote de eventos.")
+            return
+        for item in items:
+            self._record_success(state, item)
+
+    def _apply_overrides(self, state: _ImportState) -> None:
+        """Exceções (RECURRENCE-ID) substituem a ocorrência original da série, numa só transação."""
+        if not state.overrides:
+            return
+        try:
+            for override in state.overrides:
+                series = state.series_by_uid.get(override.series_uid)
+                row = override.item.rows[0]
+                if series is None:
+                    continue
+                self.event_repo.delete_occurrence(series.recurrence_id, override.original_start)
+                row.update(recurrence_id=series.recurrence_id, recurrence=series.recurrence)
+            self.event_repo.bulk_insert([o.item.rows[0] for o in state.overrides])
+        except SQLAlchemyError:
+            self.db.rollback()
+            for override in state.overrides:
+                self._record_failure(state, override.item, "Falha ao gravar a exceção da série.")
+            return
+        for override in state.overrides:
+            self._record_success(state, override.item)
+
+    def _record_success(self, state: _ImportState, item: _PlannedItem) -> None:
+        state.created_events += len(item.rows)
+        if item.is_series:
+            state.created_series += 1
+        if item.message:
+            state.report.append(
+                schemas.EventImportItemResult(
+                    index=item.index,
+                    uid=item.uid,
+                    title=item.title,
+                    status="created",
+                    createdCount=len(item.rows),
+                    message=item.message,
+                )
+            )
+
+    def _record_failure(self, state: _ImportState, item: _PlannedItem, message: str) -> None:
+        state.failed += 1
+        state.report.append(
+            schemas.EventImportItemResult(
+                index=item.index, uid=item.uid, title=item.title, status="error", message=message
+            )
+        )
@@ -1,11 +1,13 @@
 import uuid
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.intervals import Interval, overlapping_pairs
 from app.core.recurrence import expand_datetimes
 from app.models import event_model as models
 from app.repositories.event_repository import EventRepository
@@ -18,6 +20,16 @@ def _recurrence_json(rule: schemas.RecurrenceRule) -> dict:
     return rule.model_dump(by_alias=False, mode="json", exclude_none=True)
 
 
+class EventConflictError(ValueError):
+    """Modo `reject`: há sobreposição com eventos existentes do executivo."""
+
+    def __init__(self, conflicts: List[schemas.EventConflict]):
+        titles = ", ".join(dict.fromkeys(c.title for c in conflicts[:3]))
+        more = "" if len(conflicts) <= 3 else f" e mais {len(conflicts) - 3}"
+        super().__init__(f"Conflito de agenda com: {titles}{more}.")
+        self.conflicts = conflicts
+
+
 class EventService:
     def __init__(self, db: Session = Depends(get_db)):
         self.event_repo = EventRepository(db=db)
@@ -54,14 +66,96 @@ class EventService:
     ) -> List[models.Event]:
         return self.event_repo.get_all(skip=skip, limit=limit, executive_id=executive_id)
 
-    def create_event(self, payload: schemas.EventCreate) -> models.Event:
+    def find_conflicts(
+        self,
+        executive_id: int,
+        occurrences: Sequence[Interval],
+        exclude_ids: Sequence[int] = (),
+        exclude_recurrence_id: Optional[str] = None,
+    ) -> Dict[datetime, List[schemas.EventConflict]]:
+        """
+        Conflitos por início de ocorrência. Uma única consulta carrega os intervalos da
+        janela [primeiro início, último fim); a comparação é feita por varredura ordenada.
+        """
+        if not occurrences:
+            return {}
+        rows = self.event_repo.get_intervals(
+            [executive_id],
+            min(o.start for o in occurrences),
+            max(o.end for o in occurrences),
+            exclude_ids=exclude_ids,
+            exclude_recurrence_id=exclude_recurrence_id,
+        )
+        existing = [Interval(row.start_time, row.end_time, row) for row in rows]
+        found: Dict[datetime, List[schemas.EventConflict]] = defaultdict(list)
+        for candidate, other in overlapping_pairs(occurrences, existing):
+            row = other.key
+            found[candidate.start].append(
+                schemas.EventConflict(
+                    eventId=row.id,
+                    title=row.title,
+                    startTime=row.start_time,
+                    endTime=row.end_time,
+                    recurrenceId=row.recurrence_id,
+                    occurrenceStart=candidate.start,
+                )
+            )
+        return dict(found)
+
+    def _check_conflicts(
+        self,
+        mode: schemas.ConflictMode,
+        rows: Sequence[dict],
+        exclude_ids: Sequence[int] = (),
+        exclude_recurrence_id: Optional[str] = None,
+    ) -> Dict[datetime, List[schemas.EventConflict]]:
+        if mode == "ignore" or not rows:
+            return {}
+        conflicts = self.find_conflicts(
+            rows[0]["executive_id"],
+            [Interval(row["start_time"], row["end_time"]) for row in rows],
+            exclude_ids=exclude_ids,
+            exclude_recurrence_id=exclude_recurrence_id,
+        )
+        if conflicts and mode == "reject":
+            raise EventConflictError(
+                [c for start in sorted(conflicts) for c in conflicts[start]]
+            )
+        return conflicts
+
+    @staticmethod
+    def _attach_conflicts(
+        items: Sequence[models.Event],
+        conflicts: Dict[datetime, List[schemas.EventConflict]],
+        mode: schemas.ConflictMode,
+    ) -> None:
+        if mode == "ignore":
+            return
+        for item in items:
+            item.conflicts = conflicts.get(item.start_time, [])
+
+    def create_event(
+        self, payload: schemas.EventCreate, conflict_mode: schemas.ConflictMode = "ignore"
+    ) -> models.Event:
         data = payload.model_dump(exclude_unset=True, by_alias=False)
         if payload.recurrence is not None:
             data["recurrence"] = _recurrence_json(payload.recurrence)
         self._validate_payload_references(data)
-        return self.event_repo.create(data)
+        conflicts = self._check_conflicts(conflict_mode, [data])
+        db_item = self.event_repo.create(data)
+        self._attach_conflicts([db_item], conflicts, conflict_mode)
+        return db_item
+
+    def create_series(
+        self, payload: schemas.EventSeriesCreate, conflict_mode: schemas.ConflictMode = "ignore"
+    ) -> List[models.Event]:
+        rows = self._series_rows(payload)
+        conflicts = self._check_conflicts(conflict_mode, rows)
+        created = self.event_repo.create_many(rows)
+        self._attach_conflicts(created, conflicts, conflict_mode)
+        return created
 
-    def create_series(self, payload: schemas.EventSeriesCreate) -> List[models.Event]:
+    def _series_rows(self, payload: schemas.EventSeriesCreate) -> List[dict]:
         if payload.start_time >= payload.end_time:
             raise ValueError("A data/hora de fim deve ser maior que a de início.")
 
@@ -98,15 +192,28 @@ class EventService:
                     "recurrence": recurrence_json,
                 }
             )
-        return self.event_repo.create_many(rows)
+        return rows
 
     def replace_series(
-        self, recurrence_id: str, payload: schemas.EventSeriesCreate
+        self,
+        recurrence_id: str,
+        payload: schemas.EventSeriesCreate,
+        conflict_mode: schemas.ConflictMode = "ignore",
     ) -> List[models.Event]:
+        rows = self._series_rows(payload)
+        # Verificado antes de apagar a série antiga: um `reject` não pode perder dados.
+        conflicts = self._check_conflicts(conflict_mode, rows, exclude_recurrence_id=recurrence_id)
         self.event_repo.delete_by_recurrence(recurrence_id=recurrence_id)
-        return self.create_series(payload)
+        created = self.event_repo.create_many(rows)
+        self._attach_conflicts(created, conflicts, conflict_mode)
+        return created
 
-    def update_event(self, event_id: int, payload: schemas.EventUpdate) -> models.Event:
+    def update_event(
+        self,
+        event_id: int,
+        payload: schemas.EventUpdate,
+        conflict_mode: schemas.ConflictMode = "ignore",
+    ) -> models.Event:
         db_item = self.event_repo.get_by_id(event_id)
         if not db_item:
             raise ValueError("Evento não encontrado.")
@@ -124,7 +231,10 @@ class EventService:
             "end_time": update_data.get("end_time", db_item.end_time),
         }
         self._validate_payload_references(merged)
-        return self.event_repo.update(db_item, update_data)
+        conflicts = self._check_conflicts(conflict_mode, [merged], exclude_ids=[event_id])
+        db_item = self.event_repo.update(db_item, update_data)
+        self._attach_conflicts([db_item], conflicts, conflict_mode)
+        return db_item
 
     def delete_event(self, event_id: int):
         db_item = self.event_repo.get_by_id(event_id)
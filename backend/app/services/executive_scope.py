@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Set
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
@@ -92,3 +92,25 @@ def scoped_executives_query(db: Session, actor: user_models.Usuario):
             return q.filter(False)
         return q.filter(Executive.organization_id == org_id)
     return q.filter(False)
+
+
+def executive_visible_to_actor(
+    db: Session, actor: user_models.Usuario, executive_id: int
+) -> bool:
+    """Leitura de dados de um executivo: o próprio executivo ou quem o enxerga na listagem."""
+    if actor.role == "executive" and actor.executive_id == executive_id:
+        return True
+    return (
+        scoped_executives_query(db, actor).filter(Executive.id == executive_id).first()
+        is not None
+    )
+
+
+def visible_executive_ids(db: Session, actor: user_models.Usuario) -> Optional[Set[int]]:
+    """Ids dos executivos que o ator enxerga; None = todos (master)."""
+    if actor.role == "master":
+        return None
+    ids = {row.id for row in scoped_executives_query(db, actor).with_entities(Executive.id)}
+    if actor.role == "executive" and actor.executive_id is not None:
+        ids.add(actor.executive_id)
+    return ids
@@ -0,0 +1,261 @@
+import hashlib
+import io
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from typing import IO, Dict, List, Optional, Set, Tuple
+
+from fastapi import Depends, HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.money import to_cents
+from app.core.statement_import import iter_csv_records, iter_ofx_transactions, parse_amount, parse_date
+from app.models import user_model as user_models
+from app.repositories.expense_category_repository import ExpenseCategoryRepository
+from app.repositories.expense_repository import ExpenseRepository
+from app.repositories.executive_repository import ExecutiveRepository
+from app.schemas import expense_schema as schemas
+from app.services.executive_scope import executive_visible_to_actor
+
+IMPORT_CHUNK_SIZE = int(os.getenv("EXPENSE_IMPORT_CHUNK_SIZE", "1000"))
+# Linhas com erro listadas no relatório (a contagem `failed` segue completa)
+IMPORT_REPORT_LIMIT = 500
+
+ENTRY_TYPES = ("A pagar", "A receber")
+STATUSES = ("Pendente", "Pago", "Recebida")
+ENTITY_TYPES = ("Pessoa Física", "Pessoa Jurídica")
+_ENTITY_ABBREVIATIONS = {"pf": "Pessoa Física", "pj": "Pessoa Jurídica"}
+
+
+def _normalize(value: str) -> str:
+    return " ".join((value or "").casefold().split())
+
+
+def _choice(value: str, allowed: Tuple[str, ...], label: str) -> str:
+    wanted = _normalize(value)
+    for option in allowed:
+        if _normalize(option) == wanted:
+            return option
+    raise ValueError(f"{label} inválido: {value!r}.")
+
+
+def _signature(expense_date: date, cents: int, description: str) -> bytes:
+    """Chave de deduplicação (executivo fixo na importação): data, valor e descrição normalizada."""
+    return hashlib.sha1(f"{expense_date.isoformat()}|{cents}|{_normalize(description)}".encode("utf-8")).digest()
+
+
+def _fitid_signature(fitid: str) -> bytes:
+    """Chave de deduplicação no OFX: o FITID identifica a transação no extrato, mesmo entre lançamentos iguais."""
+    return hashlib.sha1(f"fitid|{fitid}".encode("utf-8")).digest()
+
+
+@dataclass
+class _PendingRow:
+    line: int
+    signature: bytes  # deduplicação dentro do arquivo (FITID no OFX)
+    content: bytes  # deduplicação contra o banco: data, valor e descrição
+    row: dict
+    category_key: Optional[str] = None  # categoria a criar antes do INSERT
+
+
+@dataclass
+class _ImportState:
+    pending: List[_PendingRow] = field(default_factory=list)
+    seen: Set[bytes] = field(default_factory=set)  # assinaturas do arquivo já aceitas
+    existing: Counter[bytes] = field(default_factory=Counter)  # assinaturas que já estavam no banco → quantos lançamentos
+    loaded_dates: Set[date] = field(default_factory=set)
+    category_ids: Dict[str, int] = field(default_factory=dict)  # nome normalizado → id
+    new_categories: Dict[str, str] = field(default_factory=dict)  # nome normalizado → nome original
+    created_categories: List[str] = field(default_factory=list)
+    report: List[schemas.ExpenseImportItemResult] = field(default_factory=list)
+    total: int = 0
+    created: int = 0
+    duplicates: int = 0
+    failed: int = 0
+
+
+class ExpenseImportService:
+    """Importação de CSV/OFX em streaming: uma linha por vez, gravação em lotes (executemany) por transação."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.repository = ExpenseRepository(db=db)
+        self.category_repo = ExpenseCategoryRepository(db=db)
+        self.executive_repo = ExecutiveRepository()
+
+    def import_file(
+        self,
+        actor: user_models.Usuario,
+        stream: IO[bytes],
+        executive_id: int,
+        import_format: str = "csv",
+        create_categories: bool = False,
+        default_type: str = "A pagar",
+        entity_type: str = "Pessoa Jurídica",
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> schemas.ExpenseImportResult:
+        # Referências validadas uma vez para o arquivo inteiro.
+        if self.executive_repo.get_by_id(self.db, executive_id) is None:
+            raise ValueError("Executivo informado não existe.")
+        if not executive_visible_to_actor(self.db, actor, executive_id):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+
+        state = _ImportState()
+        state.category_ids = {
+            _normalize(name): category_id
+            for name, category_id in self.category_repo.names_for_executive(executive_id).items()
+        }
+        encoding = "utf-8-sig"
+        if import_format == "ofx":
+            head = stream.read(1024)
+            stream.seek(0)
+            if b"1252" in head or b"ISO-8859-1" in head.upper():
+                encoding = "cp1252"
+        text = io.TextIOWrapper(stream, encoding=encoding, errors="replace", newline="")
+        records = iter_ofx_transactions(text) if import_format == "ofx" else iter_csv_records(text)
+        defaults = {
+            "default_type": default_type,
+            "entity_type": entity_type,
+            "create_categories": create_categories,
+            "statement": import_format == "ofx",
+        }
+        try:
+            for line, record in records:
+                state.total += 1
+                try:
+                    pending = self._plan(state, line, record, executive_id, **defaults)
+                except ValueError as error:
+                    self._record_failure(state, line, record.get("description"), str(error))
+                    continue
+                if pending.signature in state.seen:
+                    state.duplicates += 1
+                    continue
+                state.seen.add(pending.signature)
+                state.pending.append(pending)
+                if len(state.pending) >= chunk_size:
+                    self._flush(state, executive_id)
+            self._flush(state, executive_id)
+        finally:
+            text.detach()
+
+        return schemas.ExpenseImportResult(
+            total_rows=state.total,
+            created=state.created,
+            duplicates=state.duplicates,
+            failed=state.failed,
+            created_categories=state.created_categories,
+            items=state.report,
+        )
+
+    def _plan(
+        self,
+        state: _ImportState,
+        line: int,
+        record: Dict[str, str],
+        executive_id: int,
+        default_type: str,
+        entity_type: str,
+        create_categories: bool,
+        statement: bool,
+    ) -> _PendingRow:
+        amount = parse_amount(record.get("amount", ""))
+        if record.get("entry_type"):
+            entry_type = _choice(record["entry_type"], ENTRY_TYPES, "Tipo")
+        elif amount < 0:
+            entry_type = "A pagar"  # débito
+        elif amount > 0 and statement:
+            entry_type = "A receber"  # crédito no extrato; no CSV o valor positivo é o caso comum de despesa
+        else:
+            entry_type = default_type
+        category_id, category_key = None, None
+        category_name = (record.get("category") or "").strip()
+        if category_name:
+            category_key = _normalize(category_name)
+            category_id = state.category_ids.get(category_key)
+            if category_id is None:
+                if not create_categories:
+                    raise ValueError(f"Categoria não encontrada: {category_name}.")
+                state.new_categories.setdefault(category_key, category_name[:255])
+        entity = record.get("entity_type") or entity_type
+        entity = _ENTITY_ABBREVIATIONS.get(_normalize(entity), entity)
+        try:
+            payload = schemas.ExpenseCreate(
+                description=(record.get("description") or "").strip()[:512],
+                amount=abs(amount),
+                expense_date=parse_date(record.get("expense_date", "")),
+                entry_type=entry_type,
+                entity_type=_choice(entity, ENTITY_TYPES, "Tipo de pessoa"),
+                status=_choice(record["status"], STATUSES, "Status") if record.get("status") else "Pendente",
+                executive_id=executive_id,
+                expense_category_id=category_id,
+                receipt_url=record.get("receipt_url") or None,
+            )
+        except ValidationError as error:
+            first = error.errors()[0]
+            raise ValueError(f"Campo inválido ({'.'.join(str(part) for part in first['loc'])}): {first['msg']}.")
+
+        row = payload.model_dump(by_alias=False)
+        row["amount_cents"] = to_cents(row.pop("amount"))
+        content = _signature(row["expense_date"], row["amount_cents"], row["description"])
+        fitid = (record.get("fitid") or "").strip()
+        return _PendingRow(
+            line=line,
+            signature=_fitid_signature(fitid) if fitid else content,
+            content=content,
+            row=row,
+            category_key=category_key if category_id is None else None,
+        )
+
+    def _flush(self, state: _ImportState, executive_id: int) -> None:
+        if not state.pending:
+            return
+        chunk, state.pending = state.pending, []
+
+        # Deduplicação contra o banco: cada data é lida uma vez, antes do primeiro INSERT nela;
+        # o que a própria importação grava depois já está em `seen`. Cada lançamento do banco
+        # absorve uma linha só, então transações iguais no mesmo dia (FITIDs distintos) não somem.
+        dates = {item.row["expense_date"] for item in chunk} - state.loaded_dates
+        if dates:
+            state.existing.update(
+                _signature(expense_date, cents, description)
+                for expense_date, cents, description in self.repository.existing_signatures(executive_id, dates)
+            )
+            state.loaded_dates.update(dates)
+        fresh = []
+        for item in chunk:
+            if state.existing[item.content] > 0:
+                state.existing[item.content] -= 1
+                state.duplicates += 1
+            else:
+                fresh.append(item)
+        if not fresh:
+            return
+
+        to_create = {item.category_key for item in fresh if item.category_key is not None} - set(state.category_ids)
+        try:
+            created = self.category_repo.bulk_create(executive_id, [state.new_categories[key] for key in sorted(to_create)])
+            created_ids = {_normalize(name): category_id for name, category_id in created.items()}
+            for item in fresh:
+                if item.category_key is not None:
+                    item.row["expense_category_id"] = state.category_ids.get(item.category_key) or created_ids[item.category_key]
+            self.repository.bulk_insert([item.row for item in fresh])
+        except SQLAlchemyError:
+            self.db.rollback()
+            for item in fresh:
+                state.seen.discard(item.signature)
+                self._record_failure(state, item.line, item.row["description"], "Falha ao gravar o lote de lançamentos.")
+            return
+        state.category_ids.update(created_ids)
+        state.created_categories.extend(created)
+        state.created += len(fresh)
+
+    def _record_failure(self, state: _ImportState, line: int, description: Optional[str], message: str) -> None:
+        state.failed += 1
+        if len(state.report) < IMPORT_REPORT_LIMIT:
+            state.report.append(
+                schemas.ExpenseImportItemResult(line=line, description=description or None, message=message)
+            )
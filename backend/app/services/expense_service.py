@@ -1,15 +1,33 @@
-from decimal import Decimal
-from typing import List, Optional
+from datetime import date
+from typing import Dict, List, Optional
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.money import from_cents
 from app.models import expense_model as models
+from app.models import user_model as user_models
+from app.models.expense_category_model import ExpenseCategory
 from app.repositories.expense_category_repository import ExpenseCategoryRepository
 from app.repositories.expense_repository import ExpenseRepository
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository
 from app.repositories.executive_repository import ExecutiveRepository
 from app.schemas import expense_schema as schemas
+from app.services.executive_scope import executive_visible_to_actor, visible_executive_ids
+
+# dimensão do resumo → posição na linha (mês, categoria, tipo, status, quantidade, centavos)
+_SUMMARY_DIMENSIONS = {"by_month": 0, "by_category": 1, "by_type": 2, "by_status": 3}
+
+
+def _parse_month(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        year, month = value.split("-")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        raise ValueError("Mês inválido (use AAAA-MM).")
 
 
 class ExpenseService:
@@ -43,8 +61,6 @@ class ExpenseService:
     def create_expense(self, payload: schemas.ExpenseCreate) -> models.Expense:
         data = payload.model_dump(exclude_unset=True, by_alias=False)
         self._validate_refs(data["executive_id"], data.get("expense_category_id"))
-        if isinstance(data.get("amount"), float):
-            data["amount"] = Decimal(str(data["amount"]))
         return self.repository.create(data)
 
     def update_expense(self, expense_id: int, payload: schemas.ExpenseUpdate) -> models.Expense:
@@ -57,9 +73,6 @@ class ExpenseService:
         merged_cat = update_data.get("expense_category_id", db_item.expense_category_id)
         self._validate_refs(int(merged_exec), merged_cat)
 
-        if isinstance(update_data.get("amount"), float):
-            update_data["amount"] = Decimal(str(update_data["amount"]))
-
         return self.repository.update(db_item, update_data)
 
     def delete_expense(self, expense_id: int):
@@ -68,3 +81,56 @@ class ExpenseService:
             raise ValueError("Lançamento não encontrado.")
         self.repository.delete(db_item)
         return {"message": "Lançamento excluído com sucesso."}
+
+    def get_summary(
+        self,
+        actor: user_models.Usuario,
+        executive_id: Optional[int] = None,
+        start_month: Optional[str] = None,
+        end_month: Optional[str] = None,
+    ) -> schemas.ExpenseSummary:
+        """Totais por mês, categoria, tipo e status de um executivo ou de todos os visíveis ao ator."""
+        if executive_id is not None:
+            if not executive_visible_to_actor(self.db, actor, executive_id):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+            executive_ids = {executive_id}
+        else:
+            executive_ids = visible_executive_ids(self.db, actor)
+        start, end = _parse_month(start_month), _parse_month(end_month)
+        if start and end and start > end:
+            raise ValueError("O mês inicial deve ser anterior ou igual ao mês final.")
+
+        rows = ExpenseRollupRepository(db=self.db).summary_rows(executive_ids, start, end)
+        category_ids = {row[1] for row in rows if row[1] is not None}
+        names = dict(
+            self.db.query(ExpenseCategory.id, ExpenseCategory.name).filter(ExpenseCategory.id.in_(category_ids)).all()
+        ) if category_ids else {}
+
+        def group(month: Optional[date], category_id: Optional[int], entry_type, status_value, count, cents):
+            return schemas.ExpenseSummaryGroup(
+                month=month.strftime("%Y-%m") if month else None,
+                expense_category_id=category_id,
+                category_name=names.get(category_id),
+                entry_type=entry_type,
+                status=status_value,
+                count=count,
+                amount=from_cents(cents or 0),
+            )
+
+        summary: Dict[str, List[schemas.ExpenseSummaryGroup]] = {}
+        for field, position in _SUMMARY_DIMENSIONS.items():
+            totals: Dict[object, List] = {}
+            for row in rows:
+                bucket = totals.setdefault(row[position], [0, 0])
+                bucket[0] += row[4]
+                bucket[1] += row[5] or 0
+            summary[field] = []
+            for key, (count, cents) in totals.items():
+                dimensions = [None, None, None, None]
+                dimensions[position] = key
+                summary[field].append(group(*dimensions, count, cents))
+        return schemas.ExpenseSummary(
+            count=sum(row[4] for row in rows),
+            groups=[group(*row) for row in rows],
+            **summary,
+        )
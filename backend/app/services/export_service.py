@@ -0,0 +1,38 @@
+from typing import Iterator, Optional
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.tabular_export import iter_export
+from app.models import user_model as user_models
+from app.repositories.export_repository import ExportRepository
+from app.services.executive_scope import executive_visible_to_actor, visible_executive_ids
+
+# entidade → nome da planilha
+EXPORT_SHEET_NAMES = {"expenses": "Financeiro", "events": "Agenda", "contacts": "Contatos"}
+
+
+class ExportService:
+    """Exporta listas (financeiro, agenda, contatos) em CSV/XLSX sem carregar tudo em memória."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.repository = ExportRepository(db=db)
+
+    def iter_entity(
+        self,
+        actor: user_models.Usuario,
+        entity: str,
+        export_format: str,
+        executive_id: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """Valida o escopo já na chamada; os bytes saem conforme o cliente consome."""
+        if executive_id is not None:
+            if not executive_visible_to_actor(self.db, actor, executive_id):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+            executive_ids = {executive_id}
+        else:
+            executive_ids = visible_executive_ids(self.db, actor)
+        rows = self.repository.iter_rows(entity, executive_ids)
+        return iter_export(export_format, self.repository.header(entity), rows, sheet_name=EXPORT_SHEET_NAMES[entity])
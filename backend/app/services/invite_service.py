@@ -1,9 +1,14 @@
+import csv
+import io
 import os
 import secrets
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set
 
 from fastapi import Depends, HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -21,7 +26,12 @@ from app.repositories.user_repository import UserRepository
 from app.schemas import auth_schema as auth_schemas
 from app.schemas.executive_schema import ExecutiveProfileComplete
 from app.services.auth_service import _user_to_public
-from app.services.email_service import build_set_password_link, send_invite_email
+from app.services.email_service import (
+    _smtp_settings,
+    build_set_password_link,
+    send_invite_email,
+    send_invite_emails,
+)
 from app.core.tenant_scope import normalize_user_scope_fields, validate_user_tenant_scope
 from app.services.executive_service import integrity_error_detail, raise_if_cpf_taken
 from app.services.secretary_service import SecretaryService, validated_secretary_executive_ids_for_org
@@ -31,6 +41,10 @@ InvitedRole = Literal["admin_company", "executive", "secretary"]
 INVITER_ROLES = frozenset({"master", "admin_legal_organization", "admin_company"})
 
 INVITE_DAYS = int(os.getenv("INVITE_TOKEN_DAYS", "7"))
+BULK_INVITE_MAX_ROWS = int(os.getenv("BULK_INVITE_MAX_ROWS", "1000"))
+BULK_INVITE_CHUNK_SIZE = int(os.getenv("BULK_INVITE_CHUNK_SIZE", "100"))
+# Limite de parâmetros por IN (...) nas consultas de validação.
+_IN_CHUNK = 500
 
 
 def _utcnow() -> datetime:
@@ -98,6 +112,52 @@ def _require_org_for_invited_role(
     return organization_id
 
 
+def parse_bulk_invite_csv(data: bytes) -> List[Dict[str, Any]]:
+    """CSV com cabeçalho (fullName, email, invitedRole, organizationId, secretaryExecutiveIds)."""
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV deve estar em UTF-8.",
+        ) from exc
+    sample = text[:4096]
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(io.StringIO(text), dialect=dialect)
+    if not reader.fieldnames:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CSV sem cabeçalho.")
+    reader.fieldnames = [(name or "").strip() for name in reader.fieldnames]
+    return [
+        {key: value.strip() if isinstance(value, str) else value for key, value in row.items() if key}
+        for row in reader
+        if any((value or "").strip() for value in row.values() if isinstance(value, str))
+    ]
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first.get("loc", ()))
+    message = str(first.get("msg", "inválido")).removeprefix("Value error, ")
+    return f"{field}: {message}" if field else message
+
+
+@dataclass
+class _BulkInviteItem:
+    row: int
+    data: auth_schemas.BulkInviteRow
+    email: str
+    organization: Organization
+    executives: List[Executive]
+
+
+def _in_chunks(values: List[Any]) -> Iterable[List[Any]]:
+    for start in range(0, len(values), _IN_CHUNK):
+        yield values[start:start + _IN_CHUNK]
+
+
 class InviteService:
     def __init__(self, db: Session = Depends(get_db)):
         self.db = db
@@ -264,7 +324,7 @@ class InviteService:
             self.db.flush()
 
             link = build_set_password_link(raw_token, frontend_base)
-            send_invite_email(str(body.email), body.full_name.strip(), link)
+            send_invite_email(str(body.email), body.full_name.strip(), link, db=self.db)
 
             self.db.commit()
             self.db.refresh(user_row)
@@ -283,6 +343,251 @@ class InviteService:
             message="Convite enviado. O usuário receberá um e-mail para definir a senha.",
         )
 
+    def invite_users_bulk(
+        self,
+        inviter: user_models.Usuario,
+        rows: List[Dict[str, Any]],
+        frontend_base: str,
+        default_organization_id: Optional[int] = None,
+    ) -> auth_schemas.BulkInviteResult:
+        """
+        Convida vários usuários: valida todas as linhas antes de gravar (consultas em lote para
+        e-mails existentes, empresas e executivos), grava em transações de
+        BULK_INVITE_CHUNK_SIZE linhas e enfileira os e-mails, enviados pelo worker numa só
+        sessão SMTP. Linhas inválidas não impedem as demais; o relatório traz cada linha.
+        """
+        _assert_inviter_can_invite(inviter)
+        if not rows:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Nenhum convite informado.")
+        if len(rows) > BULK_INVITE_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Máximo de {BULK_INVITE_MAX_ROWS} convites por envio.",
+            )
+
+        results: Dict[int, auth_schemas.BulkInviteItemResult] = {}
+
+        def fail(row: int, email: Optional[str], message: str) -> None:
+            results[row] = auth_schemas.BulkInviteItemResult(row=row, email=email, status="error", message=message)
+
+        parsed: List[tuple[int, auth_schemas.BulkInviteRow, str]] = []
+        first_row_by_email: Dict[str, int] = {}
+        for row_number, raw in enumerate(rows, start=1):
+            data = {key: value for key, value in raw.items() if value not in (None, "")}
+            if default_organization_id is not None and not (
+                data.get("organizationId") or data.get("organization_id")
+            ):
+                data["organizationId"] = default_organization_id
+            raw_email = str(raw.get("email") or "").strip() or None
+            try:
+                item = auth_schemas.BulkInviteRow.model_validate(data)
+            except ValidationError as exc:
+                fail(row_number, raw_email, _validation_message(exc))
+                continue
+            email = str(item.email).lower().strip()
+            if email in first_row_by_email:
+                fail(row_number, email, f"E-mail repetido no envio (linha {first_row_by_email[email]}).")
+                continue
+            first_row_by_email[email] = row_number
+            parsed.append((row_number, item, email))
+
+        emails = [email for _, _, email in parsed]
+        taken_users = self._existing_user_emails(emails)
+        taken_executives = self._existing_executive_emails(
+            [email for _, item, email in parsed if item.invited_role == "executive"]
+        )
+        organizations = self._organizations_by_id({item.organization_id for _, item, _ in parsed if item.organization_id})
+        executives = self._executives_by_id(
+            {eid for _, item, _ in parsed for eid in (item.secretary_executive_ids or [])}
+        )
+
+        valid: List[_BulkInviteItem] = []
+        for row_number, item, email in parsed:
+            if email in taken_users:
+                fail(row_number, email, "Este e-mail já está cadastrado.")
+                continue
+            if email in taken_executives:
+                fail(row_number, email, "Já existe executivo com este e-mail de trabalho.")
+                continue
+            try:
+                org_id = _require_org_for_invited_role(item.invited_role, item.organization_id, inviter)
+                org = organizations.get(org_id)
+                if org is None:
+                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organização não encontrada.")
+                _assert_inviter_org_scope(inviter, org)
+                linked = self._secretary_executives(item, org, executives)
+            except HTTPException as exc:
+                fail(row_number, email, str(exc.detail))
+                continue
+            valid.append(_BulkInviteItem(row_number, item, email, org, linked))
+
+        if valid:
+            try:
+                _smtp_settings()  # SMTP mal configurado: falha o envio todo, como no convite individual
+            except RuntimeError as exc:
+                raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
+
+        # Senha provisória nunca é revelada: um único hash bcrypt serve para o lote inteiro.
+        placeholder_hash = hash_password(secrets.token_urlsafe(48))
+        for start in range(0, len(valid), BULK_INVITE_CHUNK_SIZE):
+            chunk = valid[start:start + BULK_INVITE_CHUNK_SIZE]
+            try:
+                self._insert_invites(chunk, placeholder_hash, frontend_base, results)
+            except Exception:  # noqa: BLE001 — conflito concorrente: refaz linha a linha
+                self.db.rollback()
+                for single in chunk:
+                    try:
+                        self._insert_invites([single], placeholder_hash, frontend_base, results)
+                    except IntegrityError as exc:
+                        self.db.rollback()
+                        fail(single.row, single.email, integrity_error_detail(exc))
+                    except Exception as exc:  # noqa: BLE001
+                        self.db.rollback()
+                        fail(single.row, single.email, f"Falha ao gravar convite: {exc!s}")
+
+        items = [results[row] for row in sorted(results)]
+        invited = sum(1 for item in items if item.status == "invited")
+        return auth_schemas.BulkInviteResult(
+            total=len(rows),
+            invited=invited,
+            failed=len(items) - invited,
+            items=items,
+        )
+
+    def _existing_user_emails(self, emails: List[str]) -> Set[str]:
+        found: Set[str] = set()
+        for part in _in_chunks(emails):
+            found.update(
+                email
+                for (email,) in self.db.query(func.lower(user_models.Usuario.email))
+                .filter(func.lower(user_models.Usuario.email).in_(part))
+                .all()
+            )
+        return found
+
+    def _existing_executive_emails(self, emails: List[str]) -> Set[str]:
+        found: Set[str] = set()
+        for part in _in_chunks(emails):
+            found.update(
+                email
+                for (email,) in self.db.query(Executive.work_email).filter(Executive.work_email.in_(part)).all()
+            )
+        return found
+
+    def _organizations_by_id(self, ids: Set[int]) -> Dict[int, Organization]:
+        found: Dict[int, Organization] = {}
+        for part in _in_chunks(sorted(ids)):
+            found.update((org.id, org) for org in self.db.query(Organization).filter(Organization.id.in_(part)))
+        return found
+
+    def _executives_by_id(self, ids: Set[int]) -> Dict[int, Executive]:
+        found: Dict[int, Executive] = {}
+        for part in _in_chunks(sorted(ids)):
+            found.update((ex.id, ex) for ex in self.db.query(Executive).filter(Executive.id.in_(part)))
+        return found
+
+    @staticmethod
+    def _secretary_executives(
+        item: auth_schemas.BulkInviteRow, org: Organization, executives: Dict[int, Executive]
+    ) -> List[Executive]:
+        """Mesmas regras de validated_secretary_executive_ids_for_org, sem consulta por id."""
+        if item.invited_role != "secretary":
+            return []
+        ids = list(dict.fromkeys(item.secretary_executive_ids or []))
+        if not ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe ao menos um executivo da empresa para a secretária.",
+            )
+        linked = []
+        for eid in ids:
+            ex = executives.get(eid)
+            if ex is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Executivo inválido (id={eid}).")
+            if ex.organization_id != org.id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Todos os executivos devem pertencer à mesma empresa da secretária.",
+                )
+            linked.append(ex)
+        return linked
+
+    def _insert_invites(
+        self,
+        chunk: List[_BulkInviteItem],
+        placeholder_hash: str,
+        frontend_base: str,
+        results: Dict[int, auth_schemas.BulkInviteItemResult],
+    ) -> None:
+        """Uma transação por bloco: perfis (executivo/secretária), usuários, tokens e e-mails."""
+        profiles: Dict[int, Any] = {}
+        for item in chunk:
+            name = item.data.full_name.strip()
+            if item.data.invited_role == "executive":
+                profiles[item.row] = Executive(full_name=name, work_email=item.email, organization_id=item.organization.id)
+            elif item.data.invited_role == "secretary":
+                profiles[item.row] = Secretary(
+                    full_name=name,
+                    organization_id=item.organization.id,
+                    work_email=item.email,
+                    job_title=None,
+                    profile_json=None,
+                    executives=item.executives,
+                )
+        self.db.add_all(profiles.values())
+        self.db.flush()
+
+        users: List[user_models.Usuario] = []
+        for item in chunk:
+            role = item.data.invited_role
+            scope = normalize_user_scope_fields(
+                role=role,
+                legal_organization_id=item.organization.legalOrganizationId,
+                organization_id=item.organization.id,
+            )
+            validate_user_tenant_scope(role=role, **scope)
+            profile = profiles.get(item.row)
+            users.append(
+                user_models.Usuario(
+                    name=item.data.full_name.strip(),
+                    email=item.email,
+                    phone=None,
+                    hashed_password=placeholder_hash,
+                    is_active=True,
+                    needs_profile_completion=role != "admin_company",
+                    role=role,
+                    legal_organization_id=scope["legal_organization_id"],
+                    organization_id=scope["organization_id"],
+                    executive_id=profile.id if role == "executive" else None,
+                    secretary_external_id=str(profile.id) if role == "secretary" else None,
+                )
+            )
+        self.db.add_all(users)
+        self.db.flush()
+
+        expires_at = _utcnow() + timedelta(days=INVITE_DAYS)
+        raw_tokens = [secrets.token_urlsafe(32) for _ in users]
+        self.db.add_all(
+            UserInviteToken(
+                user_id=user.id,
+                token_hash=hash_invite_token(raw_token),
+                expires_at=expires_at,
+                used_at=None,
+            )
+            for user, raw_token in zip(users, raw_tokens)
+        )
+        send_invite_emails(
+            [
+                (user.email, user.name, build_set_password_link(raw_token, frontend_base))
+                for user, raw_token in zip(users, raw_tokens)
+            ],
+            db=self.db,
+        )
+        invited = [(item.row, item.email, user.id) for item, user in zip(chunk, users)]
+        self.db.commit()
+        for row, email, user_id in invited:
+            results[row] = auth_schemas.BulkInviteItemResult(row=row, email=email, status="invited", userId=user_id)
+
     def complete_invite(self, body: auth_schemas.CompleteInviteRequest) -> auth_schemas.TokenResponse:
         if body.password != body.password_confirm:
             raise HTTPException(
@@ -0,0 +1,461 @@
+"""
+Agendador de lembretes de eventos no servidor.
+
+Mantém em memória só os lembretes que disparam nas próximas N horas (min-heap por horário
+de disparo), carregados por uma consulta indexada por janela. Criações, alterações e
+exclusões de eventos chegam pelos hooks de sessão do ORM (after_flush/after_commit) e
+atualizam o heap incrementalmente; operações em lote (insert/delete por statement) pedem
+uma recarga da janela. A entrega é feita por canais plugáveis (SSE, e-mail em lote).
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.sse import SSE_HEARTBEAT, SSE_HEARTBEAT_SECONDS, sse_message, sse_retry
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+from app.repositories.event_repository import EventRepository
+from app.schemas import event_schema as schemas
+from app.services.email_service import send_event_reminder_emails
+
+logger = logging.getLogger(__name__)
+
+REMINDER_HORIZON_HOURS = float(os.getenv("REMINDER_HORIZON_HOURS", "6"))
+REMINDER_EMAIL_BATCH_SECONDS = float(os.getenv("REMINDER_EMAIL_BATCH_SECONDS", "60"))
+SSE_QUEUE_SIZE = 100
+
+_PENDING_KEY = "reminder_scheduler.pending"
+_BULK_KEY = "reminder_scheduler.bulk"
+
+
+def reminder_scheduler_enabled() -> bool:
+    return os.getenv("REMINDER_SCHEDULER_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+
+
+def reminder_email_enabled() -> bool:
+    return os.getenv("REMINDER_EMAIL_ENABLED", "false").strip().lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class Reminder:
+    event_id: int
+    executive_id: int
+    title: str
+    location: Optional[str]
+    start_time: datetime
+    reminder_minutes: int
+
+    @property
+    def fire_at(self) -> datetime:
+        return self.start_time - timedelta(minutes=self.reminder_minutes)
+
+    def to_schema(self) -> schemas.EventReminder:
+        return schemas.EventReminder(
+            eventId=self.event_id,
+            executiveId=self.executive_id,
+            title=self.title,
+            location=self.location,
+            startTime=self.start_time,
+            reminderMinutes=self.reminder_minutes,
+            fireAt=self.fire_at,
+        )
+
+
+def _reminder_from(item) -> Optional[Reminder]:
+    if not item.reminder_minutes or item.reminder_minutes <= 0 or item.start_time is None:
+        return None
+    return Reminder(
+        event_id=item.id,
+        executive_id=item.executive_id,
+        title=item.title,
+        location=item.location,
+        start_time=item.start_time,
+        reminder_minutes=item.reminder_minutes,
+    )
+
+
+class ReminderChannel(Protocol):
+    async def deliver(self, reminders: Sequence[Reminder]) -> None: ...
+
+
+class SseReminderChannel:
+    """Fan-out para clientes conectados; cada assinante tem uma fila limitada própria."""
+
+    def __init__(self, queue_size: int = SSE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Tuple[Optional[Set[int]], asyncio.Queue]] = {}
+        self._ids = itertools.count()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, executive_ids: Optional[Iterable[int]] = None) -> Tuple[int, asyncio.Queue]:
+        token = next(self._ids)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        # None = todos (master); conjunto vazio = nenhum executivo visível, nada chega
+        self._subscribers[token] = (set(executive_ids) if executive_ids is not None else None, queue)
+        return token, queue
+
+    def unsubscribe(self, token: int) -> None:
+        self._subscribers.pop(token, None)
+
+    async def deliver(self, reminders: Sequence[Reminder]) -> None:
+        for wanted, queue in list(self._subscribers.values()):
+            for reminder in reminders:
+                if wanted is not None and reminder.executive_id not in wanted:
+                    continue
+                if queue.full():
+                    # Cliente lento: descarta o mais antigo em vez de bloquear os demais.
+                    queue.get_nowait()
+                queue.put_nowait(reminder)
+
+    async def stream(
+        self,
+        is_disconnected: Callable[[], Awaitable[bool]],
+        executive_ids: Optional[Iterable[int]] = None,
+        heartbeat_seconds: float = SSE_HEARTBEAT_SECONDS,
+    ) -> AsyncIterator[str]:
+        token, queue = self.subscribe(executive_ids)
+        try:
+            yield sse_retry(int(heartbeat_seconds * 1000))
+            while not await is_disconnected():
+                try:
+                    reminder = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield SSE_HEARTBEAT
+                    continue
+                data = reminder.to_schema().model_dump(by_alias=True, mode="json")
+                yield sse_message("reminder", data, event_id=reminder.event_id)
+        finally:
+            self.unsubscribe(token)
+
+
+class EmailReminderChannel:
+    """Acumula lembretes por `batch_seconds` e enfileira um e-mail por executivo (fila de saída)."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_seconds: float = REMINDER_EMAIL_BATCH_SECONDS,
+        sender: Callable[..., None] = send_event_reminder_emails,
+    ):
+        self.session_factory = session_factory
+        self.batch_seconds = batch_seconds
+        self.sender = sender
+        self._pending: List[Reminder] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def deliver(self, reminders: Sequence[Reminder]) -> None:
+        self._pending.extend(reminders)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.batch_seconds)
+        await self.flush()
+
+    async def flush(self) -> None:
+        batch, self._pending = self._pending, []
+        if batch:
+            await asyncio.to_thread(self._send, batch)
+
+    def _send(self, batch: List[Reminder]) -> None:
+        by_executive: Dict[int, List[Reminder]] = {}
+        for reminder in batch:
+            by_executive.setdefault(reminder.executive_id, []).append(reminder)
+        db = self.session_factory()
+        try:
+            recipients = (
+                db.query(Executive.id, Executive.full_name, Executive.work_email)
+                .filter(Executive.id.in_(list(by_executive)))
+                .all()
+            )
+            digests = []
+            for executive_id, full_name, work_email in recipients:
+                if not work_email:
+                    continue
+                lines = [
+                    f"{r.start_time:%d/%m/%Y %H:%M} — {r.title}" + (f" ({r.location})" if r.location else "")
+                    for r in sorted(by_executive[executive_id], key=lambda r: r.start_time)
+                ]
+                digests.append((work_email, full_name, lines))
+            if digests:
+                self.sender(digests, db=db)
+                db.commit()
+        except Exception:  # noqa: BLE001 — SMTP mal configurado não derruba o agendador
+            db.rollback()
+            logger.exception("Falha ao enfileirar e-mails de lembrete")
+        finally:
+            db.close()
+
+
+class ReminderScheduler:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        channels: Sequence[ReminderChannel] = (),
+        horizon: timedelta = timedelta(hours=REMINDER_HORIZON_HOURS),
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self.session_factory = session_factory
+        self.channels = list(channels)
+        self.horizon = horizon
+        self.clock = clock
+        self._lock = threading.Lock()
+        # Heap de (disparo, sequência, event_id); entradas antigas são descartadas no pop.
+        self._heap: List[Tuple[datetime, int, int]] = []
+        self._entries: Dict[int, Tuple[int, Reminder]] = {}
+        self._sequence = itertools.count()
+        self._window_end: Optional[datetime] = None
+        self._reload_requested = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    # --- estado -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def upcoming(self) -> List[Reminder]:
+        with self._lock:
+            return sorted((r for _, r in self._entries.values()), key=lambda r: (r.fire_at, r.event_id))
+
+    def next_fire_at(self) -> Optional[datetime]:
+        with self._lock:
+            self._drop_stale_head()
+            return self._heap[0][0] if self._heap else None
+
+    def reload(self, now: Optional[datetime] = None) -> None:
+        """Recarrega a janela [agora, agora + horizonte] com duas consultas indexadas."""
+        now = now or self.clock()
+        window_end = now + self.horizon
+        db = self.session_factory()
+        try:
+            repo = EventRepository(db=db)
+            lead = timedelta(minutes=repo.max_reminder_minutes(now))
+            rows = repo.get_reminder_window(now, window_end + lead)
+        finally:
+            db.close()
+        reminders = [r for r in map(_reminder_from, rows) if r and now <= r.fire_at <= window_end]
+        with self._lock:
+            self._heap = []
+            self._entries = {}
+            self._window_end = window_end
+            self._reload_requested = False
+            for reminder in reminders:
+                self._push(reminder)
+        self._notify()
+
+    def apply_changes(self, changes: Dict[int, Optional[Reminder]]) -> None:
+        """Aplica alterações confirmadas: `None` remove, um Reminder insere/substitui."""
+        now = self.clock()
+        with self._lock:
+            for event_id, reminder in changes.items():
+                self._entries.pop(event_id, None)
+                if reminder is None or reminder.start_time <= now:
+                    continue
+                if self._window_end is not None and reminder.fire_at > self._window_end:
+                    continue
+                # Lembrete cujo horário já passou (evento criado em cima da hora) dispara já.
+                self._push(reminder)
+        self._notify()
+
+    def request_reload(self) -> None:
+        with self._lock:
+            self._reload_requested = True
+        self._notify()
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Reminder]:
+        now = now or self.clock()
+        due: List[Reminder] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, sequence, event_id = heapq.heappop(self._heap)
+                entry = self._entries.get(event_id)
+                if entry is None or entry[0] != sequence:
+                    continue
+                del self._entries[event_id]
+                due.append(entry[1])
+        return due
+
+    def _push(self, reminder: Reminder) -> None:
+        sequence = next(self._sequence)
+        self._entries[reminder.event_id] = (sequence, reminder)
+        heapq.heappush(self._heap, (reminder.fire_at, sequence, reminder.event_id))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(r.fire_at, seq, eid) for eid, (seq, r) in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _drop_stale_head(self) -> None:
+        while self._heap:
+            _, sequence, event_id = self._heap[0]
+            entry = self._entries.get(event_id)
+            if entry is not None and entry[0] == sequence:
+                return
+            heapq.heappop(self._heap)
+
+    # --- laço assíncrono ----------------------------------------------------------------
+
+    def _notify(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+
+    async def dispatch(self, reminders: Sequence[Reminder]) -> None:
+        for channel in self.channels:
+            try:
+                await channel.deliver(reminders)
+            except Exception:  # noqa: BLE001 — um canal com falha não bloqueia os outros
+                logger.exception("Falha ao entregar lembretes pelo canal %s", type(channel).__name__)
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        await asyncio.to_thread(self.reload)
+        refresh_every = self.horizon / 2
+        next_reload = self.clock() + refresh_every
+        while True:
+            self._wakeup.clear()
+            now = self.clock()
+            if self._reload_requested or now >= next_reload:
+                await asyncio.to_thread(self.reload, now)
+                next_reload = now + refresh_every
+            due = self.pop_due(now)
+            if due:
+                await self.dispatch(due)
+            wake_at = next_reload
+            next_fire = self.next_fire_at()
+            if next_fire is not None and next_fire < wake_at:
+                wake_at = next_fire
+            timeout = max((wake_at - self.clock()).total_seconds(), 0.0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+# --- hooks do ORM ------------------------------------------------------------------------
+
+_scheduler: Optional[ReminderScheduler] = None
+_task: Optional[asyncio.Task] = None
+sse_channel = SseReminderChannel()
+
+
+def get_reminder_scheduler() -> Optional[ReminderScheduler]:
+    return _scheduler
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    for item in session.new.union(session.dirty):
+        if isinstance(item, Event) and item.id is not None:
+            pending[item.id] = _reminder_from(item)
+    for item in session.deleted:
+        if isinstance(item, Event) and item.id is not None:
+            pending[item.id] = None
+
+
+def _do_orm_execute(state) -> None:
+    if state.is_select:
+        return
+    mapper = state.bind_mapper
+    if mapper is not None and mapper.class_ is Event:
+        state.session.info[_BULK_KEY] = True
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    bulk = session.info.pop(_BULK_KEY, False)
+    scheduler = _scheduler
+    if scheduler is None:
+        return
+    if pending:
+        scheduler.apply_changes(pending)
+    if bulk:
+        scheduler.request_reload()
+
+
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_BULK_KEY, None)
+
+
+_HOOKS = (
+    ("after_flush", _after_flush),
+    ("do_orm_execute", _do_orm_execute),
+    ("after_commit", _after_commit),
+    ("after_soft_rollback", _after_soft_rollback),
+)
+
+
+def install(scheduler: ReminderScheduler) -> None:
+    """Registra o agendador como destino dos hooks de sessão (todas as sessões)."""
+    global _scheduler
+    if _scheduler is None:
+        for name, hook in _HOOKS:
+            sa_event.listen(Session, name, hook)
+    _scheduler = scheduler
+
+
+def uninstall() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        for name, hook in _HOOKS:
+            sa_event.remove(Session, name, hook)
+    _scheduler = None
+
+
+def build_default_channels() -> List[ReminderChannel]:
+    channels: List[ReminderChannel] = [sse_channel]
+    if reminder_email_enabled():
+        channels.append(EmailReminderChannel())
+    return channels
+
+
+async def start() -> None:
+    global _task
+    if not reminder_scheduler_enabled() or _task is not None:
+        return
+    scheduler = ReminderScheduler(channels=build_default_channels())
+    install(scheduler)
+    _task = asyncio.create_task(scheduler.run())
+
+
+async def stop() -> None:
+    global _task
+    task, _task = _task, None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):  # noqa: BLE001
+            pass
+    for channel in (_scheduler.channels if _scheduler else []):
+        if isinstance(channel, EmailReminderChannel):
+            await channel.flush()
+    uninstall()
@@ -0,0 +1,91 @@
+from datetime import datetime
+from typing import List
+
+from fastapi import Depends
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.report_job_model import ReportJob, ReportSchedule
+from app.models import user_model as user_models
+from app.repositories.report_job_repository import ReportJobRepository
+from app.schemas import report_schema as schemas
+from app.services import report_jobs
+from app.services.report_service import ReportService
+
+_SCHEDULE_PARAM_KEYS = (
+    "selected_executive_ids",
+    "include_events",
+    "include_expenses",
+    "include_tasks",
+    "include_contacts",
+)
+
+
+def _schedule_out(schedule: ReportSchedule) -> schemas.ReportSchedule:
+    return schemas.ReportSchedule(
+        id=schedule.id,
+        name=schedule.name,
+        frequency=schedule.frequency,
+        is_active=schedule.is_active,
+        next_run_at=schedule.next_run_at,
+        last_run_at=schedule.last_run_at,
+        **{key: schedule.params[key] for key in _SCHEDULE_PARAM_KEYS},
+    )
+
+
+class ReportJobService:
+    """Lado do request dos jobs de relatório: valida, grava e entrega ao worker (report_jobs)."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.repository = ReportJobRepository(db=db)
+        self.report_service = ReportService(db=db)
+
+    def _visible(self, actor: user_models.Usuario, owner_id) -> bool:
+        return actor.role == "master" or owner_id == actor.id
+
+    def create_job(self, actor: user_models.Usuario, payload: schemas.ReportGenerateRequest) -> ReportJob:
+        data, executive_ids = self.report_service.prepare_generation(actor, payload)
+        job = self.repository.create_job(
+            {"params": jsonable_encoder(data), "executive_ids": executive_ids, "requested_by_id": actor.id}
+        )
+        report_jobs.submit(job.id)
+        return job
+
+    def get_job(self, actor: user_models.Usuario, job_id: int) -> ReportJob:
+        job = self.repository.get_job(job_id)
+        if job is None or not self._visible(actor, job.requested_by_id):
+            raise ValueError("Job de relatório não encontrado.")
+        return job
+
+    def create_schedule(
+        self, actor: user_models.Usuario, payload: schemas.ReportScheduleCreate
+    ) -> schemas.ReportSchedule:
+        request = schemas.ReportGenerateRequest(
+            name=payload.name, **payload.model_dump(include=set(_SCHEDULE_PARAM_KEYS), by_alias=False)
+        )
+        data, executive_ids = self.report_service.prepare_generation(actor, request)
+        schedule = self.repository.create_schedule(
+            {
+                "name": payload.name,
+                "frequency": payload.frequency,
+                "params": {key: data[key] for key in _SCHEDULE_PARAM_KEYS},
+                "executive_ids": executive_ids,
+                "owner_id": actor.id,
+                "is_active": True,
+                "next_run_at": report_jobs.next_run_after(payload.frequency, datetime.utcnow()),
+            }
+        )
+        return _schedule_out(schedule)
+
+    def list_schedules(self, actor: user_models.Usuario) -> List[schemas.ReportSchedule]:
+        owner_id = None if actor.role == "master" else actor.id
+        return [_schedule_out(schedule) for schedule in self.repository.list_schedules(owner_id)]
+
+    def delete_schedule(self, actor: user_models.Usuario, schedule_id: int) -> dict:
+        schedule = self.repository.get_schedule(schedule_id)
+        if schedule is None or not self._visible(actor, schedule.owner_id):
+            raise ValueError("Agendamento não encontrado.")
+        self.repository.delete_schedule(schedule)
+        return {"message": "Agendamento removido com sucesso."}
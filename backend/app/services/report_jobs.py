@@ -0,0 +1,218 @@
+"""
+Jobs de relatório em segundo plano.
+
+`POST /reports/jobs` só grava o job (`queued`) e devolve o id. Um pool de threads gera o
+relatório seção a seção (`ReportService.build_report`), gravando o progresso antes de cada
+seção. Um laço de agendamento transforma agendamentos vencidos — sempre no horário de baixa
+REPORT_SCHEDULE_HOUR (UTC) — em jobs do período anterior e recolhe jobs ainda na fila (ex.:
+enfileirados com o worker desligado ou antes de um reinício). O job é reservado com UPDATE
+condicional, então mais de um processo pode rodar o worker sem gerar o mesmo relatório duas vezes.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from typing import Callable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.report_job_model import FREQUENCY_DAILY, FREQUENCY_WEEKLY
+from app.repositories.report_job_repository import ReportJobRepository
+from app.schemas import report_schema as schemas
+from app.services.report_service import ReportService
+
+logger = logging.getLogger(__name__)
+
+REPORT_JOB_WORKERS = int(os.getenv("REPORT_JOB_WORKERS", "2"))
+REPORT_JOB_POLL_SECONDS = float(os.getenv("REPORT_JOB_POLL_SECONDS", "30"))
+REPORT_SCHEDULE_HOUR = int(os.getenv("REPORT_SCHEDULE_HOUR", "3"))
+
+
+def report_jobs_enabled() -> bool:
+    return os.getenv("REPORT_JOBS_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+
+
+def next_run_after(frequency: str, moment: datetime, hour: int = REPORT_SCHEDULE_HOUR) -> datetime:
+    """Próxima execução estritamente depois de `moment`: todo dia, toda segunda ou todo dia 1º, às `hour`h."""
+    day = moment.date()
+    if frequency == FREQUENCY_DAILY:
+        candidate = datetime.combine(day, time(hour))
+        return candidate if candidate > moment else candidate + timedelta(days=1)
+    if frequency == FREQUENCY_WEEKLY:
+        candidate = datetime.combine(day + timedelta(days=(7 - day.weekday()) % 7), time(hour))
+        return candidate if candidate > moment else candidate + timedelta(days=7)
+    candidate = datetime.combine(day.replace(day=1), time(hour))
+    if candidate > moment:
+        return candidate
+    next_month = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return datetime.combine(next_month, time(hour))
+
+
+def schedule_period(frequency: str, run_at: datetime) -> Tuple[date, date]:
+    """Período fechado anterior à execução: ontem, a semana passada ou o mês passado."""
+    day = run_at.date()
+    if frequency == FREQUENCY_DAILY:
+        previous = day - timedelta(days=1)
+        return previous, previous
+    if frequency == FREQUENCY_WEEKLY:
+        monday = day - timedelta(days=day.weekday())
+        return monday - timedelta(days=7), monday - timedelta(days=1)
+    end = day.replace(day=1) - timedelta(days=1)
+    return end.replace(day=1), end
+
+
+class ReportJobRunner:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        workers: int = REPORT_JOB_WORKERS,
+        poll_seconds: float = REPORT_JOB_POLL_SECONDS,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self.clock = clock
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._submitted: Set[int] = set()
+
+    # --- ciclo de vida --------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        db = self.session_factory()
+        try:
+            requeued = ReportJobRepository(db).requeue_interrupted()
+        finally:
+            db.close()
+        if requeued:
+            logger.info("%s job(s) de relatório interrompido(s) voltaram para a fila", requeued)
+        self._stopping.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="report-job")
+        self._thread = threading.Thread(target=self.run, name="report-jobs", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # Jobs ainda não iniciados ficam `queued` no banco e rodam no próximo arranque.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def submit(self, job_id: int) -> None:
+        with self._lock:
+            if self._executor is None or job_id in self._submitted:
+                return
+            self._submitted.add(job_id)
+            self._executor.submit(self._run_submitted, job_id)
+
+    def _run_submitted(self, job_id: int) -> None:
+        try:
+            self.run_job(job_id)
+        except Exception:  # noqa: BLE001 — uma falha não derruba o pool
+            logger.exception("Falha ao executar o job de relatório %s", job_id)
+        finally:
+            with self._lock:
+                self._submitted.discard(job_id)
+
+    def run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            try:
+                self.enqueue_due_schedules()
+                db = self.session_factory()
+                try:
+                    queued = ReportJobRepository(db).queued_ids(limit=self.workers * 4)
+                finally:
+                    db.close()
+                for job_id in queued:
+                    self.submit(job_id)
+            except Exception:  # noqa: BLE001 — o laço não pode morrer por uma rodada
+                logger.exception("Falha no agendamento de relatórios")
+            self._wakeup.wait(self.poll_seconds)
+
+    # --- execução -------------------------------------------------------------------------
+
+    def enqueue_due_schedules(self) -> List[int]:
+        """Um job por agendamento vencido, para o período anterior à execução prevista."""
+        db = self.session_factory()
+        try:
+            repo = ReportJobRepository(db)
+            now = self.clock()
+            created: List[int] = []
+            for schedule in repo.due_schedules(now):
+                start, end = schedule_period(schedule.frequency, schedule.next_run_at)
+                params = {
+                    **schedule.params,
+                    "name": f"{schedule.name} ({start:%d/%m/%Y} a {end:%d/%m/%Y})",
+                    "start_date": start.isoformat(),
+                    "end_date": end.isoformat(),
+                }
+                next_run_at = next_run_after(schedule.frequency, max(now, schedule.next_run_at))
+                created.append(repo.enqueue_scheduled(schedule, params, now, next_run_at))
+            return created
+        finally:
+            db.close()
+
+    def run_job(self, job_id: int) -> bool:
+        """Executa o job se ainda estiver na fila; devolve False se outro worker já o pegou."""
+        db = self.session_factory()
+        try:
+            repo = ReportJobRepository(db)
+            if not repo.claim(job_id, self.clock()):
+                return False
+            job = repo.get_job(job_id)
+            data = schemas.ReportGenerateRequest.model_validate(job.params).model_dump(by_alias=False)
+
+            def on_section(section: str, done: int, total: int) -> None:
+                repo.set_progress(job, done * 100 // max(total, 1), section)
+
+            try:
+                report = ReportService(db=db).build_report(data, job.executive_ids, on_section=on_section)
+            except Exception as exc:  # noqa: BLE001 — registrado no job para quem consulta
+                db.rollback()
+                logger.exception("Job de relatório %s falhou", job_id)
+                repo.mark_failed(job, str(exc) or exc.__class__.__name__, self.clock())
+                return True
+            repo.mark_succeeded(job, report.id, self.clock())
+            return True
+        finally:
+            db.close()
+
+
+# --- integração com a aplicação ----------------------------------------------------------
+
+_runner: Optional[ReportJobRunner] = None
+
+
+def start(runner: Optional[ReportJobRunner] = None) -> None:
+    global _runner
+    if _runner is not None or (runner is None and not report_jobs_enabled()):
+        return
+    _runner = runner or ReportJobRunner()
+    _runner.start()
+
+
+def stop() -> None:
+    global _runner
+    runner, _runner = _runner, None
+    if runner is not None:
+        runner.stop()
+
+
+def submit(job_id: int) -> None:
+    """Entrega o job ao pool já; sem worker ativo ele fica na fila até o próximo arranque."""
+    if _runner is not None:
+        _runner.submit(job_id)
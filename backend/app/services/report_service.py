@@ -1,18 +1,88 @@
-from typing import List, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.money import from_cents
+from app.core.tabular_export import iter_export
 from app.models import report_model as models
-from app.repositories.report_repository import ReportRepository
+from app.models import user_model as user_models
+from app.repositories.report_repository import REPORT_SECTIONS, ReportDataRepository, ReportRepository
 from app.repositories.executive_repository import ExecutiveRepository
 from app.schemas import report_schema as schemas
+from app.services.executive_scope import visible_executive_ids
+
+# seção → chave do resumo para o agrupamento extra (ver REPORT_SECTIONS)
+_SUMMARY_BUCKETS = {"expenses": "byType", "tasks": "byStatus"}
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value.quantize(Decimal("0.01")))
+    return value
+
+
+def _report_row(section: str, row: Any) -> Dict[str, Any]:
+    return {"section": section, **{key: _json_value(value) for key, value in row._mapping.items()}}
+
+
+def _summarize(section: str, aggregates: List[tuple]) -> Dict[str, Any]:
+    """Dobra as linhas do GROUP BY (poucas: executivo × grupo) no resumo da seção."""
+    summary: Dict[str, Any] = {"total": 0, "byExecutive": {}}
+    bucket_key = _SUMMARY_BUCKETS.get(section)
+    if bucket_key:
+        summary[bucket_key] = {}
+    if section == "expenses":
+        summary["amountByType"] = {}
+    for executive_id, bucket, count, cents in aggregates:
+        summary["total"] += count
+        by_executive = summary["byExecutive"]
+        by_executive[str(executive_id)] = by_executive.get(str(executive_id), 0) + count
+        if bucket_key:
+            summary[bucket_key][bucket] = summary[bucket_key].get(bucket, 0) + count
+        if section == "expenses":
+            totals = summary["amountByType"]
+            totals[bucket] = totals.get(bucket, 0) + (cents or 0)
+    if section == "expenses":
+        summary["amountByType"] = {key: _json_value(from_cents(value)) for key, value in summary["amountByType"].items()}
+    return summary
+
+
+def _stored_fingerprint(entry: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    return entry.get("rows"), entry.get("maxId"), entry.get("maxUpdatedAt")
+
+
+def _fingerprint_state(fingerprints: Dict[int, tuple], aggregates: List[tuple]) -> Dict[str, Dict[str, Any]]:
+    """executivo → impressão digital + grupos do resumo, no formato gravado em `reports.fingerprints`."""
+    state: Dict[str, Dict[str, Any]] = {
+        str(executive_id): {"rows": count, "maxId": max_id, "maxUpdatedAt": _json_value(max_updated_at), "groups": []}
+        for executive_id, (count, max_id, max_updated_at) in fingerprints.items()
+    }
+    for executive_id, bucket, count, cents in aggregates:
+        # linha incluída entre as duas consultas: sem impressão, fica obsoleta na próxima vez
+        entry = state.setdefault(str(executive_id), {"rows": None, "maxId": None, "maxUpdatedAt": None, "groups": []})
+        entry["groups"].append([bucket, count, cents])
+    return state
+
+
+def _state_summary(section: str, state: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    aggregates = [
+        (int(key), bucket, count, cents)
+        for key in sorted(state, key=int)
+        for bucket, count, cents in state[key]["groups"]
+    ]
+    return _summarize(section, aggregates)
 
 
 class ReportService:
     def __init__(self, db: Session = Depends(get_db)):
         self.repository = ReportRepository(db=db)
+        self.data_repository = ReportDataRepository(db=db)
         self.executive_repo = ExecutiveRepository()
         self.db = db
 
@@ -23,16 +93,230 @@ class ReportService:
             if not executive:
                 raise ValueError(f"Executivo informado não existe: {executive_id}")
 
-    def get_report(self, report_id: int) -> Optional[models.Report]:
-        return self.repository.get_by_id(report_id)
+    def _report_executive_ids(self, db_item: models.Report) -> Set[int]:
+        """Executivos cobertos: os selecionados e os das impressões digitais (gerados no servidor)."""
+        ids = set(db_item.selected_executive_ids or [])
+        for entries in (db_item.fingerprints or {}).values():
+            ids.update(int(key) for key in entries)
+        if not db_item.selected_executive_ids and db_item.fingerprints is None:
+            # relatório enviado pelo cliente (legado): a cobertura só está nas linhas
+            ids.update(
+                row["executiveId"]
+                for block in self.repository.iter_chunks(db_item.id)
+                for row in block
+                if row.get("executiveId") is not None
+            )
+        return ids
+
+    def _ensure_visible(self, actor: user_models.Usuario, db_item: models.Report) -> None:
+        visible = visible_executive_ids(self.db, actor)
+        if visible is not None and not self._report_executive_ids(db_item) <= visible:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+
+    def get_report(self, actor: user_models.Usuario, report_id: int) -> Optional[models.Report]:
+        db_item = self.repository.get_by_id(report_id)
+        if db_item is not None:
+            self._ensure_visible(actor, db_item)
+        return db_item
 
     def get_all_reports(self, skip: int = 0, limit: int = 1000) -> List[models.Report]:
         return self.repository.get_all(skip=skip, limit=limit)
 
+    def get_report_rows(
+        self, actor: user_models.Usuario, report_id: int, skip: int = 0, limit: int = 500
+    ) -> schemas.ReportRowsPage:
+        db_item = self.get_report(actor, report_id)
+        if not db_item:
+            raise ValueError("Relatório não encontrado.")
+        return schemas.ReportRowsPage(
+            items=self.repository.get_rows(report_id, skip=skip, limit=limit),
+            total=db_item.row_count,
+            skip=skip,
+            limit=limit,
+        )
+
+    def iter_report_export(self, actor: user_models.Usuario, report_id: int, export_format: str) -> Iterator[bytes]:
+        """Exporta as linhas bloco a bloco; uma passada prévia nos blocos só colhe as colunas."""
+        db_item = self.get_report(actor, report_id)
+        if not db_item:
+            raise ValueError("Relatório não encontrado.")
+        header: Dict[str, None] = {"section": None}
+        for block in self.repository.iter_chunks(report_id):
+            for row in block:
+                header.update(dict.fromkeys(row))
+        columns = list(header)
+        rows = (
+            tuple(row.get(column) for column in columns)
+            for block in self.repository.iter_chunks(report_id)
+            for row in block
+        )
+        return iter_export(export_format, columns, rows, sheet_name=db_item.name)
+
     def create_report(self, payload: schemas.ReportCreate) -> models.Report:
         data = payload.model_dump(exclude_unset=True, by_alias=False)
         self._validate_references(data)
-        return self.repository.create(data)
+        rows = data.pop("generated_data", [])
+        return self.repository.create(data, rows=rows)
+
+    def _resolve_report_executives(
+        self, actor: user_models.Usuario, selected: List[int]
+    ) -> Optional[List[int]]:
+        """Executivos do relatório dentro do escopo do ator; None = sem filtro (master, todos)."""
+        visible = visible_executive_ids(self.db, actor)
+        if not selected:
+            return None if visible is None else sorted(visible)
+        for executive_id in selected:
+            if not self.executive_repo.get_by_id(self.db, executive_id):
+                raise ValueError(f"Executivo informado não existe: {executive_id}")
+            if visible is not None and executive_id not in visible:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+        return selected
+
+    def prepare_generation(
+        self, actor: user_models.Usuario, payload: schemas.ReportGenerateRequest
+    ) -> Tuple[Dict[str, Any], Optional[List[int]]]:
+        """Valida os parâmetros e resolve os executivos no escopo do ator (antes de gerar ou enfileirar)."""
+        data = payload.model_dump(by_alias=False)
+        data["selected_executive_ids"] = list(dict.fromkeys(data["selected_executive_ids"]))
+        start, end = data["start_date"], data["end_date"]
+        if start and end and start > end:
+            raise ValueError("A data inicial deve ser anterior ou igual à data final.")
+        return data, self._resolve_report_executives(actor, data["selected_executive_ids"])
+
+    def _compute_sections(
+        self,
+        sections: List[str],
+        executive_ids: Optional[List[int]],
+        start: Optional[date],
+        end: Optional[date],
+        on_section: Optional[Callable[[str, int, int], None]] = None,
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
+        """Linhas e impressões digitais por seção; a impressão é lida antes das linhas (na dúvida, fica obsoleta)."""
+        rows: Dict[str, List[Dict[str, Any]]] = {}
+        state: Dict[str, Dict[str, Any]] = {}
+        for index, section in enumerate(sections):
+            if on_section is not None:
+                on_section(section, index, len(sections))
+            fingerprints = self.data_repository.section_fingerprints(section, executive_ids, start, end)
+            aggregates = self.data_repository.section_aggregates(section, executive_ids, start, end)
+            state[section] = _fingerprint_state(fingerprints, aggregates)
+            rows[section] = [
+                _report_row(section, row)
+                for row in self.data_repository.section_rows(section, executive_ids, start, end)
+            ]
+        return rows, state
+
+    def build_report(
+        self,
+        data: Dict[str, Any],
+        executive_ids: Optional[List[int]],
+        on_section: Optional[Callable[[str, int, int], None]] = None,
+    ) -> models.Report:
+        """
+        Calcula o relatório no banco, seção a seção: linhas na janela de datas e contagens via
+        GROUP BY. `on_section(seção, concluídas, total)` é chamado antes de cada seção.
+        """
+        sections = [section for section in REPORT_SECTIONS if data[f"include_{section}"]]
+        rows, state = self._compute_sections(sections, executive_ids, data["start_date"], data["end_date"], on_section)
+        summary = {section: _state_summary(section, state[section]) for section in sections}
+        payload = {**data, "summary": summary, "fingerprints": state}
+        payload["total_records"] = sum(section["total"] for section in summary.values())
+        return self.repository.create(payload, rows=[row for section in sections for row in rows[section]])
+
+    def regenerate_report(self, actor: user_models.Usuario, report_id: int) -> schemas.ReportRegeneration:
+        """
+        Atualiza um relatório gerado recalculando só os pares (seção, executivo) cuja impressão
+        digital mudou; as demais linhas são reaproveitadas dos blocos gravados.
+        """
+        db_item = self.repository.get_by_id(report_id)
+        if not db_item:
+            raise ValueError("Relatório não encontrado.")
+        # Sem impressões digitais (legado, enviado pelo cliente, parâmetros alterados) a cobertura
+        # vem das linhas gravadas: quem não enxerga todos os executivos não pode sobrescrevê-las.
+        self._ensure_visible(actor, db_item)
+        params = schemas.ReportGenerateRequest(
+            name=db_item.name,
+            selected_executive_ids=db_item.selected_executive_ids or [],
+            start_date=db_item.start_date,
+            end_date=db_item.end_date,
+            include_events=db_item.include_events,
+            include_expenses=db_item.include_expenses,
+            include_tasks=db_item.include_tasks,
+            include_contacts=db_item.include_contacts,
+        )
+        data, executive_ids = self.prepare_generation(actor, params)
+        start, end = data["start_date"], data["end_date"]
+        sections = [section for section in REPORT_SECTIONS if data[f"include_{section}"]]
+        stored: Dict[str, Dict[str, Any]] = db_item.fingerprints or {}
+
+        if set(stored) != set(sections):
+            # relatório legado, enviado pelo cliente ou com seções alteradas: recalcula tudo
+            fresh_rows, state = self._compute_sections(sections, executive_ids, start, end)
+            rows = [row for section in sections for row in fresh_rows[section]]
+            stale = {section: sorted(int(key) for key in state[section]) for section in sections}
+        else:
+            state, stale, fresh_rows = {}, {}, {}
+            for section in sections:
+                current = self.data_repository.section_fingerprints(section, executive_ids, start, end)
+                current_state = _fingerprint_state(current, [])
+                previous = stored[section]
+                changed = sorted(
+                    int(key)
+                    for key in set(current_state) | set(previous)
+                    if key not in current_state
+                    or key not in previous
+                    or _stored_fingerprint(current_state[key]) != _stored_fingerprint(previous[key])
+                )
+                stale[section] = changed
+                state[section] = {key: entry for key, entry in previous.items() if int(key) not in changed}
+                fresh_rows[section] = []
+                if not changed:
+                    continue
+                fingerprints = {executive_id: current[executive_id] for executive_id in changed if executive_id in current}
+                aggregates = self.data_repository.section_aggregates(section, stale[section], start, end)
+                state[section].update(_fingerprint_state(fingerprints, aggregates))
+                fresh_rows[section] = [
+                    _report_row(section, row)
+                    for row in self.data_repository.section_rows(section, stale[section], start, end)
+                ]
+            rows = self._splice_rows(report_id, sections, stale, fresh_rows)
+
+        summary = {section: _state_summary(section, state[section]) for section in sections}
+        payload = {
+            "summary": summary,
+            "fingerprints": state,
+            "total_records": sum(section["total"] for section in summary.values()),
+            "generated_at": datetime.utcnow(),
+        }
+        report = self.repository.update(db_item, payload, rows=rows)
+        return schemas.ReportRegeneration(report=report, stale_executives=stale)
+
+    def _splice_rows(
+        self,
+        report_id: int,
+        sections: List[str],
+        stale: Dict[str, List[int]],
+        fresh_rows: Dict[str, List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Mantém as linhas gravadas dos executivos inalterados e intercala as novas por executivo."""
+        kept: Dict[str, List[Dict[str, Any]]] = {section: [] for section in sections}
+        stale_sets = {section: set(ids) for section, ids in stale.items()}
+        for block in self.repository.iter_chunks(report_id):
+            for row in block:
+                section = row.get("section")
+                if section in kept and row.get("executiveId") not in stale_sets[section]:
+                    kept[section].append(row)
+        rows: List[Dict[str, Any]] = []
+        for section in sections:
+            # ordenação estável: dentro do executivo, a ordem (data, id) de cada lado é preservada
+            rows.extend(sorted(kept[section] + fresh_rows[section], key=lambda row: row.get("executiveId") or 0))
+        return rows
+
+    def generate_report(
+        self, actor: user_models.Usuario, payload: schemas.ReportGenerateRequest
+    ) -> models.Report:
+        data, executive_ids = self.prepare_generation(actor, payload)
+        return self.build_report(data, executive_ids)
 
     def update_report(self, report_id: int, payload: schemas.ReportUpdate) -> models.Report:
         db_item = self.repository.get_by_id(report_id)
@@ -42,7 +326,10 @@ class ReportService:
         update_data = payload.model_dump(exclude_unset=True, by_alias=False)
         if "selected_executive_ids" in update_data:
             self._validate_references(update_data)
-        return self.repository.update(db_item, update_data)
+        rows = update_data.pop("generated_data", None)
+        if rows is not None or set(update_data) - {"name"}:
+            update_data["fingerprints"] = None  # parâmetros ou linhas mudaram: próxima regeneração é completa
+        return self.repository.update(db_item, update_data, rows=rows)
 
     def delete_report(self, report_id: int):
         db_item = self.repository.get_by_id(report_id)
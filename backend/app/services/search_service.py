@@ -0,0 +1,85 @@
+import base64
+import html
+import json
+from typing import Optional, Tuple
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.search_index import SEARCH_ENTITIES, SNIPPET_CLOSE, SNIPPET_OPEN, match_expression
+from app.models import user_model as user_models
+from app.repositories.search_repository import SearchRepository
+from app.schemas import search_schema as schemas
+from app.services.executive_scope import executive_visible_to_actor, visible_executive_ids
+
+
+def encode_search_cursor(rank: float, entity: str, row_id: int) -> str:
+    raw = json.dumps([rank, entity, row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        rank, entity, row_id = json.loads(raw)
+        return float(rank), str(entity), int(row_id)
+    except (ValueError, TypeError):
+        raise ValueError("Cursor inválido.")
+
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet or "").replace(SNIPPET_OPEN, "<mark>").replace(SNIPPET_CLOSE, "</mark>")
+
+
+class SearchService:
+    """Busca textual em contatos, documentos, eventos e tarefas dos executivos visíveis ao ator."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.repository = SearchRepository(db=db)
+
+    def search(
+        self,
+        actor: user_models.Usuario,
+        q: str,
+        executive_id: Optional[int] = None,
+        entity: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> schemas.SearchResults:
+        match = match_expression(q)
+        if not match:
+            raise ValueError("Informe ao menos um termo de busca.")
+        if executive_id is not None:
+            if not executive_visible_to_actor(self.db, actor, executive_id):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+            executive_ids = {executive_id}
+        else:
+            executive_ids = visible_executive_ids(self.db, actor)
+        if executive_ids is not None and not executive_ids:
+            return schemas.SearchResults()
+
+        after = decode_search_cursor(cursor) if cursor else None
+        entities = (entity,) if entity else SEARCH_ENTITIES
+        # Uma linha a mais diz se há próxima página sem um COUNT.
+        rows = self.repository.search(match, executive_ids, entities, limit + 1, after=after)
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = page[-1]
+            next_cursor = encode_search_cursor(last[5], last[0], last[1])
+        return schemas.SearchResults(
+            items=[
+                schemas.SearchHit(
+                    entity=entity_name,
+                    id=row_id,
+                    executive_id=owner_id,
+                    title=title,
+                    snippet=_highlight(snippet),
+                    rank=rank,
+                )
+                for entity_name, row_id, owner_id, title, snippet, rank in page
+            ],
+            next_cursor=next_cursor,
+        )
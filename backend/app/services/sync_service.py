@@ -0,0 +1,114 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.contact_model import Contact
+from app.models.contact_type_model import ContactType
+from app.models.document_category_model import DocumentCategory
+from app.models.document_model import Document
+from app.models.event_model import Event
+from app.models.event_type_model import EventType
+from app.models.expense_category_model import ExpenseCategory
+from app.models.expense_model import Expense
+from app.models.task_model import Task
+from app.models import user_model as user_models
+from app.repositories.sync_repository import SyncRepository
+from app.schemas import sync_schema as schemas
+from app.services.executive_scope import visible_executive_ids
+
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "90"))
+# Folga para transações que gravaram updated_at pouco antes de commitar: reenvia, nunca perde.
+SYNC_OVERLAP = timedelta(seconds=float(os.getenv("SYNC_OVERLAP_SECONDS", "5")))
+_PRUNE_INTERVAL = timedelta(hours=1)
+
+# campo da resposta → modelo
+SYNC_MODELS = (
+    ("events", Event),
+    ("tasks", Task),
+    ("contacts", Contact),
+    ("expenses", Expense),
+    ("documents", Document),
+    ("event_types", EventType),
+    ("contact_types", ContactType),
+    ("expense_categories", ExpenseCategory),
+    ("document_categories", DocumentCategory),
+)
+
+_EPOCH = datetime(1970, 1, 1)
+_prune_lock = threading.Lock()
+_last_prune: Optional[datetime] = None
+
+
+def encode_sync_token(moment: datetime) -> str:
+    return str((moment - _EPOCH) // timedelta(microseconds=1))
+
+
+def decode_sync_token(token: str) -> datetime:
+    try:
+        return _EPOCH + timedelta(microseconds=int(token))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError("Token de sincronização inválido.")
+
+
+class SyncService:
+    """Delta sync: linhas com updated_at posterior ao token + tombstones de exclusões."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.repository = SyncRepository(db=db)
+
+    def sync(
+        self,
+        actor: user_models.Usuario,
+        since: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> schemas.SyncResponse:
+        now = now or datetime.utcnow()
+        since_at, full = self._resolve_since(since, now)
+        self._maybe_prune(now)
+        executive_ids = visible_executive_ids(self.db, actor)
+
+        changed = {
+            field: self.repository.changed_since(model, since_at, now, executive_ids)
+            for field, model in SYNC_MODELS
+        }
+        deleted = []
+        if since_at is not None:
+            deleted = [
+                schemas.SyncDeleted(
+                    entity=t.entity,
+                    id=t.entity_id,
+                    executiveId=t.executive_id,
+                    deletedAt=t.deleted_at,
+                )
+                for t in self.repository.tombstones_since(since_at, now, executive_ids)
+            ]
+        return schemas.SyncResponse(
+            token=encode_sync_token(now - SYNC_OVERLAP),
+            full=full,
+            changed=schemas.SyncChanges(**changed),
+            deleted=deleted,
+        )
+
+    @staticmethod
+    def _resolve_since(since: Optional[str], now: datetime) -> Tuple[Optional[datetime], bool]:
+        if not since:
+            return None, True
+        since_at = decode_sync_token(since)
+        if since_at < now - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+            # Tombstones mais antigos já podem ter sido removidos: só um snapshot é confiável.
+            return None, True
+        return since_at, False
+
+    def _maybe_prune(self, now: datetime) -> None:
+        global _last_prune
+        with _prune_lock:
+            if _last_prune is not None and now - _last_prune < _PRUNE_INTERVAL:
+                return
+            _last_prune = now
+        self.repository.prune_tombstones(now - timedelta(days=TOMBSTONE_RETENTION_DAYS))
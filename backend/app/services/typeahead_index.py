@@ -0,0 +1,233 @@
+"""
+Índice em memória para autocompletar executivos e contatos (nome, e-mail e CPF por prefixo).
+
+Por tipo, um balde por executivo dono (o executivo, no caso de executivos; `executive_id`, no
+caso de contatos) com a lista ordenada de (chave normalizada, id): a busca é um `bisect` seguido
+de leitura sequencial enquanto a chave começa com o prefixo. Os baldes são montados na primeira
+consulta ao executivo e atualizados pelo unit of work (after_flush → after_commit); gravações por
+statement (bulk) chamam `invalidate`. Como cada processo tem o seu índice, um balde também é
+recarregado depois de TYPEAHEAD_REFRESH_SECONDS, para enxergar gravações de outros workers.
+"""
+
+import heapq
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from app.core.text_normalize import fold_text
+from app.models.contact_model import Contact
+from app.models.executive_model import Executive
+from app.repositories.typeahead_repository import TypeaheadRow
+
+TYPEAHEAD_REFRESH_SECONDS = float(os.getenv("TYPEAHEAD_REFRESH_SECONDS", "300"))
+TYPEAHEAD_KINDS = ("executive", "contact")
+
+_MODELS = {Executive: "executive", Contact: "contact"}
+_PENDING_KEY = "typeahead_pending"
+_DOCUMENT_PREFIX = re.compile(r"^[\d.\-/ ]+$")
+
+# (tipo, id, executivo dono, nome, e-mail, CPF); dono None = excluído
+_Change = Tuple[str, int, Optional[int], str, Optional[str], Optional[str]]
+
+
+def index_keys(name: str, email: Optional[str], document: Optional[str]) -> List[str]:
+    """Nome completo, cada sobrenome (acha "Silva" em "Ana Silva"), e-mail e CPF só com dígitos."""
+    folded = fold_text(name)
+    keys = {folded} if folded else set()
+    keys.update(folded.split(" ")[1:])
+    if email:
+        keys.add(fold_text(email))
+    digits = re.sub(r"\D", "", document or "")
+    if digits:
+        keys.add(digits)
+    return sorted(key for key in keys if key)
+
+
+def normalize_prefix(prefix: str) -> str:
+    if _DOCUMENT_PREFIX.match(prefix or "") and any(char.isdigit() for char in prefix):
+        return re.sub(r"\D", "", prefix)  # "123.456" casa o CPF guardado só com dígitos
+    return fold_text(prefix)
+
+
+@dataclass
+class _Bucket:
+    loaded_at: float
+    entries: List[Tuple[str, int]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class TypeaheadEntry:
+    id: int
+    executive_id: int
+    name: str
+    email: Optional[str]
+    matched: str
+
+
+class TypeaheadIndex:
+    def __init__(self, refresh_seconds: float = TYPEAHEAD_REFRESH_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[int, _Bucket]] = {kind: {} for kind in TYPEAHEAD_KINDS}
+        # tipo → id → (dono, nome, e-mail, chaves)
+        self._items: Dict[str, Dict[int, Tuple[int, str, Optional[str], List[str]]]] = {
+            kind: {} for kind in TYPEAHEAD_KINDS
+        }
+
+    def missing_owners(self, kind: str, owner_ids: Iterable[int]) -> List[int]:
+        now = self.clock()
+        with self._lock:
+            buckets = self._buckets[kind]
+            return [
+                owner_id
+                for owner_id in owner_ids
+                if owner_id not in buckets or now - buckets[owner_id].loaded_at >= self.refresh_seconds
+            ]
+
+    def load(self, kind: str, owner_ids: Iterable[int], rows: Iterable[TypeaheadRow]) -> None:
+        """Substitui os baldes dos donos informados (os sem linhas ficam vazios, mas carregados)."""
+        now = self.clock()
+        fresh: Dict[int, _Bucket] = {owner_id: _Bucket(loaded_at=now) for owner_id in owner_ids}
+        items: Dict[int, Tuple[int, str, Optional[str], List[str]]] = {}
+        for row_id, owner_id, name, email, document in rows:
+            keys = index_keys(name, email, document)
+            items[row_id] = (owner_id, name, email, keys)
+            bucket = fresh.setdefault(owner_id, _Bucket(loaded_at=now))
+            bucket.entries.extend((key, row_id) for key in keys)
+        for bucket in fresh.values():
+            bucket.entries.sort()
+        with self._lock:
+            self._drop_items(kind, fresh)
+            self._items[kind].update(items)
+            self._buckets[kind].update(fresh)
+
+    def _drop_items(self, kind: str, owner_ids: Iterable[int]) -> None:
+        buckets, items = self._buckets[kind], self._items[kind]
+        for owner_id in owner_ids:
+            bucket = buckets.get(owner_id)
+            if bucket is not None:
+                for _key, row_id in bucket.entries:
+                    items.pop(row_id, None)
+
+    def apply(self, changes: Iterable[_Change]) -> None:
+        """Mudanças confirmadas; só mexe em baldes já carregados (os outros carregam sob demanda)."""
+        with self._lock:
+            for kind, row_id, owner_id, name, email, document in changes:
+                buckets, items = self._buckets[kind], self._items[kind]
+                previous = items.pop(row_id, None)
+                if previous is not None and previous[0] in buckets:
+                    entries = buckets[previous[0]].entries
+                    for key in previous[3]:
+                        position = bisect_left(entries, (key, row_id))
+                        if position < len(entries) and entries[position] == (key, row_id):
+                            del entries[position]
+                if owner_id is None or owner_id not in buckets:
+                    continue
+                keys = index_keys(name, email, document)
+                items[row_id] = (owner_id, name, email, keys)
+                for key in keys:
+                    insort(buckets[owner_id].entries, (key, row_id))
+
+    def invalidate(self, kind: str, owner_ids: Optional[Iterable[int]] = None) -> None:
+        """Descarta baldes (todos, com None); a próxima consulta recarrega do banco."""
+        with self._lock:
+            buckets = self._buckets[kind]
+            targets = list(buckets) if owner_ids is None else [owner for owner in owner_ids if owner in buckets]
+            self._drop_items(kind, targets)
+            for owner_id in targets:
+                del buckets[owner_id]
+
+    def reset(self) -> None:
+        with self._lock:
+            for kind in TYPEAHEAD_KINDS:
+                self._buckets[kind].clear()
+                self._items[kind].clear()
+
+    def lookup(self, kind: str, owner_ids: Iterable[int], prefix: str, limit: int) -> List[TypeaheadEntry]:
+        """Top `limit` por chave casada (ordem alfabética), sem repetir a mesma linha."""
+        if not prefix:
+            return []
+        with self._lock:
+            buckets, items = self._buckets[kind], self._items[kind]
+            per_owner = []
+            for owner_id in owner_ids:
+                bucket = buckets.get(owner_id)
+                if bucket is None:
+                    continue
+                entries = bucket.entries
+                matches, seen = [], set()
+                position = bisect_left(entries, (prefix,))
+                while position < len(entries) and len(matches) < limit:
+                    key, row_id = entries[position]
+                    if not key.startswith(prefix):
+                        break
+                    if row_id not in seen:
+                        seen.add(row_id)
+                        matches.append((key, row_id))
+                    position += 1
+                if matches:
+                    per_owner.append(matches)
+            result: List[TypeaheadEntry] = []
+            for key, row_id in heapq.merge(*per_owner):
+                owner_id, name, email, _keys = items[row_id]
+                result.append(TypeaheadEntry(id=row_id, executive_id=owner_id, name=name, email=email, matched=key))
+                if len(result) == limit:
+                    break
+            return result
+
+
+_index = TypeaheadIndex()
+
+
+def get_index() -> TypeaheadIndex:
+    return _index
+
+
+def _snapshot(kind: str, item, deleted: bool) -> _Change:
+    if kind == "executive":
+        return kind, item.id, None if deleted else item.id, item.full_name, item.work_email, item.cpf
+    return kind, item.id, None if deleted else item.executive_id, item.full_name, item.email, None
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    pending: Dict[Tuple[str, int], _Change] = session.info.setdefault(_PENDING_KEY, {})
+    for items, deleted in ((session.new, False), (session.dirty, False), (session.deleted, True)):
+        for item in items:
+            kind = _MODELS.get(type(item))
+            if kind is None or item.id is None:
+                continue
+            if not deleted and item in session.dirty and not session.is_modified(item, include_collections=False):
+                continue
+            pending[(kind, item.id)] = _snapshot(kind, item, deleted)
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        _index.apply(pending.values())
+
+
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+_installed = False
+
+
+def install() -> None:
+    global _installed
+    if _installed:
+        return
+    sa_event.listen(Session, "after_flush", _after_flush)
+    sa_event.listen(Session, "after_commit", _after_commit)
+    sa_event.listen(Session, "after_soft_rollback", _after_soft_rollback)
+    _installed = True
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models import user_model as user_models
+from app.repositories.typeahead_repository import TypeaheadRepository
+from app.schemas import typeahead_schema as schemas
+from app.services.executive_scope import executive_visible_to_actor, visible_executive_ids
+from app.services.typeahead_index import get_index, normalize_prefix
+
+
+class TypeaheadService:
+    """Autocompletar de executivos e contatos no escopo do ator, servido do índice em memória."""
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+        self.repository = TypeaheadRepository(db=db)
+
+    def lookup(
+        self,
+        actor: user_models.Usuario,
+        kind: str,
+        prefix: str,
+        executive_id: Optional[int] = None,
+        limit: int = 10,
+    ) -> schemas.TypeaheadResults:
+        if executive_id is not None:
+            if not executive_visible_to_actor(self.db, actor, executive_id):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Executivo fora do seu escopo.")
+            owner_ids = [executive_id]
+        else:
+            visible = visible_executive_ids(self.db, actor)
+            owner_ids = sorted(visible) if visible is not None else self.repository.all_executive_ids()
+
+        index = get_index()
+        missing = index.missing_owners(kind, owner_ids)
+        if missing:
+            index.load(kind, missing, self.repository.rows(kind, missing))
+        entries = index.lookup(kind, owner_ids, normalize_prefix(prefix), limit)
+        return schemas.TypeaheadResults(
+            kind=kind,
+            items=[schemas.TypeaheadItem.model_validate(entry) for entry in entries],
+        )
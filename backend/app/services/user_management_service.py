@@ -4,12 +4,14 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import func, or_
+from sqlalchemy import column, func, or_, text
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_current_user
 from app.core.database import get_db
 from app.core.invite_token import hash_invite_token
+from app.core.search_index import USER_SEARCH_MIN_LENGTH, trigram_expression
+from app.core.text_normalize import fold_text
 from app.models.department_model import Department
 from app.models.executive_model import Executive
 from app.models.organization_model import Organization
@@ -190,22 +192,28 @@ class UserManagementService:
     ) -> Tuple[List[user_models.Usuario], int]:
         assert_user_manager(actor)
         query = _scoped_users_query(self.db, actor)
-        if q and q.strip():
-            term = f"%{q.strip().lower()}%"
-            query = query.filter(
-                or_(
-                    func.lower(user_models.Usuario.name).like(term),
-                    func.lower(user_models.Usuario.email).like(term),
-                )
+        term = fold_text(q or "")
+        if len(term) >= USER_SEARCH_MIN_LENGTH:
+            # "contém" via índice de trigramas (users_fts) em vez de varrer lower(nome)/lower(e-mail)
+            matches = text("SELECT rowid FROM users_fts WHERE users_fts MATCH :user_term").bindparams(
+                user_term=trigram_expression(term)
             )
-        total = query.count()
+            query = query.filter(user_models.Usuario.id.in_(matches.columns(column("rowid"))))
+        elif term:
+            # 1–2 caracteres: abaixo do trigram; coluna já normalizada, sem lower() por linha
+            query = query.filter(user_models.Usuario.search_text.contains(term, autoescape=True))
+        # Total na mesma consulta (COUNT(*) OVER ()), sem um segundo SELECT COUNT.
         rows = (
-            query.order_by(user_models.Usuario.name)
+            query.add_columns(func.count().over().label("total"))
+            .order_by(user_models.Usuario.name, user_models.Usuario.id)
             .offset(max(skip, 0))
             .limit(min(max(limit, 1), 200))
             .all()
         )
-        return rows, total
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        # Página vazia não traz o total: só além do fim é preciso contar.
+        return [], query.count() if skip > 0 else 0
 
     def get_user(self, actor: user_models.Usuario, user_id: int) -> user_models.Usuario:
         assert_user_manager(actor)
@@ -446,7 +454,7 @@ class UserManagementService:
         try:
             raw_token = self._issue_new_set_password_token(target.id)
             link = build_set_password_link(raw_token, frontend_base)
-            send_invite_email(str(target.email), str(target.name).strip(), link)
+            send_invite_email(str(target.email), str(target.name).strip(), link, db=self.db)
             self.db.commit()
         except HTTPException:
             self.db.rollback()
@@ -491,7 +499,7 @@ class UserManagementService:
         try:
             raw_token = self._issue_new_set_password_token(target.id)
             link = build_set_password_link(raw_token, frontend_base)
-            send_password_reset_email(str(target.email), str(target.name).strip(), link)
+            send_password_reset_email(str(target.email), str(target.name).strip(), link, db=self.db)
             self.db.commit()
         except HTTPException:
             self.db.rollback()
@@ -1,4 +1,7 @@
 import os
+import socket
+import socketserver
+import threading
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,8 +11,11 @@ from sqlalchemy.pool import StaticPool
 
 os.environ.setdefault("JWT_SECRET", "test-jwt-secret-for-pytest-only")
 os.environ.setdefault("EXECUTIVA_SETUP_TOKEN", "test-setup-token-secret")
+os.environ.setdefault("REMINDER_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("EMAIL_QUEUE_ENABLED", "false")
+os.environ.setdefault("REPORT_JOBS_ENABLED", "false")
 
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_session_factory
 from app.main import app as fastapi_app
 import app.models  # noqa: F401
 
@@ -48,6 +54,98 @@ def client(db_session):
             pass
 
     fastapi_app.dependency_overrides[get_db] = override_get_db
+    # Sessões curtas (ex.: autenticação dos streams SSE) na mesma conexão/transação do teste
+    fastapi_app.dependency_overrides[get_session_factory] = lambda: lambda: TestingSessionLocal(
+        bind=db_session.connection()
+    )
     with TestClient(fastapi_app) as test_client:
         yield test_client
     fastapi_app.dependency_overrides.clear()
+
+
+class _SmtpStandInHandler(socketserver.StreamRequestHandler):
+    """Diálogo SMTP mínimo (sem TLS/AUTH) para testar envio sem relay real."""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+            server.sockets.append(self.connection)
+        self._reply("220 stand-in ESMTP")
+        recipients = []
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            command = raw.decode(errors="replace").strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 stand-in")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip().strip("<>")
+                code = server.rcpt_codes.get(address, 250)
+                if code == 250:
+                    recipients.append(address)
+                self._reply(f"{code} {'OK' if code == 250 else 'recusado'}")
+            elif verb == "DATA":
+                self._reply("354 fim com <CRLF>.<CRLF>")
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line or line == b".\r\n":
+                        break
+                    lines.append(line)
+                with server.lock:
+                    server.messages.append((list(recipients), b"".join(lines).decode(errors="replace")))
+                self._reply("250 aceito")
+            elif verb in ("RSET", "NOOP"):
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 tchau")
+                return
+            else:
+                self._reply("502 comando não suportado")
+
+
+class SmtpStandIn(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SmtpStandInHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.sockets = []
+        self.messages = []
+        self.rcpt_codes = {}  # destinatário → código de resposta ao RCPT (ex.: 451, 550)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def drop_connections(self) -> None:
+        """Simula o relay derrubando as sessões abertas."""
+        with self.lock:
+            for sock in self.sockets:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self.sockets.clear()
+
+
+@pytest.fixture()
+def smtp_server():
+    server = SmtpStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,220 @@
+"""POST /{entidade}/batch: lote validado de uma vez, gravado numa transação, com resultado por item."""
+
+from datetime import date
+
+from app.core.security import hash_password
+from app.models.contact_model import Contact
+from app.models.executive_model import Executive
+from app.models.expense_category_model import ExpenseCategory
+from app.models.expense_rollup_model import ExpenseMonthlyRollup
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models.task_model import Task
+from app.models import user_model as user_models
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Lote", work_email="exec.lote@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    category = ExpenseCategory(name="Viagem", executive_id=mine.id)
+    foreign_category = ExpenseCategory(name="Outra", executive_id=other.id)
+    db_session.add_all([category, foreign_category])
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.lote@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine.id, other.id, category.id, foreign_category.id
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.lote@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _task(executive_id, title="Tarefa"):
+    return {"title": title, "dueDate": "2026-11-10", "priority": "Média", "status": "A Fazer", "executiveId": executive_id}
+
+
+def test_task_batch_updates_many_in_one_request(client, db_session):
+    mine, _other, _category, _foreign = _seed(db_session)
+    headers = _headers(client)
+    created = client.post(
+        "/tasks/batch",
+        json={"operations": [{"op": "create", "data": _task(mine, f"T{i}")} for i in range(200)]},
+        headers=headers,
+    ).json()
+    assert created["committed"] and created["succeeded"] == 200
+    ids = [item["id"] for item in created["items"]]
+    assert db_session.query(Task).filter(Task.id.in_(ids)).count() == 200
+    assert db_session.get(Task, ids[5]).title == "T5"  # ids na ordem das operações
+
+    r = client.post(
+        "/tasks/batch",
+        json={"operations": [{"op": "update", "id": task_id, "data": {"status": "Concluído"}} for task_id in ids]},
+        headers=headers,
+    )
+    assert r.status_code == 200 and r.json()["succeeded"] == 200
+    db_session.expire_all()
+    assert {row.status for row in db_session.query(Task).filter(Task.id.in_(ids))} == {"Concluído"}
+    assert client.post("/tasks/batch", json={"operations": []}, headers=headers).status_code == 422
+    assert client.post("/tasks/batch", json={"operations": [{"op": "delete", "id": ids[0]}]}).status_code == 401
+
+
+def test_all_or_nothing_rolls_back_and_best_effort_keeps_valid_items(client, db_session):
+    mine, other, _category, _foreign = _seed(db_session)
+    headers = _headers(client)
+    existing = client.post("/tasks/batch", json={"operations": [{"op": "create", "data": _task(mine)}]}, headers=headers)
+    task_id = existing.json()["items"][0]["id"]
+    operations = [
+        {"op": "create", "data": _task(mine, "Nova")},
+        {"op": "update", "id": task_id, "data": {"title": None}},
+        {"op": "delete", "id": 999999},
+        {"op": "create", "data": _task(other, "Fora")},
+        {"op": "update", "id": task_id, "data": {"priority": "Alta"}},
+    ]
+
+    body = client.post("/tasks/batch", json={"operations": operations}, headers=headers).json()
+    assert body["committed"] is False and body["succeeded"] == 0 and body["failed"] == 4
+    assert [item["status"] for item in body["items"]] == ["skipped", "error", "error", "error", "error"]
+    assert body["items"][2]["message"] == "Tarefa não encontrada."
+    assert body["items"][3]["message"] == "Executivo fora do seu escopo."
+    assert body["items"][4]["message"] == "Registro repetido no lote."
+    assert db_session.query(Task).filter(Task.title == "Nova").count() == 0
+
+    body = client.post("/tasks/batch", json={"mode": "best_effort", "operations": operations[:4]}, headers=headers).json()
+    assert body["committed"] and body["succeeded"] == 1 and body["failed"] == 3
+    assert "title" in body["items"][1]["message"]  # obrigatório na linha mesclada
+    assert db_session.query(Task).filter(Task.title == "Nova").count() == 1
+
+
+def test_expense_batch_keeps_monthly_rollup_in_sync(client, db_session):
+    mine, _other, category, foreign_category = _seed(db_session)
+    headers = _headers(client)
+
+    def expense(amount, day, category_id=None):
+        return {
+            "description": "Lançamento",
+            "amount": amount,
+            "expenseDate": day,
+            "type": "A pagar",
+            "entityType": "Pessoa Jurídica",
+            "status": "Pendente",
+            "executiveId": mine,
+            "categoryId": category_id,
+        }
+
+    body = client.post(
+        "/expenses/batch",
+        json={
+            "operations": [
+                {"op": "create", "data": expense("10.10", "2026-03-05", category)},
+                {"op": "create", "data": expense("20.00", "2026-03-06")},
+                {"op": "create", "data": expense("5.00", "2026-04-01")},
+            ]
+        },
+        headers=headers,
+    ).json()
+    first, second, third = (item["id"] for item in body["items"])
+    body = client.post(
+        "/expenses/batch",
+        json={
+            "operations": [
+                {"op": "update", "id": first, "data": {"amount": "11.50", "status": "Pago"}},
+                {"op": "update", "id": second, "data": {"expenseDate": "2026-04-02"}},
+                {"op": "delete", "id": third},
+                {"op": "create", "data": expense("1.00", "2026-04-03", foreign_category)},
+            ],
+            "mode": "best_effort",
+        },
+        headers=headers,
+    ).json()
+    assert [item["status"] for item in body["items"]] == ["ok", "ok", "ok", "error"]
+    assert body["items"][3]["message"] == "A categoria não pertence ao executivo do lançamento."
+
+    def snapshot():
+        rows = db_session.query(ExpenseMonthlyRollup).filter(ExpenseMonthlyRollup.executive_id == mine).all()
+        return sorted((r.month, r.expense_category_id, r.status, r.expense_count, r.total_cents) for r in rows)
+
+    db_session.expire_all()
+    incremental = snapshot()
+    assert incremental == [(date(2026, 3, 1), category, "Pago", 1, 1150), (date(2026, 4, 1), None, "Pendente", 1, 2000)]
+    ExpenseRollupRepository(db=db_session).rebuild()
+    db_session.commit()
+    assert snapshot() == incremental
+
+
+def test_event_and_contact_batches_validate_merged_rows(client, db_session):
+    mine, _other, _category, _foreign = _seed(db_session)
+    headers = _headers(client)
+    body = client.post(
+        "/events/batch",
+        json={
+            "mode": "best_effort",
+            "operations": [
+                {"op": "create", "data": {"title": "Ok", "startTime": "2026-11-03T10:00:00", "endTime": "2026-11-03T11:00:00", "executiveId": mine}},
+                {"op": "create", "data": {"title": "Invertido", "startTime": "2026-11-03T12:00:00", "endTime": "2026-11-03T11:00:00", "executiveId": mine}},
+            ],
+        },
+        headers=headers,
+    ).json()
+    assert [item["status"] for item in body["items"]] == ["ok", "error"]
+    event_id = body["items"][0]["id"]
+    body = client.post(
+        "/events/batch",
+        json={"operations": [{"op": "update", "id": event_id, "data": {"endTime": "2026-11-03T09:00:00"}}]},
+        headers=headers,
+    ).json()
+    assert body["items"][0]["message"] == "A data/hora de fim deve ser maior que a de início."
+
+    assert client.get("/typeahead", params={"kind": "contact", "prefix": "lu"}, headers=headers).json()["items"] == []
+    body = client.post(
+        "/contacts/batch",
+        json={"operations": [{"op": "create", "data": {"fullName": "Luísa Lote", "executiveId": mine, "contactTypeId": 424242}}, {"op": "create", "data": {"fullName": "Lucas Lote", "executiveId": mine}}]},
+        headers=headers,
+    ).json()
+    assert body["committed"] is False and body["items"][0]["message"] == "Tipo de contato informado não existe."
+    body = client.post(
+        "/contacts/batch",
+        json={"operations": [{"op": "create", "data": {"fullName": "Lucas Lote", "executiveId": mine}}]},
+        headers=headers,
+    ).json()
+    assert body["committed"] and db_session.query(Contact).filter(Contact.full_name == "Lucas Lote").count() == 1
+    names = [item["name"] for item in client.get("/typeahead", params={"kind": "contact", "prefix": "lu"}, headers=headers).json()["items"]]
+    assert names == ["Lucas Lote"]  # índice do autocompletar invalidado após o lote
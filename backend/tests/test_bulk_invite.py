@@ -0,0 +1,159 @@
+"""Convite em lote: validação prévia por linha, gravação em blocos e e-mails pela fila (uma sessão SMTP)."""
+
+import smtplib
+from datetime import datetime, timedelta
+
+from app.core.security import hash_password
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models.outbound_email_model import OutboundEmail
+from app.models.secretary_model import Secretary
+from app.models.user_invite_token_model import UserInviteToken
+from app.models import user_model as user_models
+from app.services import invite_service
+from app.services.email_queue import EmailQueueWorker, SmtpConnectionPool
+
+FRONTEND = {"X-Frontend-Base-URL": "http://localhost:5173"}
+
+
+def _org(db_session, name, cnpj):
+    lo = LegalOrganization(
+        name=f"Matriz {name}",
+        cnpj=cnpj,
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name=name,
+        legalOrganizationId=lo.id,
+        cnpj=cnpj,
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    return org
+
+
+def _seed(db_session):
+    org = _org(db_session, "Empresa", "11222333000181")
+    other = _org(db_session, "Outra", "04252011000110")
+    boss = Executive(full_name="Chefe Atual", work_email="chefe@corp.com", organization_id=org.id)
+    foreign = Executive(full_name="Chefe Alheio", work_email="alheio@outra.com", organization_id=other.id)
+    db_session.add_all([boss, foreign])
+    db_session.add(
+        user_models.Usuario(
+            name="Admin Bulk",
+            email="admin.bulk@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=org.legalOrganizationId,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return org, other, boss, foreign
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.bulk@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}", **FRONTEND}
+
+
+def _smtp_env(monkeypatch, smtp_server):
+    monkeypatch.setenv("SMTP_HOST", "127.0.0.1")
+    monkeypatch.setenv("SMTP_PORT", str(smtp_server.port))
+    monkeypatch.setenv("SMTP_USER", "relay@executiva.test")
+    monkeypatch.setenv("SMTP_PASSWORD", "segredo")
+
+
+def test_bulk_json_reports_each_row(client, db_session, monkeypatch, smtp_server):
+    org, other, boss, foreign = _seed(db_session)
+    _smtp_env(monkeypatch, smtp_server)
+    headers = _headers(client)
+    invites = [
+        {"fullName": "Nova Executiva", "email": "Nova.Exec@corp.com", "invitedRole": "executive"},
+        {"fullName": "Sec Nova", "email": "sec@corp.com", "invitedRole": "secretary", "secretaryExecutiveIds": [boss.id]},
+        {"fullName": "Admin Dois", "email": "admin2@corp.com", "invitedRole": "admin_company"},
+        {"fullName": "Repetida Silva", "email": "nova.exec@corp.com", "invitedRole": "executive"},
+        {"fullName": "Ja Existe", "email": "admin.bulk@corp.com", "invitedRole": "admin_company"},
+        {"fullName": "Sec Errada", "email": "sec2@corp.com", "invitedRole": "secretary", "secretaryExecutiveIds": [foreign.id]},
+        {"fullName": "Fora Escopo", "email": "fora@outra.com", "invitedRole": "executive", "organizationId": other.id},
+        {"fullName": "Papel Invalido", "email": "papel@corp.com", "invitedRole": "master"},
+        {"fullName": "Executivo Existente", "email": "chefe@corp.com", "invitedRole": "executive"},
+    ]
+    r = client.post("/auth/invite-users/bulk", json={"invites": invites, "organizationId": org.id}, headers=headers)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["total"], body["invited"], body["failed"]) == (9, 3, 6)
+    by_row = {item["row"]: item for item in body["items"]}
+    assert [by_row[n]["status"] for n in range(1, 10)] == ["invited"] * 3 + ["error"] * 6
+    assert "linha 1" in by_row[4]["message"]
+    assert by_row[5]["message"] == "Este e-mail já está cadastrado."
+    assert "mesma empresa" in by_row[6]["message"]
+    assert by_row[7]["message"] == "organizationId deve ser a empresa do administrador."
+    assert by_row[8]["message"].startswith("invitedRole")
+    assert by_row[9]["message"] == "Já existe executivo com este e-mail de trabalho."
+
+    new_exec = db_session.get(user_models.Usuario, by_row[1]["userId"])
+    assert (new_exec.email, new_exec.role, new_exec.needs_profile_completion) == ("nova.exec@corp.com", "executive", True)
+    assert new_exec.executive_id is not None
+    secretary = db_session.get(Secretary, int(db_session.get(user_models.Usuario, by_row[2]["userId"]).secretary_external_id))
+    assert [ex.id for ex in secretary.executives] == [boss.id]
+    invited_ids = [by_row[n]["userId"] for n in (1, 2, 3)]
+    assert db_session.query(UserInviteToken).filter(UserInviteToken.user_id.in_(invited_ids)).count() == 3
+    queued = db_session.query(OutboundEmail).order_by(OutboundEmail.id).all()
+    assert [q.to_email for q in queued] == ["nova.exec@corp.com", "sec@corp.com", "admin2@corp.com"]
+    assert "flow=set-password&amp;token=" in queued[0].body_html
+    assert smtp_server.connections == 0
+
+
+def test_bulk_csv_300_invites_one_smtp_session(client, db_session, monkeypatch, smtp_server):
+    org, *_ = _seed(db_session)
+    _smtp_env(monkeypatch, smtp_server)
+    headers = _headers(client)
+    lines = ["fullName;email;invitedRole"] + [
+        f"Pessoa Numero{i};pessoa{i}@corp.com;executive" for i in range(300)
+    ]
+    hashes = []
+    monkeypatch.setattr(invite_service, "hash_password", lambda password: hashes.append(password) or hash_password(password))
+    r = client.post(
+        f"/auth/invite-users/bulk?organization_id={org.id}",
+        files={"file": ("convites.csv", "\n".join(lines).encode("utf-8"), "text/csv")},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert (r.json()["invited"], r.json()["failed"]) == (300, 0)
+    # Um único hash bcrypt por lote; antes eram 300 requisições com hash + SMTP cada.
+    assert len(hashes) == 1
+
+    worker = EmailQueueWorker(
+        session_factory=lambda: db_session,
+        pool=SmtpConnectionPool(connect=lambda: smtplib.SMTP("127.0.0.1", smtp_server.port, timeout=5)),
+        from_addr="noreply@executiva.test",
+        batch_size=500,
+        clock=lambda: datetime.utcnow() + timedelta(seconds=1),
+    )
+    assert worker.drain_once() == 300
+    assert len(smtp_server.messages) == 300 and smtp_server.connections == 1
+
+
+def test_bulk_rejects_without_permission_or_rows(client, db_session):
+    _seed(db_session)
+    headers = _headers(client)
+    assert client.post("/auth/invite-users/bulk", json={"invites": []}).status_code == 401
+    r = client.post("/auth/invite-users/bulk", content=b"fullName,email,invitedRole\n", headers={**headers, "Content-Type": "text/csv"})
+    assert r.status_code == 400 and r.json()["detail"] == "Nenhum convite informado."
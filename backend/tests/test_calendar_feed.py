@@ -0,0 +1,175 @@
+"""Feed iCalendar por executivo: RRULE por série, token e GET condicional."""
+
+from datetime import datetime
+
+from app.core.calendar_feed_token import calendar_feed_token
+from app.core.icalendar import build_rrule, escape_text, fold_line
+from app.core.recurrence import RecurrenceParams
+from app.core.security import hash_password
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+
+VALID_CEP = "01310100"
+VALID_CNPJ = "11222333000181"
+VALID_CNPJ_B = "04252011000110"
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj=VALID_CNPJ,
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode=VALID_CEP,
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj=VALID_CNPJ_B,
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    ex = Executive(full_name="Exec Feed", work_email="exec.feed@corp.com", organization_id=org.id)
+    db_session.add(ex)
+    db_session.flush()
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.feed@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return ex
+
+
+def _feed_url(ex_id: int) -> str:
+    return f"/events/feed/{ex_id}.ics?token={calendar_feed_token(ex_id)}"
+
+
+def _unfold(body: str) -> str:
+    return body.replace("\r\n ", "")
+
+
+def test_fold_line_respects_octet_limit():
+    line = "DESCRIPTION:" + "ação " * 40
+    folded = fold_line(line)
+    for physical in folded.split("\r\n")[:-1]:
+        assert len(physical.encode("utf-8")) <= 75
+    assert _unfold(folded) == line + "\r\n"
+    assert escape_text("a,b;c\nd") == "a\\,b\\;c\\nd"
+
+
+def test_build_rrule_weekly_and_unsupported_monthly():
+    rule = RecurrenceParams(frequency="weekly", interval=2, days_of_week=[1, 3])
+    rrule = build_rrule(rule, datetime(2026, 1, 5, 9), datetime(2026, 3, 2, 9))
+    assert rrule == "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;WKST=SU;UNTIL=20260302T090000"
+    monthly = RecurrenceParams(frequency="monthly", interval=1)
+    assert build_rrule(monthly, datetime(2026, 1, 31, 9), datetime(2026, 6, 30, 9)) is None
+
+
+def test_feed_exports_series_as_single_rrule(client, db_session):
+    ex = _seed(db_session)
+    r = client.post(
+        "/events/series",
+        json={
+            "title": "Standup",
+            "startTime": "2026-03-02T09:00:00",
+            "endTime": "2026-03-02T09:15:00",
+            "executiveId": ex.id,
+            "reminderMinutes": 10,
+            "recurrence": {"frequency": "daily", "interval": 1, "count": 30},
+        },
+    )
+    assert r.status_code == 201, r.text
+    rows = r.json()
+    # Uma ocorrência apagada (EXDATE) e outra editada (RECURRENCE-ID)
+    assert client.delete(f"/events/{rows[3]['id']}").status_code == 200
+    assert client.put(f"/events/{rows[5]['id']}", json={"title": "Standup longo"}).status_code == 200
+    client.post(
+        "/events/",
+        json={
+            "title": "Almoço; cliente",
+            "startTime": "2026-03-10T12:00:00",
+            "endTime": "2026-03-10T13:00:00",
+            "executiveId": ex.id,
+        },
+    )
+
+    feed = client.get(_feed_url(ex.id))
+    assert feed.status_code == 200, feed.text
+    assert feed.headers["content-type"].startswith("text/calendar")
+    body = _unfold(feed.text)
+    assert body.startswith("BEGIN:VCALENDAR\r\n") and body.endswith("END:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 3
+    assert body.count("RRULE:") == 1
+    assert "RRULE:FREQ=DAILY;UNTIL=20260331T090000" in body
+    assert "EXDATE:20260305T090000" in body
+    assert "RECURRENCE-ID:20260307T090000" in body
+    assert "SUMMARY:Almoço\\; cliente" in body
+    assert "TRIGGER:-PT10M" in body
+
+
+def test_feed_conditional_get_and_token(client, db_session):
+    ex = _seed(db_session)
+    client.post(
+        "/events/",
+        json={
+            "title": "Reunião",
+            "startTime": "2026-04-01T10:00:00",
+            "endTime": "2026-04-01T11:00:00",
+            "executiveId": ex.id,
+        },
+    )
+    assert client.get(f"/events/feed/{ex.id}.ics?token=invalido").status_code == 404
+
+    first = client.get(_feed_url(ex.id))
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    not_modified = client.get(_feed_url(ex.id), headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    since = client.get(_feed_url(ex.id), headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert since.status_code == 304
+
+    client.post(
+        "/events/",
+        json={
+            "title": "Nova",
+            "startTime": "2026-04-02T10:00:00",
+            "endTime": "2026-04-02T11:00:00",
+            "executiveId": ex.id,
+        },
+    )
+    changed = client.get(_feed_url(ex.id), headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_feed_link_requires_scope(client, db_session):
+    ex = _seed(db_session)
+    assert client.get(f"/events/feed/{ex.id}/link").status_code == 401
+    login = client.post("/auth/login", json={"email": "admin.feed@corp.com", "password": "secret123"})
+    token = login.json()["accessToken"]
+    r = client.get(f"/events/feed/{ex.id}/link", headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 200, r.text
+    assert r.json()["feedUrl"].endswith(_feed_url(ex.id))
@@ -0,0 +1,157 @@
+"""Turnstile: cliente HTTP compartilhado (keep-alive), orçamento de tempo, circuit breaker e métricas."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.core import captcha_service
+from app.core.captcha_service import CaptchaVerificationError, TurnstileVerifier
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.security import hash_password
+from app.models import user_model as user_models
+
+
+class _TurnstileStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        if server.delay:
+            time.sleep(server.delay)
+        if server.status >= 500:
+            body = b"upstream error"
+        else:
+            body = json.dumps({"success": server.success, "error-codes": [] if server.success else ["invalid-input-response"]}).encode()
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def turnstile(monkeypatch):
+    monkeypatch.setenv("TURNSTILE_SECRET_KEY", "segredo-teste")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TurnstileStandIn)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = server.requests = 0
+    server.delay, server.status, server.success = 0.0, 200, True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/siteverify"
+
+
+def test_shared_client_keeps_connection_and_records_latency(turnstile):
+    verifier = TurnstileVerifier(verify_url=_url(turnstile))
+
+    async def scenario():
+        for _ in range(5):
+            await verifier.verify("token-ok")
+        turnstile.success = False
+        with pytest.raises(CaptchaVerificationError):
+            await verifier.verify("token-ruim")
+        await verifier.aclose()
+
+    asyncio.run(scenario())
+    assert turnstile.requests == 6 and turnstile.connections == 1
+    snapshot = verifier.snapshot()
+    assert snapshot["outcomes"] == {"success": 5, "rejected": 1}
+    assert snapshot["samples"] == 6 and snapshot["p95Ms"] is not None
+    assert snapshot["breakerState"] == "closed"  # token recusado não é falha do upstream
+
+
+def test_breaker_fails_fast_when_upstream_is_slow_then_recovers(turnstile):
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=lambda: now[0])
+    verifier = TurnstileVerifier(verify_url=_url(turnstile), timeout_seconds=0.2, breaker=breaker)
+    turnstile.delay = 0.5
+
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(CaptchaVerificationError):
+                await verifier.verify("token")
+        assert breaker.state == "open"
+        requests_before = turnstile.requests
+        started = time.perf_counter()
+        with pytest.raises(CaptchaVerificationError):
+            await verifier.verify("token")
+        fast_fail = time.perf_counter() - started
+        skipped_upstream = turnstile.requests == requests_before
+
+        turnstile.delay = 0.0
+        now[0] += 31  # meio-aberto: uma chamada de prova
+        await verifier.verify("token")
+        await verifier.aclose()
+        return fast_fail, skipped_upstream
+
+    fast_fail, skipped_upstream = asyncio.run(scenario())
+    assert fast_fail < 0.05 and skipped_upstream
+    assert breaker.state == "closed"
+    outcomes = verifier.snapshot()["outcomes"]
+    assert outcomes == {"upstream_error": 2, "short_circuited": 1, "success": 1}
+
+
+def test_cancelled_half_open_probe_does_not_wedge_the_breaker(turnstile):
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=lambda: now[0])
+    verifier = TurnstileVerifier(verify_url=_url(turnstile), timeout_seconds=2, breaker=breaker)
+
+    async def scenario():
+        breaker.record_failure()
+        now[0] += 31  # meio-aberto
+        turnstile.delay = 0.5
+        probe = asyncio.create_task(verifier.verify("token"))
+        await asyncio.sleep(0.1)
+        probe.cancel()  # cliente desconectou no meio da prova
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        turnstile.delay = 0.0
+        await verifier.verify("token")
+        await verifier.aclose()
+
+    asyncio.run(scenario())
+    assert breaker.state == "closed"
+
+
+def test_metrics_endpoint_is_master_only(client, db_session):
+    db_session.add(
+        user_models.Usuario(
+            name="Master Root",
+            email="master.metrics@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="master",
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    token = client.post("/auth/login", json={"email": "master.metrics@corp.com", "password": "secret123"}).json()["accessToken"]
+    captcha_service.set_verifier(TurnstileVerifier(verify_url="http://127.0.0.1:9/siteverify"))
+    try:
+        r = client.get("/auth/captcha/metrics", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        captcha_service.set_verifier(None)
+    assert r.status_code == 200 and r.json()["breakerState"] == "closed"
+    assert client.get("/auth/captcha/metrics").status_code == 401
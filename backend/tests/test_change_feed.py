@@ -0,0 +1,230 @@
+"""Feed de alterações: hooks after_commit, escopo por executivo e replay por Last-Event-ID."""
+
+import asyncio
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.change_feed import ChangeHub, hub
+from app.core.database import Base, get_db, get_session_factory
+from app.core.security import create_access_token, hash_password
+from app.main import app as fastapi_app
+from app.models import user_model as user_models
+from app.models.event_type_model import EventType
+from app.models.executive_model import Executive
+from app.services.change_feed_service import ChangeScope, stream_changes
+
+
+def _notices_after(version):
+    return [n for n in hub._backlog if n.version > version]
+
+
+def test_commits_publish_compact_notices(client, db_session):
+    ex = Executive(full_name="Exec Feed", work_email="exec.feed@corp.com")
+    db_session.add(ex)
+    db_session.commit()
+
+    start = hub.version
+    created = client.post(
+        "/events/",
+        json={
+            "title": "Diretoria",
+            "startTime": "2026-03-02T09:00:00",
+            "endTime": "2026-03-02T10:00:00",
+            "executiveId": ex.id,
+        },
+    ).json()
+    client.put(f"/events/{created['id']}", json={"title": "Diretoria (remarcada)"})
+    client.delete(f"/events/{created['id']}")
+    ops = [(n.entity, n.id, n.op, n.executive_id) for n in _notices_after(start)]
+    assert ops == [
+        ("event", created["id"], "create", ex.id),
+        ("event", created["id"], "update", ex.id),
+        ("event", created["id"], "delete", ex.id),
+    ]
+
+    series = client.post(
+        "/events/series",
+        json={
+            "title": "Standup",
+            "startTime": "2026-03-02T09:00:00",
+            "endTime": "2026-03-02T09:15:00",
+            "executiveId": ex.id,
+            "recurrence": {"frequency": "daily", "count": 3},
+        },
+    ).json()
+    before_delete = hub.version
+    client.delete(f"/events/recurrence/{series[0]['recurrenceId']}")
+    deleted = _notices_after(before_delete)
+    assert sorted(n.id for n in deleted) == sorted(e["id"] for e in series)
+    assert {n.op for n in deleted} == {"delete"}
+
+    # Rollback descarta as alterações pendentes.
+    before_rollback = hub.version
+    db_session.add(EventType(name="Descartado", color="#000000"))
+    db_session.flush()
+    db_session.rollback()
+    assert hub.version == before_rollback
+
+
+def test_stream_filters_by_scope_and_replays():
+    local_hub = ChangeHub(backlog=3)
+
+    async def scenario():
+        local_hub.publish([("event", 1, "create", 10), ("event", 2, "create", 20)])
+        stream = stream_changes(
+            ChangeScope(executive_ids={10}),
+            lambda: asyncio.sleep(0, result=False),
+            last_event_id=0,
+            hub=local_hub,
+        )
+        assert (await stream.__anext__()).startswith("retry:")
+        replayed = await stream.__anext__()
+        local_hub.publish([("event", 3, "update", 20), ("eventType", 4, "create", None)])
+        live = await asyncio.wait_for(stream.__anext__(), timeout=2)
+        await stream.aclose()
+
+        # Backlog de 3 avisos já descartou a versão 1: reconexão recebe `reset`.
+        stale = stream_changes(
+            ChangeScope(executive_ids=None),
+            lambda: asyncio.sleep(0, result=False),
+            last_event_id=0,
+            hub=local_hub,
+        )
+        await stale.__anext__()
+        reset = await stale.__anext__()
+        await stale.aclose()
+        return replayed, live, reset
+
+    replayed, live, reset = asyncio.run(scenario())
+    assert '"id":1' in replayed and "id: 1\n" in replayed
+    assert live.startswith("event: change\nid: 4\n") and '"entity":"eventType"' in live
+    assert reset.startswith("event: reset\n")
+    assert local_hub.subscriber_count == 0
+
+
+def test_last_event_id_ahead_of_hub_gets_reset():
+    # Contador em memória: depois de um reinício, o Last-Event-ID do cliente fica à frente.
+    local_hub = ChangeHub(backlog=10)
+
+    async def scenario():
+        local_hub.publish([("event", 1, "create", 10)])
+        _token, _subscription, replay = local_hub.subscribe(lambda notice: True, since=42)
+        stream = stream_changes(
+            ChangeScope(executive_ids=None),
+            lambda: asyncio.sleep(0, result=False),
+            last_event_id=42,
+            hub=local_hub,
+        )
+        await stream.__anext__()
+        first = await stream.__anext__()
+        await stream.aclose()
+        return replay, first
+
+    replay, first = asyncio.run(scenario())
+    assert replay is None
+    assert first.startswith("event: reset\nid: 1\n")
+
+
+def test_stream_requires_authentication(client):
+    assert client.get("/changes/stream").status_code == 401
+    assert client.get("/changes/stream?access_token=invalido").status_code == 401
+
+
+def test_open_change_and_reminder_streams_do_not_hold_pool_connections(tmp_path):
+    # Pool como o de produção (5 + 10 de overflow), com timeout curto: o 16º stream, ou a
+    # requisição comum depois deles, esperaria uma conexão se cada stream segurasse a sua.
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        connect_args={"check_same_thread": False},
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=1,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with factory() as db:
+        user = user_models.Usuario(
+            name="Master",
+            email="master.pool@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="master",
+            needs_profile_completion=False,
+        )
+        db.add(user)
+        db.commit()
+        token = create_access_token(str(user.id))
+
+    def pooled_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def call(path, query, receive):
+        start = {}
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "client": ("127.0.0.1", 1234),
+            "root_path": "",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "headers": [(b"host", b"testserver"), (b"authorization", f"Bearer {token}".encode())],
+        }
+        started = asyncio.Event()
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+                started.set()
+
+        task = asyncio.create_task(fastapi_app(scope, receive, send))
+        return task, started, start
+
+    async def scenario():
+        disconnect = asyncio.Event()
+
+        async def hold_open():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        streams = [await call("/changes/stream", "", hold_open) for _ in range(16)]
+        streams += [await call("/events/reminders/stream", "", hold_open) for _ in range(16)]
+        await asyncio.wait_for(asyncio.gather(*(started.wait() for _, started, _ in streams)), timeout=10)
+        assert hub.subscriber_count >= 16
+
+        sent = False
+
+        async def request_body():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        task, _, start = await call("/event-types/", "", request_body)
+        await asyncio.wait_for(task, timeout=10)
+        disconnect.set()
+        await asyncio.gather(*(stream for stream, _, _ in streams), return_exceptions=True)
+        return [response["status"] for _, _, response in streams], start["status"]
+
+    previous = dict(fastapi_app.dependency_overrides)
+    fastapi_app.dependency_overrides[get_db] = pooled_get_db
+    fastapi_app.dependency_overrides[get_session_factory] = lambda: factory
+    try:
+        stream_statuses, status = asyncio.run(scenario())
+    finally:
+        fastapi_app.dependency_overrides.clear()
+        fastapi_app.dependency_overrides.update(previous)
+        engine.dispose()
+    assert stream_statuses == [200] * 32
+    assert status == 200
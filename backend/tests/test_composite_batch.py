@@ -0,0 +1,162 @@
+"""POST /batch: leituras agrupadas numa requisição, com uma autenticação e uma sessão."""
+
+from app.core.security import hash_password
+from app.models.event_type_model import EventType
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+from app.repositories.user_repository import UserRepository
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Lote", work_email="exec.lote@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other, EventType(name="Reunião")])
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.batch@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine.id, other.id
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.batch@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def test_batch_returns_each_response_as_the_standalone_call(client, db_session, monkeypatch):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    paths = {
+        "executives": "/executives/?skip=0&limit=1000",
+        "eventTypes": "/event-types/",
+        "contactTypes": "/contact-types/",
+        "contacts": f"/contacts/?executive_id={mine}",
+    }
+    standalone = {key: client.get(path, headers=headers) for key, path in paths.items()}
+
+    lookups = []
+    original = UserRepository.get_by_id
+    monkeypatch.setattr(UserRepository, "get_by_id", lambda self, uid: lookups.append(uid) or original(self, uid))
+    r = client.post(
+        "/batch",
+        json={"requests": [{"id": key, "path": path} for key, path in paths.items()]},
+        headers=headers,
+    )
+    assert r.status_code == 200
+    assert len(lookups) == 1  # só a requisição externa autentica
+    responses = {item["id"]: item for item in r.json()["responses"]}
+    assert list(responses) == list(paths)
+    for key, response in standalone.items():
+        assert responses[key]["status"] == response.status_code == 200, key
+        assert responses[key]["body"] == response.json()
+    assert [item["id"] for item in responses["executives"]["body"]] == [mine]
+
+
+def test_batch_opens_one_session_through_the_real_get_db(client, db_session, monkeypatch):
+    from sqlalchemy.orm import Session
+
+    import app.core.database as database
+    from app.core.database import get_db
+    from app.main import app as fastapi_app
+
+    mine, _ = _seed(db_session)
+    headers = _headers(client)
+    # Sem o override do conftest: o get_db de produção, com SessionLocal contando as sessões abertas
+    # (presas à conexão do teste para o rollback no final).
+    opened = []
+    monkeypatch.delitem(fastapi_app.dependency_overrides, get_db)
+    monkeypatch.setattr(
+        database, "SessionLocal", lambda: opened.append(1) or Session(bind=db_session.connection())
+    )
+    r = client.post(
+        "/batch",
+        json={
+            "requests": [
+                {"id": "executives", "path": "/executives/?skip=0&limit=1000"},
+                {"id": "eventTypes", "path": "/event-types/"},
+                {"id": "contacts", "path": f"/contacts/?executive_id={mine}"},
+            ]
+        },
+        headers=headers,
+    )
+    assert r.status_code == 200
+    assert [item["status"] for item in r.json()["responses"]] == [200, 200, 200]
+    assert len(opened) == 1
+
+
+def test_batch_reports_errors_per_item(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    r = client.post(
+        "/batch",
+        json={
+            "requests": [
+                {"id": "fora", "path": f"/executives/{other}"},
+                {"id": "inexistente", "path": "/nao-existe"},
+                {"id": "invalido", "path": "/tasks/?executive_id=abc"},
+                {"id": "csv", "path": "/contacts/export?format=csv"},
+                {"id": "externo", "path": "https://example.com/executives/"},
+                {"id": "recursivo", "path": "/batch"},
+                {"id": "ok", "path": f"/executives/{mine}"},
+            ]
+        },
+        headers=headers,
+    )
+    assert r.status_code == 200
+    statuses = {item["id"]: item["status"] for item in r.json()["responses"]}
+    assert statuses == {
+        "fora": 403,
+        "inexistente": 404,
+        "invalido": 422,
+        "csv": 406,
+        "externo": 400,
+        "recursivo": 400,
+        "ok": 200,
+    }
+
+
+def test_batch_requires_auth_and_valid_envelope(client, db_session):
+    _seed(db_session)
+    headers = _headers(client)
+    assert client.post("/batch", json={"requests": [{"id": "a", "path": "/event-types/"}]}).status_code == 401
+    assert client.post("/batch", json={"requests": []}, headers=headers).status_code == 422
+    duplicated = [{"id": "a", "path": "/event-types/"}, {"id": "a", "path": "/organizations/"}]
+    assert client.post("/batch", json={"requests": duplicated}, headers=headers).status_code == 422
+    writes = [{"id": "a", "method": "DELETE", "path": "/event-types/1"}]
+    assert client.post("/batch", json={"requests": writes}, headers=headers).status_code == 422
@@ -0,0 +1,144 @@
+"""GET /dashboard/summary: agregados do painel em poucas consultas, no escopo do ator, com cache curto."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.core.security import hash_password
+from app.core.ttl_cache import TTLCache
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models.task_model import Task
+from app.models import user_model as user_models
+from app.services import dashboard_service
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    dashboard_service.summary_cache.clear()
+    yield
+    dashboard_service.summary_cache.clear()
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Painel", work_email="exec.painel@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    now = datetime.utcnow()
+    db_session.add_all(
+        [
+            Event(title="Passado", start_time=now - timedelta(days=2), end_time=now - timedelta(days=2, hours=-1), executive_id=mine.id),
+            Event(title="Amanhã", start_time=now + timedelta(days=1), end_time=now + timedelta(days=1, hours=1), executive_id=mine.id),
+            Event(title="Em duas semanas", start_time=now + timedelta(days=14), end_time=now + timedelta(days=14, hours=1), executive_id=mine.id),
+            Event(title="De outro", start_time=now + timedelta(hours=3), end_time=now + timedelta(hours=4), executive_id=other.id),
+            Task(title="T1", due_date=date.today(), priority="Alta", status="A Fazer", executive_id=mine.id),
+            Task(title="T2", due_date=date.today(), priority="Alta", status="Em Andamento", executive_id=mine.id),
+            Task(title="T3", due_date=date.today(), priority="Baixa", status="Concluído", executive_id=mine.id),
+        ]
+    )
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.painel@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine.id, other.id
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.painel@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _expense(client, executive_id, amount, day, entry_type="A pagar", status="Pendente"):
+    payload = {
+        "description": "Lançamento",
+        "amount": amount,
+        "expenseDate": day,
+        "type": entry_type,
+        "entityType": "Pessoa Jurídica",
+        "status": status,
+        "executiveId": executive_id,
+    }
+    r = client.post("/expenses/", json=payload)
+    assert r.status_code == 201, r.text
+
+
+def test_summary_aggregates_for_executive(client, db_session):
+    mine, _other = _seed(db_session)
+    today = date.today()
+    _expense(client, mine, "100.50", today.isoformat())
+    _expense(client, mine, "20.00", today.replace(day=1).isoformat(), entry_type="A receber", status="Recebida")
+    _expense(client, mine, "7.00", (today.replace(day=1) - timedelta(days=1)).isoformat())  # mês anterior
+
+    r = client.get("/dashboard/summary", params={"executive_id": mine, "limit": 5}, headers=_headers(client))
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["counts"] == {"events": 3, "expenses": 3, "tasks": 3, "contacts": 0, "documents": 0}
+    assert [e["title"] for e in body["upcomingEvents"]] == ["Amanhã", "Em duas semanas"]
+    assert body["eventsNextDays"] == 1
+    assert len(body["recentExpenses"]) == 3 and body["recentExpenses"][0]["expenseDate"] == today.isoformat()
+    assert body["tasks"] == {"open": 2, "openByPriority": {"Alta": 2}, "byStatus": {"A Fazer": 1, "Em Andamento": 1, "Concluído": 1}}
+    totals = body["expenses"]
+    assert totals["month"] == today.strftime("%Y-%m") and totals["count"] == 2
+    assert {g["type"]: g["amount"] for g in totals["byType"]} == {"A pagar": "100.50", "A receber": "20.00"}
+
+
+def test_summary_scope_and_cache(client, db_session, monkeypatch):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    assert client.get("/dashboard/summary", params={"executive_id": other}, headers=headers).status_code == 403
+    assert client.get("/dashboard/summary").status_code == 401
+
+    now = [0.0]
+    monkeypatch.setattr(dashboard_service, "summary_cache", TTLCache(ttl_seconds=30, clock=lambda: now[0]))
+    first = client.get("/dashboard/summary", headers=headers).json()
+    assert first["executiveId"] is None and first["counts"]["events"] == 3  # só executivos visíveis
+
+    db_session.add(Task(title="Nova", due_date=date.today(), priority="Média", status="A Fazer", executive_id=mine))
+    db_session.commit()
+    assert client.get("/dashboard/summary", headers=headers).json()["tasks"]["open"] == 2  # servido do cache
+    now[0] += 31
+    assert client.get("/dashboard/summary", headers=headers).json()["tasks"]["open"] == 3
+
+
+def test_ttl_cache_evicts_oldest_entries():
+    cache = TTLCache(ttl_seconds=10, max_entries=2, clock=lambda: 0.0)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    assert cache.get("a") is None and cache.get("c") == "C"
@@ -0,0 +1,115 @@
+"""Fila de e-mails: request só enfileira; worker envia por sessão SMTP reaproveitada, com retry."""
+
+import smtplib
+from datetime import datetime, timedelta
+
+from app.models.outbound_email_model import OutboundEmail
+from app.repositories.outbound_email_repository import OutboundEmailRepository
+from app.services import email_queue
+from app.services.email_queue import EmailQueueWorker, SmtpConnectionPool
+
+
+def _smtp_env(monkeypatch, smtp_server):
+    monkeypatch.setenv("SMTP_HOST", "127.0.0.1")
+    monkeypatch.setenv("SMTP_PORT", str(smtp_server.port))
+    monkeypatch.setenv("SMTP_USER", "relay@executiva.test")
+    monkeypatch.setenv("SMTP_PASSWORD", "segredo")
+    monkeypatch.setenv("SUPPORT_REPORT_TO", "suporte@executiva.test")
+
+
+def _worker(db_session, smtp_server, now, **kwargs):
+    pool = SmtpConnectionPool(
+        connect=lambda: smtplib.SMTP("127.0.0.1", smtp_server.port, timeout=5),
+        check_after_seconds=0,
+    )
+    return EmailQueueWorker(
+        session_factory=lambda: db_session,
+        pool=pool,
+        from_addr="noreply@executiva.test",
+        clock=lambda: now[0],
+        **kwargs,
+    )
+
+
+class _WakeRecorder:
+    def __init__(self):
+        self.wakes = 0
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def wake(self):
+        self.wakes += 1
+
+
+def test_request_only_enqueues_and_wakes_worker_after_commit(client, db_session, monkeypatch, smtp_server):
+    _smtp_env(monkeypatch, smtp_server)
+    recorder = _WakeRecorder()
+    email_queue.start(recorder)
+    try:
+        response = client.post(
+            "/support/problem-report",
+            json={"context": "app", "email": "user@corp.com", "description": "Tela travou ao salvar"},
+        )
+    finally:
+        email_queue.stop()
+    assert response.status_code == 200, response.text
+    queued = db_session.query(OutboundEmail).one()
+    assert (queued.to_email, queued.status, queued.attempts) == ("suporte@executiva.test", "pending", 0)
+    assert smtp_server.connections == 0
+    assert recorder.wakes == 1
+
+
+def test_worker_reuses_one_session_and_retries_with_backoff(db_session, smtp_server):
+    repo = OutboundEmailRepository(db_session)
+    addresses = ["a@corp.com", "lento@corp.com", "b@corp.com", "inexistente@corp.com", "c@corp.com"]
+    for address in addresses:
+        repo.enqueue(address, f"Assunto {address}", "corpo", "<p>corpo</p>")
+    db_session.commit()
+    smtp_server.rcpt_codes = {"lento@corp.com": 451, "inexistente@corp.com": 550}
+
+    now = [datetime.utcnow() + timedelta(seconds=1)]
+    worker = _worker(db_session, smtp_server, now)
+    assert worker.drain_once() == 5
+    assert [rcpts for rcpts, _ in smtp_server.messages] == [["a@corp.com"], ["b@corp.com"], ["c@corp.com"]]
+
+    rows = {row.to_email: row for row in db_session.query(OutboundEmail)}
+    assert rows["a@corp.com"].status == "sent" and rows["a@corp.com"].sent_at is not None
+    assert rows["inexistente@corp.com"].status == "failed"
+    slow = rows["lento@corp.com"]
+    assert (slow.status, slow.attempts) == ("pending", 1)
+    assert slow.next_attempt_at > now[0] and "451" in slow.last_error
+    slow_id = slow.id
+
+    # Antes do backoff vencer, nada é reservado; depois, sai pela mesma sessão SMTP.
+    assert worker.drain_once() == 0
+    smtp_server.rcpt_codes = {}
+    now[0] += timedelta(hours=1)
+    assert worker.drain_once() == 1
+    assert db_session.get(OutboundEmail, slow_id).status == "sent"
+    assert smtp_server.connections == 1 and worker.pool.connections_opened == 1
+
+
+def test_worker_reconnects_and_recovers_expired_claims(db_session, smtp_server):
+    repo = OutboundEmailRepository(db_session)
+    repo.enqueue("primeiro@corp.com", "Um", "corpo")
+    db_session.commit()
+    now = [datetime.utcnow() + timedelta(seconds=1)]
+    worker = _worker(db_session, smtp_server, now)
+    assert worker.drain_once() == 1
+
+    # Relay derrubou a sessão ociosa; uma linha ficou "sending" por um worker que caiu.
+    smtp_server.drop_connections()
+    stuck = repo.enqueue("orfao@corp.com", "Dois", "corpo")
+    db_session.flush()
+    stuck.status = "sending"
+    stuck.locked_until = now[0] - timedelta(minutes=1)
+    db_session.commit()
+
+    assert worker.drain_once() == 1
+    assert db_session.query(OutboundEmail).filter(OutboundEmail.status == "sent").count() == 2
+    assert worker.pool.connections_opened == 2
+    assert [rcpts for rcpts, _ in smtp_server.messages] == [["primeiro@corp.com"], ["orfao@corp.com"]]
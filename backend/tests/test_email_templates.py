@@ -0,0 +1,52 @@
+"""Templates Jinja2 de e-mail: compilados uma vez, autoescape só no HTML, renderização em lote."""
+
+from app.services import email_templates
+
+
+def test_templates_compile_once_and_escape_only_html():
+    compiled = email_templates.load_templates()
+    assert set(compiled) == set(email_templates.TEMPLATE_NAMES)
+    assert email_templates.get_template(email_templates.INVITE_HTML) is compiled[email_templates.INVITE_HTML]
+
+    context = {"full_name": "Ana <Silva> & Cia", "set_password_link": "https://app/?flow=set-password&token=abc"}
+    html = email_templates.render(email_templates.INVITE_HTML, context)
+    text = email_templates.render(email_templates.INVITE_TEXT, context)
+    assert "<strong>Ana &lt;Silva&gt; &amp; Cia</strong>" in html
+    assert 'href="https://app/?flow=set-password&amp;token=abc"' in html
+    assert text.startswith("Olá, Ana <Silva> & Cia,\n") and "token=abc\n" in text
+
+    report = email_templates.render(
+        email_templates.PROBLEM_REPORT_TEXT,
+        {
+            "category": "Bug",
+            "context": "app",
+            "reporter_name": "",
+            "reporter_email": "user@corp.com",
+            "screen_label": None,
+            "page_url": None,
+            "user_agent": "UA",
+            "description": "  Tela travou \n",
+        },
+    )
+    assert "Nome do usuário: (não informado)\n" in report and "Tela: -\n" in report
+    assert report.endswith("Descrição:\nTela travou")
+
+    digests = email_templates.render_many(
+        email_templates.REMINDER_DIGEST_TEXT,
+        [{"full_name": "Exec", "lines": ["09:00 — Diretoria", "10:00 — Board"]}, {"full_name": "Outro", "lines": ["x"]}],
+    )
+    assert digests[0].endswith("breve:\n\n- 09:00 — Diretoria\n- 10:00 — Board\n")
+    assert digests[1].startswith("Olá, Outro.")
+
+
+def test_render_10k_invites():
+    email_templates.load_templates()
+    contexts = [
+        {"full_name": f"Pessoa {i}", "set_password_link": f"https://app/?flow=set-password&token={i:064d}"}
+        for i in range(10_000)
+    ]
+    html = email_templates.render_many(email_templates.INVITE_HTML, contexts)
+    text = email_templates.render_many(email_templates.INVITE_TEXT, contexts)
+    assert len(html) == len(text) == 10_000
+    assert f"token={9_999:064d}" in html[-1]
+    assert "Pessoa 1234" in text[1234] and "Pessoa 1234" not in text[1235]
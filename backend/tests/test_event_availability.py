@@ -0,0 +1,160 @@
+"""Livre/ocupado entre executivos: união ordenada e slots ranqueados."""
+
+from datetime import datetime, timedelta
+
+from app.core.intervals import Interval, merge_intervals, subtract_intervals
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+from app.schemas.event_schema import AvailabilityRequest
+from app.services.availability_service import AvailabilityService
+
+
+def _seed_executives(db_session, count):
+    executives = [
+        Executive(full_name=f"Exec {i}", work_email=f"exec.avail{i}@corp.com") for i in range(count)
+    ]
+    db_session.add_all(executives)
+    db_session.commit()
+    return executives
+
+
+def _add_event(db_session, ex, start, end):
+    db_session.add(Event(title="Ocupado", start_time=start, end_time=end, executive_id=ex.id))
+
+
+def test_merge_and_subtract_intervals():
+    d = datetime(2026, 3, 2)
+    busy = merge_intervals(
+        [
+            Interval(d.replace(hour=10), d.replace(hour=11)),
+            Interval(d.replace(hour=9), d.replace(hour=10)),
+            Interval(d.replace(hour=13), d.replace(hour=14)),
+            Interval(d.replace(hour=13, minute=30), d.replace(hour=13, minute=45)),
+        ]
+    )
+    assert [(b.start.hour, b.end.hour) for b in busy] == [(9, 11), (13, 14)]
+    free = subtract_intervals([Interval(d.replace(hour=8), d.replace(hour=18))], busy)
+    assert [(f.start.hour, f.end.hour) for f in free] == [(8, 9), (11, 13), (14, 18)]
+
+
+def test_common_slots_with_buffer(client, db_session):
+    a, b = _seed_executives(db_session, 2)
+    day = datetime(2026, 3, 2)  # segunda-feira
+    _add_event(db_session, a, day.replace(hour=9), day.replace(hour=10))
+    _add_event(db_session, b, day.replace(hour=11), day.replace(hour=12))
+    _add_event(db_session, b, day.replace(hour=13), day.replace(hour=17, minute=30))
+    db_session.commit()
+
+    r = client.post(
+        "/events/availability",
+        json={
+            "executiveIds": [a.id, b.id],
+            "rangeStart": day.isoformat(),
+            "rangeEnd": (day + timedelta(days=1)).isoformat(),
+            "slotMinutes": 60,
+            "bufferMinutes": 15,
+            "stepMinutes": 15,
+        },
+    )
+    assert r.status_code == 200, r.text
+    body = r.json()
+    starts = [(s["start"], s["rank"], s["fragments"]) for s in body["slots"]]
+    # Com 15 min de folga, sobra em comum 10:15–10:45, 12:15–12:45 e 17:45–18:00: nada cabe 1 h.
+    assert starts == []
+
+    per_exec = {e["executiveId"]: e for e in body["executives"]}
+    assert per_exec[a.id]["busy"] == [{"start": "2026-03-02T09:00:00", "end": "2026-03-02T10:00:00"}]
+    assert per_exec[a.id]["free"][0]["start"] == "2026-03-02T10:00:00"
+
+    r = client.post(
+        "/events/availability",
+        json={
+            "executiveIds": [a.id, b.id],
+            "rangeStart": day.isoformat(),
+            "rangeEnd": (day + timedelta(days=2)).isoformat(),
+            "slotMinutes": 30,
+            "bufferMinutes": 0,
+            "stepMinutes": 30,
+            "maxSlots": 3,
+        },
+    )
+    slots = r.json()["slots"]
+    # Slots encostados a um compromisso (sem sobras) vêm primeiro.
+    assert [s["rank"] for s in slots] == [1, 2, 3]
+    assert all(s["fragments"] == 0 for s in slots)
+    assert slots[0]["start"] == "2026-03-02T10:00:00"
+
+
+def test_event_only_inside_buffer_margin_is_not_a_busy_block(client, db_session):
+    (a,) = _seed_executives(db_session, 1)
+    day = datetime(2026, 3, 2)
+    _add_event(db_session, a, day.replace(hour=9, minute=40), day.replace(hour=9, minute=55))
+    db_session.commit()
+
+    r = client.post(
+        "/events/availability",
+        json={
+            "executiveIds": [a.id],
+            "rangeStart": day.replace(hour=10).isoformat(),
+            "rangeEnd": day.replace(hour=12).isoformat(),
+            "slotMinutes": 30,
+            "bufferMinutes": 30,
+            "stepMinutes": 15,
+        },
+    )
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["executives"][0]["busy"] == []
+    # A folga do evento das 9:55 ainda vale: nenhum horário antes das 10:25.
+    assert body["slots"] and min(s["start"] for s in body["slots"]) >= "2026-03-02T10:25:00"
+
+
+def test_unknown_executive_and_invalid_range(client, db_session):
+    (a,) = _seed_executives(db_session, 1)
+    payload = {
+        "executiveIds": [a.id, 999999],
+        "rangeStart": "2026-03-02T00:00:00",
+        "rangeEnd": "2026-03-03T00:00:00",
+        "slotMinutes": 30,
+    }
+    r = client.post("/events/availability", json=payload)
+    assert r.status_code == 404
+    payload.update(executiveIds=[a.id], rangeEnd="2026-03-01T00:00:00")
+    assert client.post("/events/availability", json=payload).status_code == 400
+
+
+def test_twenty_executives_over_a_month(db_session):
+    executives = _seed_executives(db_session, 20)
+    start = datetime(2026, 3, 1)
+    rows = []
+    for i, ex in enumerate(executives):
+        for day in range(31):
+            base = start + timedelta(days=day)
+            for hour in (9 + i % 3, 13, 15 + i % 2):
+                rows.append(
+                    Event(
+                        title="Ocupado",
+                        start_time=base.replace(hour=hour),
+                        end_time=base.replace(hour=hour, minute=45),
+                        executive_id=ex.id,
+                    )
+                )
+    db_session.add_all(rows)
+    db_session.commit()
+    executive_ids = [ex.id for ex in executives]
+
+    service = AvailabilityService(db=db_session)
+    payload = AvailabilityRequest(
+        executiveIds=executive_ids,
+        rangeStart=start,
+        rangeEnd=start + timedelta(days=31),
+        slotMinutes=30,
+        bufferMinutes=10,
+    )
+    result = service.find_availability(payload)
+    assert result.slots
+    assert len(result.executives) == 20
+    busy = [block for executive in result.executives for block in executive.busy]
+    assert all(len(executive.busy) == 31 * 3 for executive in result.executives)
+    # Nenhum horário sugerido cruza um bloco ocupado de qualquer executivo.
+    assert not any(slot.start < block.end and block.start < slot.end for slot in result.slots for block in busy)
@@ -0,0 +1,121 @@
+"""Detecção de conflitos de agenda: varredura ordenada, modos warn/reject."""
+
+from datetime import datetime
+
+from sqlalchemy import event as sa_event
+
+from app.core.intervals import Interval, overlapping_pairs
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+
+
+def _seed_executive(db_session, email="exec.conflict@corp.com"):
+    ex = Executive(full_name="Exec Conflito", work_email=email)
+    db_session.add(ex)
+    db_session.commit()
+    return ex
+
+
+def _event(ex_id, title, start, end):
+    return {
+        "title": title,
+        "startTime": start.isoformat(),
+        "endTime": end.isoformat(),
+        "executiveId": ex_id,
+    }
+
+
+def test_overlapping_pairs_half_open():
+    a = Interval(datetime(2026, 3, 2, 9), datetime(2026, 3, 2, 10), "a")
+    b = Interval(datetime(2026, 3, 2, 10), datetime(2026, 3, 2, 11), "b")
+    c = Interval(datetime(2026, 3, 2, 9, 30), datetime(2026, 3, 2, 10, 30), "c")
+    pairs = overlapping_pairs([c], [a, b])
+    assert sorted(other.key for _, other in pairs) == ["a", "b"]
+    # Encostar (fim == início) não é sobreposição.
+    assert overlapping_pairs([a], [b]) == []
+
+
+def test_warn_returns_conflicts_and_reject_returns_409(client, db_session):
+    ex = _seed_executive(db_session)
+    base = client.post(
+        "/events/", json=_event(ex.id, "Diretoria", datetime(2026, 3, 2, 9), datetime(2026, 3, 2, 10))
+    )
+    assert base.status_code == 201
+    assert base.json()["conflicts"] is None
+
+    payload = _event(ex.id, "Almoço", datetime(2026, 3, 2, 9, 30), datetime(2026, 3, 2, 11))
+    warned = client.post("/events/?conflicts=warn", json=payload)
+    assert warned.status_code == 201
+    conflicts = warned.json()["conflicts"]
+    assert [c["eventId"] for c in conflicts] == [base.json()["id"]]
+
+    rejected = client.post(
+        "/events/?conflicts=reject",
+        json=_event(ex.id, "Outro", datetime(2026, 3, 2, 9, 45), datetime(2026, 3, 2, 9, 50)),
+    )
+    assert rejected.status_code == 409
+    assert "Diretoria" in rejected.json()["detail"]
+    assert len(rejected.json()["conflicts"]) == 2
+    assert db_session.query(Event).filter(Event.title == "Outro").count() == 0
+
+    touching = client.post(
+        "/events/?conflicts=reject",
+        json=_event(ex.id, "Depois", datetime(2026, 3, 2, 11), datetime(2026, 3, 2, 12)),
+    )
+    assert touching.status_code == 201
+    assert touching.json()["conflicts"] == []
+
+
+def test_update_ignores_itself(client, db_session):
+    ex = _seed_executive(db_session)
+    created = client.post(
+        "/events/", json=_event(ex.id, "Reunião", datetime(2026, 3, 2, 9), datetime(2026, 3, 2, 10))
+    ).json()
+    r = client.put(
+        f"/events/{created['id']}?conflicts=reject",
+        json={"endTime": datetime(2026, 3, 2, 10, 30).isoformat()},
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["conflicts"] == []
+
+
+def test_series_conflicts_checked_with_single_query(client, db_session):
+    ex = _seed_executive(db_session)
+    client.post(
+        "/events/", json=_event(ex.id, "Viagem", datetime(2026, 3, 11, 8), datetime(2026, 3, 11, 18))
+    )
+    series = {
+        **_event(ex.id, "Standup", datetime(2026, 3, 2, 9), datetime(2026, 3, 2, 9, 15)),
+        "recurrence": {"frequency": "weekly", "daysOfWeek": [1, 3], "count": 52},
+    }
+
+    statements = []
+
+    def _capture(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "events" in statement:
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    sa_event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        rejected = client.post("/events/series?conflicts=reject", json=series)
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", _capture)
+    assert rejected.status_code == 409
+    assert [c["occurrenceStart"] for c in rejected.json()["conflicts"]] == ["2026-03-11T09:00:00"]
+    assert len([s for s in statements if "end_time >" in s]) == 1
+    assert db_session.query(Event).filter(Event.title == "Standup").count() == 0
+
+    warned = client.post("/events/series?conflicts=warn", json=series)
+    assert warned.status_code == 201
+    flagged = [e for e in warned.json() if e["conflicts"]]
+    assert len(flagged) == 1
+
+    # Substituir a série não conflita com as próprias ocorrências antigas.
+    recurrence_id = warned.json()[0]["recurrenceId"]
+    series["startTime"] = datetime(2026, 3, 2, 9, 5).isoformat()
+    series["endTime"] = datetime(2026, 3, 2, 9, 20).isoformat()
+    series["recurrence"] = {"frequency": "weekly", "daysOfWeek": [1], "count": 4}
+    replaced = client.put(f"/events/series/{recurrence_id}?conflicts=reject", json=series)
+    assert replaced.status_code == 200, replaced.text
+    assert len(replaced.json()) == 4
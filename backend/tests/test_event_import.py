@@ -0,0 +1,162 @@
+"""Importação .ics: parser em streaming, RRULE → série e relatório por item."""
+
+import io
+
+from app.core.icalendar import iter_content_lines, iter_vevents, parse_rrule
+from app.models.event_model import Event
+from app.models.event_type_model import EventType
+from app.models.executive_model import Executive
+
+ICS = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "BEGIN:VTIMEZONE\r\n"
+    "TZID:America/Sao_Paulo\r\n"
+    "BEGIN:STANDARD\r\n"
+    "DTSTART:19700101T000000\r\n"
+    "TZOFFSETFROM:-0300\r\n"
+    "TZOFFSETTO:-0300\r\n"
+    "END:STANDARD\r\n"
+    "END:VTIMEZONE\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:single-1\r\n"
+    "SUMMARY:Almoço com\r\n"
+    "  cliente\\, centro\r\n"
+    "DTSTART:20260310T150000Z\r\n"
+    "DTEND:20260310T160000Z\r\n"
+    "CATEGORIES:Reunião\r\n"
+    "BEGIN:VALARM\r\n"
+    "ACTION:DISPLAY\r\n"
+    "TRIGGER:-PT15M\r\n"
+    "END:VALARM\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:series-1\r\n"
+    "SUMMARY:Standup\r\n"
+    "DTSTART;TZID=America/Sao_Paulo:20260302T090000\r\n"
+    "DURATION:PT15M\r\n"
+    "RRULE:FREQ=WEEKLY;BYDAY=MO,WE;COUNT=6\r\n"
+    "EXDATE;TZID=America/Sao_Paulo:20260304T090000\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:series-1\r\n"
+    "RECURRENCE-ID;TZID=America/Sao_Paulo:20260309T090000\r\n"
+    "SUMMARY:Standup (remarcado)\r\n"
+    "DTSTART;TZID=America/Sao_Paulo:20260309T100000\r\n"
+    "DTEND;TZID=America/Sao_Paulo:20260309T101500\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:allday\r\n"
+    "SUMMARY:Feriado\r\n"
+    "DTSTART;VALUE=DATE:20260421\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:broken\r\n"
+    "SUMMARY:Sem início\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:positional\r\n"
+    "SUMMARY:Primeira segunda\r\n"
+    "DTSTART:20260105T080000\r\n"
+    "DTEND:20260105T090000\r\n"
+    "RRULE:FREQ=MONTHLY;BYDAY=1MO;COUNT=3\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+
+def _seed_executive(db_session, email="exec.import@corp.com"):
+    ex = Executive(full_name="Exec Import", work_email=email)
+    db_session.add(ex)
+    db_session.add(EventType(name="Reunião", color="#3b82f6"))
+    db_session.commit()
+    return ex
+
+
+def _upload(client, ex_id, content: str):
+    return client.post(
+        f"/events/import?executive_id={ex_id}",
+        files={"file": ("agenda.ics", content.encode("utf-8"), "text/calendar")},
+    )
+
+
+def test_parser_unfolds_and_skips_nested_components():
+    events = list(iter_vevents(iter_content_lines(io.StringIO(ICS))))
+    assert len(events) == 6
+    assert events[0].text("SUMMARY") == "Almoço com cliente, centro"
+    assert events[0].alarm_minutes == 15
+
+
+def test_parse_rrule_mapping():
+    from datetime import datetime
+
+    start = datetime(2026, 3, 2, 9)
+    rule = parse_rrule("FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR;UNTIL=20260331T235959", start)
+    assert rule.frequency == "weekly" and rule.days_of_week == [1, 2, 3, 4, 5]
+    assert parse_rrule("FREQ=MONTHLY;BYSETPOS=-1;BYDAY=FR", start) is None
+
+
+def test_import_ics_creates_events_series_and_report(client, db_session):
+    ex = _seed_executive(db_session)
+    r = _upload(client, ex.id, ICS)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["totalVevents"] == 6
+    assert body["createdSeries"] == 1
+    assert body["failed"] == 1
+    statuses = {item["uid"]: item for item in body["items"]}
+    assert statuses["broken"]["status"] == "error"
+    assert statuses["positional"]["status"] == "created"
+    assert "não suportada" in statuses["positional"]["message"]
+
+    rows = db_session.query(Event).filter(Event.executive_id == ex.id).order_by(Event.start_time).all()
+    single = next(e for e in rows if e.title.startswith("Almoço"))
+    assert single.start_time.hour == 12  # 15:00Z → 12:00 em São Paulo
+    assert single.reminder_minutes == 15
+    assert single.event_type_id is not None
+
+    standup = [e for e in rows if e.title.startswith("Standup")]
+    # COUNT=6 menos 1 EXDATE; a ocorrência de 09/03 foi substituída pela exceção.
+    assert len(standup) == 5
+    assert len({e.recurrence_id for e in standup}) == 1
+    moved = next(e for e in standup if e.title == "Standup (remarcado)")
+    assert moved.start_time.hour == 10
+    assert all(e.start_time.day != 4 for e in standup)
+
+    holiday = next(e for e in rows if e.title == "Feriado")
+    assert (holiday.end_time - holiday.start_time).days == 1
+
+
+def test_import_rejects_unknown_executive(client):
+    r = _upload(client, 999999, ICS)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Executivo informado não existe."
+
+
+def test_feed_round_trip_and_bulk_volume(client, db_session):
+    from app.core.calendar_feed_token import calendar_feed_token
+
+    source = _seed_executive(db_session, email="exec.source@corp.com")
+    target = Executive(full_name="Exec Target", work_email="exec.target@corp.com")
+    db_session.add(target)
+    db_session.commit()
+
+    parts = ["BEGIN:VCALENDAR\r\nVERSION:2.0\r\n"]
+    for i in range(3000):
+        parts.append(
+            "BEGIN:VEVENT\r\n"
+            f"UID:bulk-{i}\r\n"
+            f"SUMMARY:Evento {i}\r\n"
+            f"DTSTART:2026{(i % 12) + 1:02d}{(i % 28) + 1:02d}T{8 + i % 10:02d}0000\r\n"
+            "DURATION:PT30M\r\n"
+            "END:VEVENT\r\n"
+        )
+    parts.append("END:VCALENDAR\r\n")
+    r = _upload(client, source.id, "".join(parts))
+    assert r.status_code == 200, r.text
+    assert r.json()["createdEvents"] == 3000
+
+    feed = client.get(f"/events/feed/{source.id}.ics?token={calendar_feed_token(source.id)}")
+    again = _upload(client, target.id, feed.text)
+    assert again.json()["createdEvents"] == 3000
+    assert again.json()["failed"] == 0
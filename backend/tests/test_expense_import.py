@@ -0,0 +1,175 @@
+"""POST /expenses/import: CSV/OFX em streaming, categorias por nome, deduplicação e gravação em lotes."""
+
+from app.core.security import hash_password
+from app.models.executive_model import Executive
+from app.models.expense_category_model import ExpenseCategory
+from app.models.expense_model import Expense
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Import", work_email="exec.import@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    db_session.add(ExpenseCategory(name="Viagem", executive_id=mine.id))
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.import@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine.id, other.id
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.import@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+CSV = (
+    "Data;Descrição;Valor;Categoria;Status\r\n"
+    "01/03/2026;Hotel Paulista;1.234,56;viagem;Pago\r\n"
+    "02/03/2026;Almoço cliente;-85,90;Alimentação;\r\n"
+    "02/03/2026;Almoço  CLIENTE;85,90;Alimentação;\r\n"  # mesma assinatura da linha anterior
+    "03/03/2026;Sem valor;;;\r\n"
+    "31/02/2026;Data ruim;10,00;;\r\n"
+    "04/03/2026;Táxi;45,00;;Quitado\r\n"
+)
+
+
+def test_csv_import_maps_columns_creates_categories_and_dedupes(client, db_session):
+    mine, _ = _seed(db_session)
+    headers = _headers(client)
+    files = {"file": ("extrato.csv", CSV.encode("utf-8-sig"), "text/csv")}
+    r = client.post("/expenses/import", params={"executive_id": mine, "create_categories": True}, files=files, headers=headers)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["totalRows"], body["created"], body["duplicates"], body["failed"]) == (6, 2, 1, 3)
+    assert body["createdCategories"] == ["Alimentação"]
+    assert [item["line"] for item in body["items"]] == [5, 6, 7]
+    assert "Status" in body["items"][2]["message"]
+
+    rows = {e.description: e for e in db_session.query(Expense).filter(Expense.executive_id == mine)}
+    assert rows["Hotel Paulista"].amount_cents == 123456 and rows["Hotel Paulista"].status == "Pago"
+    assert rows["Hotel Paulista"].category.name == "Viagem"
+    assert rows["Almoço cliente"].entry_type == "A pagar" and rows["Almoço cliente"].category.name == "Alimentação"
+
+    # reimportar o mesmo arquivo não duplica nada (assinatura contra o banco)
+    files = {"file": ("extrato.csv", CSV.encode("utf-8"), "text/csv")}
+    body = client.post("/expenses/import", params={"executive_id": mine, "create_categories": True}, files=files, headers=headers).json()
+    assert (body["created"], body["duplicates"], body["createdCategories"]) == (0, 3, [])
+
+    summary = client.get("/expenses/summary", params={"executive_id": mine}, headers=headers).json()
+    assert summary["count"] == 2 and {g["categoryName"]: g["amount"] for g in summary["byCategory"]} == {"Viagem": "1234.56", "Alimentação": "85.90"}
+
+
+def test_unknown_category_without_auto_create_and_scope(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    files = {"file": ("extrato.csv", CSV.encode("utf-8"), "text/csv")}
+    body = client.post("/expenses/import", params={"executive_id": mine}, files=files, headers=headers).json()
+    assert body["created"] == 1 and body["failed"] == 5
+    assert body["items"][0]["message"] == "Categoria não encontrada: Alimentação."
+    assert client.post("/expenses/import", params={"executive_id": other}, files=files, headers=headers).status_code == 403
+    bad = {"file": ("x.csv", b"Nome;Telefone\r\nAna;1\r\n", "text/csv")}
+    assert client.post("/expenses/import", params={"executive_id": mine}, files=bad, headers=headers).status_code == 400
+
+
+def test_ofx_import_uses_sign_for_entry_type(client, db_session):
+    mine, _ = _seed(db_session)
+    ofx = (
+        "OFXHEADER:100\nDATA:OFXSGML\nENCODING:USASCII\nCHARSET:1252\n\n"
+        "<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>\n"
+        "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20260305120000[-3:BRT]<TRNAMT>-12.50<FITID>1<MEMO>PADARIA SÃO JOÃO\n"
+        "<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20260306\n<TRNAMT>100.00\n<FITID>2\n<NAME>PIX\n<MEMO>Reembolso\n</STMTTRN>\n"
+        "</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>\n"
+    ).encode("cp1252")
+    r = client.post(
+        "/expenses/import",
+        params={"executive_id": mine, "default_type": "A receber"},
+        files={"file": ("banco.ofx", ofx, "application/x-ofx")},
+        headers=_headers(client),
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["created"] == 2
+    rows = {e.description: e for e in db_session.query(Expense).filter(Expense.executive_id == mine)}
+    assert rows["PADARIA SÃO JOÃO"].entry_type == "A pagar" and rows["PADARIA SÃO JOÃO"].amount_cents == 1250
+    assert rows["PIX - Reembolso"].entry_type == "A receber"
+
+
+def test_ofx_import_dedupes_by_fitid_and_maps_credits_to_receivable(client, db_session):
+    mine, _ = _seed(db_session)
+    headers = _headers(client)
+    ofx = (
+        "<OFX><BANKTRANLIST>\n"
+        "<STMTTRN><DTPOSTED>20260310<TRNAMT>-4.50<FITID>A1<MEMO>CAFE</STMTTRN>\n"
+        "<STMTTRN><DTPOSTED>20260310<TRNAMT>-4.50<FITID>A2<MEMO>CAFE</STMTTRN>\n"  # mesma compra, outra transação
+        "<STMTTRN><DTPOSTED>20260310<TRNAMT>-4.50<FITID>A2<MEMO>CAFE</STMTTRN>\n"  # FITID repetido
+        "<STMTTRN><DTPOSTED>20260311<TRNAMT>250.00<FITID>A3<MEMO>PIX RECEBIDO</STMTTRN>\n"
+        "</BANKTRANLIST></OFX>\n"
+    ).encode("ascii")
+    files = {"file": ("banco.ofx", ofx, "application/x-ofx")}
+    body = client.post("/expenses/import", params={"executive_id": mine}, files=files, headers=headers).json()
+    assert (body["totalRows"], body["created"], body["duplicates"]) == (4, 3, 1)
+    rows = db_session.query(Expense).filter(Expense.executive_id == mine).all()
+    assert sorted((e.description, e.entry_type) for e in rows) == [
+        ("CAFE", "A pagar"),
+        ("CAFE", "A pagar"),
+        ("PIX RECEBIDO", "A receber"),
+    ]
+
+    body = client.post("/expenses/import", params={"executive_id": mine}, files=files, headers=headers).json()
+    assert (body["created"], body["duplicates"]) == (0, 4)
+
+
+def test_large_csv_import_writes_in_chunks(client, db_session, monkeypatch):
+    from app.repositories.expense_repository import ExpenseRepository
+
+    mine, _ = _seed(db_session)
+    headers = _headers(client)
+    lines = ["data,descricao,valor,tipo"]
+    lines += [f"2026-{1 + n % 12:02d}-{1 + n % 28:02d},Lançamento {n},{n % 500}.{n % 100:02d},A pagar" for n in range(50_000)]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    batches = []
+    original = ExpenseRepository.bulk_insert
+    monkeypatch.setattr(ExpenseRepository, "bulk_insert", lambda self, rows: batches.append(len(rows)) or original(self, rows))
+    r = client.post("/expenses/import", params={"executive_id": mine}, files={"file": ("big.csv", payload, "text/csv")}, headers=headers)
+    assert r.status_code == 200 and r.json()["created"] == 50_000, r.text[:500]
+    # Um executemany por lote de EXPENSE_IMPORT_CHUNK_SIZE (1000), não um INSERT por linha.
+    assert batches == [1000] * 50
+    assert db_session.query(Expense).filter(Expense.executive_id == mine).count() == 50_000
@@ -0,0 +1,146 @@
+"""GET /expenses/summary: resumo mensal mantido por delta nas gravações e recalculável do zero."""
+
+from app.core.security import hash_password
+from app.models.executive_model import Executive
+from app.models.expense_category_model import ExpenseCategory
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+from app.repositories.expense_rollup_repository import ExpenseRollupRepository
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Resumo", work_email="exec.resumo@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    travel = ExpenseCategory(name="Viagem", executive_id=mine.id)
+    food = ExpenseCategory(name="Alimentação", executive_id=mine.id)
+    db_session.add_all([travel, food])
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.resumo@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine.id, other.id, travel.id, food.id
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.resumo@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _expense(client, executive_id, amount, day, category_id=None, entry_type="A pagar", status="Pendente"):
+    payload = {
+        "description": "Lançamento",
+        "amount": amount,
+        "expenseDate": day,
+        "type": entry_type,
+        "entityType": "Pessoa Jurídica",
+        "status": status,
+        "executiveId": executive_id,
+        "categoryId": category_id,
+    }
+    r = client.post("/expenses/", json=payload)
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def _groups(body, field):
+    return {
+        (group["month"] or group["categoryName"] or group["type"] or group["status"]): (group["count"], group["amount"])
+        for group in body[field]
+    }
+
+
+def test_summary_follows_writes_and_matches_rebuild(client, db_session):
+    mine, other, travel, food = _seed(db_session)
+    headers = _headers(client)
+    hotel = _expense(client, mine, "100.10", "2026-03-01", travel)
+    _expense(client, mine, "20.05", "2026-03-15", food)
+    moved = _expense(client, mine, "50.00", "2026-03-20", food, entry_type="A receber", status="Recebida")
+    dropped = _expense(client, mine, "9.99", "2026-04-02", travel)
+    _expense(client, other, "999.00", "2026-03-01")
+
+    assert client.put(f"/expenses/{hotel}", json={"amount": "110.10", "status": "Pago"}).status_code == 200
+    assert client.put(f"/expenses/{moved}", json={"expenseDate": "2026-04-10"}).status_code == 200
+    assert client.delete(f"/expenses/{dropped}").status_code == 200
+
+    r = client.get("/expenses/summary", headers=headers)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["count"] == 3  # o executivo fora do escopo não entra
+    assert _groups(body, "byMonth") == {"2026-03": (2, "130.15"), "2026-04": (1, "50.00")}
+    assert _groups(body, "byCategory") == {"Viagem": (1, "110.10"), "Alimentação": (2, "70.05")}
+    assert _groups(body, "byType") == {"A pagar": (2, "130.15"), "A receber": (1, "50.00")}
+    assert _groups(body, "byStatus") == {"Pago": (1, "110.10"), "Pendente": (1, "20.05"), "Recebida": (1, "50.00")}
+
+    r = client.get("/expenses/summary", params={"executive_id": mine, "start_month": "2026-04"}, headers=headers)
+    assert _groups(r.json(), "byMonth") == {"2026-04": (1, "50.00")}
+
+    assert client.delete(f"/expense-categories/{food}").status_code == 200
+    incremental = client.get("/expenses/summary", headers=headers).json()
+    assert _groups(incremental, "byCategory") == {"Viagem": (1, "110.10"), None: (2, "70.05")}
+
+    ExpenseRollupRepository(db=db_session).rebuild()
+    db_session.commit()
+    assert client.get("/expenses/summary", headers=headers).json() == incremental
+
+
+def test_summary_scope_and_validation(client, db_session):
+    _, other, _, _ = _seed(db_session)
+    headers = _headers(client)
+    assert client.get("/expenses/summary", params={"executive_id": other}, headers=headers).status_code == 403
+    r = client.get("/expenses/summary", params={"start_month": "2026-05", "end_month": "2026-04"}, headers=headers)
+    assert r.status_code == 400
+    assert client.get("/expenses/summary", params={"start_month": "2026-13"}, headers=headers).status_code == 400
+    assert client.get("/expenses/summary").status_code == 401
+
+
+def test_amounts_are_integer_cents_with_decimal_api(client, db_session):
+    from decimal import Decimal
+
+    from app.models.expense_model import Expense
+
+    mine, _, travel, _ = _seed(db_session)
+    ids = [_expense(client, mine, 0.1, "2026-05-01", travel) for _ in range(3)]
+    _expense(client, mine, "0.005", "2026-05-02", travel)  # arredonda para 0.01
+
+    stored = db_session.query(Expense).filter(Expense.id == ids[0]).one()
+    assert stored.amount_cents == 10 and stored.amount == Decimal("0.10")
+    assert client.get(f"/expenses/{ids[0]}").json()["amount"] == "0.10"
+    total = client.get("/expenses/summary", headers=_headers(client)).json()["byMonth"]
+    assert total == [{"month": "2026-05", "categoryId": None, "categoryName": None, "type": None, "status": None, "count": 4, "amount": "0.31"}]
@@ -0,0 +1,161 @@
+"""Exportação CSV/XLSX em streaming: escopo, formato e memória limitada."""
+
+import csv
+import io
+import re
+import tracemalloc
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import insert
+
+from app.core.security import hash_password
+from app.models.contact_model import Contact
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+from app.models.expense_model import Expense
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+from app.repositories.export_repository import ExportRepository
+from app.core.tabular_export import iter_xlsx
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Export", work_email="exec.export@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    for executive in (mine, other):
+        db_session.add_all(
+            [
+                Expense(description="=HYPERLINK(x)", amount=Decimal("10.50"), expense_date=date(2026, 3, 1), entry_type="A pagar", entity_type="Pessoa Jurídica", status="Pendente", executive_id=executive.id),
+                Event(title="Reunião <diretoria>", start_time=datetime(2026, 3, 2, 9), end_time=datetime(2026, 3, 2, 10), executive_id=executive.id),
+                Contact(full_name="Ana Contato", email="ana@corp.com", executive_id=executive.id),
+            ]
+        )
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.export@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine, other
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.export@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _sheet_rows(content: bytes):
+    sheet = zipfile.ZipFile(io.BytesIO(content)).read("xl/worksheets/sheet1.xml").decode("utf-8")
+    return [re.findall(r"<t xml:space=\"preserve\">(.*?)</t>|<v>(.*?)</v>", row) for row in re.findall(r"<row .*?</row>", sheet)]
+
+
+def test_entity_exports_are_scoped_and_formatted(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+
+    r = client.get("/expenses/export", headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-disposition"] == 'attachment; filename="financeiro.csv"'
+    rows = list(csv.reader(io.StringIO(r.content.decode("utf-8-sig")), delimiter=";"))
+    assert rows[0][:3] == ["ID", "Data", "Descrição"] and len(rows) == 2
+    assert rows[1][2] == "'=HYPERLINK(x)" and rows[1][7] == "10.50" and rows[1][8] == "Exec Export"
+
+    r = client.get("/events/export", params={"format": "xlsx"}, headers=headers)
+    assert r.status_code == 200 and r.headers["content-type"].startswith("application/vnd.openxmlformats")
+    sheet = _sheet_rows(r.content)
+    assert len(sheet) == 2 and sheet[1][1][0] == "Reunião &lt;diretoria&gt;"
+
+    r = client.get("/contacts/export", params={"executive_id": mine.id}, headers=headers)
+    assert "Ana Contato" in r.content.decode("utf-8-sig")
+    assert client.get("/contacts/export", params={"executive_id": other.id}, headers=headers).status_code == 403
+    assert client.get("/contacts/export", params={"format": "pdf"}, headers=headers).status_code == 422
+    assert client.get("/contacts/export").status_code == 401
+
+
+def test_report_export_uses_union_of_row_columns(client, db_session):
+    _mine, other = _seed(db_session)
+    headers = _headers(client)
+    rows = [{"section": "tasks", "id": 1, "title": "T"}, {"section": "expenses", "id": 2, "amount": "5.00"}]
+    report_id = client.post("/reports/", json={"name": "Rel", "selectedExecutiveIds": [], "generatedData": rows}).json()["id"]
+    r = client.get(f"/reports/{report_id}/export", headers=headers)
+    lines = list(csv.reader(io.StringIO(r.content.decode("utf-8-sig")), delimiter=";"))
+    assert lines == [["section", "id", "title", "amount"], ["tasks", "1", "T", ""], ["expenses", "2", "", "5.00"]]
+    sheet = _sheet_rows(client.get(f"/reports/{report_id}/export", params={"format": "xlsx"}, headers=headers).content)
+    assert len(sheet) == 3
+    assert client.get("/reports/999/export", headers=headers).status_code == 404
+    assert client.get(f"/reports/{report_id}/export").status_code == 401
+
+    foreign_id = client.post("/reports/", json={"name": "Alheio", "selectedExecutiveIds": [other.id], "generatedData": rows}).json()["id"]
+    assert client.get(f"/reports/{foreign_id}/export", headers=headers).status_code == 403
+
+
+def test_large_expense_export_streams_in_bounded_memory(db_session):
+    mine, _ = _seed(db_session)
+    total = 30_000
+    db_session.execute(
+        insert(Expense),
+        [
+            {
+                "description": f"Despesa número {n} com descrição razoavelmente longa",
+                "amount_cents": 12345,
+                "expense_date": date(2026, 1, 1 + n % 28),
+                "entry_type": "A pagar",
+                "entity_type": "Pessoa Jurídica",
+                "status": "Pendente",
+                "executive_id": mine.id,
+                "updated_at": datetime(2026, 1, 1),
+            }
+            for n in range(total)
+        ],
+    )
+    db_session.flush()
+    repository = ExportRepository(db_session)
+
+    tracemalloc.start()
+    size = chunks = 0
+    for chunk in iter_xlsx(repository.header("expenses"), repository.iter_rows("expenses", {mine.id})):
+        size += len(chunk)
+        chunks += 1
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert chunks > total // 1000  # saiu em blocos, não num buffer único
+    assert peak < 8 * 1024 * 1024, peak
+    assert size > 0
@@ -0,0 +1,177 @@
+"""Agendador de lembretes: janela indexada, heap incremental via hooks do ORM e canais."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+from app.services import reminder_scheduler
+from app.services.reminder_scheduler import (
+    EmailReminderChannel,
+    Reminder,
+    ReminderScheduler,
+    SseReminderChannel,
+)
+
+NOW = datetime(2026, 3, 2, 8, 0)
+
+
+def _session_factory(db_session):
+    return lambda: Session(bind=db_session.connection())
+
+
+def _seed(db_session):
+    ex = Executive(full_name="Exec Lembrete", work_email="exec.reminder@corp.com")
+    db_session.add(ex)
+    db_session.flush()
+    db_session.add_all(
+        [
+            # dispara 08:45 — dentro da janela de 6 h
+            Event(title="Diretoria", start_time=NOW.replace(hour=9), end_time=NOW.replace(hour=10),
+                  executive_id=ex.id, reminder_minutes=15),
+            # dispara amanhã 07:00 (antecedência de 1 dia) — fora da janela
+            Event(title="Viagem", start_time=NOW + timedelta(days=1), end_time=NOW + timedelta(days=1, hours=2),
+                  executive_id=ex.id, reminder_minutes=60),
+            # dispara hoje 10:00 (início amanhã, antecedência de 1 dia) — dentro da janela
+            Event(title="Board", start_time=NOW + timedelta(days=1, hours=2), end_time=NOW + timedelta(days=1, hours=3),
+                  executive_id=ex.id, reminder_minutes=1440),
+            Event(title="Sem lembrete", start_time=NOW.replace(hour=11), end_time=NOW.replace(hour=12),
+                  executive_id=ex.id),
+        ]
+    )
+    db_session.commit()
+    return ex
+
+
+def test_reload_keeps_only_upcoming_window_and_pops_in_order(db_session):
+    _seed(db_session)
+    scheduler = ReminderScheduler(session_factory=_session_factory(db_session), clock=lambda: NOW)
+    scheduler.reload(NOW)
+    assert [r.title for r in scheduler.upcoming()] == ["Diretoria", "Board"]
+    assert scheduler.next_fire_at() == NOW.replace(hour=8, minute=45)
+
+    assert scheduler.pop_due(NOW.replace(hour=8, minute=30)) == []
+    assert [r.title for r in scheduler.pop_due(NOW.replace(hour=10))] == ["Diretoria", "Board"]
+    assert len(scheduler) == 0
+
+
+def test_orm_hooks_update_heap_incrementally(client, db_session):
+    ex = _seed(db_session)
+    scheduler = ReminderScheduler(session_factory=_session_factory(db_session), clock=lambda: NOW)
+    scheduler.reload(NOW)
+    reminder_scheduler.install(scheduler)
+    try:
+        created = client.post(
+            "/events/",
+            json={
+                "title": "Almoço",
+                "startTime": NOW.replace(hour=12).isoformat(),
+                "endTime": NOW.replace(hour=13).isoformat(),
+                "executiveId": ex.id,
+                "reminderMinutes": 30,
+            },
+        ).json()
+        assert "Almoço" in [r.title for r in scheduler.upcoming()]
+
+        client.put(f"/events/{created['id']}", json={"reminderMinutes": 60})
+        almoco = next(r for r in scheduler.upcoming() if r.title == "Almoço")
+        assert almoco.fire_at == NOW.replace(hour=11)
+
+        client.delete(f"/events/{created['id']}")
+        assert "Almoço" not in [r.title for r in scheduler.upcoming()]
+
+        # Operações em lote (delete por statement) pedem recarga da janela.
+        client.delete("/events/recurrence/inexistente")
+        assert scheduler._reload_requested
+    finally:
+        reminder_scheduler.uninstall()
+
+
+def test_run_loop_dispatches_to_channels_and_sse_stream():
+    sse = SseReminderChannel()
+    sent = []
+    email = EmailReminderChannel(batch_seconds=0, sender=sent.append)
+    email._send = lambda batch: sent.append([r.title for r in batch])
+
+    reminder = Reminder(
+        event_id=1, executive_id=7, title="Diretoria", location=None,
+        start_time=NOW + timedelta(minutes=10), reminder_minutes=15,
+    )
+
+    async def scenario():
+        scheduler = ReminderScheduler(channels=[sse, email], clock=lambda: NOW)
+        scheduler.reload = lambda now=None: None  # sem banco: só eventos incrementais
+        stream = sse.stream(lambda: asyncio.sleep(0, result=False), executive_ids=[7])
+        assert (await stream.__anext__()).startswith("retry:")
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0)
+        scheduler.apply_changes({1: reminder})
+        message = await asyncio.wait_for(stream.__anext__(), timeout=2)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await stream.aclose()
+        return message
+
+    message = asyncio.run(scenario())
+    assert message.startswith("event: reminder\n")
+    assert '"eventId":1' in message and '"fireAt":"2026-03-02T07:55:00"' in message
+    assert sent == [["Diretoria"]]
+    assert sse.subscriber_count == 0
+
+
+def test_reminder_stream_requires_login_and_keeps_to_visible_executives(client, db_session, monkeypatch):
+    lo = LegalOrganization(
+        name="Org Legal", cnpj="11222333000181", street="Av Paulista", number="100",
+        neighborhood="Bela Vista", city="São Paulo", state="SP", zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa", legalOrganizationId=lo.id, cnpj="04252011000110", street="Rua A", number="10",
+        neighborhood="Centro", city="São Paulo", state="SP", zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Meu", work_email="exec.meu@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora.lembrete@corp.com")
+    db_session.add_all([mine, other])
+    db_session.add(
+        user_models.Usuario(
+            name="Admin", email="admin.lembrete@corp.com", hashed_password=hash_password("secret123"),
+            is_active=True, role="admin_company", legal_organization_id=lo.id, organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+
+    subscribed = []
+
+    async def fake_stream(is_disconnected, executive_ids=None, **_kw):
+        subscribed.append(executive_ids)
+        yield "retry: 1000\n\n"
+
+    monkeypatch.setattr(reminder_scheduler.sse_channel, "stream", fake_stream)
+    assert client.get("/events/reminders/stream").status_code == 401
+
+    token = client.post("/auth/login", json={"email": "admin.lembrete@corp.com", "password": "secret123"}).json()["accessToken"]
+    assert client.get("/events/reminders/stream", params={"access_token": token}).status_code == 200
+    client.get("/events/reminders/stream", params={"access_token": token, "executive_id": [mine.id, other.id]})
+    client.get("/events/reminders/stream", params={"access_token": token, "executive_id": [other.id]})
+    assert subscribed == [{mine.id}, {mine.id}, set()]
+
+
+def test_sse_channel_with_empty_scope_receives_nothing():
+    sse = SseReminderChannel()
+    _token, queue = sse.subscribe(set())
+    reminder = Reminder(
+        event_id=1, executive_id=7, title="Diretoria", location=None,
+        start_time=NOW + timedelta(minutes=10), reminder_minutes=15,
+    )
+    asyncio.run(sse.deliver([reminder]))
+    assert queue.empty()
@@ -0,0 +1,54 @@
+"""Linhas de relatório em blocos comprimidos: listagem só com metadados e páginas parciais."""
+
+from app.core.security import hash_password
+from app.models.report_model import ReportChunk
+from app.models import user_model as user_models
+from app.repositories import report_repository
+
+
+def _headers(client, db_session):
+    db_session.add(
+        user_models.Usuario(
+            name="Master",
+            email="master.rel@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="master",
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    r = client.post("/auth/login", json={"email": "master.rel@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def test_rows_are_chunked_and_pages_decompress_only_their_chunk(client, db_session, monkeypatch):
+    monkeypatch.setattr(report_repository, "REPORT_CHUNK_ROWS", 10)
+    headers = _headers(client, db_session)
+    rows = [{"section": "tasks", "id": n, "title": f"Tarefa {n}"} for n in range(25)]
+    r = client.post("/reports/", json={"name": "Grande", "selectedExecutiveIds": [], "totalRecords": 25, "generatedData": rows})
+    assert r.status_code == 201, r.text
+    report_id = r.json()["id"]
+    assert r.json()["rowCount"] == 25 and "generatedData" not in r.json()
+    chunks = db_session.query(ReportChunk).filter(ReportChunk.report_id == report_id).order_by(ReportChunk.chunk_index).all()
+    assert [(c.first_row, c.row_count) for c in chunks] == [(0, 10), (10, 10), (20, 5)]
+
+    decoded = []
+    original = report_repository.decode_report_chunk
+    monkeypatch.setattr(report_repository, "decode_report_chunk", lambda payload: decoded.append(1) or original(payload))
+    page = client.get(f"/reports/{report_id}/rows", params={"skip": 12, "limit": 5}, headers=headers).json()
+    assert [row["id"] for row in page["items"]] == [12, 13, 14, 15, 16]
+    assert (page["total"], page["skip"], page["limit"]) == (25, 12, 5) and len(decoded) == 1
+
+    page = client.get(f"/reports/{report_id}/rows", params={"skip": 18, "limit": 50}, headers=headers).json()
+    assert [row["id"] for row in page["items"]] == list(range(18, 25))
+
+    listing = client.get("/reports/").json()
+    assert [item["id"] for item in listing] == [report_id] and "generatedData" not in listing[0]
+
+    r = client.put(f"/reports/{report_id}", json={"generatedData": rows[:3]})
+    assert r.json()["rowCount"] == 3
+    assert db_session.query(ReportChunk).filter(ReportChunk.report_id == report_id).count() == 1
+    assert client.delete(f"/reports/{report_id}").status_code == 200
+    assert db_session.query(ReportChunk).count() == 0
+    assert client.get(f"/reports/{report_id}/rows", headers=headers).status_code == 404
@@ -0,0 +1,230 @@
+"""POST /reports/generate: dados e contagens calculados no servidor, no escopo do ator."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.core.security import hash_password
+from app.models.contact_model import Contact
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+from app.models.expense_model import Expense
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models.task_model import Task
+from app.models import user_model as user_models
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Rel", work_email="exec.rel@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    for executive in (mine, other):
+        db_session.add_all(
+            [
+                Event(title="Reunião março", start_time=datetime(2026, 3, 31, 18), end_time=datetime(2026, 3, 31, 19), executive_id=executive.id),
+                Event(title="Reunião abril", start_time=datetime(2026, 4, 1, 9), end_time=datetime(2026, 4, 1, 10), executive_id=executive.id),
+                Task(title="Tarefa", due_date=date(2026, 3, 15), priority="Alta", status="Pendente", executive_id=executive.id),
+                Task(title="Feita", due_date=date(2026, 3, 20), priority="Baixa", status="Concluída", executive_id=executive.id),
+                Contact(full_name="Contato", email="c@corp.com", executive_id=executive.id),
+            ]
+        )
+    common = dict(entity_type="Pessoa Jurídica", status="Pendente", executive_id=mine.id)
+    db_session.add_all(
+        [
+            Expense(description="Hotel", amount=Decimal("100.10"), expense_date=date(2026, 3, 1), entry_type="A pagar", **common),
+            Expense(description="Táxi", amount=Decimal("20.05"), expense_date=date(2026, 3, 2), entry_type="A pagar", **common),
+            Expense(description="Reembolso", amount=Decimal("50.00"), expense_date=date(2026, 3, 3), entry_type="A receber", **common),
+            Expense(description="Fora", amount=Decimal("999"), expense_date=date(2026, 2, 1), entry_type="A pagar", **common),
+        ]
+    )
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.rel@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine, other
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.rel@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _master_headers(client, db_session):
+    db_session.add(
+        user_models.Usuario(
+            name="Master",
+            email="master.rel@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="master",
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    r = client.post("/auth/login", json={"email": "master.rel@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def test_generate_computes_rows_and_counts_in_window(client, db_session):
+    mine, _ = _seed(db_session)
+    payload = {"name": "Março", "selectedExecutiveIds": [mine.id], "startDate": "2026-03-01", "endDate": "2026-03-31"}
+    r = client.post("/reports/generate", json=payload, headers=_headers(client))
+    assert r.status_code == 201, r.text
+    body = r.json()
+    summary = body["summary"]
+    assert summary["events"] == {"total": 1, "byExecutive": {str(mine.id): 1}}
+    assert summary["tasks"]["byStatus"] == {"Pendente": 1, "Concluída": 1}
+    assert summary["expenses"]["byType"] == {"A pagar": 2, "A receber": 1}
+    assert summary["expenses"]["amountByType"] == {"A pagar": "120.15", "A receber": "50.00"}
+    assert summary["contacts"]["total"] == 1
+    assert body["totalRecords"] == 1 + 3 + 2 + 1 == body["rowCount"]
+    rows = client.get(f"/reports/{body['id']}/rows", headers=_headers(client)).json()["items"]
+    event_row = next(row for row in rows if row["section"] == "events")
+    assert event_row["title"] == "Reunião março" and event_row["startTime"] == "2026-03-31T18:00:00"
+    assert [row["description"] for row in rows if row["section"] == "expenses"] == ["Hotel", "Táxi", "Reembolso"]
+
+
+def test_generate_respects_flags_scope_and_dates(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    r = client.post("/reports/generate", json={"name": "Só tarefas", "includeEvents": False, "includeExpenses": False, "includeContacts": False}, headers=headers)
+    assert r.status_code == 201
+    assert set(r.json()["summary"]) == {"tasks"}
+    assert r.json()["summary"]["tasks"]["byExecutive"] == {str(mine.id): 2}  # vazio = todos os visíveis
+
+    r = client.post("/reports/generate", json={"name": "Alheio", "selectedExecutiveIds": [other.id]}, headers=headers)
+    assert r.status_code == 403
+    r = client.post("/reports/generate", json={"name": "Datas", "startDate": "2026-04-01", "endDate": "2026-03-01"}, headers=headers)
+    assert r.status_code == 400
+    assert client.post("/reports/generate", json={"name": "Anônimo"}).status_code == 401
+
+
+def test_reading_a_report_requires_login_and_scope(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    own = client.post("/reports/generate", json={"name": "Meu", "selectedExecutiveIds": [mine.id]}, headers=headers).json()
+    foreign = client.post(
+        "/reports/",
+        json={"name": "Alheio", "selectedExecutiveIds": [], "totalRecords": 1, "generatedData": [{"section": "tasks", "executiveId": other.id}]},
+    ).json()
+
+    assert client.get(f"/reports/{own['id']}").status_code == 401
+    assert client.get(f"/reports/{own['id']}/rows").status_code == 401
+    assert client.get(f"/reports/{own['id']}", headers=headers).status_code == 200
+    assert client.get(f"/reports/{own['id']}/rows", headers=headers).status_code == 200
+    # Sem seleção nem impressões digitais (enviado pelo cliente): a cobertura vem das linhas.
+    assert client.get(f"/reports/{foreign['id']}", headers=headers).status_code == 403
+    assert client.get(f"/reports/{foreign['id']}/rows", headers=headers).status_code == 403
+
+
+def test_regenerate_recomputes_only_changed_executives(client, db_session, monkeypatch):
+    from app.repositories.report_repository import ReportDataRepository
+
+    mine, _ = _seed(db_session)
+    second = Executive(full_name="Exec Dois", work_email="exec.dois@corp.com", organization_id=mine.organization_id)
+    db_session.add(second)
+    db_session.flush()
+    db_session.add(Task(title="Dele", due_date=date(2026, 3, 10), priority="Alta", status="Pendente", executive_id=second.id))
+    db_session.commit()
+    second_id = second.id
+    headers = _headers(client)
+    payload = {"name": "Março", "selectedExecutiveIds": [mine.id, second_id], "startDate": "2026-03-01", "endDate": "2026-03-31"}
+    report = client.post("/reports/generate", json=payload, headers=headers).json()
+
+    task = db_session.query(Task).filter(Task.executive_id == second_id).one()
+    task.status = "Concluída"
+    db_session.add(Expense(description="Almoço", amount=Decimal("30.00"), expense_date=date(2026, 3, 5), entry_type="A pagar", entity_type="Pessoa Jurídica", status="Pendente", executive_id=second_id))
+    db_session.commit()
+
+    queried = []
+    original = ReportDataRepository.section_rows
+
+    def spy(self, section, executive_ids, start, end):
+        queried.append((section, list(executive_ids)))
+        return original(self, section, executive_ids, start, end)
+
+    monkeypatch.setattr(ReportDataRepository, "section_rows", spy)
+    r = client.post(f"/reports/{report['id']}/regenerate", headers=headers)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["staleExecutives"] == {"events": [], "expenses": [second_id], "tasks": [second_id], "contacts": []}
+    assert queried == [("expenses", [second_id]), ("tasks", [second_id])]
+    summary = body["report"]["summary"]
+    assert summary["tasks"]["byStatus"] == {"Pendente": 1, "Concluída": 2}
+    assert summary["expenses"]["amountByType"] == {"A pagar": "150.15", "A receber": "50.00"}
+    assert body["report"]["totalRecords"] == report["totalRecords"] + 1 == body["report"]["rowCount"]
+    rows = client.get(f"/reports/{report['id']}/rows", headers=headers).json()["items"]
+    assert [row["section"] for row in rows] == sorted((row["section"] for row in rows), key=["events", "expenses", "tasks", "contacts"].index)
+    assert [row["status"] for row in rows if row["section"] == "tasks" and row["executiveId"] == second_id] == ["Concluída"]
+
+    queried.clear()
+    r = client.post(f"/reports/{report['id']}/regenerate", headers=headers)
+    assert r.json()["staleExecutives"] == {"events": [], "expenses": [], "tasks": [], "contacts": []} and queried == []
+
+
+def test_regenerate_refuses_report_covering_executives_out_of_scope(client, db_session, monkeypatch):
+    from app.repositories.report_repository import ReportDataRepository
+
+    _seed(db_session)
+    master = _master_headers(client, db_session)
+    report = client.post("/reports/generate", json={"name": "Todos"}, headers=master).json()
+
+    queried = []
+    monkeypatch.setattr(ReportDataRepository, "section_rows", lambda self, *args: queried.append(args) or [])
+    monkeypatch.setattr(ReportDataRepository, "section_aggregates", lambda self, *args: queried.append(args) or [])
+    r = client.post(f"/reports/{report['id']}/regenerate", headers=_headers(client))
+    assert r.status_code == 403
+    assert queried == []
+
+
+def test_regenerate_refuses_report_without_fingerprints_covering_others(client, db_session, monkeypatch):
+    from app.repositories.report_repository import ReportDataRepository
+
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    foreign = client.post(
+        "/reports/",
+        json={"name": "Alheio", "selectedExecutiveIds": [], "totalRecords": 1, "generatedData": [{"section": "tasks", "executiveId": other.id}]},
+    ).json()
+
+    queried = []
+    monkeypatch.setattr(ReportDataRepository, "section_rows", lambda self, *args: queried.append(args) or [])
+    assert client.post(f"/reports/{foreign['id']}/regenerate", headers=headers).status_code == 403
+    assert queried == []
+    rows = client.get(f"/reports/{foreign['id']}/rows", headers=_master_headers(client, db_session)).json()
+    assert [row["executiveId"] for row in rows["items"]] == [other.id]
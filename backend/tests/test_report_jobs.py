@@ -0,0 +1,169 @@
+"""Jobs de relatório: fila, progresso por seção, escopo do dono e agendamentos recorrentes."""
+
+from datetime import date, datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.security import hash_password
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models.report_job_model import ReportJob, ReportSchedule
+from app.models.report_model import Report
+from app.models.task_model import Task
+from app.models import user_model as user_models
+from app.repositories.report_job_repository import ReportJobRepository
+from app.services import report_jobs
+from app.services.report_jobs import ReportJobRunner, next_run_after, schedule_period
+from app.services.report_service import ReportService
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    executive = Executive(full_name="Exec Job", work_email="exec.job@corp.com", organization_id=org.id)
+    db_session.add(executive)
+    db_session.flush()
+    db_session.add_all(
+        [
+            Task(title="Março", due_date=date(2026, 3, 10), priority="Alta", status="Pendente", executive_id=executive.id),
+            Task(title="Abril", due_date=date(2026, 4, 10), priority="Alta", status="Pendente", executive_id=executive.id),
+        ]
+    )
+    for email in ("admin.job@corp.com", "outro.job@corp.com"):
+        db_session.add(
+            user_models.Usuario(
+                name="Admin",
+                email=email,
+                hashed_password=hash_password("secret123"),
+                is_active=True,
+                role="admin_company",
+                legal_organization_id=lo.id,
+                organization_id=org.id,
+                needs_profile_completion=False,
+            )
+        )
+    db_session.commit()
+    return executive.id
+
+
+def _headers(client, email="admin.job@corp.com"):
+    r = client.post("/auth/login", json={"email": email, "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def test_job_runs_section_by_section_and_is_owner_scoped(client, db_session, monkeypatch):
+    executive_id = _seed(db_session)
+    headers = _headers(client)
+    r = client.post("/reports/jobs", json={"name": "Grande", "selectedExecutiveIds": [executive_id]}, headers=headers)
+    assert r.status_code == 202, r.text
+    job_id = r.json()["id"]
+    assert (r.json()["status"], r.json()["progress"], r.json()["reportId"]) == ("queued", 0, None)
+
+    progress = []
+    original = ReportJobRepository.set_progress
+    monkeypatch.setattr(
+        ReportJobRepository,
+        "set_progress",
+        lambda self, job, value, section: progress.append((value, section)) or original(self, job, value, section),
+    )
+    runner = ReportJobRunner(session_factory=lambda: db_session)
+    assert runner.run_job(job_id) is True
+    assert runner.run_job(job_id) is False  # já reservado/concluído: não roda de novo
+    assert progress == [(0, "events"), (25, "expenses"), (50, "tasks"), (75, "contacts")]
+
+    job = client.get(f"/reports/jobs/{job_id}", headers=headers).json()
+    assert (job["status"], job["progress"], job["currentSection"]) == ("succeeded", 100, None)
+    assert db_session.get(Report, job["reportId"]).total_records == 2
+    assert client.get(f"/reports/jobs/{job_id}", headers=_headers(client, "outro.job@corp.com")).status_code == 404
+
+
+def test_failed_job_records_error(monkeypatch):
+    # Engine próprio: o worker faz rollback na falha, o que desfaria a transação do db_session.
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        job_id = ReportJobRepository(db).create_job(
+            {"params": {"name": "Falha", "selected_executive_ids": []}, "executive_ids": None}
+        ).id
+
+    def boom(self, *args, **kwargs):
+        raise RuntimeError("banco indisponível")
+
+    monkeypatch.setattr(ReportService, "build_report", boom)
+    assert ReportJobRunner(session_factory=factory).run_job(job_id) is True
+    with factory() as db:
+        job = db.get(ReportJob, job_id)
+        assert (job.status, job.error, job.report_id) == ("failed", "banco indisponível", None)
+        assert job.finished_at is not None
+    engine.dispose()
+
+
+def test_monthly_schedule_enqueues_previous_month_off_peak(client, db_session, monkeypatch):
+    executive_id = _seed(db_session)
+    headers = _headers(client)
+    submitted = []
+    monkeypatch.setattr(report_jobs, "submit", submitted.append)
+    r = client.post(
+        "/reports/schedules",
+        json={"name": "Mensal", "frequency": "monthly", "selectedExecutiveIds": [executive_id], "includeEvents": False},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    schedule_id = r.json()["id"]
+    next_run = datetime.fromisoformat(r.json()["nextRunAt"])
+    assert (next_run.day, next_run.hour, next_run.minute) == (1, report_jobs.REPORT_SCHEDULE_HOUR, 0)
+    assert [s["id"] for s in client.get("/reports/schedules", headers=headers).json()] == [schedule_id]
+    assert client.get("/reports/schedules", headers=_headers(client, "outro.job@corp.com")).json() == []
+
+    schedule = db_session.get(ReportSchedule, schedule_id)
+    schedule.next_run_at = datetime(2026, 4, 1, 3)
+    db_session.commit()
+    runner = ReportJobRunner(session_factory=lambda: db_session, clock=lambda: datetime(2026, 4, 1, 3, 0, 30))
+    job_ids = runner.enqueue_due_schedules()
+    assert len(job_ids) == 1 and runner.enqueue_due_schedules() == []
+    assert db_session.get(ReportSchedule, schedule_id).next_run_at == datetime(2026, 5, 1, 3)
+
+    runner.run_job(job_ids[0])
+    job = db_session.get(ReportJob, job_ids[0])
+    report = db_session.get(Report, job.report_id)
+    assert report.name == "Mensal (01/03/2026 a 31/03/2026)"
+    assert (report.start_date, report.end_date, report.total_records) == (date(2026, 3, 1), date(2026, 3, 31), 1)
+    assert client.delete(f"/reports/schedules/{schedule_id}", headers=headers).status_code == 200
+
+
+def test_schedule_calendar_helpers():
+    assert next_run_after("daily", datetime(2026, 5, 10, 2), hour=3) == datetime(2026, 5, 10, 3)
+    assert next_run_after("daily", datetime(2026, 5, 10, 3), hour=3) == datetime(2026, 5, 11, 3)
+    assert next_run_after("weekly", datetime(2026, 5, 13, 12), hour=3) == datetime(2026, 5, 18, 3)  # segunda
+    assert next_run_after("monthly", datetime(2026, 12, 15), hour=3) == datetime(2027, 1, 1, 3)
+    assert schedule_period("weekly", datetime(2026, 5, 18, 3)) == (date(2026, 5, 11), date(2026, 5, 17))
+    assert schedule_period("monthly", datetime(2027, 1, 1, 3)) == (date(2026, 12, 1), date(2026, 12, 31))
+    assert schedule_period("daily", datetime(2026, 3, 1, 3)) == (date(2026, 2, 28), date(2026, 2, 28))
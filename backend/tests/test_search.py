@@ -0,0 +1,127 @@
+"""GET /search: FTS5 mantido por triggers, ranqueado, no escopo do ator, com trecho destacado e cursor."""
+
+from datetime import date, datetime, timedelta
+
+from app.core.security import hash_password
+from app.models.contact_model import Contact
+from app.models.document_model import Document
+from app.models.event_model import Event
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models.task_model import Task
+from app.models import user_model as user_models
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Busca", work_email="exec.busca@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Fora", work_email="exec.fora@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    start = datetime(2026, 11, 3, 10, 0)
+    db_session.add_all(
+        [
+            Contact(full_name="João Conceição", email="joao@fornecedor.com", company="Fornecedor <SA>", executive_id=mine.id),
+            Contact(full_name="Maria Souza", notes="Indicada pelo joão", executive_id=mine.id),
+            Contact(full_name="João de Outro", executive_id=other.id),
+            Document(name="Contrato João 2026.pdf", image_url="/files/c.pdf", executive_id=mine.id, upload_date=start),
+            Event(title="Almoço com João", location="Centro", start_time=start, end_time=start + timedelta(hours=1), executive_id=mine.id),
+            Task(title="Enviar proposta", description="Revisar com João", due_date=date(2026, 11, 4), priority="Alta", status="A Fazer", executive_id=mine.id),
+        ]
+    )
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.busca@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine.id, other.id
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.busca@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def test_search_ranks_scopes_and_highlights(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+
+    r = client.get("/search", params={"q": "joao"}, headers=headers)
+    assert r.status_code == 200, r.text
+    items = r.json()["items"]
+    assert {(hit["entity"], hit["executiveId"]) for hit in items} == {
+        ("contact", mine), ("document", mine), ("event", mine), ("task", mine)
+    }
+    assert len(items) == 5 and all(hit["executiveId"] != other for hit in items)
+    assert items[0]["title"] == "João Conceição"  # nome pesa mais que notas/descrição
+    ranks = [hit["rank"] for hit in items]
+    assert ranks == sorted(ranks)
+    contact = items[0]
+    assert "<mark>João</mark>" in contact["snippet"]
+
+    r = client.get("/search", params={"q": "fornecedor", "entity": "contact"}, headers=headers)
+    assert [hit["title"] for hit in r.json()["items"]] == ["João Conceição"]
+    r = client.get("/search", params={"q": "sa", "entity": "contact"}, headers=headers)
+    assert r.json()["items"][0]["snippet"] == "Fornecedor &lt;<mark>SA</mark>&gt;"  # texto escapado
+
+    assert client.get("/search", params={"q": "joao", "executive_id": other}, headers=headers).status_code == 403
+    assert client.get("/search", params={"q": "\"*"}, headers=headers).status_code == 400
+    assert client.get("/search", params={"q": "joao"}).status_code == 401
+
+
+def test_search_follows_writes_and_paginates(client, db_session):
+    mine, _other = _seed(db_session)
+    headers = _headers(client)
+
+    task = db_session.query(Task).filter(Task.executive_id == mine).one()
+    task.description = "Sem nomes"
+    db_session.add(Contact(full_name="Joana Prado", executive_id=mine))
+    db_session.delete(db_session.query(Document).filter(Document.executive_id == mine).one())
+    db_session.commit()
+
+    seen, cursor = [], None
+    for _ in range(10):
+        params = {"q": "jo", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/search", params=params, headers=headers).json()
+        seen.extend((hit["entity"], hit["id"]) for hit in body["items"])
+        cursor = body["nextCursor"]
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == 4  # 3 contatos + evento
+    assert {entity for entity, _id in seen} == {"contact", "event"}
+    assert client.get("/search", params={"q": "jo", "cursor": "lixo"}, headers=headers).status_code == 400
@@ -0,0 +1,146 @@
+"""Delta sync: token monotônico, updated_at por entidade e tombstones nas exclusões."""
+
+from datetime import date, timedelta
+
+from app.core import change_feed
+from app.core.security import hash_password
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models.sync_tombstone_model import SyncTombstone
+from app.models.task_model import Task
+from app.models import user_model as user_models
+from app.services import sync_service
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Exec Sync", work_email="exec.sync@corp.com", organization_id=org.id)
+    other = Executive(full_name="Exec Outra", work_email="exec.outra@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.sync@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine, other
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.sync@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _task(ex_id, title):
+    return {
+        "title": title,
+        "dueDate": "2026-03-02",
+        "priority": "Alta",
+        "status": "A Fazer",
+        "executiveId": ex_id,
+    }
+
+
+def test_delta_sync_returns_only_changes_and_tombstones(client, db_session, monkeypatch):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    # Sem folga no teste: o próximo token começa exatamente no instante da chamada.
+    monkeypatch.setattr(sync_service, "SYNC_OVERLAP", timedelta(0))
+
+    kept = client.post("/tasks/", json=_task(mine.id, "Mantida")).json()
+    removed = client.post("/tasks/", json=_task(mine.id, "Removida")).json()
+    client.post("/tasks/", json=_task(other.id, "De outra empresa"))
+
+    full = client.get("/sync", headers=headers)
+    assert full.status_code == 200, full.text
+    body = full.json()
+    assert body["full"] is True
+    assert sorted(t["title"] for t in body["changed"]["tasks"]) == ["Mantida", "Removida"]
+
+    client.put(f"/tasks/{kept['id']}", json={"status": "Concluído"})
+    client.delete(f"/tasks/{removed['id']}")
+    series = client.post(
+        "/events/series",
+        json={
+            "title": "Standup",
+            "startTime": "2026-03-02T09:00:00",
+            "endTime": "2026-03-02T09:15:00",
+            "executiveId": mine.id,
+            "recurrence": {"frequency": "daily", "count": 2},
+        },
+    ).json()
+    client.delete(f"/events/recurrence/{series[0]['recurrenceId']}")
+
+    delta = client.get(f"/sync?since={body['token']}", headers=headers).json()
+    assert delta["full"] is False
+    assert [t["status"] for t in delta["changed"]["tasks"]] == ["Concluído"]
+    assert delta["changed"]["events"] == []
+    assert sorted((d["entity"], d["id"]) for d in delta["deleted"]) == sorted(
+        [("task", removed["id"])] + [("event", e["id"]) for e in series]
+    )
+
+    again = client.get(f"/sync?since={delta['token']}", headers=headers).json()
+    assert again["changed"]["tasks"] == [] and again["deleted"] == []
+
+
+def test_tombstones_are_scoped_and_token_validated(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+    foreign = client.post("/tasks/", json=_task(other.id, "Alheia")).json()
+    token = client.get("/sync", headers=headers).json()["token"]
+    client.delete(f"/tasks/{foreign['id']}")
+
+    assert db_session.query(SyncTombstone).filter(SyncTombstone.entity_id == foreign["id"]).count() == 1
+    delta = client.get(f"/sync?since={int(token) - 10_000_000}", headers=headers).json()
+    assert all(d["id"] != foreign["id"] for d in delta["deleted"])
+
+    assert client.get("/sync?since=abc", headers=headers).status_code == 400
+    assert client.get("/sync").status_code == 401
+
+
+def test_tombstones_do_not_depend_on_the_change_feed(db_session):
+    # Sem TestClient (sem lifespan): sessão "de script" apagando pelo ORM e por statement.
+    mine, _other = _seed(db_session)
+    task = Task(title="Script", due_date=date(2026, 3, 2), priority="Alta", status="A Fazer", executive_id=mine.id)
+    db_session.add(task)
+    db_session.commit()
+    task_id = task.id
+    db_session.delete(task)
+    change_feed.track_rows(db_session, "task", change_feed.OP_DELETE, [(987654, mine.id)])
+    db_session.commit()
+
+    rows = db_session.query(SyncTombstone).filter(SyncTombstone.entity == "task").all()
+    assert sorted((row.entity_id, row.executive_id) for row in rows) == sorted([(task_id, mine.id), (987654, mine.id)])
@@ -0,0 +1,135 @@
+"""GET /typeahead: índice em memória por executivo, sem acento, atualizado pelo unit of work."""
+
+import pytest
+
+from app.core.security import hash_password
+from app.models.contact_model import Contact
+from app.models.executive_model import Executive
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+from app.services.typeahead_index import TypeaheadIndex, get_index
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index():
+    get_index().reset()
+    yield
+    get_index().reset()
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    mine = Executive(full_name="Vânia Prado", work_email="vania@corp.com", cpf="123.456.789-09", organization_id=org.id)
+    other = Executive(full_name="Vanessa Fora", work_email="vanessa@corp.com")
+    db_session.add_all([mine, other])
+    db_session.flush()
+    db_session.add_all(
+        [
+            Contact(full_name="João Silva", email="joao@fornecedor.com", executive_id=mine.id),
+            Contact(full_name="Joana Souza", email="js@cliente.com", executive_id=mine.id),
+            Contact(full_name="Joaquim de Outro", executive_id=other.id),
+        ]
+    )
+    db_session.add(
+        user_models.Usuario(
+            name="Admin",
+            email="admin.typeahead@corp.com",
+            hashed_password=hash_password("secret123"),
+            is_active=True,
+            role="admin_company",
+            legal_organization_id=lo.id,
+            organization_id=org.id,
+            needs_profile_completion=False,
+        )
+    )
+    db_session.commit()
+    return mine.id, other.id
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.typeahead@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _names(client, headers, **params):
+    r = client.get("/typeahead", params=params, headers=headers)
+    assert r.status_code == 200, r.text
+    return [item["name"] for item in r.json()["items"]]
+
+
+def test_typeahead_prefixes_and_scope(client, db_session):
+    mine, other = _seed(db_session)
+    headers = _headers(client)
+
+    assert _names(client, headers, kind="contact", prefix="JOA") == ["Joana Souza", "João Silva"]
+    assert _names(client, headers, kind="contact", prefix="silv") == ["João Silva"]  # sobrenome
+    assert _names(client, headers, kind="contact", prefix="js@") == ["Joana Souza"]
+    assert _names(client, headers, kind="executive", prefix="van") == ["Vânia Prado"]  # o de fora não aparece
+    assert _names(client, headers, kind="executive", prefix="123.456") == ["Vânia Prado"]  # CPF
+    assert client.get("/typeahead", params={"kind": "contact", "prefix": "jo", "executive_id": other}, headers=headers).status_code == 403
+    assert client.get("/typeahead", params={"kind": "contact", "prefix": "jo"}).status_code == 401
+
+
+def test_typeahead_follows_committed_writes(client, db_session):
+    mine, _other = _seed(db_session)
+    headers = _headers(client)
+    assert _names(client, headers, kind="contact", prefix="jo") == ["Joana Souza", "João Silva"]
+
+    joana = db_session.query(Contact).filter(Contact.email == "js@cliente.com").one()
+    joana.full_name = "Ana Souza"
+    db_session.add(Contact(full_name="Jorge Lima", executive_id=mine))
+    db_session.delete(db_session.query(Contact).filter(Contact.email == "joao@fornecedor.com").one())
+    db_session.commit()
+    assert _names(client, headers, kind="contact", prefix="jo") == ["Jorge Lima"]
+    assert _names(client, headers, kind="contact", prefix="ana") == ["Ana Souza"]
+
+
+class _CountingEntries(list):
+    """Lista de entradas do bucket que conta as posições lidas (bisect e varredura)."""
+
+    reads = 0
+
+    def __getitem__(self, position):
+        self.reads += 1
+        return super().__getitem__(position)
+
+
+def test_index_lookup_reads_only_the_bisect_window_on_large_buckets():
+    index = TypeaheadIndex()
+    rows = [(row_id, row_id % 20, f"Contato {row_id:06d} Sobrenome{row_id % 97}", f"c{row_id}@corp.com", None) for row_id in range(50_000)]
+    index.load("contact", range(20), rows)
+    buckets = index._buckets["contact"]
+    for bucket in buckets.values():
+        bucket.entries = _CountingEntries(bucket.entries)
+
+    found = index.lookup("contact", list(range(20)), "contato 0123", 10)
+    assert [entry.id for entry in found] == list(range(12300, 12310))
+    assert [entry.matched for entry in found] == sorted(entry.matched for entry in found)
+    for bucket in buckets.values():
+        # log2(n) passos do bisect + no máximo `limit` casamentos + a chave que encerra a janela
+        assert bucket.entries.reads <= len(bucket.entries).bit_length() + 10 + 1
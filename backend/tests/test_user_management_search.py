@@ -0,0 +1,93 @@
+"""GET /users/management/?q=: coluna normalizada (sem acento) + trigramas FTS5, total pela mesma consulta."""
+
+from app.core.security import hash_password
+from app.models.legal_organization_model import LegalOrganization
+from app.models.organization_model import Organization
+from app.models import user_model as user_models
+
+
+def _user(name, email, org_id, lo_id, role="secretary"):
+    return user_models.Usuario(
+        name=name,
+        email=email,
+        hashed_password=hash_password("secret123"),
+        is_active=True,
+        role=role,
+        legal_organization_id=lo_id,
+        organization_id=org_id,
+        needs_profile_completion=False,
+    )
+
+
+def _seed(db_session):
+    lo = LegalOrganization(
+        name="Org Legal",
+        cnpj="11222333000181",
+        street="Av Paulista",
+        number="100",
+        neighborhood="Bela Vista",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310100",
+    )
+    db_session.add(lo)
+    db_session.flush()
+    org = Organization(
+        name="Empresa",
+        legalOrganizationId=lo.id,
+        cnpj="04252011000110",
+        street="Rua A",
+        number="10",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zipCode="01310200",
+    )
+    db_session.add(org)
+    db_session.flush()
+    db_session.add_all(
+        [
+            _user("Admin", "admin.usuarios@corp.com", org.id, lo.id, role="admin_company"),
+            _user("José Conceição", "jose.c@corp.com", org.id, lo.id),
+            _user("Ana Souza", "ana@fornecedor.com.br", org.id, lo.id),
+            _user("Zélia Prado", "zelia@corp.com", org.id, lo.id),
+            _user("José de Fora", "jose.fora@outra.com", None, None),
+        ]
+    )
+    db_session.commit()
+
+
+def _headers(client):
+    r = client.post("/auth/login", json={"email": "admin.usuarios@corp.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {r.json()['accessToken']}"}
+
+
+def _names(client, headers, **params):
+    body = client.get("/users/management/", params=params, headers=headers).json()
+    return [item["fullName"] for item in body["items"]], body["total"]
+
+
+def test_search_is_accent_insensitive_substring_and_scoped(client, db_session):
+    _seed(db_session)
+    headers = _headers(client)
+
+    assert _names(client, headers, q="CONCE") == (["José Conceição"], 1)  # meio do nome, sem acento
+    assert _names(client, headers, q="fornecedor.com") == (["Ana Souza"], 1)  # meio do e-mail
+    assert _names(client, headers, q="jose") == (["José Conceição"], 1)  # o de outra empresa fica fora
+    assert _names(client, headers, q="zé") == (["Zélia Prado"], 1)  # 2 caracteres: sem trigram
+    assert _names(client, headers, q="100%") == ([], 0)
+
+    names, total = _names(client, headers, q="corp.com", limit=2)
+    assert total == 3 and names == ["Admin", "José Conceição"]
+    assert _names(client, headers, q="corp.com", skip=10) == ([], 3)
+
+
+def test_search_text_follows_renames(client, db_session):
+    _seed(db_session)
+    headers = _headers(client)
+    row = db_session.query(user_models.Usuario).filter(user_models.Usuario.email == "ana@fornecedor.com.br").one()
+    row.name = "Ana Brandão"
+    db_session.commit()
+    assert row.search_text == "ana brandao ana@fornecedor.com.br"
+    assert _names(client, headers, q="brandao") == (["Ana Brandão"], 1)
+    assert _names(client, headers, q="souza") == ([], 0)
@@ -17,6 +17,7 @@ import {
   ExpenseCategory,
   LegalOrganization,
   LayoutView,
+  ChangeEntity,
 } from './types';
 import ViewSwitcher from './components/ViewSwitcher';
 import Sidebar from './components/Sidebar';
@@ -53,6 +54,22 @@ import { taskService } from './services/taskService';
 import { secretaryService } from './services/secretaryService';
 import { expenseService } from './services/expenseService';
 import { expenseCategoryService } from './services/expenseCategoryService';
+import { changeFeedService } from './services/changeFeedService';
+
+/** Telas cujo conjunto de dados (loadViewDataset) mostra cada entidade do feed de alterações. */
+const VIEWS_BY_ENTITY: Record<ChangeEntity, View[]> = {
+  event: ['dashboard', 'agenda'],
+  eventType: ['agenda'],
+  contact: ['contacts'],
+  contactType: ['contacts'],
+  task: ['tasks'],
+  document: ['documents'],
+  documentCategory: ['documents'],
+  expense: ['dashboard', 'finances'],
+  expenseCategory: ['dashboard', 'finances'],
+};
+/** Avisos em rajada (importação, lote) viram uma recarga só. */
+const CHANGE_RELOAD_DELAY_MS = 300;
 
 export interface MainAppLayoutProps {
   currentUser: User;
@@ -97,13 +114,18 @@ const MainAppLayout: React.FC<MainAppLayoutProps> = ({ currentUser, onLogout, on
     const gen = ++coreLoadGenRef.current;
     const stale = () => (isStale?.() ?? false) || gen !== coreLoadGenRef.current;
     try {
-      const legalOrgsRes = await legalOrganizationService.getAll();
+      // Disparadas juntas: vão num único POST /batch (ver services/compositeService.ts).
+      const [legalOrgsRes, orgsRes, executivesData, secretariesData] = await Promise.all([
+        legalOrganizationService.getAll(),
+        organizationService.getAll(),
+        executiveService.getAll(0, 1000),
+        secretaryService.getAll(),
+      ]);
       if (stale()) return;
       setLegalOrganizations(legalOrgsRes);
-
-      const orgsRes = await organizationService.getAll();
-      if (stale()) return;
       setOrganizations(orgsRes);
+      setExecutives(executivesData);
+      setSecretaries(secretariesData);
 
       let allDepts: Department[] = [];
       if (orgsRes.length > 0) {
@@ -115,14 +137,6 @@ const MainAppLayout: React.FC<MainAppLayoutProps> = ({ currentUser, onLogout, on
       }
       if (stale()) return;
       setDepartments(allDepts);
-
-      const executivesData = await executiveService.getAll(0, 1000);
-      if (stale()) return;
-      setExecutives(executivesData);
-
-      const secretariesData = await secretaryService.getAll();
-      if (stale()) return;
-      setSecretaries(secretariesData);
     } catch (error) {
       if (!stale()) {
         console.error('Erro ao carregar núcleo (organizações/executivos):', error);
@@ -324,6 +338,49 @@ const MainAppLayout: React.FC<MainAppLayoutProps> = ({ currentUser, onLogout, on
     return () => window.clearInterval(id);
   }, []);
 
+  const openViewRef = useRef({ view: currentView, executiveId: selectedExecutiveId });
+  openViewRef.current = { view: currentView, executiveId: selectedExecutiveId };
+
+  // Feed de alterações (GET /changes/stream): recarrega a tela aberta quando outro usuário ou
+  // outra aba altera algo que ela mostra; `reset` (avisos perdidos) recarrega tudo.
+  useEffect(() => {
+    let timer: number | undefined;
+    let reloadView = false;
+    let reloadReminders = false;
+    const schedule = () => {
+      window.clearTimeout(timer);
+      timer = window.setTimeout(() => {
+        const { view, executiveId } = openViewRef.current;
+        if (reloadView) void loadViewDataset(view, executiveId);
+        if (reloadReminders) void loadReminderEvents(executiveId);
+        reloadView = false;
+        reloadReminders = false;
+      }, CHANGE_RELOAD_DELAY_MS);
+    };
+    const unsubscribe = changeFeedService.subscribe({
+      onChange: (notice) => {
+        const { view, executiveId } = openViewRef.current;
+        if (notice.executiveId != null && String(notice.executiveId) !== executiveId) return;
+        const showsEntity = VIEWS_BY_ENTITY[notice.entity]?.includes(view) ?? false;
+        const isEvent = notice.entity === 'event';
+        if (!showsEntity && !isEvent) return;
+        reloadView = reloadView || showsEntity;
+        reloadReminders = reloadReminders || isEvent;
+        schedule();
+      },
+      onReset: () => {
+        void loadCoreData();
+        reloadView = true;
+        reloadReminders = true;
+        schedule();
+      },
+    });
+    return () => {
+      window.clearTimeout(timer);
+      unsubscribe();
+    };
+  }, [currentUser.id, loadCoreData, loadViewDataset, loadReminderEvents]);
+
   const visibleExecutives = useMemo(() => {
     switch (currentUser.role) {
       case 'master':
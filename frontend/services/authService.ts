@@ -194,6 +194,51 @@ export async function inviteUser(payload: {
   return data;
 }
 
+export interface BulkInviteRow {
+  fullName: string;
+  email: string;
+  invitedRole: 'admin_company' | 'executive' | 'secretary';
+  organizationId?: number | null;
+  secretaryExecutiveIds?: number[];
+}
+
+export interface BulkInviteItemResult {
+  row: number;
+  email?: string | null;
+  status: 'invited' | 'error';
+  userId?: number | null;
+  message?: string | null;
+}
+
+export interface BulkInviteResult {
+  total: number;
+  invited: number;
+  failed: number;
+  items: BulkInviteItemResult[];
+}
+
+/** Convites em lote: lista de linhas (JSON) ou arquivo CSV (cabeçalho fullName,email,invitedRole,...). */
+export async function inviteUsersBulk(
+  input: BulkInviteRow[] | File,
+  organizationId?: string | number | null,
+): Promise<BulkInviteResult> {
+  const orgId =
+    organizationId != null && String(organizationId).trim() !== '' ? Number(organizationId) : undefined;
+  if (input instanceof File) {
+    const form = new FormData();
+    form.append('file', input);
+    const { data } = await api.post<BulkInviteResult>('/auth/invite-users/bulk', form, {
+      params: orgId != null ? { organization_id: orgId } : undefined,
+    });
+    return data;
+  }
+  const { data } = await api.post<BulkInviteResult>('/auth/invite-users/bulk', {
+    invites: input,
+    organizationId: orgId,
+  });
+  return data;
+}
+
 export async function completeExecutiveProfile(body: Record<string, unknown>): Promise<ApiCurrentUser> {
   const { data } = await api.post<ApiCurrentUser>('/auth/complete-profile/executive', body);
   return data;
@@ -0,0 +1,22 @@
+import { API_URL } from "./api";
+import { ChangeNotice } from "../types";
+
+export interface ChangeFeedHandlers {
+  onChange: (notice: ChangeNotice) => void;
+  /** Avisos perdidos (backlog esgotado ou cliente lento): recarregar as listas. */
+  onReset?: () => void;
+}
+
+export const changeFeedService = {
+  /** Assina GET /changes/stream; o EventSource reconecta sozinho com Last-Event-ID. */
+  subscribe: (handlers: ChangeFeedHandlers): (() => void) => {
+    const token = localStorage.getItem("accessToken") ?? "";
+    const search = new URLSearchParams({ access_token: token });
+    const source = new EventSource(`${API_URL}changes/stream?${search.toString()}`);
+    source.addEventListener("change", (message) => {
+      handlers.onChange(JSON.parse((message as MessageEvent).data) as ChangeNotice);
+    });
+    source.addEventListener("reset", () => handlers.onReset?.());
+    return () => source.close();
+  },
+};
@@ -0,0 +1,73 @@
+import { AxiosError, AxiosResponse } from "axios";
+import { api } from "./api";
+import { CompositeResponse, SubRequest } from "../types";
+
+/** Mesmo limite de COMPOSITE_MAX_REQUESTS no backend. */
+const MAX_REQUESTS = 25;
+
+interface Pending {
+  request: SubRequest;
+  resolve: (response: { data: any }) => void;
+  reject: (error: unknown) => void;
+}
+
+let queue: Pending[] = [];
+let scheduled = false;
+
+const toPath = (url: string) => (url.startsWith("/") ? url : `/${url}`);
+
+const settle = (item: Pending, status: number, body: any) => {
+  if (status >= 200 && status < 300) {
+    item.resolve({ data: body });
+    return;
+  }
+  const response = { status, statusText: "", data: body, headers: {}, config: {} } as AxiosResponse;
+  item.reject(
+    new AxiosError(`Request failed with status code ${status}`, AxiosError.ERR_BAD_RESPONSE, undefined, undefined, response),
+  );
+};
+
+const sendAlone = (item: Pending) =>
+  api.get(item.request.path).then(item.resolve, item.reject);
+
+const flush = async () => {
+  scheduled = false;
+  const pending = queue;
+  queue = [];
+  for (let start = 0; start < pending.length; start += MAX_REQUESTS) {
+    const chunk = pending.slice(start, start + MAX_REQUESTS);
+    if (chunk.length === 1) {
+      sendAlone(chunk[0]);
+      continue;
+    }
+    api
+      .post<CompositeResponse>("/batch", { requests: chunk.map((item) => item.request) })
+      .then((response) => {
+        const byId = new Map(response.data.responses.map((item) => [item.id, item]));
+        chunk.forEach((item) => {
+          const result = byId.get(item.request.id);
+          if (result) {
+            settle(item, result.status, result.body);
+          } else {
+            sendAlone(item);
+          }
+        });
+      })
+      // Servidor sem POST /batch (ou falha do envelope): cada leitura segue avulsa.
+      .catch(() => chunk.forEach(sendAlone));
+  }
+};
+
+/**
+ * GET que se junta aos outros disparados no mesmo ciclo (ex.: o Promise.all da carga inicial)
+ * num único POST /batch: uma ida e volta, uma autenticação. Devolve `{ data }` como o axios e
+ * rejeita com AxiosError quando a sub-requisição falha.
+ */
+export const batchedGet = <T = any>(url: string): Promise<{ data: T }> =>
+  new Promise((resolve, reject) => {
+    queue.push({ request: { id: String(queue.length), path: toPath(url) }, resolve, reject });
+    if (!scheduled) {
+      scheduled = true;
+      setTimeout(flush, 0);
+    }
+  });
@@ -1,5 +1,6 @@
 import { api } from "./api";
-import { Contact } from "../types";
+import { batchedGet } from "./compositeService";
+import { BatchRequest, BatchResult, Contact, ExportFormat } from "../types";
 
 const mapContact = (item: any): Contact => ({
   ...item,
@@ -18,7 +19,7 @@ export const contactService = {
     if (params?.executiveId) {
       search.append("executive_id", String(Number(params.executiveId)));
     }
-    const response = await api.get<any[]>(`/contacts/?${search.toString()}`);
+    const response = await batchedGet<any[]>(`/contacts/?${search.toString()}`);
     return response.data.map(mapContact);
   },
 
@@ -35,4 +36,20 @@ export const contactService = {
   delete: async (id: string) => {
     await api.delete(`/contacts/${Number(id)}`);
   },
+
+  /** Várias criações/alterações/exclusões numa requisição; resultado por item. */
+  batch: async (data: BatchRequest<Contact>) => {
+    const response = await api.post<BatchResult>("/contacts/batch", data);
+    return response.data;
+  },
+
+  /** Exporta em CSV/XLSX (gerado em streaming no servidor). */
+  exportFile: async (format: ExportFormat = "csv", executiveId?: string) => {
+    const search = new URLSearchParams({ format });
+    if (executiveId) {
+      search.append("executive_id", String(Number(executiveId)));
+    }
+    const response = await api.get<Blob>(`/contacts/export?${search.toString()}`, { responseType: "blob" });
+    return response.data;
+  },
 };
@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import { ContactType } from "../types";
 import { sortByNamePt } from "../utils/sortByName";
 
@@ -10,7 +11,7 @@ const mapContactType = (item: any): ContactType => ({
 
 export const contactTypeService = {
   getAll: async () => {
-    const response = await api.get<any[]>("/contact-types/?skip=0&limit=1000");
+    const response = await batchedGet<any[]>("/contact-types/?skip=0&limit=1000");
     return sortByNamePt(response.data.map(mapContactType));
   },
 
@@ -0,0 +1,24 @@
+import { api } from "./api";
+import { DashboardSummary } from "../types";
+
+export const dashboardService = {
+  /** GET /dashboard/summary: agregados do painel (cache de alguns segundos no servidor). */
+  getSummary: async (params: { executiveId?: number | null; limit?: number; days?: number; month?: string } = {}) => {
+    const search = new URLSearchParams();
+    if (params.executiveId != null) {
+      search.append("executive_id", String(params.executiveId));
+    }
+    if (params.limit != null) {
+      search.append("limit", String(params.limit));
+    }
+    if (params.days != null) {
+      search.append("days", String(params.days));
+    }
+    if (params.month) {
+      search.append("month", params.month);
+    }
+    const query = search.toString();
+    const response = await api.get<DashboardSummary>(`/dashboard/summary${query ? `?${query}` : ""}`);
+    return response.data;
+  },
+};
@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import { Department, DepartmentCreate, DepartmentUpdate } from "../types";
 
 const mapDepartment = (item: any): Department => ({
@@ -10,11 +11,11 @@ const mapDepartment = (item: any): Department => ({
 export const departmentService = {
   // Método crucial para carregar a lista completa e permitir filtro no frontend
   getAll: async () => {
-    const response = await api.get<any[]>("/departments/");
+    const response = await batchedGet<any[]>("/departments/");
     return response.data.map(mapDepartment);
   },
   getByOrg: async (orgId: string) => {
-    const response = await api.get<any[]>(
+    const response = await batchedGet<any[]>(
       `/departments/by-organization/${orgId}`,
     );
     return response.data.map(mapDepartment);
@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import { DocumentCategory } from "../types";
 import { sortByNamePt } from "../utils/sortByName";
 
@@ -10,7 +11,7 @@ const mapDocumentCategory = (item: any): DocumentCategory => ({
 
 export const documentCategoryService = {
   getAll: async () => {
-    const response = await api.get<any[]>("/document-categories/?skip=0&limit=1000");
+    const response = await batchedGet<any[]>("/document-categories/?skip=0&limit=1000");
     return sortByNamePt(response.data.map(mapDocumentCategory));
   },
 
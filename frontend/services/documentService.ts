@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import { Document } from "../types";
 
 const mapDocument = (item: any): Document => ({
@@ -18,7 +19,7 @@ export const documentService = {
     if (params?.executiveId) {
       search.append("executive_id", String(Number(params.executiveId)));
     }
-    const response = await api.get<any[]>(`/documents/?${search.toString()}`);
+    const response = await batchedGet<any[]>(`/documents/?${search.toString()}`);
     return response.data.map(mapDocument);
   },
 
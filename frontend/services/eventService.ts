@@ -1,5 +1,18 @@
-import { api } from "./api";
-import { Event, RecurrenceRule } from "../types";
+import { api, API_URL } from "./api";
+import { batchedGet } from "./compositeService";
+import {
+  AvailabilityRequest,
+  AvailabilityResult,
+  BatchRequest,
+  BatchResult,
+  CalendarFeedLink,
+  ConflictMode,
+  Event,
+  EventImportResult,
+  EventReminder,
+  ExportFormat,
+  RecurrenceRule,
+} from "../types";
 
 const mapEvent = (item: any): Event => ({
   ...item,
@@ -20,23 +33,26 @@ export type EventSeriesPayload = Omit<Partial<Event>, "id" | "recurrenceId"> & {
   recurrence: RecurrenceRule;
 };
 
+const conflictQuery = (mode?: ConflictMode) =>
+  mode && mode !== "ignore" ? `?conflicts=${mode}` : "";
+
 export const eventService = {
   getAll: async (params?: GetEventsParams) => {
     const search = new URLSearchParams({ skip: "0", limit: "1000" });
     if (params?.executiveId) {
       search.append("executive_id", String(Number(params.executiveId)));
     }
-    const response = await api.get<any[]>(`/events/?${search.toString()}`);
+    const response = await batchedGet<any[]>(`/events/?${search.toString()}`);
     return response.data.map(mapEvent);
   },
 
-  create: async (data: Partial<Event>) => {
-    const response = await api.post<any>("/events/", data);
+  create: async (data: Partial<Event>, conflicts?: ConflictMode) => {
+    const response = await api.post<any>(`/events/${conflictQuery(conflicts)}`, data);
     return mapEvent(response.data);
   },
 
-  createSeries: async (data: EventSeriesPayload) => {
-    const response = await api.post<any[]>("/events/series", {
+  createSeries: async (data: EventSeriesPayload, conflicts?: ConflictMode) => {
+    const response = await api.post<any[]>(`/events/series${conflictQuery(conflicts)}`, {
       ...data,
       executiveId: Number(data.executiveId),
       eventTypeId: data.eventTypeId != null ? Number(data.eventTypeId) : undefined,
@@ -44,9 +60,13 @@ export const eventService = {
     return response.data.map(mapEvent);
   },
 
-  replaceSeries: async (recurrenceId: string, data: EventSeriesPayload) => {
+  replaceSeries: async (
+    recurrenceId: string,
+    data: EventSeriesPayload,
+    conflicts?: ConflictMode,
+  ) => {
     const response = await api.put<any[]>(
-      `/events/series/${encodeURIComponent(recurrenceId)}`,
+      `/events/series/${encodeURIComponent(recurrenceId)}${conflictQuery(conflicts)}`,
       {
         ...data,
         executiveId: Number(data.executiveId),
@@ -56,8 +76,8 @@ export const eventService = {
     return response.data.map(mapEvent);
   },
 
-  update: async (id: string, data: Partial<Event>) => {
-    const response = await api.put<any>(`/events/${Number(id)}`, data);
+  update: async (id: string, data: Partial<Event>, conflicts?: ConflictMode) => {
+    const response = await api.put<any>(`/events/${Number(id)}${conflictQuery(conflicts)}`, data);
     return mapEvent(response.data);
   },
 
@@ -65,6 +85,12 @@ export const eventService = {
     await api.delete(`/events/${Number(id)}`);
   },
 
+  /** Várias criações/alterações/exclusões numa requisição; resultado por item. */
+  batch: async (data: BatchRequest<Event>) => {
+    const response = await api.post<BatchResult>("/events/batch", data);
+    return response.data;
+  },
+
   deleteByRecurrence: async (recurrenceId: string, fromStartTime?: string) => {
     const search = new URLSearchParams();
     if (fromStartTime) {
@@ -74,4 +100,60 @@ export const eventService = {
     const response = await api.delete(`/events/recurrence/${encodeURIComponent(recurrenceId)}${suffix}`);
     return response.data;
   },
+
+  importIcs: async (
+    file: File,
+    executiveId: string,
+    eventTypeId?: string,
+  ): Promise<EventImportResult> => {
+    const search = new URLSearchParams({ executive_id: String(Number(executiveId)) });
+    if (eventTypeId) {
+      search.append("event_type_id", String(Number(eventTypeId)));
+    }
+    const form = new FormData();
+    form.append("file", file);
+    const response = await api.post<EventImportResult>(`/events/import?${search.toString()}`, form);
+    return response.data;
+  },
+
+  findAvailability: async (data: AvailabilityRequest): Promise<AvailabilityResult> => {
+    const response = await api.post<AvailabilityResult>("/events/availability", {
+      ...data,
+      executiveIds: data.executiveIds.map(Number),
+    });
+    return response.data;
+  },
+
+  /** Lembretes disparados pelo servidor (SSE); devolve a função que encerra a assinatura. */
+  subscribeReminders: (
+    executiveIds: string[],
+    onReminder: (reminder: EventReminder) => void,
+  ): (() => void) => {
+    // EventSource não envia cabeçalhos: o token vai na query, como em /changes/stream.
+    const search = new URLSearchParams({ access_token: localStorage.getItem("accessToken") ?? "" });
+    executiveIds.forEach((id) => search.append("executive_id", String(Number(id))));
+    const source = new EventSource(`${API_URL}events/reminders/stream?${search.toString()}`);
+    source.addEventListener("reminder", (message) => {
+      onReminder(JSON.parse((message as MessageEvent).data) as EventReminder);
+    });
+    return () => source.close();
+  },
+
+  getCalendarFeedLink: async (executiveId: string): Promise<CalendarFeedLink> => {
+    const response = await api.get<any>(`/events/feed/${Number(executiveId)}/link`);
+    return {
+      executiveId: String(response.data.executiveId),
+      feedUrl: response.data.feedUrl,
+    };
+  },
+
+  /** Exporta em CSV/XLSX (gerado em streaming no servidor). */
+  exportFile: async (format: ExportFormat = "csv", executiveId?: string) => {
+    const search = new URLSearchParams({ format });
+    if (executiveId) {
+      search.append("executive_id", String(Number(executiveId)));
+    }
+    const response = await api.get<Blob>(`/events/export?${search.toString()}`, { responseType: "blob" });
+    return response.data;
+  },
 };
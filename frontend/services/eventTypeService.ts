@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import { EventType } from "../types";
 import { sortByNamePt } from "../utils/sortByName";
 
@@ -9,7 +10,7 @@ const mapEventType = (item: any): EventType => ({
 
 export const eventTypeService = {
   getAll: async () => {
-    const response = await api.get<any[]>("/event-types/?skip=0&limit=1000");
+    const response = await batchedGet<any[]>("/event-types/?skip=0&limit=1000");
     return sortByNamePt(response.data.map(mapEventType));
   },
 
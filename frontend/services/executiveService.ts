@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import { Executive } from "../types";
 
 const mapExecutive = (item: any): Executive => ({
@@ -39,7 +40,7 @@ export const executiveService = {
 
   // Ajustado default para 1000 para permitir paginação no frontend fluida
   getAll: async (skip: number = 0, limit: number = 1000) => {
-    const response = await api.get<any[]>(
+    const response = await batchedGet<any[]>(
       `/executives/?skip=${skip}&limit=${limit}`,
     );
     return response.data.map(mapExecutive);
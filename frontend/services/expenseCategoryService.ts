@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import type { ExpenseCategory } from "../types";
 import { sortByNamePt } from "../utils/sortByName";
 
@@ -19,7 +20,7 @@ export const expenseCategoryService = {
     if (params?.executiveId) {
       search.append("executive_id", String(Number(params.executiveId)));
     }
-    const response = await api.get<Record<string, unknown>[]>(
+    const response = await batchedGet<Record<string, unknown>[]>(
       `/expense-categories/?${search.toString()}`,
     );
     return sortByNamePt(response.data.map(mapCategory));
@@ -1,5 +1,16 @@
 import { api } from "./api";
-import type { Expense, ExpenseEntityType, ExpenseStatus, ExpenseType } from "../types";
+import { batchedGet } from "./compositeService";
+import type {
+  BatchRequest,
+  BatchResult,
+  Expense,
+  ExpenseEntityType,
+  ExpenseImportResult,
+  ExpenseStatus,
+  ExpenseSummary,
+  ExpenseType,
+  ExportFormat,
+} from "../types";
 
 const mapExpense = (item: Record<string, unknown>): Expense => {
   const amount = item.amount;
@@ -61,7 +72,7 @@ export const expenseService = {
     if (params?.executiveId) {
       search.append("executive_id", String(Number(params.executiveId)));
     }
-    const response = await api.get<Record<string, unknown>[]>(`/expenses/?${search.toString()}`);
+    const response = await batchedGet<Record<string, unknown>[]>(`/expenses/?${search.toString()}`);
     return response.data.map(mapExpense);
   },
 
@@ -81,4 +92,48 @@ export const expenseService = {
   delete: async (id: string) => {
     await api.delete(`/expenses/${Number(id)}`);
   },
+
+  /** Várias criações/alterações/exclusões numa requisição; resultado por item. */
+  batch: async (data: BatchRequest<Expense>) => {
+    const response = await api.post<BatchResult>("/expenses/batch", data);
+    return response.data;
+  },
+
+  /** Importa planilha CSV ou extrato OFX; linhas repetidas (data, valor e descrição) são ignoradas. */
+  importFile: async (
+    file: File,
+    executiveId: string,
+    options?: { createCategories?: boolean; defaultType?: ExpenseType; entityType?: ExpenseEntityType },
+  ): Promise<ExpenseImportResult> => {
+    const search = new URLSearchParams({ executive_id: String(Number(executiveId)) });
+    if (options?.createCategories) search.append("create_categories", "true");
+    if (options?.defaultType) search.append("default_type", options.defaultType);
+    if (options?.entityType) search.append("entity_type", options.entityType);
+    const form = new FormData();
+    form.append("file", file);
+    const response = await api.post<ExpenseImportResult>(`/expenses/import?${search.toString()}`, form);
+    return response.data;
+  },
+
+  /** Totais por mês, categoria, tipo e status calculados no servidor (meses no formato YYYY-MM). */
+  getSummary: async (params?: ListParams & { startMonth?: string; endMonth?: string }) => {
+    const search = new URLSearchParams();
+    if (params?.executiveId) {
+      search.append("executive_id", String(Number(params.executiveId)));
+    }
+    if (params?.startMonth) search.append("start_month", params.startMonth);
+    if (params?.endMonth) search.append("end_month", params.endMonth);
+    const response = await api.get<ExpenseSummary>(`/expenses/summary?${search.toString()}`);
+    return response.data;
+  },
+
+  /** Exporta em CSV/XLSX (gerado em streaming no servidor). */
+  exportFile: async (format: ExportFormat = "csv", executiveId?: string) => {
+    const search = new URLSearchParams({ format });
+    if (executiveId) {
+      search.append("executive_id", String(Number(executiveId)));
+    }
+    const response = await api.get<Blob>(`/expenses/export?${search.toString()}`, { responseType: "blob" });
+    return response.data;
+  },
 };
@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import {
   LegalOrganization,
   LegalOrganizationCreate,
@@ -12,7 +13,7 @@ const mapLegalOrganization = (item: any): LegalOrganization => ({
 
 export const legalOrganizationService = {
   getAll: async () => {
-    const response = await api.get<any[]>(
+    const response = await batchedGet<any[]>(
       "/legal-organizations/?skip=0&limit=1000",
     );
     return response.data.map(mapLegalOrganization);
@@ -1,4 +1,5 @@
 import { api } from "./api";
+import { batchedGet } from "./compositeService";
 import { Organization, OrganizationCreate, OrganizationUpdate } from "../types";
 
 const mapOrganization = (item: any): Organization => ({
@@ -11,7 +12,7 @@ const mapOrganization = (item: any): Organization => ({
 export const organizationService = {
   getAll: async () => {
     // Garante retorno de array mesmo que a API use paginação padrão
-    const response = await api.get<any[]>(
+    const response = await batchedGet<any[]>(
       "/organizations/?skip=0&limit=1000",
     );
     return response.data.map(mapOrganization);
@@ -0,0 +1,66 @@
+import { api } from "./api";
+import {
+  ExportFormat,
+  Report,
+  ReportGenerateInput,
+  ReportJob,
+  ReportRegeneration,
+  ReportRowsPage,
+  ReportSchedule,
+  ReportScheduleInput,
+} from "../types";
+
+export const reportService = {
+  /** GET /reports/: só metadados (as linhas vêm de getRows). */
+  getAll: async () => {
+    const response = await api.get<Report[]>("/reports/");
+    return response.data;
+  },
+
+  getRows: async (reportId: number, skip = 0, limit = 500) => {
+    const response = await api.get<ReportRowsPage>(`/reports/${reportId}/rows?skip=${skip}&limit=${limit}`);
+    return response.data;
+  },
+
+  /** POST /reports/generate: o servidor monta o relatório; o navegador não baixa as tabelas. */
+  generate: async (input: ReportGenerateInput) => {
+    const response = await api.post<Report>("/reports/generate", input);
+    return response.data;
+  },
+
+  /** POST /reports/{id}/regenerate: recalcula só os executivos cujos dados mudaram. */
+  regenerate: async (reportId: number) => {
+    const response = await api.post<ReportRegeneration>(`/reports/${reportId}/regenerate`);
+    return response.data;
+  },
+
+  exportFile: async (reportId: number, format: ExportFormat = "csv") => {
+    const response = await api.get<Blob>(`/reports/${reportId}/export?format=${format}`, { responseType: "blob" });
+    return response.data;
+  },
+
+  /** POST /reports/jobs: enfileira e devolve o job; acompanhe com getJob até `succeeded`. */
+  createJob: async (input: ReportGenerateInput) => {
+    const response = await api.post<ReportJob>("/reports/jobs", input);
+    return response.data;
+  },
+
+  getJob: async (jobId: number) => {
+    const response = await api.get<ReportJob>(`/reports/jobs/${jobId}`);
+    return response.data;
+  },
+
+  getSchedules: async () => {
+    const response = await api.get<ReportSchedule[]>("/reports/schedules");
+    return response.data;
+  },
+
+  createSchedule: async (input: ReportScheduleInput) => {
+    const response = await api.post<ReportSchedule>("/reports/schedules", input);
+    return response.data;
+  },
+
+  deleteSchedule: async (scheduleId: number) => {
+    await api.delete(`/reports/schedules/${scheduleId}`);
+  },
+};
@@ -0,0 +1,26 @@
+import { api } from "./api";
+import { SearchEntity, SearchResults } from "../types";
+
+export const searchService = {
+  /** GET /search: mais relevantes primeiro; passe `nextCursor` da resposta anterior para a próxima página. */
+  search: async (
+    q: string,
+    params: { executiveId?: number | null; entity?: SearchEntity; limit?: number; cursor?: string | null } = {},
+  ) => {
+    const search = new URLSearchParams({ q });
+    if (params.executiveId != null) {
+      search.append("executive_id", String(params.executiveId));
+    }
+    if (params.entity) {
+      search.append("entity", params.entity);
+    }
+    if (params.limit != null) {
+      search.append("limit", String(params.limit));
+    }
+    if (params.cursor) {
+      search.append("cursor", params.cursor);
+    }
+    const response = await api.get<SearchResults>(`/search?${search.toString()}`);
+    return response.data;
+  },
+};
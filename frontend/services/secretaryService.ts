@@ -1,5 +1,6 @@
 import { Secretary } from '../types';
 import { api } from './api';
+import { batchedGet } from './compositeService';
 
 function mapRow(row: Record<string, unknown>): Secretary {
   const executiveIds = Array.isArray(row.executiveIds)
@@ -19,7 +20,7 @@ function mapRow(row: Record<string, unknown>): Secretary {
 
 export const secretaryService = {
   getAll: async (): Promise<Secretary[]> => {
-    const { data } = await api.get<Record<string, unknown>[]>('/secretaries/');
+    const { data } = await batchedGet<Record<string, unknown>[]>('/secretaries/');
     return data.map(mapRow);
   },
 
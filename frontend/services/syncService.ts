@@ -0,0 +1,15 @@
+import { api } from "./api";
+import { SyncResponse } from "../types";
+
+export const syncService = {
+  /** GET /sync: sem `since` devolve o snapshot completo; guarde `token` para o próximo delta. */
+  getDelta: async (since?: string | null) => {
+    const search = new URLSearchParams();
+    if (since) {
+      search.append("since", since);
+    }
+    const query = search.toString();
+    const response = await api.get<SyncResponse>(`/sync${query ? `?${query}` : ""}`);
+    return response.data;
+  },
+};
@@ -1,5 +1,6 @@
 import { api } from "./api";
-import { RecurrenceRule, Task } from "../types";
+import { batchedGet } from "./compositeService";
+import { BatchRequest, BatchResult, RecurrenceRule, Task } from "../types";
 
 const mapTask = (item: any): Task => ({
   ...item,
@@ -26,7 +27,7 @@ export const taskService = {
     if (params?.executiveId) {
       search.append("executive_id", String(Number(params.executiveId)));
     }
-    const response = await api.get<any[]>(`/tasks/?${search.toString()}`);
+    const response = await batchedGet<any[]>(`/tasks/?${search.toString()}`);
     return response.data.map(mapTask);
   },
 
@@ -63,6 +64,12 @@ export const taskService = {
     await api.delete(`/tasks/${Number(id)}`);
   },
 
+  /** Várias criações/alterações/exclusões numa requisição; resultado por item. */
+  batch: async (data: BatchRequest<Task>) => {
+    const response = await api.post<BatchResult>("/tasks/batch", data);
+    return response.data;
+  },
+
   deleteByRecurrence: async (recurrenceId: string, fromDueDate?: string) => {
     const search = new URLSearchParams();
     if (fromDueDate) {
@@ -0,0 +1,17 @@
+import { api } from "./api";
+import { TypeaheadKind, TypeaheadResults } from "../types";
+
+export const typeaheadService = {
+  /** GET /typeahead: sugestões por prefixo de nome, e-mail ou CPF (substitui baixar a lista inteira). */
+  lookup: async (kind: TypeaheadKind, prefix: string, params: { executiveId?: number | null; limit?: number } = {}) => {
+    const search = new URLSearchParams({ kind, prefix });
+    if (params.executiveId != null) {
+      search.append("executive_id", String(params.executiveId));
+    }
+    if (params.limit != null) {
+      search.append("limit", String(params.limit));
+    }
+    const response = await api.get<TypeaheadResults>(`/typeahead?${search.toString()}`);
+    return response.data;
+  },
+};
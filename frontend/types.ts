@@ -203,6 +203,130 @@ export interface Event {
   reminderMinutes?: number;
   recurrenceId?: string;
   recurrence?: RecurrenceRule;
+  conflicts?: EventConflict[] | null;
+}
+
+export type ConflictMode = 'ignore' | 'warn' | 'reject';
+
+export interface EventConflict {
+  eventId: number;
+  title: string;
+  startTime: string;
+  endTime: string;
+  recurrenceId?: string | null;
+  occurrenceStart: string;
+}
+
+export interface AvailabilityRequest {
+  executiveIds: number[];
+  rangeStart: string;
+  rangeEnd: string;
+  workdayStart?: string; // "HH:MM"
+  workdayEnd?: string;
+  workingDays?: number[]; // 0 = domingo
+  slotMinutes: number;
+  bufferMinutes?: number;
+  stepMinutes?: number;
+  maxSlots?: number;
+}
+
+export interface TimeBlock {
+  start: string;
+  end: string;
+}
+
+export interface AvailabilitySlot extends TimeBlock {
+  rank: number;
+  fragments: number;
+}
+
+export interface ExecutiveAvailability {
+  executiveId: number;
+  busy: TimeBlock[];
+  free: TimeBlock[];
+}
+
+export interface AvailabilityResult {
+  slots: AvailabilitySlot[];
+  executives: ExecutiveAvailability[];
+}
+
+export interface EventReminder {
+  eventId: number;
+  executiveId: number;
+  title: string;
+  location?: string | null;
+  startTime: string;
+  reminderMinutes: number;
+  fireAt: string;
+}
+
+export type ChangeEntity =
+  | 'event'
+  | 'task'
+  | 'contact'
+  | 'expense'
+  | 'document'
+  | 'eventType'
+  | 'contactType'
+  | 'expenseCategory'
+  | 'documentCategory';
+
+export interface ChangeNotice {
+  entity: ChangeEntity;
+  id: number;
+  op: 'create' | 'update' | 'delete';
+  version: number;
+  executiveId?: number | null;
+}
+
+export interface SyncDeleted {
+  entity: ChangeEntity;
+  id: number;
+  executiveId?: number | null;
+  deletedAt: string;
+}
+
+export interface SyncChanges {
+  events: Event[];
+  tasks: Task[];
+  contacts: Contact[];
+  expenses: Expense[];
+  documents: Document[];
+  eventTypes: EventType[];
+  contactTypes: ContactType[];
+  expenseCategories: ExpenseCategory[];
+  documentCategories: DocumentCategory[];
+}
+
+/** `full`: snapshot completo — substituir o cache; senão aplicar `deleted` e depois `changed`. */
+export interface SyncResponse {
+  token: string;
+  full: boolean;
+  changed: SyncChanges;
+  deleted: SyncDeleted[];
+}
+
+export interface EventImportItemResult {
+  index: number;
+  uid?: string;
+  title?: string;
+  status: 'created' | 'error';
+  createdCount: number;
+  message?: string;
+}
+
+export interface EventImportResult {
+  totalVevents: number;
+  createdEvents: number;
+  createdSeries: number;
+  failed: number;
+  items: EventImportItemResult[];
+}
+
+export interface CalendarFeedLink {
+  executiveId: string;
+  feedUrl: string; // assinatura .ics (Outlook / Google Agenda)
 }
 
 export interface ContactType {
@@ -248,6 +372,159 @@ export interface Expense {
     executiveId: string; // UUID
 }
 
+/** Grupo de GET /expenses/summary: só as dimensões do agrupamento vêm preenchidas; amount em string decimal. */
+export interface ExpenseSummaryGroup {
+    month?: string | null; // YYYY-MM
+    categoryId?: number | null;
+    categoryName?: string | null;
+    type?: ExpenseType | null;
+    status?: ExpenseStatus | null;
+    count: number;
+    amount: string;
+}
+
+export interface ExpenseImportItemResult {
+    line: number;
+    description?: string | null;
+    status: 'error';
+    message: string;
+}
+
+export interface ExpenseImportResult {
+    totalRows: number;
+    created: number;
+    duplicates: number;
+    failed: number;
+    createdCategories: string[];
+    items: ExpenseImportItemResult[];
+}
+
+export type BatchOp = 'create' | 'update' | 'delete';
+export type BatchMode = 'all_or_nothing' | 'best_effort';
+
+export interface BatchOperation<T = Record<string, unknown>> {
+    op: BatchOp;
+    id?: number;
+    data?: Partial<T>;
+}
+
+export interface BatchRequest<T = Record<string, unknown>> {
+    mode?: BatchMode;
+    operations: BatchOperation<T>[];
+}
+
+export interface BatchItemResult {
+    index: number;
+    op: BatchOp;
+    id?: number | null;
+    status: 'ok' | 'error' | 'skipped';
+    message?: string | null;
+}
+
+export interface BatchResult {
+    mode: BatchMode;
+    committed: boolean;
+    succeeded: number;
+    failed: number;
+    items: BatchItemResult[];
+}
+
+export interface SubRequest {
+    id: string;
+    method?: 'GET';
+    path: string;
+}
+
+export interface SubResponse {
+    id: string;
+    status: number;
+    body: any;
+}
+
+export interface CompositeResponse {
+    responses: SubResponse[];
+}
+
+export interface ExpenseSummary {
+    count: number;
+    byMonth: ExpenseSummaryGroup[];
+    byCategory: ExpenseSummaryGroup[];
+    byType: ExpenseSummaryGroup[];
+    byStatus: ExpenseSummaryGroup[];
+    groups: ExpenseSummaryGroup[];
+}
+
+export interface DashboardEvent {
+    id: number;
+    title: string;
+    startTime: string;
+    endTime: string;
+    location?: string | null;
+    executiveId: number;
+}
+
+export interface DashboardExpense {
+    id: number;
+    description: string;
+    amount: string;
+    expenseDate: string;
+    type: ExpenseType;
+    status: ExpenseStatus;
+    categoryName?: string | null;
+    executiveId: number;
+}
+
+export interface DashboardSummary {
+    executiveId?: number | null;
+    generatedAt: string;
+    counts: Record<'events' | 'expenses' | 'tasks' | 'contacts' | 'documents', number>;
+    upcomingEvents: DashboardEvent[];
+    eventsNextDays: number;
+    recentExpenses: DashboardExpense[];
+    tasks: {
+        open: number;
+        openByPriority: Record<string, number>;
+        byStatus: Record<string, number>;
+    };
+    expenses: {
+        month: string; // YYYY-MM
+        count: number;
+        byType: ExpenseSummaryGroup[];
+        byStatus: ExpenseSummaryGroup[];
+    };
+}
+
+export type SearchEntity = 'contact' | 'document' | 'event' | 'task';
+
+export interface SearchHit {
+    entity: SearchEntity;
+    id: number;
+    executiveId: number;
+    title: string;
+    snippet: string; // HTML escapado; termos encontrados em <mark>
+    rank: number;
+}
+
+export interface SearchResults {
+    items: SearchHit[];
+    nextCursor?: string | null;
+}
+
+export type TypeaheadKind = 'executive' | 'contact';
+
+export interface TypeaheadItem {
+    id: number;
+    executiveId: number;
+    name: string;
+    email?: string | null;
+    matched: string;
+}
+
+export interface TypeaheadResults {
+    kind: TypeaheadKind;
+    items: TypeaheadItem[];
+}
+
 // Views correspond to navigation items in the sidebar
 export type View = 'dashboard' | 'executives' | 'agenda' | 'contacts' | 'finances' | 'legalOrganizations' | 'organizations' | 'tasks' | 'secretaries' | 'documents' | 'userManagement';
 
@@ -326,4 +603,90 @@ export type OrganizationUpdate = Partial<OrganizationCreate>;
 
 // Para Department
 export type DepartmentCreate = Omit<Department, 'id'>;
-export type DepartmentUpdate = Partial<DepartmentCreate>;
\ No newline at end of file
+export type DepartmentUpdate = Partial<DepartmentCreate>;
+export type ExportFormat = 'csv' | 'xlsx';
+
+export type ReportSection = 'events' | 'expenses' | 'tasks' | 'contacts';
+
+export interface ReportSectionSummary {
+  total: number;
+  byExecutive: Record<string, number>;
+  byType?: Record<string, number>;
+  byStatus?: Record<string, number>;
+  amountByType?: Record<string, string>;
+}
+
+export interface Report {
+  id: number;
+  name: string;
+  selectedExecutiveIds: number[];
+  startDate?: string | null;
+  endDate?: string | null;
+  includeEvents: boolean;
+  includeExpenses: boolean;
+  includeTasks: boolean;
+  includeContacts: boolean;
+  totalRecords: number;
+  rowCount: number;
+  generatedAt: string;
+  summary?: Partial<Record<ReportSection, ReportSectionSummary>> | null;
+}
+
+export type ReportRow = Record<string, unknown> & { section: ReportSection };
+
+export interface ReportRegeneration {
+  report: Report;
+  staleExecutives: Partial<Record<ReportSection, number[]>>;
+}
+
+export interface ReportRowsPage {
+  items: ReportRow[];
+  total: number;
+  skip: number;
+  limit: number;
+}
+
+export interface ReportGenerateInput {
+  name: string;
+  selectedExecutiveIds: number[];
+  startDate?: string | null;
+  endDate?: string | null;
+  includeEvents?: boolean;
+  includeExpenses?: boolean;
+  includeTasks?: boolean;
+  includeContacts?: boolean;
+}
+
+export type ReportJobStatus = 'queued' | 'running' | 'succeeded' | 'failed';
+
+export interface ReportJob {
+  id: number;
+  status: ReportJobStatus;
+  progress: number;
+  currentSection?: ReportSection | null;
+  reportId?: number | null;
+  scheduleId?: number | null;
+  error?: string | null;
+  createdAt: string;
+  startedAt?: string | null;
+  finishedAt?: string | null;
+}
+
+export type ReportScheduleFrequency = 'daily' | 'weekly' | 'monthly';
+
+export interface ReportScheduleInput {
+  name: string;
+  frequency: ReportScheduleFrequency;
+  selectedExecutiveIds: number[];
+  includeEvents?: boolean;
+  includeExpenses?: boolean;
+  includeTasks?: boolean;
+  includeContacts?: boolean;
+}
+
+export interface ReportSchedule extends Required<ReportScheduleInput> {
+  id: number;
+  isActive: boolean;
+  nextRunAt: string;
+  lastRunAt?: string | null;
+}